@@ -108,6 +108,14 @@ python manage.py collectstatic --noinput --settings=eclick.settings_production
 print_status "Running database migrations..."
 python manage.py migrate --settings=eclick.settings_production
 
+# Index existing messages, comments and logs the first time search is deployed
+print_status "Building the search index..."
+python manage.py rebuild_search_index --missing --settings=eclick.settings_production
+
+# Render the report donut charts once, so no web worker has to load matplotlib for them
+print_status "Pre-rendering report charts..."
+python manage.py prerender_charts --settings=eclick.settings_production
+
 # Create superuser (optional)
 print_warning "Do you want to create a superuser? (y/n)"
 read -r response
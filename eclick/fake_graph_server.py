@@ -0,0 +1,108 @@
+"""
+Local stand-in for the Microsoft Graph mail endpoints
+
+Used by the email backend tests, and handy for trying report runs locally
+without sending real mail:
+
+    python -m eclick.fake_graph_server 8025
+    GRAPH_API_URL=http://127.0.0.1:8025/v1.0
+
+It accepts POST /v1.0/users/<sender>/sendMail and POST /v1.0/$batch, records
+every sendMail body it receives and can throttle the first N sendMail
+requests with 429 + Retry-After to exercise retries.
+"""
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SEND_MAIL_PATH = re.compile(r'^/users/(?P<sender>[^/]+)/sendMail$')
+
+
+class FakeGraphServer:
+    def __init__(self, port=0, throttle=0, retry_after=0):
+        self.port = port
+        self.throttle = throttle  # number of sendMail requests to reject with 429
+        self.retry_after = retry_after
+        self.http_requests = []  # (path, body) of every HTTP call
+        self.sent = []  # (sender, sendMail body) of every accepted message
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/v1.0"
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                server.http_requests.append((self.path, body))
+
+                path = self.path[len('/v1.0'):] if self.path.startswith('/v1.0') else self.path
+                if path == '/$batch':
+                    responses = [server.handle_send(sub['url'], sub.get('body'), sub['id'])
+                                 for sub in body.get('requests', [])]
+                    self._reply(200, {'responses': responses})
+                else:
+                    result = server.handle_send(path, body)
+                    self._reply(result['status'], result['body'], result['headers'])
+
+            def _reply(self, status, payload, headers=None):
+                data = json.dumps(payload).encode() if payload is not None else b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def handle_send(self, path, body, request_id=None):
+        """Answer one sendMail request, as a $batch sub-response dict"""
+        match = SEND_MAIL_PATH.match(path)
+        with self._lock:
+            if not match:
+                status, headers, payload = 404, {}, {'error': {'code': 'NotFound'}}
+            elif self.throttle > 0:
+                self.throttle -= 1
+                status, headers = 429, {'Retry-After': str(self.retry_after)}
+                payload = {'error': {'code': 'TooManyRequests'}}
+            else:
+                self.sent.append((match.group('sender'), body))
+                status, headers, payload = 202, {}, None
+        return {'id': request_id, 'status': status, 'headers': headers, 'body': payload}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == '__main__':
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8025
+    fake = FakeGraphServer(port=port).start()
+    print(f"Fake Graph API listening on {fake.url}")
+    try:
+        fake._thread.join()
+    except KeyboardInterrupt:
+        fake.stop()
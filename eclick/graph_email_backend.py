@@ -1,15 +1,78 @@
 """
 Microsoft Graph API Email Backend
 Sends emails via Microsoft Graph API instead of SMTP
+
+The MSAL application (and with it the token cache) and the HTTP session are
+shared by every backend instance in the process, so a token is only requested
+when the cached one is about to expire and connections are kept alive.
+Messages are sent in JSON $batch requests of up to 4, and throttled
+requests are retried after the Retry-After delay Graph asks for.
 """
 from django.core.mail.backends.base import BaseEmailBackend
 from django.conf import settings
-import msal
-import requests
+import base64
+import json
 import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
+DEFAULT_GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
+
+# Graph accepts up to 20 requests per $batch call and runs them in parallel,
+# but Outlook throttles more than 4 concurrent requests per mailbox, so a
+# batch is capped at 4 sendMail requests
+BATCH_SIZE = 4
+# Messages above this JSON size are sent on their own instead of in a batch
+MAX_BATCH_PAYLOAD_BYTES = 3 * 1024 * 1024
+MAX_RETRIES = 3
+MAX_RETRY_AFTER = 60
+RETRYABLE_STATUSES = (429, 503, 504)
+
+_lock = threading.Lock()
+_msal_apps = {}
+_session = None
+
+
+def get_msal_app(client_id, client_secret, tenant_id):
+    """Process-wide MSAL application; its in-memory token cache is reused across sends"""
+    key = (client_id, tenant_id)
+    with _lock:
+        if key not in _msal_apps:
+            import msal
+            _msal_apps[key] = msal.ConfidentialClientApplication(
+                client_id,
+                authority=f"https://login.microsoftonline.com/{tenant_id}",
+                client_credential=client_secret,
+            )
+        return _msal_apps[key]
+
+
+def get_session():
+    """Process-wide keep-alive session with a connection pool"""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+            _session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+        return _session
+
+
+def retry_after_seconds(headers, default=1):
+    """Parse a Retry-After header (seconds) and cap it"""
+    try:
+        value = int(float((headers or {}).get("Retry-After", default)))
+    except (TypeError, ValueError):
+        value = default
+    return max(0, min(value, MAX_RETRY_AFTER))
+
+
 class GraphEmailBackend(BaseEmailBackend):
     """
     Email backend that uses Microsoft Graph API to send emails
@@ -21,17 +84,13 @@ class GraphEmailBackend(BaseEmailBackend):
         self.client_secret = settings.GRAPH_CLIENT_SECRET
         self.tenant_id = settings.GRAPH_TENANT_ID
         self.from_email = settings.DEFAULT_FROM_EMAIL
+        self.api_url = getattr(settings, "GRAPH_API_URL", DEFAULT_GRAPH_API_URL).rstrip("/")
+        self.session = get_session()
 
     def get_access_token(self):
-        """Get access token using client credentials flow"""
-        authority = f"https://login.microsoftonline.com/{self.tenant_id}"
-        app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=authority,
-            client_credential=self.client_secret,
-        )
-
-        result = app.acquire_token_for_client(scopes=["https://graph.microsoft.com/.default"])
+        """Get access token using client credentials flow (served from the MSAL cache when valid)"""
+        app = get_msal_app(self.client_id, self.client_secret, self.tenant_id)
+        result = app.acquire_token_for_client(scopes=GRAPH_SCOPES)
 
         if "access_token" in result:
             return result["access_token"]
@@ -39,10 +98,109 @@ class GraphEmailBackend(BaseEmailBackend):
             error = result.get("error_description", result.get("error"))
             raise Exception(f"Failed to acquire token: {error}")
 
+    def build_graph_message(self, message):
+        """Convert a Django EmailMessage to a Graph sendMail request body"""
+        # Check if there's an HTML alternative
+        html_body = None
+        if hasattr(message, 'alternatives') and message.alternatives:
+            for content, mimetype in message.alternatives:
+                if mimetype == 'text/html':
+                    html_body = content
+                    break
+
+        # Determine content type - check alternatives first, then content_subtype
+        if html_body:
+            body_content = html_body
+            body_type = "HTML"
+        elif hasattr(message, 'content_subtype') and message.content_subtype == 'html':
+            body_content = message.body
+            body_type = "HTML"
+        else:
+            body_content = message.body
+            body_type = "Text"
+
+        graph_message = {
+            "message": {
+                "subject": message.subject,
+                "body": {
+                    "contentType": body_type,
+                    "content": body_content
+                },
+                "toRecipients": [
+                    {"emailAddress": {"address": addr}} for addr in message.to
+                ],
+            }
+        }
+
+        # Add CC recipients if present
+        if message.cc:
+            graph_message["message"]["ccRecipients"] = [
+                {"emailAddress": {"address": addr}} for addr in message.cc
+            ]
+
+        # Add BCC recipients if present
+        if message.bcc:
+            graph_message["message"]["bccRecipients"] = [
+                {"emailAddress": {"address": addr}} for addr in message.bcc
+            ]
+
+        # Add attachments if present
+        if hasattr(message, 'attachments') and message.attachments:
+            graph_message["message"]["attachments"] = [
+                self.build_graph_attachment(attachment, idx)
+                for idx, attachment in enumerate(message.attachments)
+            ]
+
+        return graph_message
+
+    def build_graph_attachment(self, attachment, idx):
+        """Convert a MIME part or (filename, content, mimetype) tuple to a Graph fileAttachment"""
+        if hasattr(attachment, 'get_payload'):
+            # MIMEImage or similar MIME object
+            filename = attachment.get_filename() or f"attachment{idx}"
+            content_type = attachment.get_content_type()
+            content_id = attachment.get('Content-ID', '').strip('<>')
+            if attachment.get('Content-Transfer-Encoding', '').lower() == 'base64':
+                # Already encoded (e.g. by the email asset cache), just drop the line breaks
+                content_bytes = ''.join(attachment.get_payload().split())
+            else:
+                content_bytes = base64.b64encode(attachment.get_payload(decode=True)).decode()
+        else:
+            filename, content, content_type = attachment
+            content_id = ''
+            if isinstance(content, str):
+                content = content.encode()
+            content_bytes = base64.b64encode(content).decode()
+            content_type = content_type or 'application/octet-stream'
+
+        att_data = {
+            "@odata.type": "#microsoft.graph.fileAttachment",
+            "name": filename,
+            "contentType": content_type,
+            "contentBytes": content_bytes,
+            "isInline": bool(content_id)
+        }
+        if content_id:
+            att_data["contentId"] = content_id
+        return att_data
+
     def send_messages(self, email_messages):
         """Send email messages using Microsoft Graph API"""
+        errors = self.send_messages_with_results(email_messages)
+        failures = [error for error in errors if error]
+        if failures and not self.fail_silently:
+            raise Exception(f"Failed to send {len(failures)} email(s): {failures[0]}")
+        return len(errors) - len(failures)
+
+    def send_messages_with_results(self, email_messages):
+        """
+        Send email messages and report how each one went.
+
+        Returns:
+            list: None for every message sent, else the error message, in the order given
+        """
         if not email_messages:
-            return 0
+            return []
 
         try:
             access_token = self.get_access_token()
@@ -50,117 +208,137 @@ class GraphEmailBackend(BaseEmailBackend):
             logger.error(f"[GRAPH API] Failed to get access token: {e}")
             if not self.fail_silently:
                 raise
-            return 0
+            return [str(e)] * len(email_messages)
 
-        sent_count = 0
-
-        for message in email_messages:
+        errors = [None] * len(email_messages)
+        batched = []
+        single = []
+        for index, message in enumerate(email_messages):
             try:
-                # Prepare the email message for Graph API
-                # Check if there's an HTML alternative
-                html_body = None
-                if hasattr(message, 'alternatives') and message.alternatives:
-                    for content, mimetype in message.alternatives:
-                        if mimetype == 'text/html':
-                            html_body = content
-                            break
-
-                # Determine content type - check alternatives first, then content_subtype
-                if html_body:
-                    body_content = html_body
-                    body_type = "HTML"
-                    logger.info(f"[GRAPH API] Using HTML body from alternatives ({len(html_body)} chars)")
-                elif hasattr(message, 'content_subtype') and message.content_subtype == 'html':
-                    body_content = message.body
-                    body_type = "HTML"
-                    logger.info(f"[GRAPH API] Using HTML body from content_subtype")
-                else:
-                    body_content = message.body
-                    body_type = "Text"
-                    logger.info(f"[GRAPH API] Using plain text body")
-
-                graph_message = {
-                    "message": {
-                        "subject": message.subject,
-                        "body": {
-                            "contentType": body_type,
-                            "content": body_content
-                        },
-                        "toRecipients": [
-                            {"emailAddress": {"address": addr}} for addr in message.to
-                        ],
+                graph_message = self.build_graph_message(message)
+            except Exception as e:
+                logger.error(f"[GRAPH API] Error preparing email: {e}")
+                if not self.fail_silently:
+                    raise
+                errors[index] = f"Error preparing email: {e}"
+                continue
+
+            # Determine which email to send from
+            from_address = message.from_email or self.from_email
+            request = (index, message, from_address, graph_message)
+            if len(json.dumps(graph_message)) > MAX_BATCH_PAYLOAD_BYTES:
+                single.append(request)
+            else:
+                batched.append(request)
+
+        for start in range(0, len(batched), BATCH_SIZE):
+            for index, error in self._send_batch(batched[start:start + BATCH_SIZE], access_token).items():
+                errors[index] = error
+        for request in single:
+            errors[request[0]] = self._send_single(request, access_token)
+
+        return errors
+
+    def _post(self, url, payload, access_token):
+        """POST with retries on throttling; returns the final response"""
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json"
+        }
+        for attempt in range(MAX_RETRIES + 1):
+            response = self.session.post(url, json=payload, headers=headers, timeout=30)
+            if response.status_code not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                return response
+            delay = retry_after_seconds(response.headers)
+            logger.warning(f"[GRAPH API] Throttled ({response.status_code}), retrying in {delay}s")
+            time.sleep(delay)
+        return response
+
+    def _send_single(self, request, access_token):
+        """Send one message with sendMail; returns None or the error message"""
+        _, message, from_address, graph_message = request
+        endpoint = f"{self.api_url}/users/{from_address}/sendMail"
+        logger.info(f"[GRAPH API] Sending email to: {', '.join(message.to)}")
+
+        try:
+            response = self._post(endpoint, graph_message, access_token)
+        except requests.RequestException as e:
+            logger.error(f"[GRAPH API] Error sending email: {e}")
+            return str(e)
+
+        if response.status_code == 202:
+            logger.info(f"[GRAPH API] Successfully sent email to {', '.join(message.to)}")
+            return None
+        error_msg = f"Failed to send email: {response.status_code} - {response.text}"
+        logger.error(f"[GRAPH API] {error_msg}")
+        return error_msg
+
+    def _send_batch(self, requests_chunk, access_token):
+        """
+        Send up to BATCH_SIZE messages in one $batch call. Sub-requests that
+        are throttled are resent after the longest Retry-After they returned.
+
+        Returns:
+            dict: message index -> None if sent, else the error message
+        """
+        pending = {str(request[0]): request for request in requests_chunk}
+        results = {}
+
+        for attempt in range(MAX_RETRIES + 1):
+            batch = {
+                "requests": [
+                    {
+                        "id": request_id,
+                        "method": "POST",
+                        "url": f"/users/{from_address}/sendMail",
+                        "headers": {"Content-Type": "application/json"},
+                        "body": graph_message,
                     }
-                }
-
-                # Add CC recipients if present
-                if message.cc:
-                    graph_message["message"]["ccRecipients"] = [
-                        {"emailAddress": {"address": addr}} for addr in message.cc
-                    ]
-
-                # Add BCC recipients if present
-                if message.bcc:
-                    graph_message["message"]["bccRecipients"] = [
-                        {"emailAddress": {"address": addr}} for addr in message.bcc
-                    ]
-
-                # Add attachments if present
-                if hasattr(message, 'attachments') and message.attachments:
-                    import base64
-                    graph_message["message"]["attachments"] = []
-                    logger.info(f"[GRAPH API] Processing {len(message.attachments)} attachments")
-
-                    for idx, attachment in enumerate(message.attachments):
-                        logger.info(f"[GRAPH API] Attachment {idx}: type={type(attachment)}")
-
-                        if hasattr(attachment, 'get_payload'):
-                            # MIMEImage or similar MIME object
-                            content = attachment.get_payload(decode=True)
-                            filename = attachment.get_filename() or f"attachment{idx}"
-                            content_type = attachment.get_content_type()
-                            content_id = attachment.get('Content-ID', '').strip('<>')
-
-                            logger.info(f"[GRAPH API]   filename={filename}, content_type={content_type}, content_id={content_id}")
-
-                            att_data = {
-                                "@odata.type": "#microsoft.graph.fileAttachment",
-                                "name": filename,
-                                "contentType": content_type,
-                                "contentBytes": base64.b64encode(content).decode(),
-                                "isInline": bool(content_id)
-                            }
-                            if content_id:
-                                att_data["contentId"] = content_id
-
-                            graph_message["message"]["attachments"].append(att_data)
-                            logger.info(f"[GRAPH API]   Added attachment successfully")
-
-                # Determine which email to send from
-                from_address = message.from_email or self.from_email
-
-                # Send email via Graph API
-                endpoint = f"https://graph.microsoft.com/v1.0/users/{from_address}/sendMail"
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Content-Type": "application/json"
-                }
-
-                logger.info(f"[GRAPH API] Sending email to: {', '.join(message.to)}")
-
-                response = requests.post(endpoint, json=graph_message, headers=headers)
-
-                if response.status_code == 202:
+                    for request_id, (_, message, from_address, graph_message) in pending.items()
+                ]
+            }
+            logger.info(f"[GRAPH API] Sending batch of {len(pending)} email(s)")
+
+            try:
+                response = self._post(f"{self.api_url}/$batch", batch, access_token)
+            except requests.RequestException as e:
+                logger.error(f"[GRAPH API] Error sending batch: {e}")
+                results.update((request[0], str(e)) for request in pending.values())
+                return results
+
+            if response.status_code != 200:
+                error_msg = f"Failed to send batch: {response.status_code} - {response.text}"
+                logger.error(f"[GRAPH API] {error_msg}")
+                results.update((request[0], error_msg) for request in pending.values())
+                return results
+
+            retry = {}
+            delay = 0
+            for result in response.json().get("responses", []):
+                request_id = str(result.get("id"))
+                if request_id not in pending:
+                    continue
+                index, message = pending[request_id][:2]
+                status = result.get("status")
+                if status == 202:
+                    results[index] = None
                     logger.info(f"[GRAPH API] Successfully sent email to {', '.join(message.to)}")
-                    sent_count += 1
+                elif status in RETRYABLE_STATUSES and attempt < MAX_RETRIES:
+                    retry[request_id] = pending[request_id]
+                    delay = max(delay, retry_after_seconds(result.get("headers")))
                 else:
-                    error_msg = f"Failed to send email: {response.status_code} - {response.text}"
+                    error_msg = f"Failed to send email to {', '.join(message.to)}: {status} - {result.get('body')}"
                     logger.error(f"[GRAPH API] {error_msg}")
-                    if not self.fail_silently:
-                        raise Exception(error_msg)
+                    results[index] = error_msg
 
-            except Exception as e:
-                logger.error(f"[GRAPH API] Error sending email: {e}")
-                if not self.fail_silently:
-                    raise
+            for index, message, _, _ in pending.values():
+                if index not in results and str(index) not in retry:
+                    results[index] = f"No batch response for email to {', '.join(message.to)}"
+
+            if not retry:
+                break
+            logger.warning(f"[GRAPH API] {len(retry)} email(s) throttled, retrying in {delay}s")
+            time.sleep(delay)
+            pending = retry
 
-        return sent_count
+        return results
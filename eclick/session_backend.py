@@ -0,0 +1,87 @@
+"""
+Write-through cached session engine with lazy writes.
+
+Sessions are read from the cache and fall back to the database, like Django's
+cached_db engine, but the database row is only written when the session data
+actually changed or when the expiry is due for a refresh. Expiry is refreshed
+at a coarse interval (SESSION_REFRESH_INTERVAL seconds) instead of on every
+request, so browsing pages no longer issues an UPDATE per request.
+
+Usage in settings:
+    SESSION_ENGINE = 'eclick.session_backend'
+    SESSION_SAVE_EVERY_REQUEST = False
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.utils import timezone
+
+REFRESHED_AT_KEY = '_refreshed_at'
+
+
+def get_refresh_interval():
+    """Seconds between expiry refreshes, defaults to a tenth of the session age"""
+    return getattr(settings, 'SESSION_REFRESH_INTERVAL', settings.SESSION_COOKIE_AGE // 10)
+
+
+class SessionStore(CachedDBStore):
+    def __init__(self, session_key=None):
+        super().__init__(session_key)
+        self._loaded_digest = None
+
+    @staticmethod
+    def _digest(session_data):
+        """Stable fingerprint of the session contents"""
+        payload = json.dumps(session_data, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def load(self):
+        session_data = super().load()
+        if not session_data:
+            return session_data
+
+        self._loaded_digest = self._digest(session_data)
+
+        # Slide the expiry forward only once per refresh interval
+        refreshed_at = session_data.get(REFRESHED_AT_KEY, 0)
+        if time.time() - refreshed_at >= get_refresh_interval():
+            session_data[REFRESHED_AT_KEY] = int(time.time())
+            self.modified = True
+
+        return session_data
+
+    def save(self, must_create=False):
+        if not must_create and self.session_key is not None and self._loaded_digest is not None:
+            if self._digest(self._get_session()) == self._loaded_digest:
+                # Nothing changed since load, skip the cache and database writes
+                return
+
+        data = self._get_session(no_load=must_create)
+        data.setdefault(REFRESHED_AT_KEY, int(time.time()))
+        super().save(must_create=must_create)
+        self._loaded_digest = self._digest(data)
+
+    @classmethod
+    def clear_expired(cls, batch_size=1000):
+        """
+        Delete expired sessions in primary-key batches so the sessions table
+        is never locked by one large DELETE.
+
+        Returns:
+            int: Number of deleted rows
+        """
+        model = cls.get_model_class()
+        now = timezone.now()
+        deleted = 0
+        while True:
+            batch = list(
+                model.objects.filter(expire_date__lt=now)
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not batch:
+                return deleted
+            model.objects.filter(pk__in=batch).delete()
+            deleted += len(batch)
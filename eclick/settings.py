@@ -71,6 +71,7 @@ RECAPTCHA_REQUIRED_SCORE = 0.85  # For v3, not used in v2
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'home.rate_limit.RateLimitMiddleware',  # Shed abusive traffic before sessions hit the DB
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -78,6 +79,13 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Per-endpoint rate limit overrides: policy name -> (requests, window seconds)
+# Defaults are declared on the views with @rate_limit
+RATE_LIMITS = {}
+
+# Reverse proxies whose X-Real-IP header rate limiting trusts (nginx runs on this host)
+RATE_LIMIT_TRUSTED_PROXIES = ['127.0.0.1', '::1']
+
 ROOT_URLCONF = 'eclick.urls'
 
 TEMPLATES = [
@@ -154,6 +162,13 @@ STATICFILES_DIRS = [
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Rendered report charts (donuts, Gantt images), see home.chart_cache.
+# Defaults to a directory in the system temp dir when unset.
+CHART_CACHE_DIR = os.getenv('CHART_CACHE_DIR', '')
+# Pre-render the donuts in the first gunicorn worker (gunicorn.conf.py). Off by
+# default: deployments run `python manage.py prerender_charts` instead.
+CHART_CACHE_PRERENDER = os.getenv('CHART_CACHE_PRERENDER', 'False') == 'True'
+
 # Security Headers Configuration
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
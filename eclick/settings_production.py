@@ -42,6 +42,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # For static files
+    'home.rate_limit.RateLimitMiddleware',  # Shed abusive traffic before sessions hit the DB
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -49,6 +50,13 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Per-endpoint rate limit overrides: policy name -> (requests, window seconds)
+# Defaults are declared on the views with @rate_limit
+RATE_LIMITS = {}
+
+# Reverse proxies whose X-Real-IP header rate limiting trusts (nginx runs on this host)
+RATE_LIMIT_TRUSTED_PROXIES = ['127.0.0.1', '::1']
+
 ROOT_URLCONF = 'eclick.urls'
 
 TEMPLATES = [
@@ -93,6 +101,29 @@ DATABASES = {
     }
 }
 
+# Cache configuration
+# Use Redis when REDIS_URL is set, otherwise a file cache shared by all
+# gunicorn workers on this host (per-process memory caches would let workers
+# serve each other stale sessions)
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / 'cache')),
+            'TIMEOUT': 86400,
+            'OPTIONS': {
+                'MAX_ENTRIES': 20000,
+            },
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -144,8 +175,22 @@ SESSION_COOKIE_SECURE = True  # HTTPS required
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'
 SESSION_COOKIE_AGE = 86400  # 24 hours
-SESSION_SAVE_EVERY_REQUEST = True
-SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+# Sessions are cached in front of the DB and only written when they change;
+# expiry slides forward at most once per SESSION_REFRESH_INTERVAL
+SESSION_SAVE_EVERY_REQUEST = False
+SESSION_ENGINE = 'eclick.session_backend'
+SESSION_REFRESH_INTERVAL = 3600  # 1 hour
+
+# System monitoring: collect_system_metrics runs from cron every 5 minutes
+# */5 * * * * cd /var/www/eclick && python manage.py collect_system_metrics
+SYSTEM_METRICS_RETENTION = 288  # samples kept (24 hours)
+SYSTEM_METRICS_ALERT_THRESHOLDS = {'cpu_percent': 90, 'memory_percent': 90, 'disk_percent': 85}
+GUNICORN_PID_FILE = '/var/www/eclick/gunicorn.pid'
+
+# Expired OTPs are purged nightly
+# 30 3 * * * cd /var/www/eclick && python manage.py purge_expired_otps
+# Read notifications older than 90 days are archived weekly
+# 45 3 * * 0 cd /var/www/eclick && python manage.py archive_notifications --days 90
 
 # CSRF settings for HTTPS
 CSRF_COOKIE_SECURE = True
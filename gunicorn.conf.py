@@ -33,9 +33,19 @@ group = "www-data"
 tmp_upload_dir = "/tmp"
 
 # Worker process settings
+# The preloaded app does not import the plotting/PDF libraries; report code
+# loads them on first use (check with: python manage.py import_budget)
 preload_app = True
 worker_tmp_dir = "/dev/shm"  # Use shared memory for better performance
 
+
+def post_worker_init(worker):
+    """Pre-render the report donuts in the first worker only, never in the master"""
+    from django.conf import settings
+    if worker.age == 1 and getattr(settings, 'CHART_CACHE_PRERENDER', False):
+        from home.chart_cache import prerender_donuts_in_background
+        prerender_donuts_in_background()
+
 # Security settings
 limit_request_line = 4094
 limit_request_fields = 100
@@ -1,6 +1,5 @@
 from django.contrib import admin
-from django.db.models import Q
-from .models import Project, Task, SubTask, UserProfile, Client, ClientOTP, UserOTP, Notification, TaskUpdate, SystemLog, TaskComment, SubTaskComment, ChatbotFeedback
+from .models import Project, Task, SubTask, UserProfile, Client, ClientOTP, UserOTP, Notification, NotificationArchive, TaskUpdate, SystemLog, TaskComment, SubTaskComment, ChatbotFeedback
 
 # Register your models here.
 
@@ -46,23 +45,16 @@ class ClientAdmin(admin.ModelAdmin):
     
     def cleanup_orphaned_clients(self, request, queryset):
         """Clean up clients that are not associated with any projects"""
-        from .models import Project
-
         cleaned_count = 0
-        for client in queryset:
-            # Check if this client is associated with any active projects (old or new method)
-            has_active_projects = Project.objects.filter(
-                Q(client_email=client.email) | Q(clients=client)
-            ).exists()
-
-            if not has_active_projects:
-                # Delete related OTPs first
-                from .models import ClientOTP
-                ClientOTP.objects.filter(client=client).delete()
-
-                # Delete the client
-                client.delete()
-                cleaned_count += 1
+        # Clients without a row in the client/project link table (see home.client_links)
+        for client in queryset.filter(project_links__isnull=True):
+            # Delete related OTPs first
+            from .models import ClientOTP
+            ClientOTP.objects.filter(client=client).delete()
+
+            # Delete the client
+            client.delete()
+            cleaned_count += 1
         
         if cleaned_count > 0:
             self.message_user(request, f"Successfully cleaned up {cleaned_count} orphaned client records.")
@@ -74,7 +66,7 @@ class ClientAdmin(admin.ModelAdmin):
 
 @admin.register(ClientOTP)
 class ClientOTPAdmin(admin.ModelAdmin):
-    list_display = ['client', 'otp', 'is_used', 'expires_at', 'created_at']
+    list_display = ['client', 'is_used', 'expires_at', 'created_at']
     list_filter = ['is_used', 'expires_at', 'created_at']
     search_fields = ['client__username', 'client__email']
     readonly_fields = ['created_at']
@@ -83,7 +75,7 @@ class ClientOTPAdmin(admin.ModelAdmin):
 
 @admin.register(UserOTP)
 class UserOTPAdmin(admin.ModelAdmin):
-    list_display = ['user', 'otp', 'is_used', 'expires_at', 'created_at']
+    list_display = ['user', 'is_used', 'expires_at', 'created_at']
     list_filter = ['is_used', 'expires_at', 'created_at']
     search_fields = ['user__username', 'user__email']
     readonly_fields = ['created_at']
@@ -100,16 +92,24 @@ class NotificationAdmin(admin.ModelAdmin):
     actions = ['mark_as_read', 'mark_as_unread', 'delete_selected']
     
     def mark_as_read(self, request, queryset):
-        queryset.update(is_read=True)
-        self.message_user(request, f"{queryset.count()} notifications marked as read.")
+        updated = queryset.update(is_read=True)
+        self.message_user(request, f"{updated} notifications marked as read.")
     mark_as_read.short_description = "Mark selected notifications as read"
     
     def mark_as_unread(self, request, queryset):
-        queryset.update(is_read=False)
-        self.message_user(request, f"{queryset.count()} notifications marked as unread.")
+        updated = queryset.update(is_read=False)
+        self.message_user(request, f"{updated} notifications marked as unread.")
     mark_as_unread.short_description = "Mark selected notifications as unread"
 
 
+@admin.register(NotificationArchive)
+class NotificationArchiveAdmin(admin.ModelAdmin):
+    list_display = ['recipient', 'notification_type', 'title', 'created_at', 'archived_at']
+    list_filter = ['notification_type', 'created_at']
+    search_fields = ['title', 'message', 'recipient__username']
+    readonly_fields = ['archived_at']
+
+
 @admin.register(TaskComment)
 class TaskCommentAdmin(admin.ModelAdmin):
     list_display = ['user', 'task', 'is_admin_response', 'created_at', 'comment_preview']
@@ -1,16 +1,67 @@
+import hashlib
 import re
 import time
+from collections import OrderedDict
 from difflib import SequenceMatcher
 from typing import List, Tuple, Optional
+from django.core.cache import cache
 from django.db import models
 from .models import AIKnowledgeBase, AIConversation, AILearningMetrics
 
+# Shared across workers so every process notices knowledge base changes
+KNOWLEDGE_VERSION_KEY = 'ai_knowledge_version'
+ANSWER_CACHE_HITS_KEY = 'ai_answer_cache_hits'
+ANSWER_CACHE_MISSES_KEY = 'ai_answer_cache_misses'
+# Hit/miss counts are kept in process and added to the shared counters in batches
+ANSWER_CACHE_FLUSH_EVERY = 50
+ANSWER_CACHE_FLUSH_SECONDS = 30
+
+
+def _incr_counter(key, delta=1):
+    """Atomically add to a shared counter"""
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key, delta)
+    except ValueError:
+        cache.set(key, delta, None)
+
+
+def get_knowledge_version() -> int:
+    """Current knowledge base version, one cache round trip once it is set"""
+    version = cache.get(KNOWLEDGE_VERSION_KEY)
+    if version is None:
+        cache.add(KNOWLEDGE_VERSION_KEY, 1, None)
+        version = cache.get(KNOWLEDGE_VERSION_KEY, 1)
+    return version
+
+
+def bump_knowledge_version() -> int:
+    """Mark the knowledge base as changed so search indexes are rebuilt"""
+    cache.add(KNOWLEDGE_VERSION_KEY, 1, None)
+    try:
+        return cache.incr(KNOWLEDGE_VERSION_KEY)
+    except ValueError:
+        cache.set(KNOWLEDGE_VERSION_KEY, 2, None)
+        return 2
+
+
 class LocalAIService:
     """Local AI service that learns from conversations and provides intelligent responses"""
     
     def __init__(self):
         self.min_confidence_threshold = 0.6
         self.max_response_time = 2.0  # seconds
+        # In-process search index: list of (normalized_question, entry)
+        self._index = []
+        self._index_version = None
+        # In-process LRU of answers keyed on the normalized question, backed
+        # by the Django cache so workers share answers they already computed
+        self.answer_cache_size = 1000
+        self.answer_cache_timeout = 3600  # seconds
+        self._answer_cache = OrderedDict()
+        self._answer_cache_version = None
+        self._pending_counts = {ANSWER_CACHE_HITS_KEY: 0, ANSWER_CACHE_MISSES_KEY: 0}
+        self._counts_flushed_at = time.time()
     
     def get_response(self, question: str, user_id: str = None, session_id: str = None) -> Tuple[str, float, float]:
         """
@@ -23,20 +74,35 @@ class LocalAIService:
             # Clean and normalize the question
             normalized_question = self._normalize_text(question)
             
-            # Search knowledge base for best match
-            best_match = self._find_best_match(normalized_question)
+            # Read once per question, the answer cache and the index both depend on it
+            version = get_knowledge_version()
             
-            if best_match and best_match[1] >= self.min_confidence_threshold:
-                answer = best_match[0].answer
-                confidence = best_match[1]
-                
-                # Update usage count
-                best_match[0].usage_count += 1
-                best_match[0].save()
+            # Repeated questions are answered from the cache
+            cached = self._get_cached_answer(normalized_question, version)
+            if cached:
+                entry_id, answer, confidence = cached
             else:
-                # Generate a learning response
-                answer = self._generate_learning_response(question)
-                confidence = 0.3
+                # Search knowledge base for best match
+                best_match = self._find_best_match(normalized_question, version)
+                
+                if best_match and best_match[1] >= self.min_confidence_threshold:
+                    entry_id = best_match[0].pk
+                    answer = best_match[0].answer
+                    confidence = best_match[1]
+                    best_match[0].usage_count += 1
+                else:
+                    # Generate a learning response
+                    entry_id = None
+                    answer = self._generate_learning_response(question)
+                    confidence = 0.3
+                
+                self._cache_answer(normalized_question, entry_id, answer, confidence)
+            
+            if entry_id:
+                # Update usage count without rewriting the whole row
+                AIKnowledgeBase.objects.filter(pk=entry_id).update(
+                    usage_count=models.F('usage_count') + 1
+                )
             
             response_time = time.time() - start_time
             
@@ -50,6 +116,79 @@ class LocalAIService:
             response_time = time.time() - start_time
             return "I'm having trouble right now, but I'm here to help! Please try again.", 0.1, response_time
     
+    def _answer_cache_key(self, normalized_question: str, version: int) -> str:
+        digest = hashlib.sha1(normalized_question.encode('utf-8')).hexdigest()
+        return f'ai_answer:{version}:{digest}'
+
+    def _get_cached_answer(self, normalized_question: str, version: int) -> Optional[Tuple[Optional[int], str, float]]:
+        """
+        Look up an answer in the local LRU, then in the shared cache.
+        Returns (entry_id, answer, confidence) or None on a miss.
+        """
+        if version != self._answer_cache_version:
+            # Knowledge base changed, every cached answer may be stale
+            self._answer_cache.clear()
+            self._answer_cache_version = version
+        
+        cached = self._answer_cache.get(normalized_question)
+        if cached is None:
+            cached = cache.get(self._answer_cache_key(normalized_question, version))
+            if cached is not None:
+                self._remember_answer(normalized_question, cached)
+        else:
+            self._answer_cache.move_to_end(normalized_question)
+        
+        self._count_lookup(cached is not None)
+        return cached
+
+    def _count_lookup(self, hit: bool):
+        """Count a lookup locally, adding the counts to the shared counters now and then"""
+        self._pending_counts[ANSWER_CACHE_HITS_KEY if hit else ANSWER_CACHE_MISSES_KEY] += 1
+        if (
+            sum(self._pending_counts.values()) >= ANSWER_CACHE_FLUSH_EVERY
+            or time.time() - self._counts_flushed_at >= ANSWER_CACHE_FLUSH_SECONDS
+        ):
+            self._flush_counts()
+
+    def _flush_counts(self):
+        for key, count in self._pending_counts.items():
+            if count:
+                _incr_counter(key, count)
+                self._pending_counts[key] = 0
+        self._counts_flushed_at = time.time()
+
+    def _cache_answer(self, normalized_question: str, entry_id: Optional[int], answer: str, confidence: float):
+        """Store an answer in the local LRU and the shared cache"""
+        value = (entry_id, answer, confidence)
+        self._remember_answer(normalized_question, value)
+        cache.set(
+            self._answer_cache_key(normalized_question, self._answer_cache_version),
+            value,
+            self.answer_cache_timeout
+        )
+
+    def _remember_answer(self, normalized_question: str, value: tuple):
+        """Insert into the local LRU, evicting the least recently used answers"""
+        self._answer_cache[normalized_question] = value
+        self._answer_cache.move_to_end(normalized_question)
+        while len(self._answer_cache) > self.answer_cache_size:
+            self._answer_cache.popitem(last=False)
+
+    def get_answer_cache_stats(self) -> dict:
+        """Answer cache hit ratio across all workers (other workers' latest lookups may not be counted yet)"""
+        self._flush_counts()
+        counts = cache.get_many([ANSWER_CACHE_HITS_KEY, ANSWER_CACHE_MISSES_KEY])
+        hits = counts.get(ANSWER_CACHE_HITS_KEY, 0)
+        misses = counts.get(ANSWER_CACHE_MISSES_KEY, 0)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / lookups * 100, 2) if lookups else 0,
+            'local_size': len(self._answer_cache),
+            'max_size': self.answer_cache_size,
+        }
+
     def _normalize_text(self, text: str) -> str:
         """Normalize text for better matching"""
         # Convert to lowercase
@@ -60,18 +199,34 @@ class LocalAIService:
         text = ' '.join(text.split())
         return text
     
-    def _find_best_match(self, question: str) -> Optional[Tuple[AIKnowledgeBase, float]]:
+    def rebuild_index(self):
+        """Reload the search index from the database and tell other workers to do the same"""
+        self._index_version = bump_knowledge_version()
+        self._load_index()
+
+    def _load_index(self):
+        """Normalize every knowledge base question once and keep it in memory"""
+        self._index = [
+            (self._normalize_text(entry.question), entry)
+            for entry in AIKnowledgeBase.objects.all()
+        ]
+
+    def _get_index(self, version: Optional[int] = None):
+        """Return the search index, reloading it if the knowledge base changed"""
+        if version is None:
+            version = get_knowledge_version()
+        if version != self._index_version:
+            self._index_version = version
+            self._load_index()
+        return self._index
+
+    def _find_best_match(self, question: str, version: Optional[int] = None) -> Optional[Tuple[AIKnowledgeBase, float]]:
         """Find the best matching knowledge base entry"""
         try:
             best_match = None
             best_score = 0.0
             
-            # Get all knowledge base entries
-            entries = AIKnowledgeBase.objects.all()
-            
-            for entry in entries:
-                normalized_entry = self._normalize_text(entry.question)
-                
+            for normalized_entry, entry in self._get_index(version):
                 # Calculate similarity score
                 similarity = SequenceMatcher(None, question, normalized_entry).ratio()
                 
@@ -165,13 +320,13 @@ class LocalAIService:
         try:
             normalized_question = self._normalize_text(question)
             
-            for entry in AIKnowledgeBase.objects.all():
-                normalized_entry = self._normalize_text(entry.question)
+            for normalized_entry, entry in self._get_index():
                 similarity = SequenceMatcher(None, normalized_question, normalized_entry).ratio()
                 
                 if similarity > 0.7:  # High similarity
                     entry.confidence_score = min(1.0, entry.confidence_score + 0.1)
-                    entry.save()
+                    # usage_count of indexed entries is stale (get_response bumps it with F()), never write it back
+                    entry.save(update_fields=['confidence_score', 'updated_at'])
         except Exception:
             pass
     
@@ -187,21 +342,25 @@ class LocalAIService:
                 entry = existing[0]
                 entry.answer = answer
                 entry.confidence_score = min(1.0, entry.confidence_score + 0.1)
-                entry.usage_count += 1
                 if category:
                     entry.category = category
                 if tags:
                     entry.tags = tags
-                entry.save()
+                entry.save(update_fields=['answer', 'confidence_score', 'category', 'tags', 'updated_at'])
+                AIKnowledgeBase.objects.filter(pk=entry.pk).update(usage_count=models.F('usage_count') + 1)
             else:
                 # Create new entry
-                AIKnowledgeBase.objects.create(
+                entry = AIKnowledgeBase.objects.create(
                     question=question,
                     answer=answer,
                     confidence_score=0.7,  # Start with good confidence
                     category=category,
                     tags=tags or []
                 )
+                self._index.append((normalized_question, entry))
+            
+            # The local index already reflects this change, only other workers need to reload
+            self._index_version = get_knowledge_version()
         except Exception:
             # Silently fail if we can't add knowledge
             pass
@@ -216,7 +375,8 @@ class LocalAIService:
                 'success_rate': (metrics.successful_responses / metrics.total_conversations * 100) if metrics.total_conversations > 0 else 0,
                 'average_response_time': round(metrics.average_response_time, 2),
                 'knowledge_base_size': metrics.knowledge_base_size,
-                'last_updated': metrics.last_updated
+                'last_updated': metrics.last_updated,
+                'answer_cache': self.get_answer_cache_stats()
             }
         except AILearningMetrics.DoesNotExist:
             return {
@@ -225,7 +385,8 @@ class LocalAIService:
                 'success_rate': 0,
                 'average_response_time': 0,
                 'knowledge_base_size': 0,
-                'last_updated': None
+                'last_updated': None,
+                'answer_cache': self.get_answer_cache_stats()
             }
     
     def initialize_knowledge_base(self):
@@ -6,4 +6,4 @@ class HomeConfig(AppConfig):
     name = 'home'
     
     def ready(self):
-        import home.signals
\ No newline at end of file
+        import home.signals
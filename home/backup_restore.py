@@ -0,0 +1,282 @@
+"""
+Fast, transactional restore of dumpdata JSON backups.
+
+Replaces `flush` + `loaddata`: the archive is streamed instead of loaded whole,
+rows are inserted per model in multi-row batches with raw inserts (no model
+save(), no signals such as Task.save() date recalculation or the
+cleanup_orphaned_clients receiver), and the whole restore runs in a single
+transaction so a failure leaves the current data untouched. Derived tables
+(client/project links, search index) and project dates are rebuilt from the
+restored rows.
+"""
+import hashlib
+import json
+import logging
+import time
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.management.color import no_style
+from django.core.serializers.python import Deserializer as PythonDeserializer
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+logger = logging.getLogger(__name__)
+
+# Tables that are neither backed up nor cleared on restore
+PRESERVED_MODELS = ('contenttypes.contenttype', 'auth.permission', 'sessions.session')
+
+# Tables computed from other tables: rows found in a backup are ignored and
+# the tables are rebuilt from the restored data, so backups taken before they
+# existed restore with working client links and search
+DERIVED_MODELS = ('home.clientprojectlink', 'home.searchdocument', 'home.searchtoken')
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """SHA256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_backup_objects(path, chunk_size=1 << 20):
+    """
+    Yield the objects of a dumpdata JSON array one at a time without loading
+    the whole file into memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    started = False
+
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            buffer += chunk
+            pos = 0
+
+            while True:
+                # Skip whitespace and separators between objects
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if not started:
+                    if buffer[pos] != '[':
+                        raise ValueError('Backup file is not a JSON array')
+                    started = True
+                    pos += 1
+                    continue
+                if buffer[pos] == ']':
+                    return
+                try:
+                    obj, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # Object continues in the next chunk
+                    break
+                yield obj
+
+            buffer = buffer[pos:]
+            if not chunk:
+                if buffer.strip() or not started:
+                    raise ValueError('Backup file is malformed or truncated')
+                return
+
+
+def dependency_order(models):
+    """Sort models so that every model comes after the models it references"""
+    model_set = set(models)
+    ordered = []
+    visiting = set()
+
+    def visit(model):
+        if model in ordered or model in visiting:
+            return
+        visiting.add(model)
+        for field in model._meta.local_fields:
+            related = field.related_model if field.is_relation else None
+            if related in model_set and related is not model:
+                visit(related)
+        visiting.discard(model)
+        ordered.append(model)
+
+    for model in models:
+        visit(model)
+    return ordered
+
+
+class BackupRestoreEngine:
+    """Restore a dumpdata JSON backup with bulk inserts in one transaction"""
+
+    def __init__(self, using=DEFAULT_DB_ALIAS, batch_size=1000, progress=None):
+        self.using = using
+        self.batch_size = batch_size
+        self.progress = progress  # callable(message)
+        self.connection = connections[using]
+
+    def restore(self, path, dry_run=False):
+        """
+        Restore the backup at `path`.
+
+        Args:
+            path (str): dumpdata JSON file
+            dry_run (bool): only parse and validate the backup
+
+        Returns:
+            dict: rows per model, total rows, skipped rows, elapsed seconds and rows/s
+        """
+        self._started = time.time()
+        self._counts = {}
+        self._skipped = 0
+
+        if dry_run:
+            for deserialized in self._deserialize(path):
+                label = deserialized.object._meta.label
+                self._counts[label] = self._counts.get(label, 0) + 1
+                for related_pks in (deserialized.m2m_data or {}).values():
+                    self._counts[f'{label} (m2m)'] = self._counts.get(f'{label} (m2m)', 0) + len(related_pks)
+            return self._result(dry_run=True)
+
+        models = self._restorable_models()
+        with transaction.atomic(using=self.using):
+            with self.connection.constraint_checks_disabled():
+                self._clear(models)
+                self._insert_all(path)
+            # Validate every foreign key once, after all rows are in place
+            self.connection.check_constraints(
+                table_names=[model._meta.db_table for model in models]
+            )
+            self._reset_sequences(models)
+            self._rebuild_derived()
+
+        # Every cached value was derived from the old data
+        cache.clear()
+
+        result = self._result(dry_run=False)
+        logger.info(
+            f"Restored {result['total_rows']} rows from {path} in {result['elapsed']}s "
+            f"({result['rows_per_second']} rows/s)"
+        )
+        return result
+
+    def _restorable_models(self):
+        """Concrete tables that dumpdata backs up, in dependency order"""
+        models = [
+            model for model in apps.get_models(include_auto_created=True)
+            if model._meta.managed
+            and not model._meta.proxy
+            and model._meta.label_lower not in PRESERVED_MODELS
+        ]
+        return dependency_order(models)
+
+    def _clear(self, models):
+        """Delete current rows with plain DELETEs (no cascade collection, no signals)"""
+        quote_name = self.connection.ops.quote_name
+        with self.connection.cursor() as cursor:
+            for model in reversed(models):
+                cursor.execute(f'DELETE FROM {quote_name(model._meta.db_table)}')
+
+    def _deserialize(self, path):
+        for deserialized in PythonDeserializer(
+            iter_backup_objects(path), using=self.using, ignorenonexistent=True
+        ):
+            label = deserialized.object._meta.label_lower
+            if label in PRESERVED_MODELS or label in DERIVED_MODELS:
+                self._skipped += 1
+                continue
+            yield deserialized
+
+    def _insert_all(self, path):
+        """Stream objects into per-model buckets and flush each bucket in batches"""
+        buckets = {}
+        m2m_buckets = {}
+
+        for deserialized in self._deserialize(path):
+            obj = deserialized.object
+            model = obj.__class__
+            bucket = buckets.setdefault(model, [])
+            bucket.append(obj)
+            if len(bucket) >= self.batch_size:
+                self._flush(model, bucket)
+
+            for field_name, related_pks in (deserialized.m2m_data or {}).items():
+                field = model._meta.get_field(field_name)
+                through = field.remote_field.through
+                source = through._meta.get_field(field.m2m_field_name()).attname
+                target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+                rows = m2m_buckets.setdefault(through, [])
+                rows.extend(through(**{source: obj.pk, target: pk}) for pk in related_pks)
+                if len(rows) >= self.batch_size:
+                    self._flush_m2m(through, rows)
+
+        for model in dependency_order(list(buckets)):
+            self._flush(model, buckets[model])
+        for through, rows in m2m_buckets.items():
+            self._flush_m2m(through, rows)
+
+    def _flush(self, model, objs):
+        """Insert objects as-is (raw, so auto_now fields keep their backed-up values)"""
+        if not objs:
+            return
+        fields = model._meta.local_concrete_fields
+        batch_size = self.connection.ops.bulk_batch_size(fields, objs) or len(objs)
+        batch_size = min(batch_size, self.batch_size)
+        for start in range(0, len(objs), batch_size):
+            model._base_manager._insert(
+                objs[start:start + batch_size], fields=fields, using=self.using, raw=True
+            )
+        self._count(model, len(objs))
+        objs.clear()
+
+    def _flush_m2m(self, through, rows):
+        if not rows:
+            return
+        through._base_manager.using(self.using).bulk_create(rows, batch_size=self.batch_size)
+        self._count(through, len(rows))
+        rows.clear()
+
+    def _rebuild_derived(self):
+        """
+        Recompute the DERIVED_MODELS tables from the restored rows, and the
+        project dates that Task.save() would have maintained
+        """
+        from .client_links import rebuild_links
+        from .project_dates import recalculate_project_dates
+        from .search_index import SOURCES, search_index
+
+        added, _ = rebuild_links(batch_size=self.batch_size)
+        self._count(apps.get_model('home', 'ClientProjectLink'), added)
+        for source_name in SOURCES:
+            indexed = search_index.rebuild(source_name, batch_size=self.batch_size)
+            self._count(apps.get_model('home', 'SearchDocument'), indexed)
+        changed = recalculate_project_dates(batch_size=self.batch_size)
+        if self.progress:
+            self.progress(f'Project dates recalculated: {changed} projects changed')
+
+    def _reset_sequences(self, models):
+        """Move auto-increment sequences past the restored primary keys"""
+        statements = self.connection.ops.sequence_reset_sql(no_style(), models)
+        if statements:
+            with self.connection.cursor() as cursor:
+                for sql in statements:
+                    cursor.execute(sql)
+
+    def _count(self, model, rows):
+        label = model._meta.label
+        self._counts[label] = self._counts.get(label, 0) + rows
+        if self.progress:
+            total = sum(self._counts.values())
+            elapsed = max(time.time() - self._started, 1e-6)
+            self.progress(f'{label}: {self._counts[label]} rows ({total / elapsed:.0f} rows/s overall)')
+
+    def _result(self, dry_run):
+        total = sum(self._counts.values())
+        elapsed = time.time() - self._started
+        return {
+            'dry_run': dry_run,
+            'models': dict(self._counts),
+            'total_rows': total,
+            'skipped_rows': self._skipped,
+            'elapsed': round(elapsed, 2),
+            'rows_per_second': round(total / elapsed) if elapsed > 0 else total,
+        }
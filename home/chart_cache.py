@@ -0,0 +1,216 @@
+"""
+Content-addressed cache of rendered chart images
+
+Charts are identified by a kind and the parameters they are drawn from
+(a donut by its rounded percentage and colours, a Gantt chart by its
+project and that project's data version). The PNG bytes are kept in an
+in-memory LRU and in a directory on disk (settings.CHART_CACHE_DIR), so a
+chart is rendered once and reused by every email and report, across
+processes and restarts. All 101 donut variants are pre-rendered by the
+prerender_charts command at deploy time, or in the background by the first
+gunicorn worker when settings.CHART_CACHE_PRERENDER is set.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DONUT_COLORS = ('#dc2626', '#e5e7eb')  # Red for completed, light gray for remaining
+STALE_CHART_AGE = 60 * 60 * 24 * 7  # Gantt charts of superseded data versions
+
+
+def chart_key(kind, params):
+    """Stable digest of a chart's kind and parameters"""
+    payload = json.dumps([kind, params], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ChartCache:
+    """In-memory LRU over an on-disk directory of rendered PNGs"""
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._images = OrderedDict()  # filename -> PNG bytes
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def directory(self):
+        return str(getattr(settings, 'CHART_CACHE_DIR', '') or os.path.join(tempfile.gettempdir(), 'eclick_charts'))
+
+    def filename(self, kind, params):
+        return f'{kind}-{chart_key(kind, params)[:40]}.png'
+
+    def get(self, kind, params, render):
+        """
+        PNG bytes of a chart, calling render() only when neither memory nor
+        disk has it.
+        """
+        filename = self.filename(kind, params)
+        with self._lock:
+            if filename in self._images:
+                self._images.move_to_end(filename)
+                return self._images[filename]
+
+        path = os.path.join(self.directory, filename)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = render()
+            self._write(path, data)
+        else:
+            self._touch(path)
+
+        self._remember(filename, data)
+        return data
+
+    def path(self, kind, params, render):
+        """Path of the chart on disk, rendering it if needed. The file belongs to the cache, do not delete it"""
+        filename = self.filename(kind, params)
+        path = os.path.join(self.directory, filename)
+        if os.path.exists(path):
+            self._touch(path)
+        else:
+            self._write(path, render())
+        return path
+
+    def has(self, kind, params):
+        return os.path.exists(os.path.join(self.directory, self.filename(kind, params)))
+
+    def _touch(self, path):
+        # A hit counts as a use, so prune() keeps charts that are still served
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _write(self, path, data):
+        # Written to a temporary name and renamed, so readers never see a partial file
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store chart {path}: {e}")
+
+    def _remember(self, filename, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            if filename not in self._images:
+                self._images[filename] = data
+                self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear_memory(self):
+        with self._lock:
+            self._images.clear()
+            self._size = 0
+
+    def prune(self, max_age=STALE_CHART_AGE, keep=('donut',)):
+        """Delete chart files not used within max_age seconds, except the kinds in keep"""
+        removed = 0
+        cutoff = time.time() - max_age
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return 0
+        for entry in entries:
+            if entry.name.split('-', 1)[0] in keep:
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def donut_params(completion_rate, colors=None):
+    """Donut charts only vary by their whole percentage and colours"""
+    rate = max(0, min(100, int(round(float(completion_rate or 0)))))
+    return {'rate': rate, 'colors': list(colors or DEFAULT_DONUT_COLORS)}
+
+
+def render_donut(rate, colors):
+    """Render a donut chart PNG with matplotlib (object API, safe outside the main thread)"""
+    from io import BytesIO
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+
+    fig = Figure(figsize=(3.5, 3.5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    ax.pie(
+        [rate, 100 - rate],
+        colors=colors,
+        startangle=90,
+        wedgeprops=dict(width=0.4, edgecolor='white', linewidth=2)
+    )
+    # White circle in the centre for the donut effect
+    ax.add_artist(Circle((0, 0), 0.60, fc='white'))
+    ax.text(0, 0, f'{rate:.1f}%',
+            ha='center', va='center',
+            fontsize=28, weight='bold', color='#1f2937')
+    ax.axis('equal')
+    fig.tight_layout()
+
+    # Lower DPI to reduce file size
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=80, bbox_inches='tight', facecolor='white')
+    return buffer.getvalue()
+
+
+def donut_chart_png(completion_rate, colors=None):
+    """PNG bytes of the donut chart for a completion percentage"""
+    params = donut_params(completion_rate, colors)
+    return chart_cache.get('donut', params, lambda: render_donut(params['rate'], params['colors']))
+
+
+def prerender_donuts(colors=None):
+    """Render every donut percentage missing from the disk cache. Returns the number rendered"""
+    rendered = 0
+    for rate in range(101):
+        params = donut_params(rate, colors)
+        if not chart_cache.has('donut', params):
+            chart_cache.path('donut', params, lambda: render_donut(params['rate'], params['colors']))
+            rendered += 1
+    return rendered
+
+
+def prerender_donuts_in_background():
+    """Fill the donut cache on a daemon thread so startup is not delayed"""
+    def run():
+        try:
+            rendered = prerender_donuts()
+            if rendered:
+                logger.info(f"Pre-rendered {rendered} donut charts")
+        except ImportError as e:
+            logger.info(f"Donut charts not pre-rendered, matplotlib unavailable: {e}")
+        except Exception as e:
+            logger.warning(f"Donut chart pre-rendering failed: {e}")
+
+    thread = threading.Thread(target=run, name='chart-prerender', daemon=True)
+    thread.start()
+    return thread
+
+
+# Global chart cache instance
+chart_cache = ChartCache()
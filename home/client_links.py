@@ -0,0 +1,203 @@
+"""
+Client to project links
+
+A project belongs to a client through the clients relation, its
+client_username or its client_email. ClientProjectLink stores the union of
+the three as one row per (client, project), kept in sync by the Project,
+Client and Project.clients signals (home/signals.py) and rebuilt by the
+sync_client_links command. "Projects of a client" is then one lookup on the
+link table's (client, project) index instead of an OR across a join with
+distinct(), and client_project_ids() caches the answer per client.
+"""
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from .models import Client, ClientProjectLink, Project
+
+LINKS_VERSION_KEY = 'client_links_version:{}'
+PROJECT_IDS_KEY = 'client_project_ids:{}'
+PROJECT_IDS_TIMEOUT = 60 * 60 * 24
+
+
+def _initial_version():
+    # Seeded from the clock so a version lost to cache eviction never
+    # matches the version cached project ids were stored with
+    return int(time.time() * 1000)
+
+
+def _normalize(value):
+    # Usernames and emails match case-insensitively, as they did under MySQL's _ci collation
+    return (value or '').lower()
+
+
+def _lookup_values(values):
+    """
+    Values to look up on the raw, indexed username/email columns. MySQL's _ci
+    collation already compares them case-insensitively; the lowercase forms
+    also match lowercase rows on case-sensitive databases such as SQLite.
+    _pairs() then matches the rows found case-insensitively.
+    """
+    lookup = set()
+    for value in values:
+        if value:
+            lookup.update((value, _normalize(value)))
+    return lookup
+
+
+def _pairs(projects, clients):
+    """(client_id, project_id) pairs linking the given project and client rows by username or email"""
+    by_username = defaultdict(list)
+    by_email = defaultdict(list)
+    for client in clients:
+        by_username[_normalize(client['username'])].append(client['id'])
+        by_email[_normalize(client['email'])].append(client['id'])
+    pairs = set()
+    for project in projects:
+        matches = []
+        if project['client_username']:
+            matches += by_username.get(_normalize(project['client_username']), [])
+        if project['client_email']:
+            matches += by_email.get(_normalize(project['client_email']), [])
+        pairs.update((client_id, project['id']) for client_id in matches)
+    return pairs
+
+
+def expected_links(project_ids=None, client_ids=None):
+    """
+    The (client_id, project_id) pairs that should exist for some projects or
+    some clients, from the clients relation, client_username and client_email.
+    """
+    through = Project.clients.through
+    project_fields = ('id', 'client_username', 'client_email')
+    client_fields = ('id', 'username', 'email')
+
+    if project_ids is not None:
+        projects = list(Project.objects.filter(id__in=project_ids).values(*project_fields))
+        usernames = _lookup_values(p['client_username'] for p in projects)
+        emails = _lookup_values(p['client_email'] for p in projects)
+        clients = list(Client.objects.filter(
+            Q(username__in=usernames) | Q(email__in=emails)
+        ).values(*client_fields)) if usernames or emails else []
+        related = through.objects.filter(project_id__in=project_ids)
+    else:
+        clients = list(Client.objects.filter(id__in=client_ids).values(*client_fields))
+        projects = list(Project.objects.filter(
+            Q(client_username__in=_lookup_values(c['username'] for c in clients))
+            | Q(client_email__in=_lookup_values(c['email'] for c in clients))
+        ).values(*project_fields)) if clients else []
+        related = through.objects.filter(client_id__in=client_ids)
+
+    pairs = _pairs(projects, clients)
+    pairs.update(related.values_list('client_id', 'project_id'))
+    return pairs
+
+
+def sync_links(project_ids=None, client_ids=None):
+    """
+    Bring the links of some projects (or some clients) in line with their
+    current fields and relations. Returns (added, removed).
+    """
+    if project_ids is None and client_ids is None:
+        raise ValueError('sync_links() needs project_ids or client_ids')
+    if project_ids is not None:
+        project_ids = [pk for pk in project_ids if pk]
+        scope = ClientProjectLink.objects.filter(project_id__in=project_ids)
+    else:
+        client_ids = [pk for pk in client_ids if pk]
+        scope = ClientProjectLink.objects.filter(client_id__in=client_ids)
+
+    with transaction.atomic():
+        expected = expected_links(project_ids=project_ids, client_ids=client_ids)
+        existing = set(scope.values_list('client_id', 'project_id'))
+        missing = expected - existing
+        stale = existing - expected
+        if missing:
+            ClientProjectLink.objects.bulk_create(
+                [ClientProjectLink(client_id=client_id, project_id=project_id) for client_id, project_id in missing],
+                ignore_conflicts=True,
+            )
+        for client_id, project_id in stale:
+            scope.filter(client_id=client_id, project_id=project_id).delete()
+
+    changed_clients = {client_id for client_id, _ in missing | stale}
+    if changed_clients:
+        # Again after commit, so ids cached from the old rows meanwhile are dropped too
+        bump_versions(changed_clients)
+        transaction.on_commit(lambda: bump_versions(changed_clients))
+    return len(missing), len(stale)
+
+
+def rebuild_links(batch_size=500):
+    """Sync the links of every project, batch_size projects at a time. Returns (added, removed)"""
+    added = removed = 0
+    last_id = 0
+    while True:
+        ids = list(Project.objects.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:batch_size])
+        if not ids:
+            return added, removed
+        batch_added, batch_removed = sync_links(project_ids=ids)
+        added += batch_added
+        removed += batch_removed
+        last_id = ids[-1]
+
+
+def bump_versions(client_ids):
+    """Invalidate the cached project ids of some clients"""
+    for client_id in client_ids:
+        key = LINKS_VERSION_KEY.format(client_id)
+        cache.add(key, _initial_version(), None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _initial_version(), None)
+
+
+def client_project_ids_many(client_ids):
+    """
+    {client_id: [project_id, ...]} for several clients: one cache round trip,
+    plus one query for the clients whose ids were not cached.
+    """
+    client_ids = list(client_ids)
+    version_keys = {client_id: LINKS_VERSION_KEY.format(client_id) for client_id in client_ids}
+    ids_keys = {client_id: PROJECT_IDS_KEY.format(client_id) for client_id in client_ids}
+    found = cache.get_many(list(version_keys.values()) + list(ids_keys.values()))
+
+    result = {}
+    versions = {}
+    for client_id in client_ids:
+        version = found.get(version_keys[client_id])
+        if version is None:
+            cache.add(version_keys[client_id], _initial_version(), None)
+            version = cache.get(version_keys[client_id])
+        versions[client_id] = version
+        cached = found.get(ids_keys[client_id])
+        if cached is not None and cached[0] == version:
+            result[client_id] = cached[1]
+
+    missing = [client_id for client_id in client_ids if client_id not in result]
+    if missing:
+        for client_id in missing:
+            result[client_id] = []
+        links = ClientProjectLink.objects.filter(client_id__in=missing).order_by('project_id')
+        for client_id, project_id in links.values_list('client_id', 'project_id'):
+            result[client_id].append(project_id)
+        cache.set_many(
+            {ids_keys[client_id]: (versions[client_id], result[client_id]) for client_id in missing},
+            PROJECT_IDS_TIMEOUT,
+        )
+    return result
+
+
+def client_project_ids(client):
+    """Ids of the projects linked to a client (a Client or its id)"""
+    client_id = getattr(client, 'pk', client)
+    return client_project_ids_many([client_id])[client_id]
+
+
+def client_projects(client):
+    """Projects linked to a client, as a queryset"""
+    return Project.objects.filter(id__in=client_project_ids(client))
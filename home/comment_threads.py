@@ -0,0 +1,152 @@
+"""
+Threaded task and subtask comments
+
+TaskComment and SubTaskComment replies point at their parent through
+parent_comment. build_threads() turns a flat list of comments into a forest
+in one pass, without queries, so pages that already prefetch comments (the
+team dashboard) can thread them for free.
+
+CommentThreadService pages the top-level threads of a task or subtask with a
+keyset cursor (two queries per page: the page's threads and the target's
+replies, both with select_related('user')) and caches the threads of each
+page under a per-target version that the comment signals bump. Pages are
+rendered per request, so relative times ("2 minutes ago") stay current.
+"""
+import time
+
+from django.core.cache import cache
+from django.template.loader import render_to_string
+
+from .models import SubTask, SubTaskComment, Task, TaskComment
+from .pagination import keyset_page
+
+THREADS_PER_PAGE = 10
+THREAD_TEMPLATE = 'home/partials/comment_thread.html'
+THREAD_VERSION_KEY = 'comment_threads_version:{}:{}'
+THREAD_PAGE_KEY = 'comment_threads:{}:{}:{}:{}:{}'
+THREAD_PAGE_TIMEOUT = 60 * 60 * 24
+
+# kind -> (target model, comment model, comment field pointing at the target)
+TARGETS = {
+    'task': (Task, TaskComment, 'task'),
+    'subtask': (SubTask, SubTaskComment, 'subtask'),
+}
+
+
+def _initial_version():
+    # Seeded from the clock so a version lost to cache eviction never
+    # matches the version a cached page was rendered with
+    return int(time.time() * 1000)
+
+
+class CommentNode:
+    """A comment and its replies, oldest reply first"""
+
+    def __init__(self, comment):
+        self.comment = comment
+        self.replies = []
+
+    @property
+    def reply_count(self):
+        """Replies at every depth below this comment"""
+        return sum(1 + reply.reply_count for reply in self.replies)
+
+
+def build_threads(comments):
+    """
+    Assemble comments into threads in O(n).
+
+    Comments are expected newest first, as the comment models order them.
+    Returns the top-level CommentNodes newest first; replies are ordered
+    oldest first under their parent. Replies whose parent is not in
+    `comments` are returned as top-level threads.
+    """
+    comments = list(comments)
+    nodes = {comment.id: CommentNode(comment) for comment in comments}
+    roots = []
+    for comment in reversed(comments):
+        parent = nodes.get(comment.parent_comment_id)
+        if parent is not None:
+            parent.replies.append(nodes[comment.id])
+        else:
+            roots.append(nodes[comment.id])
+    roots.reverse()
+    return roots
+
+
+class ThreadPage:
+    """One page of top-level threads"""
+
+    def __init__(self, threads, next_cursor):
+        self.threads = threads
+        self.next_cursor = next_cursor
+
+
+class CommentThreadService:
+    """Load, page and render comment threads of tasks and subtasks"""
+
+    def comments(self, kind, target_id):
+        """All comments of a task or subtask with their authors, in one query"""
+        _, comment_model, field = TARGETS[kind]
+        return comment_model.objects.filter(**{f'{field}_id': target_id}).select_related('user')
+
+    def threads(self, kind, target_id):
+        """Every thread of a task or subtask"""
+        return build_threads(self.comments(kind, target_id))
+
+    def page(self, kind, target_id, cursor=None, limit=THREADS_PER_PAGE):
+        """Top-level threads after `cursor`, newest first, with all their replies"""
+        comments = self.comments(kind, target_id)
+        roots, next_cursor = keyset_page(comments.filter(parent_comment__isnull=True), cursor, limit)
+        if not roots:
+            return ThreadPage([], None)
+
+        # Replies of the whole target in one query; those of other pages are dropped
+        replies = comments.filter(parent_comment__isnull=False).order_by('-created_at', '-id')
+        page_ids = {root.id for root in roots}
+        threads = [node for node in build_threads(roots + list(replies)) if node.comment.id in page_ids]
+        return ThreadPage(threads, next_cursor)
+
+    def get_version(self, kind, target_id):
+        key = THREAD_VERSION_KEY.format(kind, target_id)
+        cache.add(key, _initial_version(), None)
+        return cache.get(key) or _initial_version()
+
+    def bump_version(self, kind, target_id):
+        """Invalidate the rendered pages of a task or subtask"""
+        key = THREAD_VERSION_KEY.format(kind, target_id)
+        cache.add(key, _initial_version(), None)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            version = _initial_version()
+            cache.set(key, version, None)
+            return version
+
+    def cached_page(self, kind, target_id, cursor=None, limit=THREADS_PER_PAGE):
+        """A page of threads, cached until a comment of the target is added, edited or deleted"""
+        version = self.get_version(kind, target_id)
+        key = THREAD_PAGE_KEY.format(kind, target_id, version, cursor or '', limit)
+        page = cache.get(key)
+        if page is None:
+            page = self.page(kind, target_id, cursor=cursor, limit=limit)
+            cache.set(key, page, THREAD_PAGE_TIMEOUT)
+        return page
+
+    def render_page(self, kind, target_id, cursor=None, limit=THREADS_PER_PAGE):
+        """
+        Rendered HTML of a cached page of threads.
+
+        Returns:
+            dict: {'html': str, 'next_cursor': str or None, 'thread_count': int}
+        """
+        page = self.cached_page(kind, target_id, cursor=cursor, limit=limit)
+        return {
+            'html': render_to_string(THREAD_TEMPLATE, {'threads': page.threads}),
+            'next_cursor': page.next_cursor,
+            'thread_count': len(page.threads),
+        }
+
+
+# Global comment thread service instance
+comment_threads = CommentThreadService()
@@ -5,14 +5,149 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
-from django.core.mail import send_mail, EmailMessage
+from django.core.mail import send_mail, EmailMessage, get_connection
+from django.core.mail.message import SafeMIMEMultipart
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.http import HttpResponse
+import hashlib
 import logging
+import mimetypes
+import threading
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Bytes read per step when encoding a file; a multiple of 57 so every chunk
+# encodes to whole 76 character base64 lines
+ENCODE_CHUNK_SIZE = 57 * 1024
+
+
+class EmailAsset:
+    """A file read, hashed and base64 encoded once, ready to attach to any message"""
+
+    def __init__(self, digest, filename, mimetype, size, encoded):
+        self.digest = digest
+        self.filename = filename
+        self.mimetype = mimetype
+        self.size = size
+        self.encoded = encoded
+
+    @property
+    def cid(self):
+        """Content-ID used to reference the asset as an inline image (cid:...)"""
+        return f"{self.digest[:16]}@eclick"
+
+    def mime_part(self, inline=False):
+        """Build a MIME part around the pre-encoded payload without re-encoding it"""
+        maintype, subtype = self.mimetype.split('/', 1)
+        part = MIMEBase(maintype, subtype)
+        part.set_payload(self.encoded)
+        part['Content-Transfer-Encoding'] = 'base64'
+        if inline:
+            part['Content-ID'] = f"<{self.cid}>"
+            part.add_header('Content-Disposition', 'inline', filename=self.filename)
+        else:
+            part.add_header('Content-Disposition', 'attachment', filename=self.filename)
+        return part
+
+
+class InlineImageEmailMessage(EmailMessage):
+    """
+    EmailMessage whose body and inline images are wrapped in multipart/related,
+    nested inside multipart/mixed when the message also has attachments
+    """
+
+    def __init__(self, *args, inline_parts=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.inline_parts = list(inline_parts or [])
+
+    def _create_message(self, msg):
+        if self.inline_parts:
+            related = SafeMIMEMultipart(_subtype='related', encoding=self.encoding or settings.DEFAULT_CHARSET)
+            related.attach(msg)
+            for part in self.inline_parts:
+                related.attach(part)
+            msg = related
+        return self._create_attachments(msg)
+
+
+class EmailAssetCache:
+    """
+    Content-addressed cache of attachment and inline image payloads.
+
+    Files are looked up by path, size and modification time, so an edited
+    file is reloaded, and stored by SHA256, so identical files share one
+    payload. Least recently used assets are evicted above max_bytes.
+    """
+
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._digests = {}  # (path, size, mtime) -> digest
+        self._assets = OrderedDict()  # digest -> EmailAsset
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return the EmailAsset for a file, loading it only on first use"""
+        stat = os.stat(path)
+        key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+        with self._lock:
+            digest = self._digests.get(key)
+            if digest in self._assets:
+                self._assets.move_to_end(digest)
+                return self._assets[digest]
+
+        asset = self._load(path)
+        if len(asset.encoded) > self.max_bytes:
+            return asset
+
+        with self._lock:
+            self._digests[key] = asset.digest
+            if asset.digest not in self._assets:
+                self._assets[asset.digest] = asset
+                self._size += len(asset.encoded)
+            while self._size > self.max_bytes:
+                _, evicted = self._assets.popitem(last=False)
+                self._size -= len(evicted.encoded)
+                self._digests = {k: d for k, d in self._digests.items() if d != evicted.digest}
+        return asset
+
+    def discard(self, path):
+        """Forget a file, e.g. a temporary report PDF about to be deleted"""
+        path = os.path.abspath(path)
+        with self._lock:
+            for key in [key for key in self._digests if key[0] == path]:
+                digest = self._digests.pop(key)
+                if digest not in self._digests.values() and digest in self._assets:
+                    self._size -= len(self._assets.pop(digest).encoded)
+
+    def _load(self, path):
+        """Hash and encode a file in one streaming pass"""
+        digest = hashlib.sha256()
+        encoded = []
+        size = 0
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(ENCODE_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                encoded.append(base64.encodebytes(chunk).decode('ascii'))
+                size += len(chunk)
+
+        mimetype, _ = mimetypes.guess_type(path)
+        return EmailAsset(
+            digest=digest.hexdigest(),
+            filename=os.path.basename(path),
+            mimetype=mimetype or 'application/octet-stream',
+            size=size,
+            encoded=''.join(encoded),
+        )
+
+
+# Shared by every email sent from this process
+email_assets = EmailAssetCache()
+
+
 class SimpleEmailService:
     """Simple email service using Django's built-in email functionality"""
     
@@ -332,74 +467,87 @@ E-Click Project Management
 
         return text_body.strip()
 
-    def send_email(self, to_email, subject, body, from_email=None, attachments=None, cc_emails=None):
+    def inline_image_cid(self, path):
+        """
+        Content-ID for an image to embed in an HTML body as <img src="cid:...">.
+        Pass the same path in send_email(inline_images=[...]).
+        """
+        return email_assets.get(path).cid
+
+    def build_email(self, to_email, subject, body, from_email=None, attachments=None, cc_emails=None, inline_images=None):
+        """
+        Build one message for a single recipient without sending it.
+        Attachments and inline images come pre-encoded from the asset cache.
+        """
+        # Determine if body is HTML
+        is_html = '<html>' in body.lower() or '<body>' in body.lower() or '<div>' in body.lower()
+
+        # Use EmailMessage for better control
+        email = InlineImageEmailMessage(
+            subject=subject,
+            body=body,
+            from_email=from_email or self.from_email,
+            to=[to_email],
+            headers={
+                'X-Mailer': 'E-Click Project Management System',
+                'X-Priority': '3',
+                'X-MSMail-Priority': 'Normal',
+                'Importance': 'Normal',
+                'Reply-To': self.from_email,
+            },
+            # Embed inline images referenced by cid: in the body
+            inline_parts=[email_assets.get(image_path).mime_part(inline=True) for image_path in inline_images or []],
+        )
+
+        # Add CC emails if provided
+        if cc_emails:
+            email.cc = cc_emails
+
+        # Set content type
+        if is_html:
+            email.content_subtype = "html"
+
+        # Add attachments if provided, encoded once and reused from the asset cache
+        for attachment_path in attachments or []:
+            if os.path.exists(attachment_path):
+                email.attach(email_assets.get(attachment_path).mime_part())
+            else:
+                self.logger.error(f"Attachment file not found: {attachment_path}")
+        return email
+
+    def send_email(self, to_email, subject, body, from_email=None, attachments=None, cc_emails=None, inline_images=None):
         """
         Send email using Django's built-in email functionality
 
         Args:
-            to_email (str): Recipient email address
+            to_email (str or list): Recipient email address, or several recipients
+                that each receive their own copy (no recipient sees the others)
             subject (str): Email subject
             body (str): Email body (HTML or plain text)
             from_email (str): Sender email (optional, uses default if not provided)
             attachments (list): List of attachment file paths (optional)
             cc_emails (list): List of CC email addresses (optional)
+            inline_images (list): Image file paths referenced from the body by
+                inline_image_cid() (optional)
 
         Returns:
             dict: Response with success status and message
         """
         try:
-            # Determine if body is HTML
-            is_html = '<html>' in body.lower() or '<body>' in body.lower() or '<div>' in body.lower()
-
-            # Use EmailMessage for better control
-            email = EmailMessage(
-                subject=subject,
-                body=body,
-                from_email=from_email or self.from_email,
-                to=[to_email],
-                headers={
-                    'X-Mailer': 'E-Click Project Management System',
-                    'X-Priority': '3',
-                    'X-MSMail-Priority': 'Normal',
-                    'Importance': 'Normal',
-                    'Reply-To': self.from_email,
-                }
-            )
-
-            # Add CC emails if provided
-            if cc_emails:
-                email.cc = cc_emails
-                self.logger.info(f"Adding CC emails: {cc_emails}")
-
-            # Set content type
-            if is_html:
-                email.content_subtype = "html"
-                self.logger.info("Email will be sent as HTML")
-            else:
-                self.logger.info("Email will be sent as plain text")
+            recipients = [to_email] if isinstance(to_email, str) else list(to_email)
 
-            # Add attachments if provided
+            # One message per recipient, all sent over one connection
+            messages = [
+                self.build_email(recipient, subject, body, from_email, attachments, cc_emails, inline_images)
+                for recipient in recipients
+            ]
             if attachments:
-                for attachment_path in attachments:
-                    if os.path.exists(attachment_path):
-                        file_size = os.path.getsize(attachment_path)
-                        self.logger.info(f"Attaching file: {attachment_path} ({file_size} bytes)")
-
-                        with open(attachment_path, 'rb') as f:
-                            email.attach(
-                                filename=os.path.basename(attachment_path),
-                                content=f.read()
-                            )
-                        self.logger.info(f"Successfully attached: {os.path.basename(attachment_path)}")
-                    else:
-                        self.logger.error(f"Attachment file not found: {attachment_path}")
-            else:
-                self.logger.info("No attachments to add")
-
-            # Send the email
-            email.send()
+                self.logger.info(f"Attaching {len(attachments)} file(s) to {len(messages)} message(s)")
+            sent = get_connection().send_messages(messages) or 0
+            if sent < len(messages):
+                raise Exception(f"{len(messages) - sent} of {len(messages)} messages were not sent")
 
-            self.logger.info(f"Email sent successfully to {to_email}")
+            self.logger.info(f"Email sent successfully to {', '.join(recipients)}")
             if cc_emails:
                 self.logger.info(f"Email CC'd to: {cc_emails}")
             return {
@@ -416,10 +564,11 @@ E-Click Project Management
     
     def send_report_email(self, to_email, report_data, custom_message=''):
         """
-        Send a PDF report email with attachment using the exact same PDF as the reports view
+        Send a PDF report email with attachment using the exact same PDF as the reports view.
+        The PDF is generated once and sent to every recipient in a message of their own.
         
         Args:
-            to_email (str): Recipient email address
+            to_email (str or list): Recipient email address(es)
             report_data (dict): Report data containing statistics
             custom_message (str): Custom message to include
         
@@ -428,7 +577,7 @@ E-Click Project Management
         """
         try:
             # Import the HTML PDF generation function from views (uses WeasyPrint for better layout)
-            from .views import generate_html_pdf_report
+            from .views.reports import generate_html_pdf_report
 
             # Generate professional HTML-based PDF with guaranteed beautiful layout
             pdf_file = generate_html_pdf_report(days_filter=report_data.get('days_filter', 30))
@@ -459,6 +608,7 @@ E-Click Project Management
             
             # Clean up the temporary PDF file
             try:
+                email_assets.discard(pdf_file)
                 os.unlink(pdf_file)
                 self.logger.info("PDF file cleaned up successfully")
             except Exception as cleanup_error:
@@ -487,7 +637,7 @@ E-Click Project Management
         """
         try:
             # Import the exact PDF generation function from views
-            from .views import generate_project_specific_pdf_report
+            from .views.reports import generate_project_specific_pdf_report
             
             # Generate the exact same PDF as the reports view but for specific project
             pdf_file = generate_project_specific_pdf_report(
@@ -511,7 +661,7 @@ E-Click Project Management
             
             # Clean up the temporary PDF file
             try:
-                import os
+                email_assets.discard(pdf_file)
                 os.remove(pdf_file)
                 self.logger.info(f"Cleaned up temporary PDF file: {pdf_file}")
             except Exception as e:
@@ -539,7 +689,7 @@ E-Click Project Management
         """
         try:
             # Import the PDF generation function
-            from .views import generate_client_specific_pdf_report
+            from .views.reports import generate_client_specific_pdf_report
             
             # Generate PDF report
             client_id = report_data.get('client_id')
@@ -580,6 +730,7 @@ E-Click Project Management
             
             # Clean up the temporary PDF file
             try:
+                email_assets.discard(pdf_path)
                 os.remove(pdf_path)
                 self.logger.info(f"Cleaned up temporary PDF file: {pdf_path}")
             except Exception as e:
@@ -594,6 +745,79 @@ E-Click Project Management
                 'error': f'Error sending client report email: {str(e)}'
             }
 
+    def send_messages(self, messages):
+        """
+        Send prepared messages over a single connection so the email backend
+        can batch them (the Graph backend sends them in $batch requests)
+
+        Args:
+            messages (list): EmailMessage objects
+
+        Returns:
+            list: {'success': bool, 'error': str} for every message, in order
+        """
+        if not messages:
+            return []
+        connection = get_connection(fail_silently=True)
+        try:
+            if hasattr(connection, 'send_messages_with_results'):
+                errors = connection.send_messages_with_results(messages)
+            else:
+                errors = self._send_one_by_one(connection, messages)
+        except Exception as e:
+            self.logger.error(f"Error sending {len(messages)} emails: {str(e)}")
+            errors = [str(e)] * len(messages)
+
+        results = [
+            {'success': True} if error is None else {'success': False, 'error': error}
+            for error in errors
+        ]
+        sent = sum(result['success'] for result in results)
+        self.logger.info(f"Sent {sent} of {len(messages)} emails")
+        return results
+
+    def _send_one_by_one(self, connection, messages):
+        """Per-message errors from a backend that only reports a count, over one open connection"""
+        errors = []
+        connection.open()
+        try:
+            for message in messages:
+                try:
+                    errors.append(None if connection.send_messages([message]) else 'Email was not sent')
+                except Exception as e:
+                    errors.append(str(e))
+        finally:
+            connection.close()
+        return errors
+
+    def build_weekly_client_report_message(self, client_email, client_username, report_data, site_url=None):
+        """Build the weekly client report as an HTML EmailMessage without sending it"""
+        subject = f"Weekly Project Report - {client_username}"
+        html_body = self._create_weekly_client_report_html(client_username, report_data, site_url)
+
+        email = EmailMessage(
+            subject=subject,
+            body=html_body,
+            from_email=self.from_email,
+            to=[client_email]
+        )
+        email.content_subtype = "html"
+        return email
+
+    def build_friday_client_report_message(self, client_email, client_username, report_data, site_url=None):
+        """Build the Friday client report as an HTML EmailMessage without sending it"""
+        subject = f"Friday Project Report - {client_username} - {report_data.get('report_date', '')}"
+        html_body = self._create_friday_client_report_html(client_username, report_data, site_url)
+
+        email = EmailMessage(
+            subject=subject,
+            body=html_body,
+            from_email=self.from_email,
+            to=[client_email]
+        )
+        email.content_subtype = "html"
+        return email
+
     def send_weekly_client_report(self, client_email, client_username, report_data, site_url=None):
         """
         Send weekly client report email
@@ -608,23 +832,7 @@ E-Click Project Management
             dict: Response with success status and message
         """
         try:
-            subject = f"Weekly Project Report - {client_username}"
-            
-            # Create HTML email body
-            html_body = self._create_weekly_client_report_html(client_username, report_data, site_url)
-            
-            # Create plain text email body
-            text_body = self._create_weekly_client_report_text(client_username, report_data, site_url)
-            
-            # Send email as HTML with text fallback
-            email = EmailMessage(
-                subject=subject,
-                body=html_body,
-                from_email=self.from_email,
-                to=[client_email]
-            )
-            email.content_subtype = "html"
-            
+            email = self.build_weekly_client_report_message(client_email, client_username, report_data, site_url)
             email.send()
             
             self.logger.info(f"Weekly client report sent successfully to {client_email}")
@@ -654,23 +862,7 @@ E-Click Project Management
             dict: Response with success status and message
         """
         try:
-            subject = f"Friday Project Report - {client_username} - {report_data.get('report_date', '')}"
-            
-            # Create HTML email body
-            html_body = self._create_friday_client_report_html(client_username, report_data, site_url)
-            
-            # Create plain text email body
-            text_body = self._create_friday_client_report_text(client_username, report_data, site_url)
-            
-            # Send email as HTML with text fallback
-            email = EmailMessage(
-                subject=subject,
-                body=html_body,
-                from_email=self.from_email,
-                to=[client_email]
-            )
-            email.content_subtype = "html"
-            
+            email = self.build_friday_client_report_message(client_email, client_username, report_data, site_url)
             email.send()
             
             self.logger.info(f"Friday client report sent successfully to {client_email}")
@@ -0,0 +1,154 @@
+"""
+Shared Gantt layout engine
+
+build_gantt_layout() fetches projects with their tasks and subtasks in three
+queries and computes everything a Gantt renderer needs once: each project's
+date span, progress and dominant priority, one row per dated project, task
+and subtask with its day offset, duration and colour, the overall date range
+and a lane for every project bar (projects that do not overlap in time share
+a lane). The ReportLab, Plotly and matplotlib charts and the dashboard and
+client JSON endpoints are thin adapters over the same layout.
+"""
+from collections import Counter
+from datetime import date, timedelta
+
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+
+STATUS_COLORS = {
+    'completed': '#10b981',  # Green
+    'in_progress': '#dc2626',  # E-Click Red
+    'planned': '#9ca3af',  # Gray
+    'not_started': '#d1d5db',  # Light gray
+}
+DEFAULT_COLOR = '#6b7280'
+UNDATED_PROJECT_DAYS = 7
+
+
+def _dated(item):
+    return item.start_date is not None and item.end_date is not None
+
+
+def _most_common(values, default):
+    counts = Counter(value for value in values if value)
+    return counts.most_common(1)[0][0] if counts else default
+
+
+class GanttRow:
+    """One bar: a project, task or subtask with a start and end date"""
+
+    LEVELS = {'project': 0, 'task': 1, 'subtask': 2}
+
+    def __init__(self, kind, obj, start, end, origin):
+        self.kind = kind
+        self.level = self.LEVELS[kind]
+        self.id = obj.id
+        self.label = obj.name if kind == 'project' else obj.title
+        self.status = obj.status
+        self.start = start
+        self.end = end
+        self.offset = (start - origin).days  # days from the project start
+        self.duration = max((end - start).days + 1, 1)  # inclusive
+        self.color = STATUS_COLORS.get(obj.status, DEFAULT_COLOR)
+
+
+class GanttProject:
+    """A project, its prefetched tasks and its rows"""
+
+    def __init__(self, project, today):
+        self.project = project
+        self.tasks = list(project.tasks.all())
+        dated_tasks = [task for task in self.tasks if _dated(task)]
+
+        if dated_tasks:
+            self.start = min(task.start_date for task in dated_tasks)
+            self.end = max(task.end_date for task in dated_tasks)
+        else:
+            self.start = project.start_date or today
+            self.end = project.end_date or (self.start + timedelta(days=UNDATED_PROJECT_DAYS))
+        # Projects shown only with a placeholder span are left out of the charts
+        self.has_dates = bool(dated_tasks) or _dated(project)
+        self.duration = (self.end - self.start).days + 1
+
+        total_days = (self.end - self.start).days
+        elapsed_days = (today - self.start).days
+        self.timeline_position = min(max((elapsed_days / total_days) * 100, 0), 100) if total_days > 0 else 0
+
+        self.total_tasks = len(self.tasks)
+        self.completed_tasks = sum(1 for task in self.tasks if task.status == 'completed')
+        self.progress = self.completed_tasks / self.total_tasks if self.total_tasks else 0
+        self.priority = _most_common((task.priority for task in self.tasks), 'medium')
+        self.development_status = _most_common(
+            (task.development_status for task in self.tasks), 'original_quoted'
+        )
+
+        self.row = GanttRow('project', project, self.start, self.end, self.start)
+        self.rows = [self.row]
+        for task in dated_tasks:
+            self.rows.append(GanttRow('task', task, task.start_date, task.end_date, self.start))
+            for subtask in task.subtasks.all():
+                if _dated(subtask):
+                    self.rows.append(GanttRow('subtask', subtask, subtask.start_date, subtask.end_date, self.start))
+        self.lane = 0
+
+    def task_offset(self, task):
+        """(start offset, duration) of a task relative to the project start"""
+        if not _dated(task):
+            return 0, 1
+        return (task.start_date - self.start).days, (task.end_date - task.start_date).days + 1
+
+
+class GanttLayout:
+    """Layout of several projects on a common timeline"""
+
+    def __init__(self, projects, today):
+        self.today = today
+        self.projects = projects
+        self.dated_projects = [project for project in projects if project.has_dates]
+
+        if self.dated_projects:
+            self.start = min(project.start for project in self.dated_projects)
+            self.end = max(project.end for project in self.dated_projects)
+        else:
+            self.start = self.end = today
+        self.total_days = (self.end - self.start).days + 1
+        self.lane_count = self._pack_lanes()
+
+    def _pack_lanes(self):
+        # Greedy interval packing: each project bar goes in the first lane
+        # whose last bar ends before it starts
+        lane_ends = []
+        for project in sorted(self.dated_projects, key=lambda project: (project.start, project.end)):
+            for lane, lane_end in enumerate(lane_ends):
+                if lane_end < project.start:
+                    project.lane = lane
+                    lane_ends[lane] = project.end
+                    break
+            else:
+                project.lane = len(lane_ends)
+                lane_ends.append(project.end)
+        return len(lane_ends)
+
+    def fraction(self, row):
+        """(start, width) of a row as fractions of the common timeline"""
+        return (row.start - self.start).days / self.total_days, row.duration / self.total_days
+
+
+def build_gantt_layout(projects, today=None):
+    """
+    Lay out projects (a queryset or list) with their tasks and subtasks.
+
+    Tasks and subtasks are fetched with prefetch_related, so the whole layout
+    costs three queries however many projects, tasks and subtasks there are.
+    """
+    if isinstance(projects, GanttLayout):
+        return projects
+    today = today or timezone.now().date()
+    projects = list(projects)
+    prefetch_related_objects(projects, 'tasks__subtasks')
+    return GanttLayout([GanttProject(project, today) for project in projects], today)
+
+
+def subtask_sort_key(subtask):
+    # Undated subtasks first, as the database sorts NULLs in ascending order
+    return (subtask.start_date is not None, subtask.start_date or date.min, subtask.created_at)
@@ -0,0 +1,95 @@
+"""
+Import budget for web workers
+
+measure_imports() imports modules in a fresh interpreter started with
+`-X importtime` and reports the cumulative import time of every module,
+the resident memory of the process afterwards and which of the heavy
+plotting/PDF libraries were loaded. Web workers should never load those:
+charts and PDFs import them inside the functions that render them.
+
+    python manage.py import_budget eclick.urls --max-ms 1500 --max-rss-mb 150
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+
+# Plotting and PDF libraries that only report rendering may import
+HEAVY_MODULES = ('matplotlib', 'reportlab', 'plotly', 'pandas', 'numpy', 'kaleido', 'weasyprint', 'xhtml2pdf')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+_PROBE = '''
+import json, resource, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+modules, url_names = json.loads(sys.argv[1])
+for name in modules:
+    __import__(name)
+if url_names:
+    from django.urls import reverse
+    for name in url_names:
+        reverse(name)
+print(json.dumps({
+    "elapsed_ms": (time.perf_counter() - started) * 1000,
+    "rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": sorted(sys.modules),
+}))
+'''
+
+
+class ImportReport:
+    """Result of measure_imports()"""
+
+    def __init__(self, cumulative_us, top_level, elapsed_ms, rss_kb, loaded):
+        self.cumulative_us = cumulative_us  # module -> cumulative import time in microseconds
+        self.top_level = top_level  # modules imported directly by the probe
+        self.elapsed_ms = elapsed_ms  # django.setup() plus the imports, wall clock
+        self.rss_kb = rss_kb
+        self.loaded = loaded
+
+    def loaded_under(self, package):
+        """Loaded modules inside a package, e.g. the home.views feature modules"""
+        return sorted(name for name in self.loaded if name.startswith(package + '.'))
+
+    @property
+    def heavy_modules(self):
+        """Heavy top-level packages that were imported"""
+        return sorted({name.split('.')[0] for name in self.loaded} & set(HEAVY_MODULES))
+
+    def slowest(self, count=15, top_level_only=True):
+        """[(module, milliseconds)] of the slowest imports"""
+        items = [
+            (name, us / 1000) for name, us in self.cumulative_us.items()
+            if not top_level_only or name in self.top_level
+        ]
+        return sorted(items, key=lambda item: item[1], reverse=True)[:count]
+
+
+def measure_imports(modules, settings_module=None, url_names=()):
+    """
+    Import modules (after django.setup()) in a fresh interpreter and measure them,
+    then reverse() url_names, as rendering the first page does
+    """
+    env = dict(os.environ)
+    if settings_module:
+        env['DJANGO_SETTINGS_MODULE'] = settings_module
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _PROBE, json.dumps([list(modules), list(url_names)])],
+        capture_output=True, text=True, env=env, check=True,
+    )
+
+    cumulative_us = {}
+    top_level = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            _, cumulative, indent, name = match.groups()
+            cumulative_us[name] = int(cumulative)
+            if len(indent) <= 1:
+                top_level.add(name)
+
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return ImportReport(cumulative_us, top_level, probe['elapsed_ms'], probe['rss_kb'], probe['modules'])
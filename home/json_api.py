@@ -0,0 +1,67 @@
+"""
+Versioned JSON responses for the polled AJAX endpoints
+
+@versioned_json(version_func) computes a cheap version token for the
+resource (from updated_at maxima or the data-version counters) before the
+view runs. When it matches the client's If-None-Match the view is skipped
+and a 304 is returned; otherwise the response carries the token as its
+ETag. Large payloads are serialized with compact_dumps, which uses orjson
+when it is installed and compact separators otherwise.
+"""
+import hashlib
+import json
+import time
+from functools import wraps
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def compact_dumps(data):
+    """Serialize to UTF-8 JSON bytes without whitespace"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # a type orjson does not know, use the Django encoder
+    return json.dumps(data, cls=DjangoJSONEncoder, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+class CompactJsonResponse(HttpResponse):
+    """JsonResponse equivalent for large payloads, serialized with compact_dumps"""
+
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=compact_dumps(data), **kwargs)
+
+
+def time_bucket(seconds):
+    """Changes every `seconds`, for payloads that contain relative times"""
+    return int(time.time() // seconds)
+
+
+def versioned_json(version_func):
+    """
+    Answer conditional GETs from a version token instead of building the payload.
+
+    version_func(request, *args, **kwargs) returns any repr-able token that
+    changes whenever the response would, and must include whatever identifies
+    the requester for per-user data. Returning None disables the check.
+    """
+    def decorator(view):
+        def etag_func(request, *args, **kwargs):
+            token = version_func(request, *args, **kwargs)
+            if token is None:
+                return None
+            return hashlib.sha1(f'{view.__module__}.{view.__name__}:{token!r}'.encode()).hexdigest()
+
+        # Responses are per user and must be revalidated on every poll
+        return wraps(view)(cache_control(private=True, no_cache=True)(etag(etag_func)(view)))
+    return decorator
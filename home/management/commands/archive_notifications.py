@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from home.notification_inbox import notification_inbox
+
+
+class Command(BaseCommand):
+    help = 'Move read notifications older than the retention period to the archive in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=90,
+            help='Archive read notifications older than this many days (default: 90)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of notifications moved per transaction (default: 1000)'
+        )
+        parser.add_argument(
+            '--delete',
+            action='store_true',
+            help='Delete the notifications instead of archiving them'
+        )
+
+    def handle(self, *args, **options):
+        action = 'Deleting' if options['delete'] else 'Archiving'
+        self.stdout.write(f"{action} read notifications older than {options['days']} days...")
+
+        removed = notification_inbox.archive_read(
+            options['days'], batch_size=options['batch_size'], archive=not options['delete']
+        )
+
+        done = 'deleted' if options['delete'] else 'archived'
+        self.stdout.write(self.style.SUCCESS(f'{removed} notifications {done}'))
@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from importlib import import_module
+import inspect
+
+
+class Command(BaseCommand):
+    help = 'Delete expired sessions from the database in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of sessions deleted per query (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        engine = import_module(settings.SESSION_ENGINE)
+
+        self.stdout.write('Deleting expired sessions...')
+
+        clear_expired = engine.SessionStore.clear_expired
+        if 'batch_size' in inspect.signature(clear_expired).parameters:
+            deleted = clear_expired(batch_size=batch_size)
+        else:
+            # Stock Django engines clear everything in a single query
+            clear_expired()
+            deleted = None
+
+        if deleted is None:
+            self.stdout.write(self.style.SUCCESS('Expired sessions cleared'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired sessions'))
@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand
-from home.models import Client, ClientOTP, Project
+from home.models import Client, ClientOTP
 
 
 class Command(BaseCommand):
@@ -7,30 +7,24 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         self.stdout.write('Starting cleanup of orphaned client records...')
-        
-        # Find all clients
-        all_clients = Client.objects.all()
+
+        # Clients without a row in the client/project link table (see home.client_links)
+        orphaned_clients = Client.objects.filter(project_links__isnull=True)
         cleaned_count = 0
-        
-        for client in all_clients:
-            # Check if this client is associated with any active projects
-            has_active_projects = Project.objects.filter(
-                client_email=client.email
-            ).exists()
-            
-            if not has_active_projects:
-                self.stdout.write(f'Found orphaned client: {client.username} ({client.email})')
-                
-                # Delete related OTPs first
-                otp_count = ClientOTP.objects.filter(client=client).count()
-                ClientOTP.objects.filter(client=client).delete()
-                
-                # Delete the client
-                client.delete()
-                
-                cleaned_count += 1
-                self.stdout.write(f'  - Deleted {otp_count} OTPs and client record')
-        
+
+        for client in orphaned_clients:
+            self.stdout.write(f'Found orphaned client: {client.username} ({client.email})')
+
+            # Delete related OTPs first
+            otp_count = ClientOTP.objects.filter(client=client).count()
+            ClientOTP.objects.filter(client=client).delete()
+
+            # Delete the client
+            client.delete()
+
+            cleaned_count += 1
+            self.stdout.write(f'  - Deleted {otp_count} OTPs and client record')
+
         if cleaned_count > 0:
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully cleaned up {cleaned_count} orphaned client records')
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from home.system_metrics import metrics_collector
+
+
+class Command(BaseCommand):
+    help = 'Sample host, worker and database metrics for the system monitoring page'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--cpu-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to measure CPU usage over (default: 1.0)'
+        )
+
+    def handle(self, *args, **options):
+        sample = metrics_collector.sample(cpu_interval=options['cpu_interval'])
+
+        self.stdout.write(
+            f'CPU {sample.cpu_percent}% | Memory {sample.memory_percent}% | '
+            f'Disk {sample.disk_percent}% | DB {sample.db_size} MB | '
+            f'Workers {sample.worker_count} ({sample.process_memory} MB)'
+        )
+        for alert in sample.alerts:
+            self.stdout.write(self.style.WARNING(f"ALERT: {alert['message']}"))
+
+        self.stdout.write(self.style.SUCCESS('System metrics sampled'))
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from home.import_budget import measure_imports
+
+
+class Command(BaseCommand):
+    help = 'Measure import time and memory of modules as a web worker loads them'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'modules',
+            nargs='*',
+            default=['eclick.urls'],
+            help='Modules to import after django.setup() (default: eclick.urls)'
+        )
+        parser.add_argument(
+            '--max-ms',
+            type=float,
+            help='Fail when django.setup() plus the imports take longer (milliseconds)'
+        )
+        parser.add_argument(
+            '--max-rss-mb',
+            type=float,
+            help='Fail when resident memory after the imports is higher (MB)'
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=15,
+            help='Number of slowest imports to list (default: 15)'
+        )
+
+    def handle(self, *args, **options):
+        report = measure_imports(options['modules'], settings.SETTINGS_MODULE)
+
+        rss_mb = report.rss_kb / 1024
+        self.stdout.write(f"django.setup() + imports: {report.elapsed_ms:.0f} ms")
+        self.stdout.write(f"Resident memory after import: {rss_mb:.1f} MB")
+        views = report.loaded_under('home.views')
+        self.stdout.write(f"View modules loaded: {', '.join(views) or 'none'}")
+        self.stdout.write('Slowest imports (cumulative):')
+        for name, milliseconds in report.slowest(options['top']):
+            self.stdout.write(f'  {milliseconds:8.1f} ms  {name}')
+
+        if report.heavy_modules:
+            raise CommandError(f"Heavy libraries loaded at import time: {', '.join(report.heavy_modules)}")
+        if options['max_ms'] is not None and report.elapsed_ms > options['max_ms']:
+            raise CommandError(f"Import time {report.elapsed_ms:.0f} ms exceeds {options['max_ms']:.0f} ms")
+        if options['max_rss_mb'] is not None and rss_mb > options['max_rss_mb']:
+            raise CommandError(f"Resident memory {rss_mb:.1f} MB exceeds {options['max_rss_mb']:.0f} MB")
+        self.stdout.write(self.style.SUCCESS('No plotting/PDF libraries loaded at import time'))
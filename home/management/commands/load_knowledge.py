@@ -0,0 +1,136 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+import csv
+import hashlib
+import json
+import os
+import time
+
+from home.ai_service import ai_service
+from home.models import AIKnowledgeBase
+
+
+class Command(BaseCommand):
+    help = 'Bulk load chatbot knowledge from JSONL or CSV files, skipping duplicate questions'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths',
+            nargs='+',
+            type=str,
+            help='JSONL (.jsonl) or CSV (.csv) files with question, answer, category, tags and confidence_score'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of entries inserted per query (default: 500)'
+        )
+        parser.add_argument(
+            '--replace',
+            action='store_true',
+            help='Delete all existing knowledge before loading'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Parse and deduplicate without writing to the database'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        replace = options['replace']
+        dry_run = options['dry_run']
+        started = time.time()
+
+        # Hash every existing question once so deduplication is a set lookup
+        seen = set()
+        if not replace:
+            for question in AIKnowledgeBase.objects.values_list('question', flat=True).iterator():
+                seen.add(self._question_hash(question))
+            self.stdout.write(f'Found {len(seen)} existing questions')
+
+        entries = []
+        duplicates = 0
+        invalid = 0
+        for path in options['paths']:
+            for row in self._read_rows(path):
+                question = (row.get('question') or '').strip()
+                answer = (row.get('answer') or '').strip()
+                if not question or not answer:
+                    invalid += 1
+                    continue
+
+                key = self._question_hash(question)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+
+                entries.append(AIKnowledgeBase(
+                    question=question,
+                    answer=answer,
+                    category=(row.get('category') or '').strip(),
+                    tags=self._parse_tags(row.get('tags')),
+                    confidence_score=float(row.get('confidence_score') or 0.7),
+                ))
+
+        self.stdout.write(
+            f'Parsed {len(entries)} new entries ({duplicates} duplicates, {invalid} invalid rows skipped)'
+        )
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('DRY RUN MODE - No entries were written'))
+            return
+
+        with transaction.atomic():
+            if replace:
+                deleted, _ = AIKnowledgeBase.objects.all().delete()
+                self.stdout.write(f'Deleted {deleted} existing entries')
+
+            for start in range(0, len(entries), batch_size):
+                AIKnowledgeBase.objects.bulk_create(entries[start:start + batch_size])
+                self.stdout.write(f'  - Inserted {min(start + batch_size, len(entries))}/{len(entries)}')
+
+        # Rebuild the chatbot search index once for the whole load
+        ai_service.rebuild_index()
+        ai_service._update_metrics()
+
+        elapsed = time.time() - started
+        self.stdout.write(
+            self.style.SUCCESS(f'Successfully loaded {len(entries)} knowledge entries in {elapsed:.2f}s')
+        )
+
+    def _read_rows(self, path):
+        """Yield one dict per entry from a JSONL or CSV file"""
+        if not os.path.exists(path):
+            raise CommandError(f'File not found: {path}')
+
+        extension = os.path.splitext(path)[1].lower()
+        with open(path, encoding='utf-8', newline='') as f:
+            if extension == '.csv':
+                yield from csv.DictReader(f)
+            elif extension in ('.jsonl', '.json'):
+                for line_number, line in enumerate(f, start=1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise CommandError(f'{path}:{line_number}: invalid JSON ({e})')
+            else:
+                raise CommandError(f'Unsupported file type: {path} (expected .jsonl or .csv)')
+
+    def _question_hash(self, question):
+        """Hash of the normalized question, matching how the chatbot compares questions"""
+        normalized = ai_service._normalize_text(question)
+        return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+    def _parse_tags(self, tags):
+        """Tags are a list in JSONL and a ';'-separated string in CSV"""
+        if not tags:
+            return []
+        if isinstance(tags, list):
+            return [str(tag).strip() for tag in tags if str(tag).strip()]
+        return [tag.strip() for tag in str(tags).split(';') if tag.strip()]
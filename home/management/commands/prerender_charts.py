@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from home.chart_cache import chart_cache, prerender_donuts
+
+
+class Command(BaseCommand):
+    help = 'Pre-render all donut chart variants and prune stale Gantt chart images'
+
+    def handle(self, *args, **options):
+        self.stdout.write(f'Chart cache: {chart_cache.directory}')
+
+        rendered = prerender_donuts()
+        self.stdout.write(f'  donut charts rendered: {rendered} (101 variants)')
+
+        removed = chart_cache.prune()
+        self.stdout.write(f'  stale charts removed: {removed}')
+
+        self.stdout.write(self.style.SUCCESS('Chart cache ready'))
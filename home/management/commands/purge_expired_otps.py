@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from home.models import ClientOTP, UserOTP
+from home.otp_service import otp_service
+
+
+class Command(BaseCommand):
+    help = 'Delete expired client and user OTPs from the database in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of OTPs deleted per query (default: 1000)'
+        )
+        parser.add_argument(
+            '--grace-hours',
+            type=int,
+            default=0,
+            help='Keep OTPs that expired less than this many hours ago (default: 0)'
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(hours=options['grace_hours'])
+
+        self.stdout.write('Deleting expired OTPs...')
+
+        for model in (ClientOTP, UserOTP):
+            deleted = otp_service.purge_expired(model, before=before, batch_size=options['batch_size'])
+            self.stdout.write(f'  {model.__name__}: {deleted} deleted')
+
+        self.stdout.write(self.style.SUCCESS('Expired OTPs purged'))
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from home.models import SearchDocument
+from home.search_index import SOURCES, search_index, use_fulltext
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for messages, comments and system logs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--source',
+            action='append',
+            choices=sorted(SOURCES),
+            help='Only rebuild this source (can be repeated, default: all)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Objects indexed per transaction (default: 1000)'
+        )
+        parser.add_argument(
+            '--missing',
+            action='store_true',
+            help='Only rebuild sources that have no indexed documents yet, e.g. on the first deploy after migrating'
+        )
+
+    def handle(self, *args, **options):
+        backend = 'MySQL FULLTEXT' if use_fulltext() else 'token table'
+        self.stdout.write(f'Rebuilding search index ({backend})...')
+
+        for source in options['source'] or sorted(SOURCES):
+            if options['missing'] and SearchDocument.objects.filter(source=source).exists():
+                self.stdout.write(f'  {source}: already indexed')
+                continue
+            count = search_index.rebuild(source, batch_size=options['batch_size'])
+            self.stdout.write(f'  {source}: {count} indexed')
+
+        self.stdout.write(self.style.SUCCESS('Search index rebuilt'))
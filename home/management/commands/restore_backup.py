@@ -3,9 +3,9 @@ from django.conf import settings
 from django.core.management import call_command
 from django.utils import timezone
 import os
-import hashlib
 from datetime import datetime
 
+from home.backup_restore import BackupRestoreEngine, file_sha256
 from home.models import BackupFile, SystemLog
 
 
@@ -28,11 +28,23 @@ class Command(BaseCommand):
             action='store_true',
             help='Skip creating safety backup before restore'
         )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate the backup file without changing the database'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of rows inserted per query (default: 1000)'
+        )
 
     def handle(self, *args, **options):
         backup_id = options['backup_id']
         force = options['force']
         no_safety_backup = options['no_safety_backup']
+        dry_run = options['dry_run']
 
         try:
             # Get the backup
@@ -53,8 +65,7 @@ class Command(BaseCommand):
 
             # Verify file integrity
             self.stdout.write('Verifying backup file integrity...')
-            with open(backup.file_path, 'rb') as f:
-                current_checksum = hashlib.sha256(f.read()).hexdigest()
+            current_checksum = file_sha256(backup.file_path)
 
             if current_checksum != backup.backup_checksum:
                 self.stdout.write(
@@ -64,6 +75,24 @@ class Command(BaseCommand):
                 backup.save()
                 return
 
+            engine = BackupRestoreEngine(
+                batch_size=options['batch_size'],
+                progress=lambda message: self.stdout.write(f'  - {message}')
+            )
+
+            if dry_run:
+                self.stdout.write('Validating backup contents...')
+                result = engine.restore(backup.file_path, dry_run=True)
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"DRY RUN: backup is valid, {result['total_rows']} rows "
+                        f"across {len(result['models'])} tables would be restored"
+                    )
+                )
+                for label, rows in sorted(result['models'].items()):
+                    self.stdout.write(f'  - {label}: {rows}')
+                return
+
             # Confirm restore
             if not force:
                 self.stdout.write(
@@ -92,14 +121,13 @@ class Command(BaseCommand):
                         )
                     )
 
-            # Perform the restore
+            # Perform the restore (single transaction, rolled back on any error)
             self.stdout.write('Restoring database from backup...')
-            
-            # Clear existing data (excluding system tables)
-            call_command('flush', '--no-input')
-            
-            # Restore from backup
-            call_command('loaddata', backup.file_path)
+            result = engine.restore(backup.file_path)
+            self.stdout.write(
+                f"Restored {result['total_rows']} rows in {result['elapsed']}s "
+                f"({result['rows_per_second']} rows/s)"
+            )
             
             # Update backup status
             backup.status = 'restored'
@@ -144,8 +172,7 @@ class Command(BaseCommand):
             
             # Get file size and create checksum
             safety_size = os.path.getsize(safety_path)
-            with open(safety_path, 'rb') as f:
-                safety_checksum = hashlib.sha256(f.read()).hexdigest()
+            safety_checksum = file_sha256(safety_path)
             
             # Create safety backup record
             safety_backup = BackupFile.objects.create(
@@ -1,9 +1,9 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.conf import settings
-from django.db.models import Q
-from home.models import Client, Project, Task
+from home.models import Client
 from home.email_service import email_service
+from home.report_snapshots import get_client_snapshot, recent_tasks_since, upcoming_deadlines
 from datetime import timedelta
 import logging
 
@@ -77,14 +77,17 @@ class Command(BaseCommand):
         success_count = 0
         error_count = 0
         skipped_count = 0
+        reused_count = 0
+        outgoing = []
         
         for client in clients:
             try:
-                # Check if client has any projects using both new ManyToMany relationship and legacy client_username
-                client_projects = Project.objects.filter(
-                    Q(clients=client) | Q(client_username=client.username)
-                ).distinct()
-                if not client_projects.exists():
+                # Generate report data for this client, reusing its snapshot if its projects did not change
+                report_data, cached = self._generate_friday_client_report_data(client, week_start, current_date)
+                if cached:
+                    reused_count += 1
+
+                if not report_data['total_projects']:
                     if not dry_run:
                         self.stdout.write(
                             f'⚠ Skipping {client.username} - no projects found'
@@ -92,9 +95,6 @@ class Command(BaseCommand):
                     skipped_count += 1
                     continue
                 
-                # Generate report data for this client
-                report_data = self._generate_friday_client_report_data(client, week_start, current_date)
-                
                 if dry_run:
                     self.stdout.write(
                         f'[DRY RUN] Would send Friday report to {client.username} ({client.email})'
@@ -104,28 +104,14 @@ class Command(BaseCommand):
                     self.stdout.write(f'  Active Projects: {report_data["active_projects"]}')
                     continue
                 
-                # Send the Friday report
-                result = email_service.send_friday_client_report(
+                # Queue the Friday report, all reports are sent together below
+                outgoing.append((client, email_service.build_friday_client_report_message(
                     client_email=client.email,
                     client_username=client.username,
                     report_data=report_data,
                     site_url=settings.SITE_URL if hasattr(settings, 'SITE_URL') else None
-                )
-                
-                if result['success']:
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'✓ Friday report sent to {client.username} ({client.email})'
-                        )
-                    )
-                    success_count += 1
-                else:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f'✗ Failed to send Friday report to {client.username}: {result.get("error", "Unknown error")}'
-                        )
-                    )
-                    error_count += 1
+                )))
+                self.stdout.write(f'  Prepared Friday report for {client.username} ({client.email})')
                     
             except Exception as e:
                 self.stdout.write(
@@ -136,7 +122,26 @@ class Command(BaseCommand):
                 error_count += 1
                 logger.error(f'Error sending Friday report to client {client.username}: {str(e)}')
         
+        # One connection for every report so the email backend can batch them
+        results = email_service.send_messages([message for _, message in outgoing])
+        for (client, _), result in zip(outgoing, results):
+            if result['success']:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'✓ Friday report sent to {client.username} ({client.email})'
+                    )
+                )
+                success_count += 1
+            else:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f'✗ Failed to send Friday report to {client.username}: {result.get("error", "Unknown error")}'
+                    )
+                )
+                error_count += 1
+        
         # Summary
+        self.stdout.write(f'Report data: {reused_count} clients unchanged (snapshot reused), {clients.count() - reused_count} recomputed')
         if dry_run:
             self.stdout.write(
                 self.style.SUCCESS(
@@ -151,102 +156,33 @@ class Command(BaseCommand):
             )
 
     def _generate_friday_client_report_data(self, client, week_start, current_date):
-        """Generate Friday report data for a specific client"""
+        """
+        Generate Friday report data for a specific client from its versioned
+        snapshot. Returns (report_data, True if the snapshot was reused).
+        """
+        snapshot, cached = get_client_snapshot(client)
 
-        # Get client's projects using both new ManyToMany relationship and legacy client_username
-        client_projects = Project.objects.filter(
-            Q(clients=client) | Q(client_username=client.username)
-        ).distinct()
-        
-        # Project statistics
-        total_projects = client_projects.count()
-        active_projects = client_projects.filter(status='in_progress').count()
-        completed_projects = client_projects.filter(status='completed').count()
-        planned_projects = client_projects.filter(status='planned').count()
-        
-        # Task statistics
-        total_tasks = Task.objects.filter(project__client_username=client.username).count()
-        completed_tasks = Task.objects.filter(
-            project__client_username=client.username, 
-            status='completed'
-        ).count()
-        in_progress_tasks = Task.objects.filter(
-            project__client_username=client.username, 
-            status='in_progress'
-        ).count()
-        
-        # Calculate completion rates
-        project_completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
-        task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
-        
-        # Get project details for the report
-        projects_data = []
-        for project in client_projects:
-            project_tasks = project.tasks.all()
-            if project_tasks.exists():
-                completion_rate = (project_tasks.filter(status='completed').count() / project_tasks.count()) * 100
-            else:
-                completion_rate = 0
-                
-            projects_data.append({
-                'name': project.name,
-                'status': project.status,
-                'description': project.description or 'No description available',
-                'completion_rate': round(completion_rate, 1),
-                'start_date': project.start_date,
-                'end_date': project.end_date,
-                'total_tasks': project_tasks.count(),
-                'completed_tasks': project_tasks.filter(status='completed').count()
-            })
-        
-        # Get recent task activity (last 7 days)
-        recent_tasks = Task.objects.filter(
-            project__client_username=client.username,
-            updated_at__gte=week_start
-        ).select_related('project').order_by('-updated_at')[:15]
-        
-        tasks_data = []
-        for task in recent_tasks:
-            tasks_data.append({
-                'title': task.title,
-                'status': task.status,
-                'project_name': task.project.name,
-                'updated_at': task.updated_at,
-                'priority': task.priority,
-                'description': task.description or 'No description'
-            })
-        
-        # Get upcoming deadlines (next 2 weeks)
-        upcoming_deadlines = []
-        for project in client_projects.filter(status='in_progress'):
-            if project.end_date:
-                days_until_deadline = (project.end_date - current_date.date()).days
-                if 0 <= days_until_deadline <= 14:
-                    upcoming_deadlines.append({
-                        'project_name': project.name,
-                        'deadline': project.end_date,
-                        'days_remaining': days_until_deadline,
-                        'completion_rate': next((p['completion_rate'] for p in projects_data if p['name'] == project.name), 0)
-                    })
-        
-        # Sort by urgency (closest deadline first)
-        upcoming_deadlines.sort(key=lambda x: x['days_remaining'])
-        
-        return {
+        total_projects = snapshot['total_projects']
+        total_tasks = snapshot['total_tasks']
+        project_completion_rate = (snapshot['completed_projects'] / total_projects * 100) if total_projects > 0 else 0
+        task_completion_rate = (snapshot['completed_tasks'] / total_tasks * 100) if total_tasks > 0 else 0
+
+        report_data = {
             'total_projects': total_projects,
-            'active_projects': active_projects,
-            'completed_projects': completed_projects,
-            'planned_projects': planned_projects,
+            'active_projects': snapshot['active_projects'],
+            'completed_projects': snapshot['completed_projects'],
+            'planned_projects': snapshot['planned_projects'],
             'total_tasks': total_tasks,
-            'completed_tasks': completed_tasks,
-            'in_progress_tasks': in_progress_tasks,
+            'completed_tasks': snapshot['completed_tasks'],
+            'in_progress_tasks': snapshot['in_progress_tasks'],
             'project_completion_rate': round(project_completion_rate, 1),
             'task_completion_rate': round(task_completion_rate, 1),
-            'projects': projects_data,
-            'recent_tasks': tasks_data,
-            'upcoming_deadlines': upcoming_deadlines,
+            'projects': snapshot['projects'],
+            'recent_tasks': recent_tasks_since(snapshot, week_start, limit=15),
+            'upcoming_deadlines': upcoming_deadlines(snapshot, current_date.date()),
             'report_date': current_date.strftime('%B %d, %Y'),
             'week_range': f"{week_start.strftime('%B %d')} - {current_date.strftime('%B %d, %Y')}",
             'is_friday': True,
             'next_friday': (current_date + timedelta(days=7)).strftime('%B %d, %Y')
         }
+        return report_data, cached
@@ -1,9 +1,9 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.conf import settings
-from django.db.models import Q
-from home.models import Client, Project, Task
+from home.models import Client
 from home.email_service import email_service
+from home.report_snapshots import get_client_snapshot, recent_tasks_since
 from datetime import timedelta
 import logging
 
@@ -56,11 +56,15 @@ class Command(BaseCommand):
         
         success_count = 0
         error_count = 0
+        reused_count = 0
+        outgoing = []
         
         for client in clients:
             try:
-                # Generate report data for this client
-                report_data = self._generate_client_report_data(client, week_start, current_date)
+                # Generate report data for this client, reusing its snapshot if its projects did not change
+                report_data, cached = self._generate_client_report_data(client, week_start, current_date)
+                if cached:
+                    reused_count += 1
                 
                 if dry_run:
                     self.stdout.write(
@@ -70,28 +74,14 @@ class Command(BaseCommand):
                     self.stdout.write(f'  Tasks: {report_data["total_tasks"]}')
                     continue
                 
-                # Send the report
-                result = email_service.send_weekly_client_report(
+                # Queue the report, all reports are sent together below
+                outgoing.append((client, email_service.build_weekly_client_report_message(
                     client_email=client.email,
                     client_username=client.username,
                     report_data=report_data,
                     site_url=settings.SITE_URL if hasattr(settings, 'SITE_URL') else None
-                )
-                
-                if result['success']:
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'✓ Report sent to {client.username} ({client.email})'
-                        )
-                    )
-                    success_count += 1
-                else:
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f'✗ Failed to send report to {client.username}: {result.get("error", "Unknown error")}'
-                        )
-                    )
-                    error_count += 1
+                )))
+                self.stdout.write(f'  Prepared report for {client.username} ({client.email})')
                     
             except Exception as e:
                 self.stdout.write(
@@ -102,7 +92,26 @@ class Command(BaseCommand):
                 error_count += 1
                 logger.error(f'Error sending weekly report to client {client.username}: {str(e)}')
         
+        # One connection for every report so the email backend can batch them
+        results = email_service.send_messages([message for _, message in outgoing])
+        for (client, _), result in zip(outgoing, results):
+            if result['success']:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f'✓ Report sent to {client.username} ({client.email})'
+                    )
+                )
+                success_count += 1
+            else:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f'✗ Failed to send report to {client.username}: {result.get("error", "Unknown error")}'
+                    )
+                )
+                error_count += 1
+        
         # Summary
+        self.stdout.write(f'Report data: {reused_count} clients unchanged (snapshot reused), {clients.count() - reused_count} recomputed')
         if dry_run:
             self.stdout.write(
                 self.style.SUCCESS(
@@ -117,62 +126,20 @@ class Command(BaseCommand):
             )
 
     def _generate_client_report_data(self, client, week_start, current_date):
-        """Generate weekly report data for a specific client"""
+        """
+        Generate weekly report data for a specific client from its versioned
+        snapshot. Returns (report_data, True if the snapshot was reused).
+        """
+        snapshot, cached = get_client_snapshot(client)
 
-        # Get client's projects using both new ManyToMany relationship and legacy client_username
-        client_projects = Project.objects.filter(
-            Q(clients=client) | Q(client_username=client.username)
-        ).distinct()
-        
-        # Project statistics
-        total_projects = client_projects.count()
-        active_projects = client_projects.filter(status='in_progress').count()
-        completed_projects = client_projects.filter(status='completed').count()
-        
-        # Task statistics
-        total_tasks = Task.objects.filter(project__client_username=client.username).count()
-        
-        # Get project details for the report
-        projects_data = []
-        for project in client_projects:
-            project_tasks = project.tasks.all()
-            if project_tasks.exists():
-                completion_rate = (project_tasks.filter(status='completed').count() / project_tasks.count()) * 100
-            else:
-                completion_rate = 0
-                
-            projects_data.append({
-                'name': project.name,
-                'status': project.status,
-                'description': project.description or 'No description available',
-                'completion_rate': round(completion_rate, 1),
-                'start_date': project.start_date,
-                'end_date': project.end_date
-            })
-        
-        # Get recent task activity (last 7 days)
-        recent_tasks = Task.objects.filter(
-            project__client_username=client.username,
-            updated_at__gte=week_start
-        ).select_related('project').order_by('-updated_at')[:10]
-        
-        tasks_data = []
-        for task in recent_tasks:
-            tasks_data.append({
-                'title': task.title,
-                'status': task.status,
-                'project_name': task.project.name,
-                'updated_at': task.updated_at,
-                'priority': task.priority
-            })
-        
-        return {
-            'total_projects': total_projects,
-            'active_projects': active_projects,
-            'completed_projects': completed_projects,
-            'total_tasks': total_tasks,
-            'projects': projects_data,
-            'recent_tasks': tasks_data,
+        report_data = {
+            'total_projects': snapshot['total_projects'],
+            'active_projects': snapshot['active_projects'],
+            'completed_projects': snapshot['completed_projects'],
+            'total_tasks': snapshot['total_tasks'],
+            'projects': snapshot['projects'],
+            'recent_tasks': recent_tasks_since(snapshot, week_start, limit=10),
             'report_date': current_date.strftime('%B %d, %Y'),
             'week_range': f"{week_start.strftime('%B %d')} - {current_date.strftime('%B %d, %Y')}"
         }
+        return report_data, cached
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from home.client_links import rebuild_links
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the client/project link table from Project.clients, client_username and client_email'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of projects synced per transaction (default: 500)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Syncing client/project links...')
+
+        added, removed = rebuild_links(batch_size=options['batch_size'])
+
+        self.stdout.write(f'  {added} links added, {removed} stale links removed')
+        self.stdout.write(self.style.SUCCESS('Client/project links are in sync'))
@@ -1,38 +1,40 @@
 from django.core.management.base import BaseCommand
 from home.models import Project
-from datetime import timedelta
+from home.project_dates import recalculate_project_dates
 
 class Command(BaseCommand):
-    help = 'Update existing projects with proper end dates based on task dates'
+    help = 'Recalculate project start and end dates from their task dates'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project',
+            type=int,
+            action='append',
+            dest='project_ids',
+            help='Only recalculate this project id (can be repeated)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Number of projects written per UPDATE (default: 500)'
+        )
 
     def handle(self, *args, **options):
-        projects = Project.objects.filter(end_date__isnull=True)
-        
-        for project in projects:
-            # Get all tasks for this project
-            tasks = project.tasks.all()
-            
-            if tasks.exists():
-                # Find earliest start date and latest end date from tasks
-                earliest_start = min(task.start_date for task in tasks if task.start_date)
-                latest_end = max(task.end_date for task in tasks if task.end_date)
-                
-                if earliest_start and latest_end:
-                    project.start_date = earliest_start
-                    project.end_date = latest_end
-                    project.save()
-                    self.stdout.write(
-                        self.style.SUCCESS(f'Updated project "{project.name}" with dates: {project.start_date} to {project.end_date}')
-                    )
-                else:
-                    self.stdout.write(
-                        self.style.WARNING(f'Project "{project.name}" has tasks but missing start/end dates')
-                    )
-            else:
-                self.stdout.write(
-                    self.style.WARNING(f'Project "{project.name}" has no tasks')
-                )
-        
+        project_ids = options['project_ids']
+        total = len(project_ids) if project_ids else Project.objects.count()
+
+        # One grouped Min/Max aggregate over all tasks and a bulk_update of the changed projects
+        updated = recalculate_project_dates(project_ids, batch_size=options['batch_size'])
+
+        missing = Project.objects.filter(start_date__isnull=True)
+        if project_ids:
+            missing = missing.filter(id__in=project_ids)
+        for name in missing.values_list('name', flat=True):
+            self.stdout.write(
+                self.style.WARNING(f'Project "{name}" has no task dates')
+            )
+
         self.stdout.write(
-            self.style.SUCCESS(f'Successfully processed {projects.count()} projects')
-        ) 
\ No newline at end of file
+            self.style.SUCCESS(f'Successfully processed {total} projects ({updated} updated)')
+        )
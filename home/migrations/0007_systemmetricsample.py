@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0006_alter_devmessage_subject'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SystemMetricSample',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sampled_at', models.DateTimeField(auto_now_add=True, db_index=True)),
+                ('cpu_percent', models.FloatField(default=0.0)),
+                ('load_average', models.FloatField(default=0.0, help_text='1 minute load average')),
+                ('memory_percent', models.FloatField(default=0.0)),
+                ('memory_total', models.FloatField(default=0.0, help_text='GB')),
+                ('memory_available', models.FloatField(default=0.0, help_text='GB')),
+                ('disk_percent', models.FloatField(default=0.0)),
+                ('disk_total', models.FloatField(default=0.0, help_text='GB')),
+                ('disk_free', models.FloatField(default=0.0, help_text='GB')),
+                ('network_sent', models.FloatField(default=0.0, help_text='MB sent since boot')),
+                ('network_recv', models.FloatField(default=0.0, help_text='MB received since boot')),
+                ('process_memory', models.FloatField(default=0.0, help_text='Total RSS of the application workers in MB')),
+                ('worker_count', models.IntegerField(default=0)),
+                ('db_size', models.FloatField(default=0.0, help_text='MB')),
+                ('backup_size', models.FloatField(default=0.0, help_text='Size of the backups directory in MB')),
+                ('details', models.JSONField(blank=True, default=dict)),
+            ],
+            options={
+                'verbose_name': 'System Metric Sample',
+                'verbose_name_plural': 'System Metric Samples',
+                'ordering': ['-sampled_at'],
+            },
+        ),
+    ]
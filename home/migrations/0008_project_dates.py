@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:06
+
+from django.db import migrations, models
+from django.db.models import Max, Min
+
+
+def backfill_project_dates(apps, schema_editor):
+    Project = apps.get_model('home', 'Project')
+    Task = apps.get_model('home', 'Task')
+    dates = Task.objects.order_by().values('project_id').annotate(
+        first_start=Min('start_date'), last_end=Max('end_date')
+    )
+    projects = []
+    for row in dates:
+        projects.append(Project(id=row['project_id'], start_date=row['first_start'], end_date=row['last_end']))
+    Project.objects.bulk_update(projects, ['start_date', 'end_date'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0007_systemmetricsample'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='end_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='start_date',
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(backfill_project_dates, migrations.RunPython.noop),
+    ]
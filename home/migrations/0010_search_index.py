@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:13
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def add_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute(
+            'ALTER TABLE home_searchdocument ADD FULLTEXT INDEX search_document_content_ft (content)'
+        )
+
+
+def remove_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'mysql':
+        schema_editor.execute('ALTER TABLE home_searchdocument DROP INDEX search_document_content_ft')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0009_project_listing_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('dev_message', 'Dev Message'), ('task_comment', 'Task Comment'), ('subtask_comment', 'Subtask Comment'), ('system_log', 'System Log')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('content', models.TextField(help_text='Indexed text (FULLTEXT indexed on MySQL)')),
+                ('created_at', models.DateTimeField()),
+                ('user', models.ForeignKey(blank=True, help_text='Author of the indexed object', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Search Document',
+                'verbose_name_plural': 'Search Documents',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('source', models.CharField(help_text='Copied from the document so lookups stay on this table', max_length=20)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('document', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tokens', to='home.searchdocument')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='searchdocument',
+            index=models.Index(fields=['source', '-created_at'], name='search_document_source_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='searchdocument',
+            constraint=models.UniqueConstraint(fields=('source', 'object_id'), name='search_document_unique_object'),
+        ),
+        migrations.AddIndex(
+            model_name='searchtoken',
+            index=models.Index(fields=['token', 'source', 'document'], name='search_token_lookup_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='searchtoken',
+            constraint=models.UniqueConstraint(fields=('token', 'document'), name='search_token_unique_document'),
+        ),
+        migrations.RunPython(add_fulltext_index, remove_fulltext_index),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:02
+
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def hash_existing_codes(apps, schema_editor):
+    # Same keyed hash as home.otp_service.hash_code, so outstanding codes keep working
+    key = settings.SECRET_KEY.encode('utf-8')
+    for model_name, kind, field in (('ClientOTP', 'client', 'client_id'), ('UserOTP', 'user', 'user_id')):
+        model = apps.get_model('home', model_name)
+        for otp in model.objects.filter(is_used=False).only('pk', 'otp', field).iterator():
+            message = f'{kind}:{getattr(otp, field)}:{otp.otp}'.encode('utf-8')
+            otp.otp_hash = hmac.new(key, message, hashlib.sha256).hexdigest()
+            otp.save(update_fields=['otp_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0010_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clientotp',
+            name='otp_hash',
+            field=models.CharField(default='', help_text='HMAC-SHA256 of the code, the code itself is never stored', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='userotp',
+            name='otp_hash',
+            field=models.CharField(default='', help_text='HMAC-SHA256 of the code, the code itself is never stored', max_length=64),
+            preserve_default=False,
+        ),
+        migrations.RunPython(hash_existing_codes, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='clientotp',
+            name='otp',
+        ),
+        migrations.RemoveField(
+            model_name='userotp',
+            name='otp',
+        ),
+        migrations.AddIndex(
+            model_name='clientotp',
+            index=models.Index(fields=['client', 'is_used', 'expires_at'], name='client_otp_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='clientotp',
+            index=models.Index(fields=['expires_at'], name='client_otp_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userotp',
+            index=models.Index(fields=['user', 'is_used', 'expires_at'], name='user_otp_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userotp',
+            index=models.Index(fields=['expires_at'], name='user_otp_expiry_idx'),
+        ),
+    ]
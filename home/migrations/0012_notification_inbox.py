@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0011_hashed_otps'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('original_id', models.PositiveIntegerField(help_text='Primary key the notification had')),
+                ('notification_type', models.CharField(choices=[('task_completed', 'Task Completed'), ('task_delayed', 'Task Delayed'), ('task_on_hold', 'Task On Hold'), ('task_update', 'Task Update'), ('task_status_change', 'Task Status Change'), ('task_duration_extended', 'Task Duration Extended'), ('task_comment_added', 'Task Comment Added'), ('task_comment_response', 'Admin Response to Task Comment'), ('subtask_comment_added', 'Subtask Comment Added'), ('subtask_comment_response', 'Admin Response to Subtask Comment'), ('project_update', 'Project Update'), ('admin_message', 'Admin Message'), ('project_status_change', 'Project Status Change'), ('project_created', 'Project Created'), ('task_created', 'Task Created'), ('subtask_created', 'Subtask Created'), ('deadline_extended', 'Deadline Extended'), ('priority_changed', 'Priority Changed')], max_length=25)),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('is_admin_notification', models.BooleanField(default=False)),
+                ('triggered_by_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('related_project_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('related_task_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', 'is_read'], name='notification_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at'], name='notification_inbox_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['is_read', 'created_at'], name='notification_retention_idx'),
+        ),
+        migrations.AddField(
+            model_name='notificationarchive',
+            name='recipient',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_notifications', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='notificationarchive',
+            index=models.Index(fields=['recipient', '-created_at'], name='notification_archive_idx'),
+        ),
+    ]
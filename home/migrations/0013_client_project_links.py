@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:32
+
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_links(apps, schema_editor):
+    # Same union as home.client_links.expected_links: the clients relation,
+    # client_username and client_email
+    Client = apps.get_model('home', 'Client')
+    Project = apps.get_model('home', 'Project')
+    ClientProjectLink = apps.get_model('home', 'ClientProjectLink')
+
+    # Matched case-insensitively, as the queries on MySQL's _ci collation did
+    by_username = defaultdict(list)
+    by_email = defaultdict(list)
+    for client_id, username, email in Client.objects.values_list('id', 'username', 'email'):
+        by_username[(username or '').lower()].append(client_id)
+        by_email[(email or '').lower()].append(client_id)
+    pairs = set(Project.clients.through.objects.values_list('client_id', 'project_id'))
+    for project_id, username, email in Project.objects.values_list('id', 'client_username', 'client_email').iterator():
+        matches = []
+        if username:
+            matches += by_username.get(username.lower(), [])
+        if email:
+            matches += by_email.get(email.lower(), [])
+        pairs.update((client_id, project_id) for client_id in matches)
+
+    ClientProjectLink.objects.bulk_create(
+        [ClientProjectLink(client_id=client_id, project_id=project_id) for client_id, project_id in pairs],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0012_notification_inbox'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClientProjectLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['client_username'], name='project_client_username_idx'),
+        ),
+        migrations.AddField(
+            model_name='clientprojectlink',
+            name='client',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_links', to='home.client'),
+        ),
+        migrations.AddField(
+            model_name='clientprojectlink',
+            name='project',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='client_links', to='home.project'),
+        ),
+        migrations.AddIndex(
+            model_name='clientprojectlink',
+            index=models.Index(fields=['project', 'client'], name='client_link_project_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='clientprojectlink',
+            constraint=models.UniqueConstraint(fields=('client', 'project'), name='unique_client_project_link'),
+        ),
+        migrations.RunPython(backfill_links, migrations.RunPython.noop),
+    ]
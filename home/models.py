@@ -2,8 +2,6 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import datetime, timedelta
-import random
-import string
 
 User = get_user_model()
 
@@ -28,26 +26,24 @@ class Project(models.Model):
     # Multiple clients/investors can be associated with one project
     clients = models.ManyToManyField('Client', blank=True, related_name='projects', help_text='Clients/investors associated with this project')
 
+    # Earliest task start date and latest task end date, maintained by home.project_dates
+    start_date = models.DateField(null=True, blank=True, editable=False)
+    end_date = models.DateField(null=True, blank=True, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.name
 
-    @property
-    def start_date(self):
-        """Start date is determined by the earliest task start date"""
-        earliest_task = self.tasks.filter(start_date__isnull=False).order_by('start_date').first()
-        return earliest_task.start_date if earliest_task else None
-
-    @property
-    def end_date(self):
-        """End date is determined by the latest task end date"""
-        latest_task = self.tasks.filter(end_date__isnull=False).order_by('end_date').last()
-        return latest_task.end_date if latest_task else None
-
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='project_status_created_idx'),
+            models.Index(fields=['-created_at'], name='project_created_idx'),
+            models.Index(fields=['client_email'], name='project_client_email_idx'),
+            models.Index(fields=['client_username'], name='project_client_username_idx'),
+        ]
 
 
 class Task(models.Model):
@@ -95,22 +91,31 @@ class Task(models.Model):
     def __str__(self):
         return f"{self.title} - {self.project.name}"
 
+    DATE_FIELDS = ('start_date', 'end_date', 'project_id')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_dates = instance._current_dates()
+        return instance
+
+    def _current_dates(self):
+        return {name: getattr(self, name) for name in self.DATE_FIELDS if name in self.__dict__}
+
     def save(self, *args, **kwargs):
-        # Update project dates when task dates change
-        old_instance = None
-        if self.pk:
-            try:
-                old_instance = Task.objects.get(pk=self.pk)
-            except Task.DoesNotExist:
-                pass
-        
+        # Compare against the values loaded from the database instead of re-fetching the row
+        loaded = getattr(self, '_loaded_dates', None)
+        update_fields = kwargs.get('update_fields')
         super().save(*args, **kwargs)
-        
-        # If dates changed, update project dates
-        if old_instance:
-            if (old_instance.start_date != self.start_date or 
-                old_instance.end_date != self.end_date):
-                self.project.save()  # This will trigger project date recalculation
+
+        if update_fields is not None and not {'start_date', 'end_date', 'project', 'project_id'} & set(update_fields):
+            return
+
+        current = self._current_dates()
+        if loaded is None or current != loaded:
+            from .project_dates import schedule_project_dates
+            schedule_project_dates([self.project_id, (loaded or {}).get('project_id')])
+        self._loaded_dates = current
 
     class Meta:
         ordering = ['start_date', 'created_at']
@@ -229,6 +234,15 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"{self.user.username}'s Profile"
 
+    @classmethod
+    def create_missing(cls):
+        """Create default profiles for every user that has none, in one INSERT"""
+        missing = User.objects.filter(profile__isnull=True).values_list('pk', flat=True)
+        profiles = [cls(user_id=user_id) for user_id in missing]
+        if profiles:
+            cls.objects.bulk_create(profiles, ignore_conflicts=True)
+        return len(profiles)
+
     def get_profile_picture_url(self):
         """Return the URL of the profile picture or a default avatar"""
         if self.profile_picture and hasattr(self.profile_picture, 'url'):
@@ -324,27 +338,34 @@ class Client(models.Model):
         return self.username
 
     def generate_otp(self):
-        """Generate a 6-digit OTP for the client"""
-        otp = ''.join(random.choices(string.digits, k=6))
-        expires_at = timezone.now() + timedelta(hours=24)
-        
-        # Mark all existing OTPs for this client as used
-        ClientOTP.objects.filter(client=self).update(is_used=True)
-        
-        # Create new OTP
-        otp_obj = ClientOTP.objects.create(
-            client=self,
-            otp=otp,
-            expires_at=expires_at,
-            is_used=False
-        )
-        
-        return otp
+        """Generate a 6-digit OTP for the client (see home.otp_service)"""
+        from .otp_service import otp_service
+        return otp_service.generate(self)
+
+
+class ClientProjectLink(models.Model):
+    """
+    A client and a project linked through Project.clients, Project.client_username
+    or Project.client_email, one row per pair (maintained by home.client_links)
+    """
+    client = models.ForeignKey(Client, on_delete=models.CASCADE, related_name='project_links')
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='client_links')
+
+    def __str__(self):
+        return f"{self.client_id} - {self.project_id}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['client', 'project'], name='unique_client_project_link'),
+        ]
+        indexes = [
+            models.Index(fields=['project', 'client'], name='client_link_project_idx'),
+        ]
 
 
 class ClientOTP(models.Model):
     client = models.ForeignKey(Client, on_delete=models.CASCADE)
-    otp = models.CharField(max_length=6)
+    otp_hash = models.CharField(max_length=64, help_text="HMAC-SHA256 of the code, the code itself is never stored")
     is_used = models.BooleanField(default=False)
     expires_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -367,11 +388,16 @@ class ClientOTP(models.Model):
                 name='unique_active_client_otp'
             )
         ]
+        indexes = [
+            # Verification looks up the owner's active OTP, the purge sweeps by expiry
+            models.Index(fields=['client', 'is_used', 'expires_at'], name='client_otp_active_idx'),
+            models.Index(fields=['expires_at'], name='client_otp_expiry_idx'),
+        ]
 
 
 class UserOTP(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
-    otp = models.CharField(max_length=6)
+    otp_hash = models.CharField(max_length=64, help_text="HMAC-SHA256 of the code, the code itself is never stored")
     is_used = models.BooleanField(default=False)
     expires_at = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
@@ -394,29 +420,17 @@ class UserOTP(models.Model):
                 name='unique_active_user_otp'
             )
         ]
+        indexes = [
+            # Verification looks up the owner's active OTP, the purge sweeps by expiry
+            models.Index(fields=['user', 'is_used', 'expires_at'], name='user_otp_active_idx'),
+            models.Index(fields=['expires_at'], name='user_otp_expiry_idx'),
+        ]
 
 
 def generate_user_otp(user):
-    """Generate a 6-digit OTP for the user"""
-    import random
-    import string
-    from datetime import timedelta
-
-    otp = ''.join(random.choices(string.digits, k=6))
-    expires_at = timezone.now() + timedelta(hours=24)
-    
-    # Mark all existing OTPs for this user as used
-    UserOTP.objects.filter(user=user).update(is_used=True)
-    
-    # Create new OTP
-    otp_obj = UserOTP.objects.create(
-        user=user,
-        otp=otp,
-        expires_at=expires_at,
-        is_used=False
-    )
-    
-    return otp
+    """Generate a 6-digit OTP for the user (see home.otp_service)"""
+    from .otp_service import otp_service
+    return otp_service.generate(user)
 
 
 class Notification(models.Model):
@@ -470,6 +484,12 @@ class Notification(models.Model):
             ('recipient', 'notification_type', 'related_task', 'related_project'),
             ('recipient', 'notification_type', 'related_subtask'),
         ]
+        indexes = [
+            # Unread badge (a count answered from the index), inbox pages and the retention sweep
+            models.Index(fields=['recipient', 'is_read'], name='notification_unread_idx'),
+            models.Index(fields=['recipient', '-created_at'], name='notification_inbox_idx'),
+            models.Index(fields=['is_read', 'created_at'], name='notification_retention_idx'),
+        ]
 
     @classmethod
     def create_if_not_exists(cls, **kwargs):
@@ -571,6 +591,30 @@ class Notification(models.Model):
         return cls.create_if_not_exists(**notification_data)
 
 
+class NotificationArchive(models.Model):
+    """Read notifications moved out of Notification by the archive_notifications command"""
+    original_id = models.PositiveIntegerField(help_text='Primary key the notification had')
+    recipient = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, related_name='archived_notifications')
+    notification_type = models.CharField(max_length=25, choices=Notification.NOTIFICATION_TYPES)
+    title = models.CharField(max_length=200)
+    message = models.TextField()
+    is_admin_notification = models.BooleanField(default=False)
+    triggered_by_id = models.PositiveIntegerField(null=True, blank=True)
+    related_project_id = models.PositiveIntegerField(null=True, blank=True)
+    related_task_id = models.PositiveIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.notification_type} (archived)"
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['recipient', '-created_at'], name='notification_archive_idx'),
+        ]
+
+
 class TaskUpdate(models.Model):
     UPDATE_TYPES = [
         ('completed', 'Completed'),
@@ -1544,6 +1588,57 @@ class BackupFile(models.Model):
         except Exception:
             return False
 
+class SystemMetricSample(models.Model):
+    """
+    One sample of host, process and database metrics, written by the
+    collect_system_metrics command. The table is a ring buffer: only the most
+    recent SYSTEM_METRICS_RETENTION samples are kept.
+    """
+    sampled_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    # Host
+    cpu_percent = models.FloatField(default=0.0)
+    load_average = models.FloatField(default=0.0, help_text='1 minute load average')
+    memory_percent = models.FloatField(default=0.0)
+    memory_total = models.FloatField(default=0.0, help_text='GB')
+    memory_available = models.FloatField(default=0.0, help_text='GB')
+    disk_percent = models.FloatField(default=0.0)
+    disk_total = models.FloatField(default=0.0, help_text='GB')
+    disk_free = models.FloatField(default=0.0, help_text='GB')
+    network_sent = models.FloatField(default=0.0, help_text='MB sent since boot')
+    network_recv = models.FloatField(default=0.0, help_text='MB received since boot')
+
+    # Application
+    process_memory = models.FloatField(default=0.0, help_text='Total RSS of the application workers in MB')
+    worker_count = models.IntegerField(default=0)
+    db_size = models.FloatField(default=0.0, help_text='MB')
+    backup_size = models.FloatField(default=0.0, help_text='Size of the backups directory in MB')
+
+    # Per-worker RSS, largest tables and capacity alerts
+    details = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        ordering = ['-sampled_at']
+        verbose_name = 'System Metric Sample'
+        verbose_name_plural = 'System Metric Samples'
+
+    def __str__(self):
+        return f"Metrics at {self.sampled_at.strftime('%Y-%m-%d %H:%M')}"
+
+    @property
+    def alerts(self):
+        return self.details.get('alerts', [])
+
+    @classmethod
+    def trim(cls, keep):
+        """Delete every sample older than the newest `keep` samples"""
+        cutoff = cls.objects.order_by('-sampled_at').values_list('sampled_at', flat=True)[keep:keep + 1]
+        cutoff = list(cutoff)
+        if not cutoff:
+            return 0
+        deleted, _ = cls.objects.filter(sampled_at__lte=cutoff[0]).delete()
+        return deleted
+
 class AIKnowledgeBase(models.Model):
     """AI Knowledge Base for storing learned information"""
     question = models.TextField()
@@ -1599,6 +1694,9 @@ class AILearningMetrics(models.Model):
 
 class ChatbotFeedback(models.Model):
     """Model to store chatbot feedback and satisfaction ratings"""
+    REPORT_WINDOWS = (7, 30, 90, 365)
+    SUMMARY_CACHE_KEY = 'chatbot_feedback_summary'
+
     SATISFACTION_CHOICES = [
         (1, 'Very Dissatisfied'),
         (2, 'Dissatisfied'),
@@ -1674,6 +1772,64 @@ class ChatbotFeedback(models.Model):
         from django.db.models import Count
         return cls.objects.filter(satisfaction_rating__isnull=False).values('satisfaction_rating').annotate(count=Count('id')).order_by('satisfaction_rating')
 
+    @classmethod
+    def get_summary(cls):
+        """
+        Get totals, average rating and distribution in two queries.
+        Cached until the next feedback is saved (see home.signals).
+        """
+        from django.core.cache import cache
+        from django.db.models import Avg, Count
+
+        summary = cache.get(cls.SUMMARY_CACHE_KEY)
+        if summary is None:
+            totals = cls.objects.aggregate(
+                total_feedback=Count('id'),
+                total_ratings=Count('satisfaction_rating'),
+                average_satisfaction=Avg('satisfaction_rating'),
+            )
+            summary = {
+                'average_satisfaction': round(totals['average_satisfaction'] or 0, 2),
+                'distribution': list(cls.get_satisfaction_distribution()),
+                'total_feedback': totals['total_feedback'],
+                'total_ratings': totals['total_ratings'],
+            }
+            cache.set(cls.SUMMARY_CACHE_KEY, summary, 3600)
+        return summary
+
+    @classmethod
+    def get_daily_trend(cls, days=30):
+        """
+        Get feedback count and average rating per day for the last `days` days
+        with a single grouped query. Days without feedback are filled with zeros.
+        """
+        from django.db.models import Avg, Count
+        from django.db.models.functions import TruncDate
+
+        today_start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        window_start = today_start - timedelta(days=days - 1)
+
+        rows = (
+            cls.objects.filter(created_at__gte=window_start)
+            .annotate(day=TruncDate('created_at'))
+            .values('day')
+            .annotate(count=Count('id'), avg_rating=Avg('satisfaction_rating'))
+            .order_by()
+        )
+        by_day = {row['day']: row for row in rows}
+
+        trend = []
+        for offset in range(days):
+            day = (window_start + timedelta(days=offset)).date()
+            row = by_day.get(day)
+            avg_rating = row['avg_rating'] if row else None
+            trend.append({
+                'date': day,
+                'count': row['count'] if row else 0,
+                'avg_rating': round(avg_rating, 2) if avg_rating else None,
+            })
+        return trend
+
 
 class DevMessage(models.Model):
     """Messages from clients and employees to developers about bugs, features, issues, etc."""
@@ -1751,4 +1907,54 @@ class DevMessage(models.Model):
         if admin_user:
             self.responded_by = admin_user
             self.responded_at = timezone.now()
-        self.save()
\ No newline at end of file
+        self.save()
+
+class SearchDocument(models.Model):
+    """Searchable text of a message, comment or log entry, maintained by home.search_index"""
+
+    SOURCE_CHOICES = [
+        ('dev_message', 'Dev Message'),
+        ('task_comment', 'Task Comment'),
+        ('subtask_comment', 'Subtask Comment'),
+        ('system_log', 'System Log'),
+    ]
+
+    source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    user = models.ForeignKey(User, on_delete=models.CASCADE, null=True, blank=True, related_name='+', help_text='Author of the indexed object')
+    content = models.TextField(help_text='Indexed text (FULLTEXT indexed on MySQL)')
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = 'Search Document'
+        verbose_name_plural = 'Search Documents'
+        constraints = [
+            models.UniqueConstraint(fields=['source', 'object_id'], name='search_document_unique_object'),
+        ]
+        indexes = [
+            models.Index(fields=['source', '-created_at'], name='search_document_source_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_source_display()} #{self.object_id}"
+
+
+class SearchToken(models.Model):
+    """Inverted index entry used when the database has no FULLTEXT support"""
+
+    token = models.CharField(max_length=64)
+    document = models.ForeignKey(SearchDocument, on_delete=models.CASCADE, related_name='tokens')
+    source = models.CharField(max_length=20, help_text='Copied from the document so lookups stay on this table')
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['token', 'document'], name='search_token_unique_document'),
+        ]
+        indexes = [
+            models.Index(fields=['token', 'source', 'document'], name='search_token_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.token} -> {self.document_id}"
@@ -0,0 +1,110 @@
+"""
+Notification inbox
+
+Lists notifications newest first with a (created_at, id) keyset cursor, so
+a page costs the same however deep the user scrolls. Marking notifications
+read is a single UPDATE whatever the number of rows, and the counters shown
+on the notification pages come from one aggregate. Read notifications older
+than the retention period are moved to NotificationArchive in batches by
+the archive_notifications command, which keeps the table, and the unread
+badge count on the (recipient, is_read) index, small.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Notification, NotificationArchive
+from .pagination import keyset_page
+
+PAGE_SIZE = 20
+ARCHIVE_FIELDS = (
+    'id', 'recipient_id', 'notification_type', 'title', 'message', 'is_admin_notification',
+    'triggered_by_id', 'related_project_id', 'related_task_id', 'created_at',
+)
+
+
+class NotificationPage:
+    """One page of notifications and the cursor of the next page"""
+
+    def __init__(self, notifications, next_cursor):
+        self.notifications = notifications
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+
+class NotificationInbox:
+    """Listing, bulk read marking, counters and retention of notifications"""
+
+    def for_user(self, user):
+        """A user's personal notifications (system-wide ones are only shown to admins)"""
+        return Notification.objects.filter(recipient=user)
+
+    def page(self, notifications, cursor=None, limit=PAGE_SIZE):
+        """Notifications of a queryset after `cursor`, newest first"""
+        return NotificationPage(*keyset_page(notifications, cursor, limit))
+
+    def mark_read(self, ids, user=None):
+        """Mark notifications read in one UPDATE, only the user's own when a user is given. Returns the rows changed"""
+        notifications = Notification.objects.filter(id__in=ids, is_read=False)
+        if user is not None:
+            notifications = notifications.filter(recipient=user)
+        return notifications.update(is_read=True)
+
+    def mark_all_read(self, user):
+        """Mark all of a user's notifications read in one UPDATE"""
+        return self.for_user(user).filter(is_read=False).update(is_read=True)
+
+    def unread_count(self, user):
+        return self.for_user(user).filter(is_read=False).count()
+
+    def counts(self, user):
+        """{'total', 'unread'} of a user's notifications in one query"""
+        return self.for_user(user).aggregate(
+            total=Count('id'),
+            unread=Count('id', filter=Q(is_read=False)),
+        )
+
+    def summary(self):
+        """Counters of the admin notification pages in one aggregate"""
+        today = timezone.localdate()
+        return Notification.objects.aggregate(
+            total=Count('id'),
+            unread=Count('id', filter=Q(is_read=False)),
+            admin=Count('id', filter=Q(is_admin_notification=True)),
+            team=Count('id', filter=Q(is_admin_notification=False)),
+            today=Count('id', filter=Q(created_at__date=today)),
+            week=Count('id', filter=Q(created_at__date__gte=today - timedelta(days=7))),
+            tracked=Count('id', filter=Q(triggered_by__isnull=False)),
+        )
+
+    def archive_read(self, older_than_days, batch_size=1000, archive=True):
+        """
+        Move read notifications older than `older_than_days` to NotificationArchive
+        (or delete them when archive is False), batch_size rows per transaction.
+        Returns the number of notifications removed from the inbox.
+        """
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+        removed = 0
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    Notification.objects.filter(is_read=True, created_at__lt=cutoff)
+                    .order_by('created_at', 'id').values(*ARCHIVE_FIELDS)[:batch_size]
+                )
+                if not rows:
+                    return removed
+                ids = [row['id'] for row in rows]
+                if archive:
+                    NotificationArchive.objects.bulk_create([
+                        NotificationArchive(original_id=row.pop('id'), **row) for row in rows
+                    ])
+                removed += Notification.objects.filter(id__in=ids).delete()[0]
+
+
+# Global notification inbox instance
+notification_inbox = NotificationInbox()
@@ -0,0 +1,128 @@
+"""
+One-time passwords for client and user password setup and reset
+
+Codes are drawn with `secrets` and only a keyed hash (HMAC-SHA256 with
+SECRET_KEY, bound to the owner) is stored. Each owner has at most one unused
+OTP (a partial unique constraint), so verification is a single lookup on the
+(owner, is_used, expires_at) index followed by a constant-time comparison,
+however many rows the tables hold. Failed attempts are counted in the cache
+and the OTP is burnt after MAX_ATTEMPTS. Expired rows are deleted in batches
+by the purge_expired_otps command.
+"""
+import hashlib
+import hmac
+import secrets
+import string
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+# Results of OTPService.verify()
+VALID = 'valid'
+INVALID = 'invalid'
+EXPIRED = 'expired'
+LOCKED = 'locked'
+
+ATTEMPTS_KEY = 'otp:attempts:{}:{}'
+
+
+def hash_code(kind, owner_id, code):
+    """Keyed hash of an OTP; the owner is part of the message so hashes cannot be reused across owners"""
+    message = f'{kind}:{owner_id}:{code}'.encode('utf-8')
+    return hmac.new(settings.SECRET_KEY.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+
+class OTPService:
+    """Generate, verify and purge ClientOTP and UserOTP records"""
+
+    CODE_LENGTH = 6
+    LIFETIME = timedelta(hours=24)
+    MAX_ATTEMPTS = 5
+
+    def _target(self, owner):
+        """(kind, model, owner field) for a Client or a User"""
+        from .models import Client, ClientOTP, UserOTP
+        if isinstance(owner, Client):
+            return 'client', ClientOTP, 'client'
+        return 'user', UserOTP, 'user'
+
+    def _attempts_key(self, kind, owner):
+        return ATTEMPTS_KEY.format(kind, owner.pk)
+
+    def generate(self, owner):
+        """Create a new OTP for a Client or User, invalidating the previous one. Returns the plain code"""
+        kind, model, field = self._target(owner)
+        code = ''.join(secrets.choice(string.digits) for _ in range(self.CODE_LENGTH))
+
+        with transaction.atomic():
+            model.objects.filter(**{field: owner, 'is_used': False}).update(is_used=True)
+            model.objects.create(**{
+                field: owner,
+                'otp_hash': hash_code(kind, owner.pk, code),
+                'expires_at': timezone.now() + self.LIFETIME,
+                'is_used': False,
+            })
+
+        cache.delete(self._attempts_key(kind, owner))
+        return code
+
+    def verify(self, owner, code):
+        """
+        Check a code against the owner's active OTP and consume it on success.
+
+        Returns:
+            str: VALID, INVALID, EXPIRED or LOCKED (too many failed attempts)
+        """
+        kind, model, field = self._target(owner)
+        attempts_key = self._attempts_key(kind, owner)
+        if cache.get(attempts_key, 0) >= self.MAX_ATTEMPTS:
+            return LOCKED
+
+        # At most one unused row per owner, so this is a single index probe
+        otp_obj = model.objects.filter(**{field: owner, 'is_used': False}).order_by().first()
+        if otp_obj is None:
+            return INVALID
+        if otp_obj.expires_at <= timezone.now():
+            return EXPIRED
+
+        expected = hash_code(kind, owner.pk, (code or '').strip())
+        if not hmac.compare_digest(otp_obj.otp_hash, expected):
+            if self._record_failure(attempts_key) >= self.MAX_ATTEMPTS:
+                model.objects.filter(pk=otp_obj.pk).update(is_used=True)
+                return LOCKED
+            return INVALID
+
+        # Conditional update so two concurrent requests cannot both consume the code
+        if not model.objects.filter(pk=otp_obj.pk, is_used=False).update(is_used=True):
+            return INVALID
+        cache.delete(attempts_key)
+        return VALID
+
+    def _record_failure(self, key):
+        timeout = int(self.LIFETIME.total_seconds())
+        cache.add(key, 0, timeout)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # Key expired between add() and incr()
+            cache.set(key, 1, timeout)
+            return 1
+
+    def purge_expired(self, model, before=None, batch_size=1000):
+        """Delete rows of an OTP model that expired before `before` (default now), batch_size rows per query"""
+        before = before or timezone.now()
+        deleted = 0
+        while True:
+            ids = list(
+                model.objects.filter(expires_at__lt=before).order_by().values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            deleted += model.objects.filter(pk__in=ids).delete()[0]
+
+
+# Global OTP service instance
+otp_service = OTPService()
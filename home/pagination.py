@@ -0,0 +1,44 @@
+"""
+Keyset pagination on (created_at, id)
+
+Listings ordered newest first are paged with an opaque cursor holding the
+(created_at, id) of the last row of the previous page, so a page costs the
+same however deep the reader goes, unlike OFFSET.
+"""
+import base64
+import binascii
+from datetime import datetime
+
+from django.db.models import Q
+
+
+def encode_cursor(obj):
+    raw = f'{obj.created_at.isoformat()}|{obj.id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """(created_at, id) of the last row of the previous page, None for an invalid cursor"""
+    try:
+        created_at, obj_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|')
+        return datetime.fromisoformat(created_at), int(obj_id)
+    except (ValueError, UnicodeError, binascii.Error):
+        return None
+
+
+def keyset_page(queryset, cursor=None, limit=20):
+    """
+    Rows of a queryset after `cursor`, newest first.
+
+    Returns:
+        tuple: (list of at most `limit` rows, cursor of the next page or None)
+    """
+    queryset = queryset.order_by('-created_at', '-id')
+    position = decode_cursor(cursor) if cursor else None
+    if position:
+        created_at, obj_id = position
+        queryset = queryset.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=obj_id))
+
+    rows = list(queryset[:limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return rows[:limit], next_cursor
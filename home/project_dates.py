@@ -0,0 +1,108 @@
+"""
+Project date maintenance
+
+A project's start and end dates are the earliest task start and latest task
+end. Task.save() tracks its loaded dates in memory and, when they change,
+schedules its project here instead of re-reading the old row and saving the
+project. Scheduled projects are recalculated once, when the surrounding
+transaction commits, with a single grouped Min/Max query and a bulk_update,
+so importing many tasks in one transaction costs a constant number of
+queries.
+"""
+import threading
+import weakref
+
+from django.db import transaction
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from .report_snapshots import bump_data_version
+
+_state = threading.local()
+
+
+def recalculate_project_dates(project_ids=None, batch_size=500):
+    """
+    Recompute start/end dates for the given projects (all projects when None).
+
+    Returns:
+        int: number of projects whose dates changed
+    """
+    from .models import Project, Task
+
+    projects = Project.objects.only('id', 'start_date', 'end_date')
+    tasks = Task.objects.all()
+    if project_ids is not None:
+        project_ids = {project_id for project_id in project_ids if project_id}
+        if not project_ids:
+            return 0
+        projects = projects.filter(id__in=project_ids)
+        tasks = tasks.filter(project_id__in=project_ids)
+
+    dates = {
+        row['project_id']: (row['first_start'], row['last_end'])
+        for row in tasks.order_by().values('project_id').annotate(
+            first_start=Min('start_date'), last_end=Max('end_date')
+        )
+    }
+
+    now = timezone.now()
+    changed = []
+    for project in projects:
+        start_date, end_date = dates.get(project.id, (None, None))
+        if project.start_date != start_date or project.end_date != end_date:
+            project.start_date = start_date
+            project.end_date = end_date
+            project.updated_at = now
+            changed.append(project)
+
+    if changed:
+        Project.objects.bulk_update(changed, ['start_date', 'end_date', 'updated_at'], batch_size=batch_size)
+        # bulk_update sends no signals, so invalidate the report snapshots here
+        bump_data_version([project.id for project in changed])
+    return len(changed)
+
+
+class _PendingFlush:
+    """on_commit callback recalculating the projects scheduled in one transaction"""
+
+    def __init__(self):
+        self.project_ids = set()
+
+    def __call__(self):
+        # Projects scheduled from here on wait for the next commit
+        _state.pending = None
+        recalculate_project_dates(self.project_ids)
+
+
+def _pending_flush():
+    """
+    The callback registered for the current transaction, or None.
+
+    Only a weak reference is kept: when the transaction rolls back Django
+    drops its on_commit callbacks, the callback is freed and the next
+    scheduled project registers a new one.
+    """
+    pending = getattr(_state, 'pending', None)
+    return pending() if pending is not None else None
+
+
+def schedule_project_dates(project_ids):
+    """
+    Recalculate the projects' dates when the current transaction commits
+    (immediately in autocommit mode). Projects scheduled within the same
+    transaction are recalculated together.
+    """
+    project_ids = {project_id for project_id in project_ids if project_id}
+    if not project_ids:
+        return
+
+    flush = _pending_flush()
+    if flush is not None:
+        flush.project_ids.update(project_ids)
+        return
+
+    flush = _PendingFlush()
+    flush.project_ids.update(project_ids)
+    _state.pending = weakref.ref(flush)
+    transaction.on_commit(flush)
@@ -0,0 +1,221 @@
+"""
+Cache-backed sliding-window rate limiting for public endpoints
+"""
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines
+    fcntl = None
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.http import HttpResponse, JsonResponse
+from django.urls import Resolver404, resolve
+
+logger = logging.getLogger(__name__)
+
+REJECTED_COUNTER_KEY = 'ratelimit:rejected:{}'
+COUNTER_LOCK_FILE = 'ratelimit.lock'
+
+# Registry of every policy declared with @rate_limit, keyed by policy name
+_policies = {}
+
+
+def client_ip(request):
+    """
+    Address a request is rate limited under.
+
+    X-Forwarded-For is not used: nginx appends to whatever the client sent,
+    so its first entry is chosen by the client. X-Real-IP is set by nginx
+    from the connecting address and is only trusted on requests coming from
+    one of settings.RATE_LIMIT_TRUSTED_PROXIES.
+    """
+    remote_addr = request.META.get('REMOTE_ADDR', '')
+    if remote_addr in getattr(settings, 'RATE_LIMIT_TRUSTED_PROXIES', ()):
+        return request.META.get('HTTP_X_REAL_IP') or remote_addr
+    return remote_addr or 'unknown'
+
+
+@contextmanager
+def _counter_lock():
+    """
+    Serialize counter updates on the file cache, whose incr() is a read
+    followed by a write. Other backends increment atomically.
+    """
+    if fcntl is None or not isinstance(caches['default'], FileBasedCache):
+        yield
+        return
+    location = settings.CACHES['default']['LOCATION']
+    os.makedirs(location, exist_ok=True)
+    with open(os.path.join(location, COUNTER_LOCK_FILE), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _increment(key, timeout):
+    """Atomically add one to a counter, creating it if needed"""
+    with _counter_lock():
+        cache.add(key, 0, timeout)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            # Key expired between add() and incr()
+            cache.set(key, 1, timeout)
+            return 1
+
+
+class RateLimitPolicy:
+    """A named limit of `limit` requests per `window` seconds per client IP"""
+
+    def __init__(self, name, limit, window, methods=('POST',)):
+        self.name = name
+        self.default_limit = limit
+        self.default_window = window
+        self.methods = methods
+
+    @property
+    def limit(self):
+        override = getattr(settings, 'RATE_LIMITS', {}).get(self.name)
+        return override[0] if override else self.default_limit
+
+    @property
+    def window(self):
+        override = getattr(settings, 'RATE_LIMITS', {}).get(self.name)
+        return override[1] if override else self.default_window
+
+    def applies_to(self, request):
+        """Only count the HTTP methods this policy covers (None means all)"""
+        return self.methods is None or request.method in self.methods
+
+    def hit(self, identifier):
+        """
+        Record one request and decide whether it is allowed.
+
+        Uses a sliding-window counter: the current fixed window is counted with
+        an atomic cache increment and the previous window's count is weighted by
+        how much of it still overlaps the sliding window.
+
+        Returns:
+            tuple: (allowed, retry_after_seconds)
+        """
+        window = self.window
+        now = time.time()
+        window_index = int(now // window)
+        current_key = f'ratelimit:{self.name}:{identifier}:{window_index}'
+        previous_key = f'ratelimit:{self.name}:{identifier}:{window_index - 1}'
+
+        current = _increment(current_key, window * 2)
+        previous = cache.get(previous_key, 0)
+
+        elapsed_fraction = (now % window) / window
+        estimated = previous * (1 - elapsed_fraction) + current
+        retry_after = max(1, math.ceil(window - (now % window)))
+        return estimated <= self.limit, retry_after
+
+
+def record_rejection(policy_name):
+    """Count a rejected request for the given policy"""
+    _increment(REJECTED_COUNTER_KEY.format(policy_name), None)
+
+
+def get_rejection_stats():
+    """Return {policy_name: rejected_count} for every registered policy"""
+    keys = {REJECTED_COUNTER_KEY.format(name): name for name in _policies}
+    counts = cache.get_many(list(keys))
+    return {name: counts.get(key, 0) for key, name in keys.items()}
+
+
+def _too_many_requests(request, retry_after):
+    """Build the 429 response, JSON for AJAX callers and plain text otherwise"""
+    message = 'Too many requests. Please wait before trying again.'
+    wants_json = (
+        request.content_type == 'application/json'
+        or 'application/json' in request.headers.get('Accept', '')
+        or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+    )
+    if wants_json:
+        response = JsonResponse({'success': False, 'error': message}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type='text/plain')
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def check_rate_limit(request, policy):
+    """
+    Apply a policy to a request.
+
+    Returns:
+        HttpResponse or None: a 429 response if the request must be rejected
+    """
+    if getattr(request, '_rate_limit_checked', False) or not policy.applies_to(request):
+        return None
+    request._rate_limit_checked = True
+
+    identifier = client_ip(request)
+    allowed, retry_after = policy.hit(identifier)
+    if allowed:
+        return None
+
+    record_rejection(policy.name)
+    logger.warning(f"Rate limit '{policy.name}' exceeded by {identifier} on {request.path}")
+    return _too_many_requests(request, retry_after)
+
+
+def rate_limit(name, limit, window, methods=('POST',)):
+    """
+    Decorator to rate limit a view per client IP.
+    Usage: @rate_limit('ai_chat', limit=20, window=60)
+
+    Limits can be overridden per policy name with settings.RATE_LIMITS,
+    e.g. RATE_LIMITS = {'ai_chat': (40, 60)}.
+    """
+    policy = RateLimitPolicy(name, limit, window, methods)
+    _policies[name] = policy
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            rejected = check_rate_limit(request, policy)
+            if rejected is not None:
+                return rejected
+            return view_func(request, *args, **kwargs)
+        _wrapped_view.rate_limit_policy = policy
+        return _wrapped_view
+    return decorator
+
+
+class RateLimitMiddleware:
+    """
+    Enforce @rate_limit policies before sessions and authentication are loaded.
+
+    Place it ahead of SessionMiddleware so rejected requests never touch the
+    database. Views without a policy pass straight through.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            match = None
+
+        policy = getattr(match.func, 'rate_limit_policy', None) if match else None
+        if policy is not None:
+            rejected = check_rate_limit(request, policy)
+            if rejected is not None:
+                return rejected
+
+        return self.get_response(request)
@@ -0,0 +1,171 @@
+"""
+Versioned per-client report snapshots
+
+Project, Task and SubTask signals bump a version counter for the affected
+project (and a global data version). A client's report snapshot is cached
+under a key derived from its project ids and their versions, so clients
+whose projects did not change are served from the cache and only clients
+with activity are recomputed.
+
+Snapshots hold the date-independent part of a client report; the weekly and
+Friday reports derive their time windows (recent activity, upcoming
+deadlines) from it.
+"""
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .client_links import client_project_ids
+from .models import Project, Task
+
+DATA_VERSION_KEY = 'project_data_version'
+PROJECT_VERSION_KEY = 'project_data_version:{}'
+SNAPSHOT_KEY = 'client_report_snapshot:{}:{}'
+SNAPSHOT_TIMEOUT = 60 * 60 * 24 * 8  # outlives the weekly report interval
+RECENT_TASKS_LIMIT = 15
+
+
+def _initial_version():
+    # Seeded from the clock so a version lost to cache eviction never
+    # matches a version an existing snapshot was built with
+    return int(time.time() * 1000)
+
+
+def _bump(key):
+    cache.add(key, _initial_version(), None)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        version = _initial_version()
+        cache.set(key, version, None)
+        return version
+
+
+def get_data_version():
+    """Version of all project data, changes whenever any project, task or subtask changes"""
+    cache.add(DATA_VERSION_KEY, _initial_version(), None)
+    return cache.get(DATA_VERSION_KEY) or _initial_version()
+
+
+def bump_data_version(project_ids=()):
+    """Mark project data as changed, globally and for the given projects"""
+    for project_id in project_ids:
+        if project_id:
+            _bump(PROJECT_VERSION_KEY.format(project_id))
+    return _bump(DATA_VERSION_KEY)
+
+
+def get_project_versions(project_ids):
+    """Return {project_id: version} with one cache round trip for known projects"""
+    keys = {PROJECT_VERSION_KEY.format(project_id): project_id for project_id in project_ids}
+    found = cache.get_many(list(keys))
+    versions = {}
+    for key, project_id in keys.items():
+        if key not in found:
+            cache.add(key, _initial_version(), None)
+            found[key] = cache.get(key)
+        versions[project_id] = found[key]
+    return versions
+
+
+def build_client_snapshot(project_ids):
+    """Compute the report summary for a set of projects with two queries"""
+    projects = Project.objects.filter(id__in=project_ids).annotate(
+        task_count=Count('tasks'),
+        completed_task_count=Count('tasks', filter=Q(tasks__status='completed')),
+        in_progress_task_count=Count('tasks', filter=Q(tasks__status='in_progress')),
+    ).order_by('-created_at')
+
+    projects_data = []
+    for project in projects:
+        completion_rate = (
+            project.completed_task_count / project.task_count * 100 if project.task_count else 0
+        )
+        projects_data.append({
+            'id': project.id,
+            'name': project.name,
+            'status': project.status,
+            'description': getattr(project, 'description', '') or 'No description available',
+            'completion_rate': round(completion_rate, 1),
+            'start_date': project.start_date,
+            'end_date': project.end_date,
+            'created_at': project.created_at,
+            'total_tasks': project.task_count,
+            'completed_tasks': project.completed_task_count,
+            'in_progress_tasks': project.in_progress_task_count,
+        })
+
+    # The most recently updated tasks; any later time window is a prefix of this list
+    recent_tasks = [
+        {
+            'title': task.title,
+            'status': task.status,
+            'project_name': task.project.name,
+            'updated_at': task.updated_at,
+            'priority': task.priority,
+            'description': task.description or 'No description',
+        }
+        for task in Task.objects.filter(project_id__in=project_ids)
+        .select_related('project').order_by('-updated_at')[:RECENT_TASKS_LIMIT]
+    ]
+
+    return {
+        'total_projects': len(projects_data),
+        'active_projects': sum(1 for p in projects_data if p['status'] == 'in_progress'),
+        'completed_projects': sum(1 for p in projects_data if p['status'] == 'completed'),
+        'planned_projects': sum(1 for p in projects_data if p['status'] == 'planned'),
+        'total_tasks': sum(p['total_tasks'] for p in projects_data),
+        'completed_tasks': sum(p['completed_tasks'] for p in projects_data),
+        'in_progress_tasks': sum(p['in_progress_tasks'] for p in projects_data),
+        'projects': projects_data,
+        'recent_tasks': recent_tasks,
+    }
+
+
+def get_client_snapshot(client):
+    """
+    Report summary for a client, served from the cache while none of the
+    client's projects changed.
+
+    Returns:
+        tuple: (snapshot dict, True if it came from the cache)
+    """
+    project_ids = sorted(client_project_ids(client))
+    versions = get_project_versions(project_ids)
+    fingerprint = hashlib.sha1(
+        json.dumps([[project_id, versions[project_id]] for project_id in project_ids]).encode()
+    ).hexdigest()
+    key = SNAPSHOT_KEY.format(client.pk, fingerprint)
+
+    snapshot = cache.get(key)
+    if snapshot is not None:
+        return snapshot, True
+
+    snapshot = build_client_snapshot(project_ids)
+    cache.set(key, snapshot, SNAPSHOT_TIMEOUT)
+    return snapshot, False
+
+
+def recent_tasks_since(snapshot, since, limit=RECENT_TASKS_LIMIT):
+    """Tasks updated at or after `since`, newest first"""
+    return [task for task in snapshot['recent_tasks'] if task['updated_at'] >= since][:limit]
+
+
+def upcoming_deadlines(snapshot, today, days=14):
+    """In-progress projects ending within `days` days, closest deadline first"""
+    deadlines = []
+    for project in snapshot['projects']:
+        if project['status'] == 'in_progress' and project['end_date']:
+            days_remaining = (project['end_date'] - today).days
+            if 0 <= days_remaining <= days:
+                deadlines.append({
+                    'project_name': project['name'],
+                    'deadline': project['end_date'],
+                    'days_remaining': days_remaining,
+                    'completion_rate': project['completion_rate'],
+                })
+    deadlines.sort(key=lambda x: x['days_remaining'])
+    return deadlines
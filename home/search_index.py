@@ -0,0 +1,263 @@
+"""
+Full-text search over dev messages, task/subtask comments and system logs
+
+Every indexed object has one SearchDocument row holding its searchable text
+(including the author's name). On MySQL the documents are matched with a
+FULLTEXT index (MATCH ... AGAINST in boolean mode); on other databases a
+SearchToken inverted index is kept alongside them. Both are maintained by
+signals (see home.signals) and can be rebuilt with the rebuild_search_index
+command.
+
+Queries are AND-ed words. Results are ranked by relevance, then recency.
+"""
+import logging
+import re
+from collections import Counter
+
+from django.db import connection, transaction
+from django.db.models import Case, F, FloatField, Func, IntegerField, Max, Q, Sum, Value, When
+
+from .models import DevMessage, SearchDocument, SearchToken, SubTaskComment, SystemLog, TaskComment
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+MIN_TOKEN_LENGTH = 2
+MAX_TOKEN_LENGTH = 64
+MAX_TOKENS_PER_DOCUMENT = 500
+MAX_QUERY_TERMS = 8
+
+
+def tokenize(text):
+    """Lower-cased word tokens of `text`"""
+    return [
+        token for token in TOKEN_PATTERN.findall((text or '').lower())
+        if MIN_TOKEN_LENGTH <= len(token) <= MAX_TOKEN_LENGTH
+    ]
+
+
+def query_terms(query):
+    """Distinct search terms of a user query, in order"""
+    return list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+
+
+def use_fulltext():
+    return connection.vendor == 'mysql'
+
+
+class FullTextMatch(Func):
+    """MATCH (content) AGAINST (query IN BOOLEAN MODE), usable in filter() and as a score"""
+    template = 'MATCH (%(expressions)s) AGAINST (%%s IN BOOLEAN MODE)'
+    output_field = FloatField()
+    conditional = True
+
+    def __init__(self, terms):
+        super().__init__(F('content'))
+        # Every term required, prefix match so "deploy" finds "deployment"
+        self.boolean_query = ' '.join(f'+{term}*' for term in terms)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = super().as_sql(compiler, connection, **extra_context)
+        return sql, (*params, self.boolean_query)
+
+
+def _user_text(user):
+    if user is None:
+        return []
+    return [(user.username, 1), (user.first_name, 1), (user.last_name, 1)]
+
+
+def _log_details(value):
+    """Flatten the string values of SystemLog.additional_info"""
+    if isinstance(value, dict):
+        return ' '.join(_log_details(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return ' '.join(_log_details(item) for item in value)
+    return value if isinstance(value, str) else ''
+
+
+class IndexedSource:
+    """How one model is turned into a search document"""
+
+    def __init__(self, name, model, fields, select_related=('user',), created_field='created_at'):
+        self.name = name
+        self.model = model
+        self.fields = fields  # instance -> [(text, weight), ...]
+        self.select_related = select_related
+        self.created_field = created_field
+
+    def document_values(self, instance):
+        parts = [(text, weight) for text, weight in self.fields(instance) if text]
+        return {
+            'user_id': instance.user_id,
+            'content': '\n'.join(text for text, _ in parts),
+            'created_at': getattr(instance, self.created_field),
+        }, parts
+
+
+SOURCES = {
+    source.name: source for source in [
+        IndexedSource('dev_message', DevMessage, lambda m: [
+            (m.subject, 3), (m.message, 1), (m.admin_response, 1), *_user_text(m.user),
+        ]),
+        IndexedSource('task_comment', TaskComment, lambda c: [(c.comment, 1), *_user_text(c.user)]),
+        IndexedSource('subtask_comment', SubTaskComment, lambda c: [(c.comment, 1), *_user_text(c.user)]),
+        IndexedSource('system_log', SystemLog, lambda log: [
+            (log.get_action_display(), 1), (_log_details(log.additional_info), 1),
+            (log.os_info, 1), (log.browser_info, 1), *_user_text(log.user),
+        ], created_field='timestamp'),
+    ]
+}
+SOURCE_FOR_MODEL = {source.model: source for source in SOURCES.values()}
+
+
+def _token_rows(document, parts):
+    weights = Counter()
+    for text, weight in parts:
+        for token in tokenize(text):
+            weights[token] += weight
+    return [
+        SearchToken(token=token, document=document, source=document.source, weight=min(weight, 32767))
+        for token, weight in weights.most_common(MAX_TOKENS_PER_DOCUMENT)
+    ]
+
+
+def _token_hits(terms, sources=None):
+    """
+    Ids of the documents holding, for every term, a token starting with it
+    (prefix match, like the FULLTEXT `term*` query), with the summed weight
+    of the matching tokens as `score`
+    """
+    prefixes = [Q(token__startswith=term) for term in terms]
+    condition = prefixes[0]
+    for prefix in prefixes[1:]:
+        condition |= prefix
+    tokens = SearchToken.objects.filter(condition)
+    if sources:
+        tokens = tokens.filter(source__in=sources)
+    has_term = {
+        f'has_term_{i}': Max(Case(When(prefix, then=Value(1)), default=Value(0), output_field=IntegerField()))
+        for i, prefix in enumerate(prefixes)
+    }
+    return tokens.values('document_id').annotate(score=Sum('weight'), **has_term).filter(
+        **{name: 1 for name in has_term}
+    )
+
+
+class SearchIndex:
+    """Maintains and queries the search documents"""
+
+    def index(self, instance, created=False):
+        """Add or refresh the document for a saved instance"""
+        source = SOURCE_FOR_MODEL[type(instance)]
+        values, parts = source.document_values(instance)
+        with transaction.atomic():
+            if created:
+                document = SearchDocument.objects.create(source=source.name, object_id=instance.pk, **values)
+            else:
+                document, created = SearchDocument.objects.update_or_create(
+                    source=source.name, object_id=instance.pk, defaults=values
+                )
+            if not use_fulltext():
+                if not created:
+                    document.tokens.all().delete()
+                SearchToken.objects.bulk_create(_token_rows(document, parts))
+        return document
+
+    def remove(self, instance):
+        source = SOURCE_FOR_MODEL[type(instance)]
+        SearchDocument.objects.filter(source=source.name, object_id=instance.pk).delete()
+
+    def rebuild(self, source_name, batch_size=1000):
+        """Re-index every object of a source. Returns the number indexed"""
+        source = SOURCES[source_name]
+        fulltext = use_fulltext()
+        SearchDocument.objects.filter(source=source_name).delete()
+
+        count = 0
+        objects = source.model.objects.select_related(*source.select_related).order_by('pk')
+        last_pk = 0
+        while True:
+            batch = list(objects.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                documents = []
+                all_parts = []
+                for instance in batch:
+                    values, parts = source.document_values(instance)
+                    documents.append(SearchDocument(source=source_name, object_id=instance.pk, **values))
+                    all_parts.append(parts)
+                documents = SearchDocument.objects.bulk_create(documents)
+                if not fulltext:
+                    if documents and documents[0].pk is None:
+                        # Backends that do not return primary keys from bulk_create
+                        ids = dict(SearchDocument.objects.filter(
+                            source=source_name, object_id__in=[d.object_id for d in documents]
+                        ).values_list('object_id', 'id'))
+                        for document in documents:
+                            document.pk = ids[document.object_id]
+                    SearchToken.objects.bulk_create(
+                        [row for document, parts in zip(documents, all_parts) for row in _token_rows(document, parts)],
+                        batch_size=batch_size,
+                    )
+            count += len(batch)
+            last_pk = batch[-1].pk
+        return count
+
+    def matching_documents(self, query, sources=None):
+        """
+        Documents containing every term of `query`, with a relevance `score`.
+        Returns None when the query has no searchable terms.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return None
+
+        documents = SearchDocument.objects.all()
+        if sources:
+            documents = documents.filter(source__in=sources)
+
+        if use_fulltext():
+            match = FullTextMatch(terms)
+            return documents.filter(match).annotate(score=FullTextMatch(terms))
+
+        # Documents holding all the terms, scored by the summed term weights
+        scores = {row['document_id']: row['score'] for row in _token_hits(terms, sources)}
+        documents = list(documents.filter(id__in=scores))
+        for document in documents:
+            document.score = scores[document.id]
+        return documents
+
+    def matching_ids(self, source, query):
+        """
+        Subquery of the object ids of `source` matching `query`, for filtering
+        the model's own queryset. Returns None when the query has no searchable terms.
+        """
+        terms = query_terms(query)
+        if not terms:
+            return None
+        if use_fulltext():
+            return SearchDocument.objects.filter(source=source).filter(FullTextMatch(terms)).values('object_id')
+        hits = _token_hits(terms, [source]).values('document_id')
+        return SearchDocument.objects.filter(id__in=hits).values('object_id')
+
+    def search(self, query, sources=None, offset=0, limit=20):
+        """
+        Ranked search results, best first and newest first among equals.
+
+        Returns:
+            tuple: (list of SearchDocument with .score, total number of matches)
+        """
+        documents = self.matching_documents(query, sources)
+        if documents is None:
+            return [], 0
+        if isinstance(documents, list):
+            documents.sort(key=lambda document: (document.score, document.created_at), reverse=True)
+            return documents[offset:offset + limit], len(documents)
+        total = documents.count()
+        return list(documents.order_by('-score', '-created_at')[offset:offset + limit]), total
+
+
+# Global search index instance
+search_index = SearchIndex()
@@ -1,6 +1,28 @@
-from django.db.models.signals import post_delete
+import logging
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
-from .models import Project, Client, ClientOTP
+from .models import (
+    Project, Task, SubTask, Client, ClientOTP, ChatbotFeedback, AIKnowledgeBase,
+    DevMessage, TaskComment, SubTaskComment, SystemLog,
+)
+from .ai_service import bump_knowledge_version
+from .client_links import bump_versions as bump_client_links, client_project_ids, sync_links
+from .comment_threads import comment_threads
+from .project_dates import schedule_project_dates
+from .report_snapshots import bump_data_version
+from .search_index import search_index
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(pre_delete, sender=Project)
+def remember_project_clients(sender, instance, **kwargs):
+    """
+    Note the linked clients before their links are deleted along with the project
+    """
+    instance._linked_client_ids = list(instance.client_links.values_list('client_id', flat=True))
 
 
 @receiver(post_delete, sender=Project)
@@ -8,21 +30,146 @@ def cleanup_orphaned_clients(sender, instance, **kwargs):
     """
     Clean up client records when a project is deleted
     """
+    bump_client_links(getattr(instance, '_linked_client_ids', []))
+
     if instance.client_email:
-        # Check if this client email is used by any other projects
-        other_projects_with_same_email = Project.objects.filter(
-            client_email=instance.client_email
-        ).exists()
-        
-        if not other_projects_with_same_email:
-            # No other projects use this email, so we can safely delete client records
+        client = Client.objects.filter(email=instance.client_email).first()
+
+        # Only delete a client that is no longer linked to any project
+        if client and not client_project_ids(client):
             try:
                 # Delete related client OTPs
-                ClientOTP.objects.filter(client__email=instance.client_email).delete()
+                ClientOTP.objects.filter(client=client).delete()
                 
                 # Delete the client
-                Client.objects.filter(email=instance.client_email).delete()
+                client.delete()
                 
                 print(f"Signals: Cleaned up client records for email: {instance.client_email}")
             except Exception as e:
                 print(f"Signals: Warning - Could not clean up client records: {e}")
+
+
+@receiver(post_save, sender=Project)
+def project_client_links_changed(sender, instance, update_fields=None, **kwargs):
+    """
+    Re-link a project whose client_username or client_email may have changed
+    """
+    if update_fields is not None and not {'client_username', 'client_email'} & set(update_fields):
+        return
+    sync_links(project_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Client)
+def client_links_changed(sender, instance, update_fields=None, **kwargs):
+    """
+    Re-link a client whose username or email may have changed
+    """
+    if update_fields is not None and not {'username', 'email'} & set(update_fields):
+        return
+    sync_links(client_ids=[instance.pk])
+
+
+@receiver(post_save, sender=ChatbotFeedback)
+@receiver(post_delete, sender=ChatbotFeedback)
+def invalidate_feedback_summary(sender, instance, **kwargs):
+    """
+    Drop the cached feedback summary so the next report reflects the change
+    """
+    cache.delete(ChatbotFeedback.SUMMARY_CACHE_KEY)
+
+
+@receiver(post_save, sender=AIKnowledgeBase)
+@receiver(post_delete, sender=AIKnowledgeBase)
+def invalidate_knowledge_index(sender, instance, **kwargs):
+    """
+    Bump the knowledge base version so every worker reloads its search index
+    """
+    bump_knowledge_version()
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_data_changed(sender, instance, **kwargs):
+    """
+    Bump the project data version so cached client report snapshots are rebuilt
+    """
+    bump_data_version([instance.pk])
+
+
+@receiver(m2m_changed, sender=Project.clients.through)
+def project_clients_changed(sender, instance, action, pk_set, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        if isinstance(instance, Project):
+            bump_data_version([instance.pk])
+            sync_links(project_ids=[instance.pk])
+        else:
+            bump_data_version(pk_set or [])
+            sync_links(client_ids=[instance.pk])
+
+
+@receiver(m2m_changed, sender=Project.assigned_users.through)
+def project_team_changed(sender, instance, action, pk_set, **kwargs):
+    """
+    Assignment changes alter which tasks appear on each user's task board
+    """
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        bump_data_version([instance.pk] if isinstance(instance, Project) else (pk_set or []))
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_delete, sender=Task)
+def task_data_changed(sender, instance, **kwargs):
+    bump_data_version([instance.project_id])
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted_update_project_dates(sender, instance, **kwargs):
+    """
+    Recalculate the project's dates without the deleted task (saves are handled in Task.save)
+    """
+    schedule_project_dates([instance.project_id])
+
+
+@receiver(post_save, sender=SubTask)
+@receiver(post_delete, sender=SubTask)
+def subtask_data_changed(sender, instance, **kwargs):
+    if SubTask.task.is_cached(instance):
+        project_id = instance.task.project_id
+    else:
+        project_id = Task.objects.filter(pk=instance.task_id).values_list('project_id', flat=True).first()
+    bump_data_version([project_id])
+
+
+@receiver(post_save, sender=TaskComment)
+@receiver(post_delete, sender=TaskComment)
+def task_comment_changed(sender, instance, **kwargs):
+    comment_threads.bump_version('task', instance.task_id)
+
+
+@receiver(post_save, sender=SubTaskComment)
+@receiver(post_delete, sender=SubTaskComment)
+def subtask_comment_changed(sender, instance, **kwargs):
+    comment_threads.bump_version('subtask', instance.subtask_id)
+
+
+@receiver(post_save, sender=DevMessage)
+@receiver(post_save, sender=TaskComment)
+@receiver(post_save, sender=SubTaskComment)
+@receiver(post_save, sender=SystemLog)
+def update_search_index(sender, instance, created, **kwargs):
+    """
+    Keep the search document of a message, comment or log entry current.
+    Failures are logged rather than raised; rebuild_search_index repairs gaps.
+    """
+    try:
+        search_index.index(instance, created=created)
+    except Exception as e:
+        logger.warning(f"Could not index {sender.__name__} {instance.pk}: {e}")
+
+
+@receiver(post_delete, sender=DevMessage)
+@receiver(post_delete, sender=TaskComment)
+@receiver(post_delete, sender=SubTaskComment)
+@receiver(post_delete, sender=SystemLog)
+def remove_from_search_index(sender, instance, **kwargs):
+    search_index.remove(instance)
@@ -0,0 +1,272 @@
+"""
+System metrics collector for the admin monitoring pages
+
+Host stats are read straight from /proc and shutil.disk_usage (no psutil), the
+application workers are found through the gunicorn pidfile, and database size
+comes from information_schema on MySQL or the page count on SQLite. Samples
+are written by the collect_system_metrics command on a schedule so the admin
+pages only read the latest rows.
+"""
+import logging
+import os
+import shutil
+import time
+
+from django.conf import settings
+from django.db import connection
+
+from .models import SystemMetricSample
+
+logger = logging.getLogger(__name__)
+
+GB = 1024 ** 3
+MB = 1024 ** 2
+
+DEFAULT_ALERT_THRESHOLDS = {
+    'cpu_percent': 90,
+    'memory_percent': 90,
+    'disk_percent': 90,
+}
+
+
+def _read_file(path):
+    try:
+        with open(path) as f:
+            return f.read()
+    except OSError:
+        return ''
+
+
+def read_cpu_times():
+    """Return (idle, total) jiffies from the aggregate cpu line of /proc/stat"""
+    for line in _read_file('/proc/stat').splitlines():
+        if line.startswith('cpu '):
+            values = [int(value) for value in line.split()[1:]]
+            idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+            return idle, sum(values)
+    return 0, 0
+
+
+def cpu_percent(interval=1.0):
+    """CPU utilisation across all cores over `interval` seconds"""
+    idle_before, total_before = read_cpu_times()
+    time.sleep(interval)
+    idle_after, total_after = read_cpu_times()
+    total = total_after - total_before
+    if total <= 0:
+        return 0.0
+    return round(100.0 * (1 - (idle_after - idle_before) / total), 1)
+
+
+def load_average():
+    try:
+        return round(os.getloadavg()[0], 2)
+    except OSError:
+        return 0.0
+
+
+def memory_info():
+    """Total and available memory in GB from /proc/meminfo"""
+    meminfo = {}
+    for line in _read_file('/proc/meminfo').splitlines():
+        key, _, value = line.partition(':')
+        parts = value.split()
+        if parts:
+            meminfo[key] = int(parts[0]) * 1024  # kB
+    total = meminfo.get('MemTotal', 0)
+    available = meminfo.get('MemAvailable', meminfo.get('MemFree', 0))
+    percent = round(100.0 * (total - available) / total, 1) if total else 0.0
+    return {
+        'memory_percent': percent,
+        'memory_total': round(total / GB, 2),
+        'memory_available': round(available / GB, 2),
+    }
+
+
+def disk_info(path=None):
+    """Usage of the filesystem holding the project"""
+    usage = shutil.disk_usage(path or settings.BASE_DIR)
+    return {
+        'disk_percent': round(100.0 * usage.used / usage.total, 1) if usage.total else 0.0,
+        'disk_total': round(usage.total / GB, 2),
+        'disk_free': round(usage.free / GB, 2),
+    }
+
+
+def network_info():
+    """Bytes sent and received since boot on every non-loopback interface, in MB"""
+    sent = recv = 0
+    for line in _read_file('/proc/net/dev').splitlines()[2:]:
+        interface, _, counters = line.partition(':')
+        if interface.strip() == 'lo':
+            continue
+        fields = counters.split()
+        if len(fields) >= 9:
+            recv += int(fields[0])
+            sent += int(fields[8])
+    return {'network_sent': round(sent / MB, 2), 'network_recv': round(recv / MB, 2)}
+
+
+def process_rss(pid):
+    """Resident memory of a process in MB, 0 if it is gone"""
+    for line in _read_file(f'/proc/{pid}/status').splitlines():
+        if line.startswith('VmRSS:'):
+            return round(int(line.split()[1]) / 1024, 2)
+    return 0.0
+
+
+def _child_pids(parent_pid):
+    children = []
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return children
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        stat = _read_file(f'/proc/{entry}/stat')
+        # The command name is in parentheses and may contain spaces
+        fields = stat.rpartition(')')[2].split()
+        if len(fields) > 1 and fields[1] == str(parent_pid):
+            children.append(int(entry))
+    return children
+
+
+def worker_memory():
+    """
+    RSS of the gunicorn master and its workers, found through the pidfile.
+    Falls back to the current process when gunicorn is not running.
+    """
+    pidfile = getattr(settings, 'GUNICORN_PID_FILE', '/var/www/eclick/gunicorn.pid')
+    master_pid = None
+    content = _read_file(pidfile).strip()
+    if content.isdigit() and os.path.exists(f'/proc/{content}'):
+        master_pid = int(content)
+
+    if master_pid is None:
+        pids = [os.getpid()]
+    else:
+        pids = [master_pid] + _child_pids(master_pid)
+
+    workers = {str(pid): process_rss(pid) for pid in pids}
+    return {
+        'process_memory': round(sum(workers.values()), 2),
+        'worker_count': len(pids) - 1 if master_pid else 1,
+        'workers': workers,
+    }
+
+
+def database_size(top=10):
+    """
+    Total database size in MB and the largest tables.
+
+    Returns:
+        tuple: (size_mb, [{'table': name, 'size': mb}, ...])
+    """
+    tables = []
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == 'mysql':
+                cursor.execute(
+                    "SELECT table_name, COALESCE(data_length, 0) + COALESCE(index_length, 0) "
+                    "FROM information_schema.tables WHERE table_schema = DATABASE()"
+                )
+                tables = [(name, size) for name, size in cursor.fetchall()]
+                total = sum(size for _, size in tables)
+            elif connection.vendor == 'sqlite':
+                cursor.execute('PRAGMA page_count')
+                page_count = cursor.fetchone()[0]
+                cursor.execute('PRAGMA page_size')
+                total = page_count * cursor.fetchone()[0]
+            else:
+                return 0.0, []
+    except Exception as e:
+        logger.warning(f"Could not read database size: {e}")
+        return 0.0, []
+
+    tables.sort(key=lambda item: item[1], reverse=True)
+    largest = [{'table': name, 'size': round(size / MB, 2)} for name, size in tables[:top]]
+    return round(total / MB, 2), largest
+
+
+def directory_size(path):
+    """Total size of the files under `path` in MB"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return round(total / MB, 2)
+
+
+def check_alerts(values):
+    """Return an alert for every metric above its configured threshold"""
+    thresholds = {**DEFAULT_ALERT_THRESHOLDS, **getattr(settings, 'SYSTEM_METRICS_ALERT_THRESHOLDS', {})}
+    alerts = []
+    for metric, threshold in thresholds.items():
+        value = values.get(metric)
+        if value is not None and value >= threshold:
+            label = metric.replace('_percent', '').replace('_', ' ').title()
+            alerts.append({
+                'metric': metric,
+                'value': value,
+                'threshold': threshold,
+                'message': f'{label} usage at {value}% (threshold {threshold}%)',
+            })
+    return alerts
+
+
+class SystemMetricsCollector:
+    """Samples system metrics into the SystemMetricSample ring buffer"""
+
+    def __init__(self):
+        self.backup_dir = os.path.join(settings.BASE_DIR, 'backups')
+
+    @property
+    def retention(self):
+        # 288 samples is one day at a 5 minute schedule
+        return getattr(settings, 'SYSTEM_METRICS_RETENTION', 288)
+
+    def collect(self, cpu_interval=1.0):
+        """Read every metric once and return them as a dict"""
+        workers = worker_memory()
+        db_size, largest_tables = database_size()
+
+        values = {
+            'cpu_percent': cpu_percent(cpu_interval),
+            'load_average': load_average(),
+            **memory_info(),
+            **disk_info(),
+            **network_info(),
+            'process_memory': workers['process_memory'],
+            'worker_count': workers['worker_count'],
+            'db_size': db_size,
+            'backup_size': directory_size(self.backup_dir),
+        }
+        values['details'] = {
+            'workers': workers['workers'],
+            'largest_tables': largest_tables,
+            'alerts': check_alerts(values),
+        }
+        return values
+
+    def sample(self, cpu_interval=1.0):
+        """Collect, store and trim. Returns the new sample"""
+        sample = SystemMetricSample.objects.create(**self.collect(cpu_interval))
+        SystemMetricSample.trim(self.retention)
+        for alert in sample.alerts:
+            logger.warning(f"Capacity alert: {alert['message']}")
+        return sample
+
+    def latest(self):
+        return SystemMetricSample.objects.first()
+
+    def history(self, limit=48):
+        """Most recent samples, oldest first for charting"""
+        return list(SystemMetricSample.objects.all()[:limit])[::-1]
+
+
+# Global collector instance
+metrics_collector = SystemMetricsCollector()
@@ -0,0 +1,87 @@
+"""
+Per-user task board for the planner and team dashboard
+
+A user's assigned projects and their tasks are fetched once (one query each)
+and partitioned in Python by status, due window and priority. The board is
+cached briefly under the user and the project data version, which every
+project, task and assignment change bumps, so both pages usually only query
+for their notifications.
+"""
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Project, Task
+from .report_snapshots import get_data_version
+
+TASK_BOARD_KEY = 'task_board:{}:{}'
+TASK_BOARD_TIMEOUT = 60
+BOARD_STATUSES = ('not_started', 'in_progress', 'on_hold', 'completed')
+OPEN_STATUSES = ('not_started', 'in_progress')
+HIGH_PRIORITIES = ('high', 'urgent')
+
+
+def _by_end_date(task):
+    # Undated tasks first, as the database sorts NULLs in ascending order
+    return (task.end_date is not None, task.end_date or date.min)
+
+
+class TaskBoard:
+    """A user's assigned projects and tasks, grouped for display"""
+
+    def __init__(self, projects, tasks, today):
+        self.today = today
+        self.projects = projects
+        self.tasks = tasks
+
+        self.by_status = {status: [] for status in BOARD_STATUSES}
+        tasks_by_project = {project.id: [] for project in projects}
+        for task in tasks:
+            self.by_status.setdefault(task.status, []).append(task)
+            tasks_by_project.setdefault(task.project_id, []).append(task)
+        for project in projects:
+            project.board_tasks = tasks_by_project[project.id]
+
+        self.total_projects = len(projects)
+        self.active_projects = sum(1 for project in projects if project.status == 'in_progress')
+        self.completed_projects = sum(1 for project in projects if project.status == 'completed')
+
+        open_tasks = [task for task in tasks if task.status in OPEN_STATUSES]
+        self.total_tasks = len(tasks)
+        self.completed_tasks = len(self.by_status['completed'])
+        self.pending_tasks = self.total_tasks - self.completed_tasks
+        self.open_tasks = len(open_tasks)
+
+        self.upcoming_tasks = sorted(
+            (task for task in open_tasks
+             if task.end_date and today <= task.end_date <= today + timedelta(days=7)),
+            key=_by_end_date
+        )
+        self.urgent_tasks = sorted(
+            (task for task in open_tasks if task.end_date and task.end_date <= today + timedelta(days=3)),
+            key=_by_end_date
+        )
+        self.high_priority_tasks = sorted(
+            (task for task in open_tasks if task.priority in HIGH_PRIORITIES),
+            key=lambda task: (task.priority, _by_end_date(task))
+        )
+
+
+def build_task_board(user, today=None):
+    """Build the board with one query for the projects and one for their tasks"""
+    projects = list(Project.objects.filter(assigned_users=user))
+    project_ids = [project.id for project in projects]
+    tasks = list(Task.objects.filter(project_id__in=project_ids).select_related('project')) if project_ids else []
+    return TaskBoard(projects, tasks, today or timezone.now().date())
+
+
+def get_task_board(user):
+    """The user's task board, cached until project data changes or the day rolls over"""
+    today = timezone.now().date()
+    key = TASK_BOARD_KEY.format(user.pk, get_data_version())
+    board = cache.get(key)
+    if board is None or board.today != today:
+        board = build_task_board(user, today)
+        cache.set(key, board, TASK_BOARD_TIMEOUT)
+    return board
@@ -1,7 +1,43 @@
+import json
+import os
+import tempfile
+from unittest import mock
+from datetime import date, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail import EmailMessage
+from django.core.cache import cache
 from django.core.management import call_command
-from django.test import TestCase
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from home.models import Client, Project
+from eclick.fake_graph_server import FakeGraphServer
+from eclick.graph_email_backend import GraphEmailBackend
+from home.ai_service import LocalAIService
+from home.backup_restore import BackupRestoreEngine
+from home.chart_cache import ChartCache, donut_params
+from home.client_links import client_project_ids, client_project_ids_many
+from home.comment_threads import build_threads, comment_threads
+from home.gantt_layout import build_gantt_layout
+from home.import_budget import measure_imports
+from home.notification_inbox import notification_inbox
+from home.otp_service import EXPIRED, INVALID, LOCKED, VALID, otp_service
+from home.email_service import EmailAssetCache, SimpleEmailService, email_assets
+from home.models import (
+    AIKnowledgeBase, ChatbotFeedback, Client, ClientOTP, ClientProjectLink, DevMessage, Notification, NotificationArchive, Project,
+    SearchDocument, SubTask, SystemMetricSample, Task, TaskComment, UserOTP, UserProfile, generate_user_otp,
+)
+from home.rate_limit import get_rejection_stats
+from home.report_snapshots import get_client_snapshot, recent_tasks_since
+from home.search_index import search_index
+from home.views import FEATURE_MODULES
+from home.system_metrics import metrics_collector
+from home.task_board import get_task_board
+from main.models import UserPermission
+from main.permissions import PermissionMatrix, get_matrix_version
 
 
 class FridayReportCommandTest(TestCase):
@@ -17,6 +53,1018 @@ class FridayReportCommandTest(TestCase):
         # Should run even if not Friday when forced, and not raise
         call_command('send_friday_reports', '--force', '--dry-run')
 
+    def test_each_client_gets_a_result_line(self):
+        out = StringIO()
+        call_command('send_weekly_reports', stdout=out)
+        self.assertIn('✓ Report sent to acme (acme@example.com)', out.getvalue())
+        self.assertEqual(mail.outbox[0].to, ['acme@example.com'])
+
 from django.test import TestCase
 
 # Create your tests here.
+
+
+class RateLimitTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_ai_chat_rejects_after_limit(self):
+        with override_settings(RATE_LIMITS={'ai_chat': (2, 60)}):
+            for _ in range(2):
+                response = self.client.post('/ai/chat/', data='{}', content_type='application/json')
+                self.assertEqual(response.status_code, 400)
+            response = self.client.post('/ai/chat/', data='{}', content_type='application/json')
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+        self.assertEqual(get_rejection_stats()['ai_chat'], 1)
+
+    def test_forwarded_for_does_not_reset_the_limit(self):
+        with override_settings(RATE_LIMITS={'ai_chat': (2, 60)}):
+            statuses = [
+                self.client.post(
+                    '/ai/chat/', data='{}', content_type='application/json',
+                    HTTP_X_FORWARDED_FOR=f'10.0.0.{i}', HTTP_X_REAL_IP='203.0.113.7',
+                ).status_code
+                for i in range(3)
+            ]
+            self.assertEqual(statuses, [400, 400, 429])
+            # Another client behind the same proxy has its own limit
+            response = self.client.post(
+                '/ai/chat/', data='{}', content_type='application/json', HTTP_X_REAL_IP='203.0.113.8'
+            )
+        self.assertEqual(response.status_code, 400)
+
+    def test_contact_form_is_rate_limited(self):
+        # Honeypot submissions are rejected before any email is sent
+        data = {'website': 'spam'}
+        for _ in range(3):
+            response = self.client.post('/contact/', data, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+            self.assertEqual(response.status_code, 200)
+        response = self.client.post('/contact/', data, HTTP_X_REQUESTED_WITH='XMLHttpRequest')
+        self.assertEqual(response.status_code, 429)
+        self.assertFalse(response.json()['success'])
+        self.assertEqual(self.client.get('/contact/').status_code, 200)
+
+
+class LazySessionStoreTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_unchanged_session_is_not_rewritten(self):
+        from eclick.session_backend import SessionStore
+
+        store = SessionStore()
+        store['client_id'] = 1
+        store.save()
+
+        reloaded = SessionStore(store.session_key)
+        self.assertEqual(reloaded['client_id'], 1)
+        reloaded['client_id'] = 1
+        with self.assertNumQueries(0):
+            reloaded.save()
+
+        reloaded['client_id'] = 2
+        reloaded.save()
+        cache.clear()
+        self.assertEqual(SessionStore(store.session_key)['client_id'], 2)
+
+    def test_cleanup_command_batches_when_the_engine_supports_it(self):
+        from django.contrib.sessions.models import Session
+
+        expired = timezone.now() - timedelta(days=1)
+        for i in range(3):
+            Session.objects.create(session_key=f'expired{i}', session_data='', expire_date=expired)
+        out = StringIO()
+        with override_settings(SESSION_ENGINE='eclick.session_backend'):
+            call_command('cleanup_expired_sessions', '--batch-size', '2', stdout=out)
+        self.assertIn('Deleted 3 expired sessions', out.getvalue())
+
+        Session.objects.create(session_key='expired', session_data='', expire_date=expired)
+        out = StringIO()
+        with override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db'):
+            call_command('cleanup_expired_sessions', stdout=out)
+        self.assertIn('Expired sessions cleared', out.getvalue())
+        self.assertFalse(Session.objects.exists())
+
+
+class SatisfactionReportTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        ChatbotFeedback.objects.create(session_id='a', feedback_type='satisfaction', satisfaction_rating=4)
+        ChatbotFeedback.objects.create(session_id='b', feedback_type='satisfaction', satisfaction_rating=2)
+        ChatbotFeedback.objects.create(session_id='c', feedback_text='Great bot')
+
+    def test_daily_trend_is_a_single_query(self):
+        with self.assertNumQueries(1):
+            trend = ChatbotFeedback.get_daily_trend(90)
+        self.assertEqual(len(trend), 90)
+        self.assertEqual(trend[-1]['count'], 3)
+        self.assertEqual(trend[-1]['avg_rating'], 3.0)
+
+    def test_summary_is_invalidated_on_new_feedback(self):
+        self.assertEqual(ChatbotFeedback.get_summary()['total_ratings'], 2)
+        ChatbotFeedback.objects.create(session_id='d', feedback_type='satisfaction', satisfaction_rating=5)
+        self.assertEqual(ChatbotFeedback.get_summary()['total_ratings'], 3)
+
+
+class LoadKnowledgeCommandTest(TestCase):
+    def test_load_knowledge_skips_duplicate_questions(self):
+        AIKnowledgeBase.objects.create(question='What is E-Click?', answer='A software company')
+        rows = [
+            {'question': 'what is e-click', 'answer': 'Duplicate of an existing entry'},
+            {'question': 'Do you build apps?', 'answer': 'Yes', 'tags': ['apps']},
+            {'question': 'Do you build apps', 'answer': 'Duplicate within the file'},
+        ]
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as f:
+            f.write('\n'.join(json.dumps(row) for row in rows))
+        self.addCleanup(os.unlink, f.name)
+
+        call_command('load_knowledge', f.name, stdout=open(os.devnull, 'w'))
+
+        self.assertEqual(AIKnowledgeBase.objects.count(), 2)
+        self.assertTrue(AIKnowledgeBase.objects.filter(question='Do you build apps?', tags=['apps']).exists())
+
+    def test_index_updates_keep_usage_count(self):
+        cache.clear()
+        AIKnowledgeBase.objects.create(question='Where are you based?', answer='Cape Town', confidence_score=0.5)
+        service = LocalAIService()
+        for _ in range(5):
+            service.get_response('Where are you based?')
+        service._boost_confidence('Where are you based?')
+        entry = AIKnowledgeBase.objects.get()
+        self.assertEqual((entry.usage_count, entry.confidence_score), (5, 0.6))
+
+        service.add_knowledge('Where are you based?', 'Johannesburg')
+        entry.refresh_from_db()
+        self.assertEqual((entry.answer, entry.usage_count), ('Johannesburg', 6))
+
+
+class AnswerCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        AIKnowledgeBase.objects.create(question='What services do you offer?', answer='Web and mobile apps')
+        self.service = LocalAIService()
+
+    def test_repeated_question_is_served_from_cache(self):
+        answer, _, _ = self.service.get_response('What services do you offer?')
+        self.assertEqual(answer, 'Web and mobile apps')
+        cached_answer, _, _ = self.service.get_response('what services do you offer')
+        self.assertEqual(cached_answer, answer)
+
+        stats = self.service.get_answer_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_local_hit_reads_only_the_knowledge_version(self):
+        self.service.get_response('What services do you offer?')
+        with mock.patch('home.ai_service.cache', wraps=cache) as shared_cache:
+            self.service.get_response('What services do you offer?')
+        self.assertEqual([call[0] for call in shared_cache.method_calls], ['get'])
+        # Counts reach the shared counters in batches
+        self.assertEqual(cache.get('ai_answer_cache_hits'), None)
+        self.assertEqual(self.service.get_answer_cache_stats()['hits'], 1)
+
+    def test_knowledge_change_invalidates_cached_answers(self):
+        self.service.get_response('What services do you offer?')
+        entry = AIKnowledgeBase.objects.get()
+        entry.answer = 'Custom software'
+        entry.save()
+        answer, _, _ = self.service.get_response('What services do you offer?')
+        self.assertEqual(answer, 'Custom software')
+
+
+class BackupRestoreEngineTest(TestCase):
+    def test_restore_replaces_data_and_keeps_timestamps(self):
+        project = Project.objects.create(name='Backed up', client='Acme', client_email='acme@example.com')
+        Task.objects.create(title='Original task', project=project)
+        Project.objects.filter(pk=project.pk).update(created_at=timezone.now() - timedelta(days=30))
+        created_at = Project.objects.get(pk=project.pk).created_at
+
+        output = StringIO()
+        call_command('dumpdata', '--exclude', 'contenttypes', '--exclude', 'auth.permission',
+                     '--exclude', 'admin.logentry', '--exclude', 'sessions.session', stdout=output)
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            f.write(output.getvalue())
+        self.addCleanup(os.unlink, f.name)
+
+        Project.objects.create(name='Created after backup', client='Other', client_email='other@example.com')
+        Task.objects.all().delete()
+
+        engine = BackupRestoreEngine(batch_size=2)
+        dry_run = engine.restore(f.name, dry_run=True)
+        self.assertEqual(Project.objects.count(), 2)
+        self.assertEqual(dry_run['models']['home.Project'], 1)
+
+        result = engine.restore(f.name)
+        self.assertEqual(list(Project.objects.values_list('name', flat=True)), ['Backed up'])
+        self.assertAlmostEqual(Project.objects.get().created_at, created_at, delta=timedelta(seconds=1))
+        self.assertEqual(Task.objects.get().title, 'Original task')
+        self.assertGreater(result['total_rows'], 0)
+
+    def test_restore_rebuilds_derived_tables(self):
+        acme = Client.objects.create(username='acme', email='acme@example.com')
+        project = Project.objects.create(name='Linked', client_email='acme@example.com')
+        task = Task.objects.create(title='Indexed', project=project)
+        author = get_user_model().objects.create(username='author', email='author@example.com')
+        TaskComment.objects.create(task=task, user=author, comment='restorable checklist')
+
+        # Task dates changed without Task.save(), so the project dates are stale
+        Task.objects.filter(id=task.id).update(start_date=date(2026, 3, 2), end_date=date(2026, 3, 6))
+
+        # Backups taken before the link and search tables existed
+        output = StringIO()
+        call_command('dumpdata', '--exclude', 'contenttypes', '--exclude', 'auth.permission',
+                     '--exclude', 'admin.logentry', '--exclude', 'sessions.session',
+                     '--exclude', 'home.clientprojectlink', '--exclude', 'home.searchdocument',
+                     '--exclude', 'home.searchtoken', stdout=output)
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            f.write(output.getvalue())
+        self.addCleanup(os.unlink, f.name)
+
+        BackupRestoreEngine().restore(f.name)
+        self.assertEqual(client_project_ids(acme), [project.id])
+        documents, total = search_index.search('checklist', ['task_comment'])
+        self.assertEqual(total, 1)
+        project.refresh_from_db()
+        self.assertEqual((project.start_date, project.end_date), (date(2026, 3, 2), date(2026, 3, 6)))
+
+
+class SystemMetricsTest(TestCase):
+    @override_settings(SYSTEM_METRICS_RETENTION=2, SYSTEM_METRICS_ALERT_THRESHOLDS={'disk_percent': 0})
+    def test_sample_stores_real_values_in_ring_buffer(self):
+        for _ in range(3):
+            sample = metrics_collector.sample(cpu_interval=0)
+
+        self.assertEqual(SystemMetricSample.objects.count(), 2)
+        self.assertEqual(metrics_collector.latest(), sample)
+        self.assertGreater(sample.disk_total, 0)
+        self.assertGreater(sample.db_size, 0)
+        self.assertIn('disk_percent', [alert['metric'] for alert in sample.alerts])
+
+
+class AdminControlDirectoryTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.admin = User.objects.create(username='admin', is_staff=True, is_superuser=True)
+        project = Project.objects.create(name='Busy', client='Acme', client_email='acme@example.com')
+        users = User.objects.bulk_create(
+            [User(username=f'user{i}', email=f'user{i}@example.com') for i in range(30)]
+        )
+        project.assigned_users.add(*users[1::2])
+        self.client.force_login(self.admin)
+
+    def test_missing_profiles_are_bulk_created_and_directory_is_paginated(self):
+        response = self.client.get('/admin-control/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(UserProfile.objects.count(), 31)
+        users = response.context['users']
+        self.assertEqual((len(users), users.paginator.count), (25, 31))
+        self.assertEqual(response.context['user_activity'][0]['projects_created'], 1)
+
+        response = self.client.get('/admin-control/', {'user_q': 'user1', 'user_page': 1})
+        self.assertEqual(response.context['users'].paginator.count, 11)
+
+    def test_query_count_does_not_grow_with_users(self):
+        self.client.get('/admin-control/')
+        with CaptureQueriesContext(connection) as small:
+            self.client.get('/admin-control/')
+
+        User = get_user_model()
+        User.objects.bulk_create([User(username=f'extra{i}', email=f'extra{i}@example.com') for i in range(30)])
+        self.client.get('/admin-control/')
+        with CaptureQueriesContext(connection) as large:
+            self.client.get('/admin-control/')
+        self.assertEqual(len(small), len(large))
+
+
+class EmailAssetCacheTest(TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('wb', suffix='.pdf', delete=False) as f:
+            f.write(os.urandom(200000))
+        self.path = f.name
+        self.addCleanup(os.unlink, self.path)
+        self.addCleanup(email_assets.discard, self.path)
+
+    def test_asset_is_encoded_once_and_matches_content(self):
+        assets = EmailAssetCache()
+        first = assets.get(self.path)
+        self.assertIs(assets.get(self.path), first)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(first.mime_part().get_payload(decode=True), f.read())
+
+    def test_each_recipient_gets_a_copy_with_inline_logo_and_attachment(self):
+        service = SimpleEmailService()
+        logo = os.path.join(os.path.dirname(__file__), '..', 'static', 'images', 'E Click Logo (1).png')
+        cid = service.inline_image_cid(logo)
+        result = service.send_email(
+            to_email=['a@example.com', 'b@example.com'],
+            subject='Report',
+            body=f'<html><body><img src="cid:{cid}"></body></html>',
+            attachments=[self.path],
+            inline_images=[logo],
+        )
+        self.assertTrue(result['success'])
+        # No recipient sees the others' addresses
+        self.assertEqual([message.to for message in mail.outbox], [['a@example.com'], ['b@example.com']])
+        message = mail.outbox[0].message()
+        self.assertIn(f'Content-ID: <{cid}>', message.as_string())
+        self.assertNotIn('data:image/png;base64', message.as_string())
+        # multipart/mixed [multipart/related [html, logo], pdf]
+        related, attachment = message.get_payload()
+        self.assertEqual(message.get_content_subtype(), 'mixed')
+        self.assertEqual(related.get_content_subtype(), 'related')
+        self.assertEqual([part.get_content_type() for part in related.get_payload()], ['text/html', 'image/png'])
+        self.assertEqual(attachment.get_content_disposition(), 'attachment')
+
+
+class GraphEmailBackendTest(TestCase):
+    def setUp(self):
+        self.server = FakeGraphServer(throttle=2).start()
+        self.addCleanup(self.server.stop)
+        patcher = mock.patch.object(GraphEmailBackend, 'get_access_token', return_value='token')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_messages_are_sent_in_batches_of_4_with_retries(self):
+        messages = [
+            EmailMessage(f'Report {i}', 'Body', 'info@example.com', [f'client{i}@example.com'])
+            for i in range(25)
+        ]
+        with override_settings(GRAPH_API_URL=self.server.url):
+            sent = GraphEmailBackend().send_messages(messages)
+
+        self.assertEqual(sent, 25)
+        self.assertEqual(len(self.server.sent), 25)
+        # Seven batches plus one retry for the two throttled messages
+        paths = [path for path, _ in self.server.http_requests]
+        self.assertEqual(paths, ['/v1.0/$batch'] * 8)
+        self.assertEqual(max(len(body['requests']) for _, body in self.server.http_requests), 4)
+        self.assertEqual(len(self.server.http_requests[1][1]['requests']), 2)
+
+    def test_results_are_reported_per_message(self):
+        messages = [
+            EmailMessage('Report', 'Body', 'info@example.com', ['acme@example.com']),
+            EmailMessage('Report', 'Body', 'no/such@example.com', ['globex@example.com']),
+        ]
+        with override_settings(GRAPH_API_URL=self.server.url):
+            errors = GraphEmailBackend(fail_silently=True).send_messages_with_results(messages)
+
+        self.assertIsNone(errors[0])
+        self.assertIn('404', errors[1])
+
+
+class ReportSnapshotTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.acme = Client.objects.create(username='acme', email='acme@example.com', is_active=True)
+        self.globex = Client.objects.create(username='globex', email='globex@example.com', is_active=True)
+        self.acme_project = Project.objects.create(
+            name='Acme site', client_username='acme', client_email='acme@example.com', status='in_progress'
+        )
+        globex_project = Project.objects.create(name='Globex app', client_email='globex@example.com')
+        globex_project.clients.add(self.globex)
+        self.task = Task.objects.create(title='Design', project=self.acme_project, status='completed')
+        Task.objects.create(title='Build', project=globex_project)
+
+    def test_only_changed_clients_are_recomputed(self):
+        snapshot, cached = get_client_snapshot(self.acme)
+        self.assertFalse(cached)
+        self.assertEqual(snapshot['total_tasks'], 1)
+        self.assertEqual(snapshot['completed_tasks'], 1)
+        self.assertTrue(get_client_snapshot(self.acme)[1])
+        get_client_snapshot(self.globex)
+
+        Task.objects.create(title='Launch', project=self.acme_project)
+
+        snapshot, cached = get_client_snapshot(self.acme)
+        self.assertFalse(cached)
+        self.assertEqual(snapshot['total_tasks'], 2)
+        self.assertTrue(get_client_snapshot(self.globex)[1])
+
+    def test_recent_tasks_window(self):
+        snapshot, _ = get_client_snapshot(self.acme)
+        self.assertEqual(len(recent_tasks_since(snapshot, timezone.now() - timedelta(days=7))), 1)
+        self.assertEqual(recent_tasks_since(snapshot, timezone.now() + timedelta(days=1)), [])
+
+
+class ProjectDatesTest(TestCase):
+    def setUp(self):
+        self.project = Project.objects.create(name='Dates', client_email='dates@example.com')
+
+    def test_task_import_recalculates_once_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for day in range(1, 11):
+                Task.objects.create(
+                    title=f'Task {day}', project=self.project,
+                    start_date=date(2025, 1, day), end_date=date(2025, 2, day)
+                )
+        self.assertEqual(len(callbacks), 1)
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.start_date, date(2025, 1, 1))
+        self.assertEqual(self.project.end_date, date(2025, 2, 10))
+
+    def test_save_without_date_change_skips_recalculation(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Task.objects.create(title='Only', project=self.project, start_date=date(2025, 3, 1), end_date=date(2025, 3, 5))
+        task = Task.objects.get(title='Only')
+
+        with self.captureOnCommitCallbacks() as callbacks, self.assertNumQueries(1):
+            task.status = 'completed'
+            task.save()
+        self.assertEqual(callbacks, [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            task.delete()
+        self.project.refresh_from_db()
+        self.assertIsNone(self.project.start_date)
+
+    def test_rolled_back_schedule_does_not_block_later_ones(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                Task.objects.create(title='Rolled back', project=self.project, start_date=date(2025, 1, 1), end_date=date(2025, 1, 2))
+                raise RuntimeError
+            Task.objects.create(title='Kept', project=self.project, start_date=date(2025, 4, 1), end_date=date(2025, 4, 9))
+        self.assertEqual(len(callbacks), 1)
+        self.project.refresh_from_db()
+        self.assertEqual((self.project.start_date, self.project.end_date), (date(2025, 4, 1), date(2025, 4, 9)))
+
+
+class ProjectsPageTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.staff = User.objects.create(username='staff', email='staff@example.com', is_staff=True)
+        self.acme = Client.objects.create(username='acme', email='acme@example.com', is_active=True)
+        for i in range(30):
+            project = Project.objects.create(
+                name=f'Project {i}', client='Acme' if i % 2 else 'Globex',
+                client_email='acme@example.com' if i % 2 else 'globex@example.com',
+                status='completed' if i % 3 == 0 else 'planned'
+            )
+            project.assigned_users.add(self.staff)
+            if i % 2:
+                project.clients.add(self.acme)
+            Task.objects.create(title='Task', project=project, status='completed')
+        self.client.force_login(self.staff)
+
+    def test_listing_is_paginated_and_filtered_server_side(self):
+        response = self.client.get('/projects-page/')
+        page = response.context['projects']
+        self.assertEqual((len(page), page.paginator.count), (24, 30))
+        self.assertEqual(page[0].completed_task_count, 1)
+
+        # Linked through the clients relation or, for the last one, client_email only
+        Project.objects.create(name='By email', client_email='acme@example.com', status='completed').assigned_users.add(self.staff)
+        response = self.client.get('/projects-page/', {'status': 'completed', 'client': self.acme.id})
+        self.assertEqual(response.context['projects'].paginator.count, 6)
+        data = self.client.get('/api/projects/', {'q': 'project 2', 'sort': 'name'}).json()
+        self.assertEqual([p['name'] for p in data['projects']][:2], ['Project 2', 'Project 20'])
+
+    def test_query_count_does_not_grow_with_projects(self):
+        self.client.get('/projects-page/', {'page': 2})
+        with CaptureQueriesContext(connection) as small:
+            self.client.get('/projects-page/', {'page': 2})
+        for i in range(30):
+            Project.objects.create(name=f'Extra {i}', client_email='x@example.com').assigned_users.add(self.staff)
+        with CaptureQueriesContext(connection) as large:
+            self.client.get('/projects-page/')
+        self.assertEqual(len(small), len(large))
+
+    def test_lookup_endpoints(self):
+        results = self.client.get('/api/lookup/clients/', {'q': 'acm'}).json()['results']
+        self.assertEqual([client['username'] for client in results], ['acme'])
+        results = self.client.get('/api/lookup/users/', {'q': 'sta'}).json()['results']
+        self.assertEqual(results[0]['username'], 'staff')
+
+
+class TaskBoardTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.member = User.objects.create(username='member', email='member@example.com', is_staff=True)
+        self.project = Project.objects.create(name='Board', client_email='board@example.com', status='in_progress')
+        self.project.assigned_users.add(self.member)
+        today = timezone.now().date()
+        Task.objects.create(title='Soon', project=self.project, status='in_progress', end_date=today + timedelta(days=2))
+        Task.objects.create(title='Later', project=self.project, priority='urgent', end_date=today + timedelta(days=30))
+        Task.objects.create(title='Done', project=self.project, status='completed')
+        Task.objects.create(title='Elsewhere', project=Project.objects.create(name='Other', client_email='o@example.com'))
+        self.client.force_login(self.member)
+
+    def test_board_is_partitioned_and_cached(self):
+        board = get_task_board(self.member)
+        self.assertEqual((board.total_tasks, board.completed_tasks, board.open_tasks), (3, 1, 2))
+        self.assertEqual([task.title for task in board.upcoming_tasks], ['Soon'])
+        self.assertEqual([task.title for task in board.urgent_tasks], ['Soon'])
+        self.assertEqual([task.title for task in board.high_priority_tasks], ['Later'])
+
+        with self.assertNumQueries(0):
+            get_task_board(self.member)
+
+        Task.objects.create(title='New', project=self.project)
+        self.assertEqual(get_task_board(self.member).total_tasks, 4)
+
+    def test_pages_use_cached_board(self):
+        response = self.client.get('/team-dashboard/')
+        self.assertEqual(len(response.context['assigned_projects'][0].board_tasks), 3)
+        response = self.client.get('/planner/')
+        self.assertEqual(len(response.context['task_groups']['not_started']), 1)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/planner/')
+        self.assertFalse(any('home_task' in query['sql'] for query in queries.captured_queries))
+
+
+class VersionedJsonTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.staff = User.objects.create(username='poller', email='poller@example.com', is_staff=True)
+        self.project = Project.objects.create(name='Polled', client_email='p@example.com')
+        self.client.force_login(self.staff)
+
+    def test_unchanged_data_returns_not_modified(self):
+        url = f'/projects/{self.project.id}/users/'
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertIn('private', response['Cache-Control'])
+
+        with self.assertNumQueries(2):  # session and user only
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.project.assigned_users.add(self.staff)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['assigned_users'], [self.staff.id])
+
+    def test_gantt_payload_is_compact(self):
+        Task.objects.create(title='Bar', project=self.project)
+        response = self.client.get('/dashboard/gantt-data/')
+        self.assertNotIn(b', "', response.content)
+        self.assertEqual(response.json()['projects'][0]['tasks'][0]['title'], 'Bar')
+        response = self.client.get('/dashboard/gantt-data/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+
+class SearchIndexTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.staff = User.objects.create(username='searcher', email='s@example.com', is_staff=True)
+        project = Project.objects.create(name='Indexed', client_email='i@example.com')
+        self.task = Task.objects.create(title='Deploy', project=project)
+        self.bug = DevMessage.objects.create(
+            user=self.staff, subject='Deployment broken', message='The staging deployment fails on login'
+        )
+        self.other = DevMessage.objects.create(
+            user=self.staff, subject='Login page', message='Staging deployment is slow'
+        )
+        self.comment = TaskComment.objects.create(task=self.task, user=self.staff, comment='deployment checklist done')
+
+    def test_all_terms_required_and_subject_ranked_first(self):
+        documents, total = search_index.search('staging deployment')
+        self.assertEqual(total, 2)
+        self.assertEqual(documents[0].object_id, self.bug.id)
+
+        documents, total = search_index.search('deployment', sources=['task_comment'])
+        self.assertEqual([d.object_id for d in documents], [self.comment.id])
+        self.assertEqual(search_index.search('x'), ([], 0))
+
+    def test_terms_match_word_prefixes(self):
+        documents, total = search_index.search('deploy check')
+        self.assertEqual([d.object_id for d in documents], [self.comment.id])
+        self.assertEqual(search_index.search('stag deploy')[1], 2)
+
+    def test_index_follows_edits_and_deletes(self):
+        self.other.subject = 'Performance regression'
+        self.other.save()
+        self.assertEqual(search_index.search('performance')[1], 1)
+        self.other.delete()
+        self.assertEqual(search_index.search('performance')[1], 0)
+        self.assertFalse(SearchDocument.objects.filter(source='dev_message', object_id=self.other.id).exists())
+
+    def test_rebuild_and_views(self):
+        SearchDocument.objects.filter(source='dev_message').delete()
+        call_command('rebuild_search_index', '--missing', stdout=StringIO())
+        self.assertEqual(SearchDocument.objects.filter(source='dev_message').count(), 2)
+        SearchDocument.objects.all().delete()
+        call_command('rebuild_search_index', stdout=StringIO())
+        self.assertEqual(SearchDocument.objects.filter(source='dev_message').count(), 2)
+
+        self.client.force_login(self.staff)
+        response = self.client.get('/eclick-chats/', {'search': 'broken'})
+        self.assertEqual([m.id for m in response.context['dev_messages']], [self.bug.id])
+        response = self.client.get('/api/search/', {'q': 'checklist'})
+        self.assertEqual(response.json()['results'][0]['source'], 'task_comment')
+        response = self.client.get('/api/search/', {'q': 'checklist', 'source': 'task_comment'})
+        self.assertEqual(response.json()['results'][0]['source'], 'task_comment')
+        response = self.client.get('/api/search/', {'q': 'checklist', 'source': 'dev_message'})
+        self.assertEqual(response.json()['total'], 0)
+
+
+class PermissionMatrixTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create(username='analyst', email='analyst@example.com')
+        self.admin = User.objects.create(username='root', email='root@example.com', is_superuser=True)
+
+    def test_checks_are_cached_until_grants_change(self):
+        UserPermission.grant_permission(self.user, 'analytics', 'view')
+        self.assertTrue(UserPermission.has_permission(self.user, 'analytics', 'view'))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(UserPermission.has_permission(self.user, 'analytics', 'view'))
+            self.assertFalse(UserPermission.has_permission(self.user, 'analytics', 'export'))
+            self.assertFalse(UserPermission.has_permission(self.user, 'team', 'view'))
+            self.assertTrue(UserPermission.has_permission(self.admin, 'system_logs', 'admin'))
+
+        UserPermission.revoke_permission(self.user, 'analytics', 'view')
+        self.assertFalse(UserPermission.has_permission(self.user, 'analytics', 'view'))
+
+    def test_known_version_is_a_single_cache_read(self):
+        version = get_matrix_version()
+        with mock.patch('main.permissions.cache', wraps=cache) as shared_cache:
+            self.assertEqual(get_matrix_version(), version)
+        self.assertEqual([call[0] for call in shared_cache.method_calls], ['get'])
+
+    def test_matrix_builds_from_one_query(self):
+        UserPermission.grant_permission(self.user, 'team', 'view')
+        UserPermission.grant_permission(self.user, 'team', 'edit')
+        UserPermission.grant_permission(self.admin, 'projects', 'delete')
+        with self.assertNumQueries(1):
+            matrix = PermissionMatrix.build()
+        self.assertEqual(matrix.grants(self.user.id), [('team', 'view'), ('team', 'edit')])
+        self.assertEqual(matrix.grants(self.admin.id), [('projects', 'delete')])
+
+
+class GanttLayoutTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.staff = User.objects.create(username='planner', email='planner@example.com', is_staff=True)
+        self.first = Project.objects.create(name='First', client_email='g@example.com', status='in_progress')
+        self.second = Project.objects.create(name='Second', client_email='g@example.com')
+        self.third = Project.objects.create(name='Third', client_email='g@example.com')
+        task = Task.objects.create(
+            title='Build', project=self.first, status='completed', priority='high',
+            start_date=date(2026, 1, 1), end_date=date(2026, 1, 10)
+        )
+        SubTask.objects.create(title='Wire', task=task, start_date=date(2026, 1, 2), end_date=date(2026, 1, 3))
+        Task.objects.create(title='Review', project=self.first, priority='high')
+        Task.objects.create(
+            title='Later', project=self.second, start_date=date(2026, 2, 1), end_date=date(2026, 2, 5)
+        )
+        Task.objects.create(
+            title='Overlap', project=self.third, start_date=date(2026, 1, 5), end_date=date(2026, 2, 2)
+        )
+
+    def test_layout_is_computed_in_three_queries(self):
+        with self.assertNumQueries(3):
+            layout = build_gantt_layout(Project.objects.order_by('id'), today=date(2026, 1, 6))
+
+        first = layout.projects[0]
+        self.assertEqual((first.start, first.end, first.duration), (date(2026, 1, 1), date(2026, 1, 10), 10))
+        self.assertEqual((first.progress, first.priority), (0.5, 'high'))
+        self.assertEqual([(row.kind, row.offset, row.duration) for row in first.rows],
+                         [('project', 0, 10), ('task', 0, 10), ('subtask', 1, 2)])
+        self.assertEqual(first.row.color, '#dc2626')
+
+        # First and Second do not overlap and share a lane, Third needs its own
+        self.assertEqual((layout.start, layout.end, layout.lane_count), (date(2026, 1, 1), date(2026, 2, 5), 2))
+        self.assertEqual([p.lane for p in layout.projects], [0, 0, 1])
+        self.assertEqual(layout.fraction(layout.projects[1].row), (31 / 36, 5 / 36))
+
+    def test_dashboard_queries_do_not_grow_with_projects(self):
+        self.client.force_login(self.staff)
+        with CaptureQueriesContext(connection) as few:
+            self.client.get('/dashboard/gantt-data/')
+        for index in range(5):
+            project = Project.objects.create(name=f'Extra {index}', client_email='g@example.com')
+            Task.objects.create(title='Extra', project=project, start_date=date(2026, 3, 1), end_date=date(2026, 3, 2))
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get('/dashboard/gantt-data/')
+        self.assertEqual(len(many), len(few))
+        self.assertEqual(len(response.json()['projects']), 8)
+
+
+class ChartCacheTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.renders = []
+
+    def render(self, data=b'png'):
+        self.renders.append(data)
+        return data
+
+    def test_charts_render_once_and_survive_restarts(self):
+        with override_settings(CHART_CACHE_DIR=self.directory):
+            cache_one = ChartCache()
+            params = donut_params(66.6)
+            self.assertEqual(params['rate'], 67)
+            self.assertEqual(donut_params(200)['rate'], 100)
+
+            self.assertEqual(cache_one.get('donut', params, self.render), b'png')
+            self.assertEqual(cache_one.get('donut', donut_params(67.4), self.render), b'png')
+            self.assertEqual(len(self.renders), 1)
+
+            # A new process finds the image on disk
+            cache_two = ChartCache()
+            self.assertEqual(cache_two.get('donut', params, self.render), b'png')
+            self.assertEqual(len(self.renders), 1)
+
+            gantt = {'renderer': 'plotly', 'project': 1, 'version': 1}
+            path = cache_two.path('gantt', gantt, lambda: self.render(b'gantt'))
+            self.assertEqual(cache_two.path('gantt', gantt, self.render), path)
+            cache_two.path('gantt', dict(gantt, version=2), lambda: self.render(b'gantt v2'))
+            self.assertEqual(self.renders[1:], [b'gantt', b'gantt v2'])
+
+            # Serving an old chart again keeps it from being pruned
+            os.utime(path, (0, 0))
+            cache_two.path('gantt', gantt, self.render)
+            self.assertEqual(cache_two.prune(), 0)
+
+            os.utime(path, (0, 0))
+            self.assertEqual(cache_two.prune(), 1)
+            self.assertFalse(os.path.exists(path))
+            self.assertTrue(cache_two.has('donut', params))
+
+    def test_memory_is_bounded(self):
+        with override_settings(CHART_CACHE_DIR=self.directory):
+            chart_cache = ChartCache(max_bytes=10)
+            for rate in range(5):
+                chart_cache.get('donut', donut_params(rate), lambda: self.render(b'12345'))
+            self.assertLessEqual(chart_cache._size, 10)
+
+
+class ImportBudgetTest(TestCase):
+    # Resident memory of a worker after loading every view module
+    RSS_BUDGET_KB = 150 * 1024
+    # django.setup() plus the URLconf, generous enough for slow CI machines
+    STARTUP_BUDGET_MS = 3000
+
+    def test_urlconf_does_not_import_view_modules(self):
+        report = measure_imports(['eclick.urls'])
+        self.assertEqual(report.loaded_under('home.views'), [])
+        self.assertEqual(report.heavy_modules, [])
+        self.assertLess(report.elapsed_ms, self.STARTUP_BUDGET_MS)
+        self.assertLess(report.rss_kb, self.RSS_BUDGET_KB)
+
+    def test_reverse_does_not_import_view_modules(self):
+        report = measure_imports(['eclick.urls'], url_names=['home', 'contact'])
+        self.assertEqual(report.loaded_under('home.views'), [])
+
+    def test_views_load_on_first_request(self):
+        response = self.client.get('/about/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.resolver_match.func.__module__, 'home.views.public')
+        self.assertTrue(getattr(self.client.get('/ai/chat/').resolver_match.func, 'csrf_exempt', False))
+
+    def test_web_modules_do_not_load_plotting_or_pdf_libraries(self):
+        view_modules = [f'home.views.{module}' for module in FEATURE_MODULES]
+        report = measure_imports(['eclick.urls', *view_modules, 'main.views', 'home.chart_utils'])
+        self.assertEqual(report.heavy_modules, [])
+        self.assertIn('home.views', report.cumulative_us)
+        self.assertLess(report.rss_kb, self.RSS_BUDGET_KB)
+
+
+class OTPServiceTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client_obj = Client.objects.create(username='otpclient', email='otp@example.com')
+        self.user = get_user_model().objects.create(username='otpuser', email='u@example.com')
+
+    def test_codes_are_hashed_and_single_use(self):
+        code = self.client_obj.generate_otp()
+        stored = ClientOTP.objects.get(client=self.client_obj, is_used=False)
+        self.assertEqual(len(code), 6)
+        self.assertNotIn(code, stored.otp_hash)
+
+        # A new code replaces the previous one
+        newer = self.client_obj.generate_otp()
+        self.assertEqual(ClientOTP.objects.filter(client=self.client_obj, is_used=False).count(), 1)
+        if newer != code:
+            self.assertEqual(otp_service.verify(self.client_obj, code), INVALID)
+        self.assertEqual(otp_service.verify(self.client_obj, newer), VALID)
+        self.assertEqual(otp_service.verify(self.client_obj, newer), INVALID)
+
+    def test_verification_is_one_query_and_attempts_are_limited(self):
+        code = generate_user_otp(self.user)
+        wrong = '000000' if code != '000000' else '111111'
+        with self.assertNumQueries(1):
+            self.assertEqual(otp_service.verify(self.user, wrong), INVALID)
+        for _ in range(otp_service.MAX_ATTEMPTS - 2):
+            otp_service.verify(self.user, wrong)
+        self.assertEqual(otp_service.verify(self.user, wrong), LOCKED)
+        self.assertEqual(otp_service.verify(self.user, code), LOCKED)
+        self.assertFalse(UserOTP.objects.filter(user=self.user, is_used=False).exists())
+
+        # Issuing a new code resets the counter
+        code = generate_user_otp(self.user)
+        self.assertEqual(otp_service.verify(self.user, code), VALID)
+
+    def test_expired_codes_and_purge(self):
+        code = generate_user_otp(self.user)
+        UserOTP.objects.update(expires_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(otp_service.verify(self.user, code), EXPIRED)
+        self.client_obj.generate_otp()
+
+        out = StringIO()
+        call_command('purge_expired_otps', batch_size=1, stdout=out)
+        self.assertIn('UserOTP: 1 deleted', out.getvalue())
+        self.assertFalse(UserOTP.objects.exists())
+        self.assertEqual(ClientOTP.objects.count(), 1)
+
+    def test_password_reset_view(self):
+        code = generate_user_otp(self.user)
+        response = self.client.post('/user/reset-password/', {
+            'username': 'otpuser', 'otp': code, 'new_password': 'n3w-password', 'confirm_password': 'n3w-password',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('n3w-password'))
+
+
+class CommentThreadTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.staff = get_user_model().objects.create(username='threader', email='t@example.com', is_staff=True)
+        project = Project.objects.create(name='Threads', client_email='t@example.com')
+        self.task = Task.objects.create(title='Discuss', project=project)
+        self.roots = [
+            TaskComment.objects.create(task=self.task, user=self.staff, comment=f'Thread {i}') for i in range(3)
+        ]
+        first = TaskComment.objects.create(
+            task=self.task, user=self.staff, comment='Reply', parent_comment=self.roots[0]
+        )
+        TaskComment.objects.create(
+            task=self.task, user=self.staff, comment='Nested reply', parent_comment=first, is_admin_response=True
+        )
+
+    def test_build_threads(self):
+        with self.assertNumQueries(1):
+            threads = comment_threads.threads('task', self.task.id)
+        # Newest thread first, the first thread carries the nested replies
+        self.assertEqual([node.comment.comment for node in threads], ['Thread 2', 'Thread 1', 'Thread 0'])
+        self.assertEqual(threads[2].reply_count, 2)
+        self.assertEqual(threads[2].replies[0].replies[0].comment.comment, 'Nested reply')
+        self.assertEqual(build_threads([]), [])
+
+    def test_cursor_pagination(self):
+        with self.assertNumQueries(2):
+            page = comment_threads.page('task', self.task.id, limit=2)
+        self.assertEqual([node.comment.id for node in page.threads], [self.roots[2].id, self.roots[1].id])
+        page = comment_threads.page('task', self.task.id, cursor=page.next_cursor, limit=2)
+        self.assertEqual([node.comment.id for node in page.threads], [self.roots[0].id])
+        self.assertEqual(page.threads[0].reply_count, 2)
+        self.assertIsNone(page.next_cursor)
+        # An invalid cursor starts from the beginning
+        self.assertEqual(len(comment_threads.page('task', self.task.id, cursor='bogus').threads), 3)
+
+    def test_pages_are_cached_until_a_new_comment(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(f'/api/tasks/{self.task.id}/comments/')
+        self.assertIn('Nested reply', response.json()['html'])
+        # The threads are cached, the HTML is rendered per request so relative times stay current
+        with self.assertNumQueries(3):  # session, user and the task lookup
+            with mock.patch('home.comment_threads.render_to_string', return_value='rendered now'):
+                response = self.client.get(f'/api/tasks/{self.task.id}/comments/')
+        self.assertEqual(response.json()['html'], 'rendered now')
+
+        TaskComment.objects.create(task=self.task, user=self.staff, comment='Late reply', parent_comment=self.roots[1])
+        response = self.client.get(f'/api/tasks/{self.task.id}/comments/')
+        self.assertIn('Late reply', response.json()['html'])
+        self.assertEqual(self.client.get('/api/subtasks/999/comments/').status_code, 404)
+
+
+class NotificationInboxTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.user = User.objects.create(username='reader', email='r@example.com')
+        self.other = User.objects.create(username='other', email='o@example.com')
+        types = [code for code, _ in Notification.NOTIFICATION_TYPES]
+        self.notifications = [
+            Notification.objects.create(recipient=self.user, notification_type=types[i], title=f'N{i}', message='m')
+            for i in range(5)
+        ]
+        self.foreign = Notification.objects.create(recipient=self.other, notification_type='task_update', title='X', message='m')
+
+    def test_keyset_pages(self):
+        notifications = notification_inbox.for_user(self.user)
+        page = notification_inbox.page(notifications, limit=2)
+        seen = [n.title for n in page.notifications]
+        while page.has_next:
+            page = notification_inbox.page(notifications, cursor=page.next_cursor, limit=2)
+            seen += [n.title for n in page.notifications]
+        self.assertEqual(seen, ['N4', 'N3', 'N2', 'N1', 'N0'])
+
+    def test_bulk_mark_read_and_counts(self):
+        ids = [n.id for n in self.notifications[:3]] + [self.foreign.id]
+        with self.assertNumQueries(1):
+            self.assertEqual(notification_inbox.mark_read(ids, user=self.user), 3)
+        self.assertFalse(Notification.objects.get(id=self.foreign.id).is_read)
+        with self.assertNumQueries(1):
+            self.assertEqual(notification_inbox.counts(self.user), {'total': 5, 'unread': 2})
+        with self.assertNumQueries(1):
+            self.assertEqual(notification_inbox.mark_all_read(self.user), 2)
+        with self.assertNumQueries(1):
+            summary = notification_inbox.summary()
+        self.assertEqual((summary['total'], summary['unread'], summary['today']), (6, 1, 6))
+
+    def test_inbox_api(self):
+        self.client.force_login(self.user)
+        data = self.client.get('/api/notifications/', {'limit': 2}).json()
+        self.assertEqual([n['title'] for n in data['notifications']], ['N4', 'N3'])
+        self.assertEqual(data['counts'], {'total': 5, 'unread': 5})
+        data = self.client.get('/api/notifications/', {'limit': 2, 'cursor': data['next_cursor']}).json()
+        self.assertEqual([n['title'] for n in data['notifications']], ['N2', 'N1'])
+
+        response = self.client.post('/api/notifications/read/', {'ids': [self.notifications[0].id, self.foreign.id]})
+        self.assertEqual(response.json()['updated'], 1)
+        response = self.client.post('/api/notifications/read/', {'all': '1'})
+        self.assertEqual(response.json(), {'success': True, 'updated': 4, 'unread': 0})
+
+    def test_archive_command(self):
+        Notification.objects.filter(id__in=[n.id for n in self.notifications[:3]]).update(
+            is_read=True, created_at=timezone.now() - timedelta(days=100)
+        )
+        # Unread notifications are kept however old they are
+        Notification.objects.filter(id=self.notifications[3].id).update(created_at=timezone.now() - timedelta(days=100))
+
+        out = StringIO()
+        call_command('archive_notifications', days=90, batch_size=2, stdout=out)
+        self.assertIn('3 notifications archived', out.getvalue())
+        self.assertEqual(Notification.objects.filter(recipient=self.user).count(), 2)
+        archived = NotificationArchive.objects.get(original_id=self.notifications[0].id)
+        self.assertEqual((archived.recipient, archived.title), (self.user, 'N0'))
+
+
+class ClientLinksTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.acme = Client.objects.create(username='acme', email='acme@example.com')
+        self.globex = Client.objects.create(username='globex', email='globex@example.com')
+        self.by_username = Project.objects.create(name='Username', client_username='acme', client_email='x@example.com')
+        self.by_email = Project.objects.create(name='Email', client_email='acme@example.com')
+        self.by_relation = Project.objects.create(name='Relation', client_email='y@example.com')
+        self.by_relation.clients.add(self.acme)
+
+    def test_links_cover_all_three_associations(self):
+        expected = sorted([self.by_username.id, self.by_email.id, self.by_relation.id])
+        self.assertEqual(client_project_ids(self.acme), expected)
+        self.assertEqual(client_project_ids(self.globex), [])
+
+    def test_resolver_is_cached_and_invalidated(self):
+        client_project_ids_many([self.acme.id, self.globex.id])
+        with self.assertNumQueries(0):
+            client_project_ids_many([self.acme.id, self.globex.id])
+
+        self.by_relation.clients.remove(self.acme)
+        self.by_relation.clients.add(self.globex)
+        self.assertNotIn(self.by_relation.id, client_project_ids(self.acme))
+        self.assertEqual(client_project_ids(self.globex), [self.by_relation.id])
+
+        self.by_email.client_email = 'globex@example.com'
+        self.by_email.save()
+        self.assertEqual(client_project_ids(self.acme), [self.by_username.id])
+        self.assertEqual(client_project_ids(self.globex), sorted([self.by_email.id, self.by_relation.id]))
+
+    def test_links_ignore_case(self):
+        project = Project.objects.create(name='Shouting', client_username='ACME', client_email='Globex@Example.com')
+        self.assertIn(project.id, client_project_ids(self.acme))
+        self.assertIn(project.id, client_project_ids(self.globex))
+        ClientProjectLink.objects.all().delete()
+        call_command('sync_client_links', stdout=StringIO())
+        self.assertIn(project.id, client_project_ids(self.acme))
+
+    def test_client_rename_relinks_projects(self):
+        # Bulk updates skip the signals, the client save and the sync command catch up
+        Project.objects.filter(id=self.by_username.id).update(client_username='globex-corp')
+        self.globex.username = 'globex-corp'
+        self.globex.save()
+        self.assertIn(self.by_username.id, client_project_ids(self.globex))
+        call_command('sync_client_links', stdout=StringIO())
+        self.assertNotIn(self.by_username.id, client_project_ids(self.acme))
+
+    def test_deleting_last_project_removes_client(self):
+        solo = Client.objects.create(username='solo', email='solo@example.com')
+        project = Project.objects.create(name='Solo', client_email='solo@example.com')
+        self.assertEqual(client_project_ids(solo), [project.id])
+        project.delete()
+        self.assertFalse(Client.objects.filter(id=solo.id).exists())
+        # acme is still linked to other projects through its username and the relation
+        self.by_email.delete()
+        self.assertTrue(Client.objects.filter(id=self.acme.id).exists())
+
+    def test_client_dashboard_lists_linked_projects(self):
+        session = self.client.session
+        session['client_id'] = self.acme.id
+        session.save()
+        response = self.client.get('/client/dashboard/')
+        self.assertEqual(
+            {project.id for project in response.context['projects']},
+            {self.by_username.id, self.by_email.id, self.by_relation.id},
+        )
+
+    def test_sync_command_backfills(self):
+        ClientProjectLink.objects.all().delete()
+        out = StringIO()
+        call_command('sync_client_links', batch_size=2, stdout=out)
+        self.assertIn('3 links added', out.getvalue())
+        self.assertEqual(ClientProjectLink.objects.filter(client=self.acme).count(), 3)
@@ -1,117 +1,134 @@
 from django.urls import path
-from . import views
+from .views import lazy
+
+# Feature modules are imported on the first request to one of their URLs
+public = lazy('public')
+core = lazy('core')
+reports = lazy('reports')
+admin = lazy('admin')
+client_portal = lazy('client_portal')
+backups = lazy('backups')
+chat = lazy('chat')
 
 urlpatterns = [
-    path('', views.home, name='home'),
-    path('about/', views.about, name='about'),
-    path('solutions/', views.solutions, name='solutions'),
-    path('contact/', views.contact, name='contact'),
-    path('captcha-token/', views.captcha_token_view, name='captcha_token'),
-    path('captcha-challenge/', views.captcha_challenge_view, name='captcha_challenge'),
-    path('captcha-verify/', views.captcha_verify_view, name='captcha_verify'),
-    path('services/', views.services, name='services'),
-    path('clients/', views.clients, name='clients'),
-    path('login/', views.login_view, name='login'),
+    path('', public.home, name='home'),
+    path('about/', public.about, name='about'),
+    path('solutions/', public.solutions, name='solutions'),
+    path('contact/', public.contact, name='contact'),
+    path('captcha-token/', public.captcha_token_view, name='captcha_token'),
+    path('captcha-challenge/', public.captcha_challenge_view, name='captcha_challenge'),
+    path('captcha-verify/', public.captcha_verify_view, name='captcha_verify'),
+    path('services/', public.services, name='services'),
+    path('clients/', public.clients, name='clients'),
+    path('login/', public.login_view, name='login'),
 
     # Password reset URLs
-    path('password-reset/', views.password_reset_request, name='password_reset'),
-    path('password-reset-done/', views.password_reset_done, name='password_reset_done'),
-    path('password-reset-confirm/<uidb64>/<token>/', views.password_reset_confirm, name='password_reset_confirm'),
-    path('password-reset-complete/', views.password_reset_complete, name='password_reset_complete'),
+    path('password-reset/', public.password_reset_request, name='password_reset'),
+    path('password-reset-done/', public.password_reset_done, name='password_reset_done'),
+    path('password-reset-confirm/<uidb64>/<token>/', public.password_reset_confirm, name='password_reset_confirm'),
+    path('password-reset-complete/', public.password_reset_complete, name='password_reset_complete'),
 
-    path('dashboard/', views.dashboard, name='dashboard'),
-    path('dashboard/gantt-data/', views.dashboard_gantt_data, name='dashboard_gantt_data'),
-    path('analytics/', views.analytics, name='analytics'),
-    path('projects-page/', views.projects_page, name='projects_page'),
-    path('projects/add/', views.add_project, name='add_project'),
-    path('projects/edit/<int:project_id>/', views.edit_project, name='edit_project'),
-    path('projects/delete/<int:project_id>/', views.delete_project, name='delete_project'),
-    path('projects/<int:project_id>/details/', views.project_details, name='project_details'),
-    path('projects/<int:project_id>/tasks/', views.project_tasks, name='project_tasks'),
-    path('projects/<int:project_id>/send-report/', views.send_project_report, name='send_project_report'),
-    path('projects/<int:project_id>/users/', views.get_project_users, name='get_project_users'),
-    path('projects/<int:project_id>/assign-users/', views.assign_users_to_project, name='assign_users_to_project'),
-    path('send-client-report/', views.send_client_report, name='send_client_report'),
-    path('send-client-report-ajax/', views.send_client_report, name='send_client_report_ajax'),
-    path('send-project-report/', views.send_project_report_ajax, name='send_project_report_ajax'),
-    path('projects/add-task/', views.add_task, name='add_task'),
-    path('projects/add-subtask/', views.add_subtask, name='add_subtask'),
-    path('projects/toggle-subtask/', views.toggle_subtask, name='toggle_subtask'),
-    path('projects/delete-task/', views.delete_task, name='delete_task'),
-    path('projects/delete-subtask/', views.delete_subtask, name='delete_subtask'),
-    path('projects/<int:project_id>/complete-task/<int:task_id>/', views.complete_task, name='complete_task'),
-    path('projects/<int:project_id>/edit-task/<int:task_id>/', views.edit_task, name='edit_task'),
-    path('projects/<int:project_id>/edit-task/<int:task_id>/edit-subtask/<int:subtask_id>/', views.edit_subtask, name='edit_subtask'),
-    path('settings/', views.settings, name='settings'),
-    path('reports/', views.reports, name='reports'),
-    path('send-report/', views.send_report, name='send_report'),
-    path('send-complete-report/', views.send_complete_report, name='send_complete_report'),
-    path('download-report/', views.download_report, name='download_report'),
-    path('admin-control/', views.admin_control, name='admin_control'),
+    path('dashboard/', core.dashboard, name='dashboard'),
+    path('dashboard/gantt-data/', core.dashboard_gantt_data, name='dashboard_gantt_data'),
+    path('analytics/', core.analytics, name='analytics'),
+    path('projects-page/', core.projects_page, name='projects_page'),
+    path('api/projects/', core.projects_api, name='projects_api'),
+    path('api/lookup/users/', core.lookup_users, name='lookup_users'),
+    path('api/lookup/clients/', core.lookup_clients, name='lookup_clients'),
+    path('api/search/', admin.search_api, name='search_api'),
+    path('api/notifications/', core.get_notifications, name='notification_inbox'),
+    path('api/notifications/read/', core.mark_notifications_read, name='mark_notifications_read'),
+    path('api/tasks/<int:object_id>/comments/', core.comment_threads_api, {'kind': 'task'}, name='task_comment_threads'),
+    path('api/subtasks/<int:object_id>/comments/', core.comment_threads_api, {'kind': 'subtask'}, name='subtask_comment_threads'),
+    path('projects/add/', core.add_project, name='add_project'),
+    path('projects/edit/<int:project_id>/', core.edit_project, name='edit_project'),
+    path('projects/delete/<int:project_id>/', core.delete_project, name='delete_project'),
+    path('projects/<int:project_id>/details/', core.project_details, name='project_details'),
+    path('projects/<int:project_id>/tasks/', core.project_tasks, name='project_tasks'),
+    path('projects/<int:project_id>/send-report/', reports.send_project_report, name='send_project_report'),
+    path('projects/<int:project_id>/users/', core.get_project_users, name='get_project_users'),
+    path('projects/<int:project_id>/assign-users/', core.assign_users_to_project, name='assign_users_to_project'),
+    path('send-client-report/', reports.send_client_report, name='send_client_report'),
+    path('send-client-report-ajax/', reports.send_client_report, name='send_client_report_ajax'),
+    path('send-project-report/', reports.send_project_report_ajax, name='send_project_report_ajax'),
+    path('projects/add-task/', core.add_task, name='add_task'),
+    path('projects/add-subtask/', core.add_subtask, name='add_subtask'),
+    path('projects/toggle-subtask/', core.toggle_subtask, name='toggle_subtask'),
+    path('projects/delete-task/', core.delete_task, name='delete_task'),
+    path('projects/delete-subtask/', core.delete_subtask, name='delete_subtask'),
+    path('projects/<int:project_id>/complete-task/<int:task_id>/', core.complete_task, name='complete_task'),
+    path('projects/<int:project_id>/edit-task/<int:task_id>/', core.edit_task, name='edit_task'),
+    path('projects/<int:project_id>/edit-task/<int:task_id>/edit-subtask/<int:subtask_id>/', core.edit_subtask, name='edit_subtask'),
+    path('settings/', core.settings, name='settings'),
+    path('reports/', reports.reports, name='reports'),
+    path('send-report/', reports.send_report, name='send_report'),
+    path('send-complete-report/', reports.send_complete_report, name='send_complete_report'),
+    path('download-report/', reports.download_report, name='download_report'),
+    path('admin-control/', admin.admin_control, name='admin_control'),
     
     # Admin endpoints
-    path('admin-api/user/<int:user_id>/details/', views.admin_user_details, name='admin_user_details'),
-    path('admin-api/user/<int:user_id>/permissions/', views.admin_user_details, name='admin_user_permissions'),
+    path('admin-api/user/<int:user_id>/details/', admin.admin_user_details, name='admin_user_details'),
+    path('admin-api/user/<int:user_id>/permissions/', admin.admin_user_details, name='admin_user_permissions'),
     
-    path('logout/', views.logout_view, name='logout'),
+    path('logout/', public.logout_view, name='logout'),
     
     # Planner functionality
-    path('planner/', views.user_planner, name='user_planner'),
-    path('team-dashboard/', views.team_dashboard, name='team_dashboard'),
-    path('tasks/<int:task_id>/update/', views.update_task_status, name='update_task_status'),
-    path('subtasks/<int:subtask_id>/update/', views.update_subtask_status, name='update_subtask_status'),
-    # path('tasks/<int:task_id>/update-with-notification/', views.update_task_with_notification, name='update_task_with_notification'),
-    # path('tasks/<int:task_id>/extend/', views.extend_task_duration, name='extend_task_duration'),
-    # path('tasks/<int:task_id>/comment/', views.add_task_comment, name='add_task_comment'),
-    # path('subtasks/<int:subtask_id>/comment/', views.add_subtask_comment, name='add_subtask_comment'),
-    # path('subtasks/<int:subtask_id>/extend/', views.extend_subtask_deadline, name='extend_subtask_deadline'),
-    # path('notifications/enhanced/', views.admin_notifications_enhanced, name='admin_notifications_enhanced'),
-    # path('notification-demo/', views.notification_demo, name='notification_demo'),
-    # path('admin/respond/task-comment/<int:comment_id>/', views.admin_respond_to_task_comment, name='admin_respond_to_task_comment'),
-    # path('admin/respond/subtask-comment/<int:comment_id>/', views.admin_respond_to_subtask_comment, name='admin_respond_to_subtask_comment'),
-    # path('admin/send-message/', views.admin_send_message, name='admin_send_message'),
-    # path('notifications/', views.get_notifications, name='get_notifications'),
-    # path('notifications/<int:notification_id>/read/', views.mark_notification_read, name='mark_notification_read'),
-    # path('notifications/<int:notification_id>/delete/', views.delete_notification, name='delete_notification'),
-    # path('admin-notifications/', views.admin_notifications, name='admin_notifications'),
-    path('system-logs/', views.system_logs, name='system_logs'),
-    path('backup-management/', views.backup_management, name='backup_management'),
-    path('backup-management/create/', views.create_backup, name='create_backup'),
-    path('backup-management/upload/', views.upload_backup, name='upload_backup'),
-    path('backup-management/restore/<int:backup_id>/', views.restore_backup, name='restore_backup'),
-    path('backup-management/delete/<int:backup_id>/', views.delete_backup, name='delete_backup'),
-    path('backup-management/download/<int:backup_id>/', views.download_backup, name='download_backup'),
-    # path('system-monitoring/', views.system_monitoring, name='system_monitoring'),
+    path('planner/', core.user_planner, name='user_planner'),
+    path('team-dashboard/', core.team_dashboard, name='team_dashboard'),
+    path('tasks/<int:task_id>/update/', core.update_task_status, name='update_task_status'),
+    path('subtasks/<int:subtask_id>/update/', core.update_subtask_status, name='update_subtask_status'),
+    # path('tasks/<int:task_id>/update-with-notification/', admin.update_task_with_notification, name='update_task_with_notification'),
+    # path('tasks/<int:task_id>/extend/', core.extend_task_duration, name='extend_task_duration'),
+    # path('tasks/<int:task_id>/comment/', core.add_task_comment, name='add_task_comment'),
+    # path('subtasks/<int:subtask_id>/comment/', core.add_subtask_comment, name='add_subtask_comment'),
+    # path('subtasks/<int:subtask_id>/extend/', core.extend_subtask_deadline, name='extend_subtask_deadline'),
+    # path('notifications/enhanced/', admin.admin_notifications_enhanced, name='admin_notifications_enhanced'),
+    # path('notification-demo/', admin.notification_demo, name='notification_demo'),
+    # path('admin/respond/task-comment/<int:comment_id>/', admin.admin_respond_to_task_comment, name='admin_respond_to_task_comment'),
+    # path('admin/respond/subtask-comment/<int:comment_id>/', admin.admin_respond_to_subtask_comment, name='admin_respond_to_subtask_comment'),
+    # path('admin/send-message/', admin.admin_send_message, name='admin_send_message'),
+    # path('notifications/', core.get_notifications, name='get_notifications'),
+    # path('notifications/<int:notification_id>/read/', core.mark_notification_read, name='mark_notification_read'),
+    # path('notifications/<int:notification_id>/delete/', core.delete_notification, name='delete_notification'),
+    # path('admin-notifications/', admin.admin_notifications, name='admin_notifications'),
+    path('system-logs/', admin.system_logs, name='system_logs'),
+    path('backup-management/', backups.backup_management, name='backup_management'),
+    path('backup-management/create/', backups.create_backup, name='create_backup'),
+    path('backup-management/upload/', backups.upload_backup, name='upload_backup'),
+    path('backup-management/restore/<int:backup_id>/', backups.restore_backup, name='restore_backup'),
+    path('backup-management/delete/<int:backup_id>/', backups.delete_backup, name='delete_backup'),
+    path('backup-management/download/<int:backup_id>/', backups.download_backup, name='download_backup'),
+    path('system-monitoring/', admin.system_monitoring, name='system_monitoring'),
 
-    path('client/dashboard/', views.client_dashboard, name='client_dashboard'),
-    path('client/gantt-data/', views.client_gantt_data, name='client_gantt_data'),
-    path('client/settings/', views.client_settings, name='client_settings'),
-    path('client/project/<int:project_id>/', views.client_project_detail, name='client_project_detail'),
-    path('client/logout/', views.client_logout, name='client_logout'),
-    path('client/setup-password/', views.client_setup_password, name='client_setup_password'),
-    path('client/change-password/', views.client_change_password, name='client_change_password'),
-    path('client/forgot-password/', views.client_forgot_password, name='client_forgot_password'),
-    path('client/reset-password/', views.client_reset_password, name='client_reset_password'),
-    path('send-client-otp/', views.send_client_otp, name='send_client_otp'),
+    path('client/dashboard/', client_portal.client_dashboard, name='client_dashboard'),
+    path('client/gantt-data/', client_portal.client_gantt_data, name='client_gantt_data'),
+    path('client/settings/', client_portal.client_settings, name='client_settings'),
+    path('client/project/<int:project_id>/', client_portal.client_project_detail, name='client_project_detail'),
+    path('client/logout/', client_portal.client_logout, name='client_logout'),
+    path('client/setup-password/', client_portal.client_setup_password, name='client_setup_password'),
+    path('client/change-password/', client_portal.client_change_password, name='client_change_password'),
+    path('client/forgot-password/', client_portal.client_forgot_password, name='client_forgot_password'),
+    path('client/reset-password/', client_portal.client_reset_password, name='client_reset_password'),
+    path('send-client-otp/', client_portal.send_client_otp, name='send_client_otp'),
 
     # User password setup
-    path('user/setup-password/', views.user_setup_password, name='user_setup_password'),
-    path('user/reset-password/', views.user_reset_password, name='user_reset_password'),
+    path('user/setup-password/', public.user_setup_password, name='user_setup_password'),
+    path('user/reset-password/', public.user_reset_password, name='user_reset_password'),
     
     # AI Chatbot endpoints
-    path('ai/chat/', views.ai_chat, name='ai_chat'),
-    path('ai/feedback/', views.ai_feedback, name='ai_feedback'),
-    path('ai/stats/', views.ai_stats, name='ai_stats'),
-    path('ai/knowledge/', views.ai_knowledge_management, name='ai_knowledge_management'),
+    path('ai/chat/', chat.ai_chat, name='ai_chat'),
+    path('ai/feedback/', chat.ai_feedback, name='ai_feedback'),
+    path('ai/stats/', chat.ai_stats, name='ai_stats'),
+    path('ai/knowledge/', chat.ai_knowledge_management, name='ai_knowledge_management'),
 
     # Chatbot feedback endpoints
-    path('chatbot/feedback/', views.chatbot_feedback, name='chatbot_feedback'),
-    path('chatbot/satisfaction/', views.chatbot_satisfaction, name='chatbot_satisfaction'),
-    path('chatbot/stats/', views.chatbot_stats, name='chatbot_stats'),
+    path('chatbot/feedback/', chat.chatbot_feedback, name='chatbot_feedback'),
+    path('chatbot/satisfaction/', chat.chatbot_satisfaction, name='chatbot_satisfaction'),
+    path('chatbot/stats/', chat.chatbot_stats, name='chatbot_stats'),
 
     # Admin reports
-    path('reports/satisfaction/', views.satisfaction_report, name='satisfaction_report'),
+    path('reports/satisfaction/', chat.satisfaction_report, name='satisfaction_report'),
 
     # Eclick Chats
-    path('eclick-chats/', views.eclick_chats, name='eclick_chats'),
+    path('eclick-chats/', chat.eclick_chats, name='eclick_chats'),
 ]
\ No newline at end of file
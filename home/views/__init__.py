@@ -0,0 +1,82 @@
+"""
+Views of the home app, split into feature modules
+
+    public          site pages, staff login/logout, captcha, password reset
+    core            dashboard, projects, tasks, planner, notifications
+    reports         report pages, PDF generation, report emails
+    admin           admin control panel, admin notifications, search, system logs
+    client_portal   client dashboard, project pages and account views
+    backups         backup management
+    chat            AI assistant, chatbot feedback, Eclick Chats
+
+The URLconf refers to views through lazy(), so a feature module is only
+imported when one of its URLs is first requested and importing the
+URLconf (every worker, management command and test run) stays cheap.
+
+`home.views.<name>` still works for any view or helper: the module that
+defines it is imported on first access.
+"""
+from functools import update_wrapper
+from importlib import import_module
+
+FEATURE_MODULES = ('public', 'core', 'reports', 'admin', 'client_portal', 'backups', 'chat')
+
+
+class LazyView:
+    """Stands in for a view function until the first request that needs it"""
+
+    def __init__(self, module, name):
+        self.view_module = f'{__name__}.{module}'
+        self.__module__ = self.view_module
+        self.__name__ = self.__qualname__ = name
+        self._view = None
+
+    def resolve(self):
+        if self._view is None:
+            view = getattr(import_module(self.view_module), self.__name__)
+            # Copies the view's attributes (csrf_exempt, __wrapped__, ...) for the middleware
+            update_wrapper(self, view)
+            self._view = view
+        return self._view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __getattr__(self, attr):
+        # Only reached for attributes the view sets, e.g. csrf_exempt in
+        # CsrfViewMiddleware.process_view, which runs just before the view.
+        # URLPattern.lookup_str probes view_class while reverse() populates
+        # the resolver; these are function views, so answer without importing
+        if attr.startswith('__') or attr in ('_view', 'view_class', 'view_initkwargs'):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self):
+        return f'<LazyView {self.view_module}.{self.__name__}>'
+
+
+class LazyViews:
+    """`lazy('reports').reports` is a LazyView of home.views.reports.reports"""
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return LazyView(self._module, name)
+
+
+def lazy(module):
+    if module not in FEATURE_MODULES:
+        raise ValueError(f'Unknown view module: {module}')
+    return LazyViews(module)
+
+
+def __getattr__(name):
+    # Compatibility for `from home.views import <name>`
+    for module in FEATURE_MODULES:
+        feature = import_module(f'{__name__}.{module}')
+        if hasattr(feature, name):
+            return getattr(feature, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,1373 @@
+"""
+Admin control panel, admin notifications, search, system logs and monitoring
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.core.paginator import Paginator
+import json
+import random
+from ..models import Project, Task, SubTask, UserProfile, Client, Notification, SystemLog, TaskComment, SubTaskComment, SearchDocument
+from ..decorators import require_admin_access
+from ..system_metrics import metrics_collector
+from ..search_index import search_index
+from ..notification_inbox import notification_inbox
+
+User = get_user_model()
+
+
+SEARCH_PAGE_SIZE = 20
+SEARCH_SNIPPET_LENGTH = 200
+NOTIFICATIONS_PAGE_SIZE = 50
+
+@login_required
+def search_api(request):
+    """Ranked full-text search over dev messages, comments and system logs (staff only)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    query = request.GET.get('q', '').strip()
+    sources = [source for source in request.GET.getlist('source') if source in dict(SearchDocument.SOURCE_CHOICES)]
+    try:
+        page = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page = 1
+    
+    offset = (page - 1) * SEARCH_PAGE_SIZE
+    documents, total = search_index.search(query, sources or None, offset=offset, limit=SEARCH_PAGE_SIZE)
+    return JsonResponse({
+        'query': query,
+        'results': [
+            {
+                'source': document.source,
+                'object_id': document.object_id,
+                'snippet': document.content[:SEARCH_SNIPPET_LENGTH],
+                'score': float(document.score),
+                'created_at': document.created_at.isoformat(),
+            }
+            for document in documents
+        ],
+        'total': total,
+        'page': page,
+        'has_next': offset + len(documents) < total,
+    })
+
+@require_admin_access
+def admin_control(request):
+    # Require superuser access
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('dashboard')
+
+    from django.db.models import Count, Q
+    from django.utils import timezone
+    from datetime import datetime, timedelta
+    import json
+    import os
+    import shutil
+
+    # Get system statistics
+    total_users = User.objects.count()
+    total_clients = Client.objects.count()
+    total_projects = Project.objects.count()
+    total_tasks = Task.objects.count()
+    total_subtasks = SubTask.objects.count()
+    
+    # User statistics
+    active_users = User.objects.filter(is_active=True).count()
+    inactive_users = User.objects.filter(is_active=False).count()
+    admin_users = User.objects.filter(is_staff=True).count()
+    
+    # Client statistics
+    active_clients = Client.objects.filter(is_active=True).count()
+    inactive_clients = Client.objects.filter(is_active=False).count()
+    
+    # Project statistics
+    projects_in_progress = Project.objects.filter(status='in_progress').count()
+    projects_completed = Project.objects.filter(status='completed').count()
+    projects_planned = Project.objects.filter(status='planned').count()
+    
+    # Task statistics
+    completed_tasks = Task.objects.filter(status='completed').count()
+    in_progress_tasks = Task.objects.filter(status='in_progress').count()
+    not_started_tasks = Task.objects.filter(status='not_started').count()
+    
+    # Create any missing profiles in one query so users can be joined to them
+    UserProfile.create_missing()
+    
+    # Recent activity
+    recent_users = User.objects.select_related('profile').order_by('-date_joined')[:5]
+    for user in recent_users:
+        user.profile_picture_url = user.profile.get_profile_picture_url()
+    recent_projects = Project.objects.order_by('-created_at')[:5]
+    
+    # Handle admin actions
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        
+        if action == 'add_user':
+            # Handle adding new user
+            username = request.POST.get('username', '').strip()
+            first_name = request.POST.get('first_name', '').strip()
+            last_name = request.POST.get('last_name', '').strip()
+            email = request.POST.get('email', '').strip()
+            phone = request.POST.get('phone', '').strip()
+            role = request.POST.get('role', 'user')
+            
+            # Validation
+            if not all([username, first_name, last_name, email]):
+                messages.error(request, 'All required fields must be filled.')
+            elif User.objects.filter(username=username).exists():
+                messages.error(request, f'Username "{username}" already exists.')
+            elif User.objects.filter(email=email).exists():
+                messages.error(request, f'Email "{email}" already exists.')
+            else:
+                try:
+                    # Create new user with a temporary password (will be changed via OTP)
+                    import string
+                    temp_password = ''.join(random.choices(string.ascii_letters + string.digits, k=20))
+                    
+                    user = User.objects.create_user(
+                        username=username,
+                        email=email,
+                        password=temp_password,
+                        first_name=first_name,
+                        last_name=last_name
+                    )
+                    
+                    # Set role permissions
+                    if role == 'admin':
+                        user.is_staff = True
+                        user.is_superuser = True
+                    else:  # role == 'user'
+                        user.is_staff = False
+                        user.is_superuser = False
+                    
+                    user.save()
+                    
+                    # Create user profile with proper defaults
+                    profile = UserProfile.objects.create(
+                        user=user,
+                        phone=phone if phone else '',
+                        # Set default permissions based on role
+                        can_access_dashboard=True,
+                        can_access_projects=True,
+                        can_access_reports=True,
+                        can_access_analytics=True,
+                        can_access_admin=(role == 'admin'),
+                        can_manage_users=(role == 'admin'),
+                        can_manage_clients=(role == 'admin')
+                    )
+                    
+                    # Generate OTP for the new user
+                    from ..models import generate_user_otp
+                    otp = generate_user_otp(user)
+                    
+                    # Send OTP email using SimpleEmailService with Microsoft SMTP
+                    site_url = request.build_absolute_uri('/').rstrip('/')
+                    from ..email_service import SimpleEmailService
+                    email_service = SimpleEmailService()
+                    email_result = email_service.send_email(
+                        to_email=email,
+                        subject="Set Your Password - Welcome to E-Click",
+                        body=f"""<html>
+<body>
+<p><img src="https://drive.google.com/uc?id=1v_KeFPd25pTVK57IJdE9LhFniHnjKD-A" alt="E-Click Logo" width="140"></p>
+<p>Dear {username},</p>
+<p>Welcome to E-Click! Please use the One-Time Password (OTP) below to set your password:</p>
+<p>OTP: {otp}</p>
+<p>You can set your password here: <a href="{site_url}/user/setup-password/?username={username}">Set Up New Password</a></p>
+<p>This OTP is valid for 24 hours.</p>
+<p>Best regards,<br>E-Click Team</p>
+</body>
+</html>""",
+                        from_email=None  # Will use default from settings
+                    )
+                    
+                    if email_result['success']:
+                        messages.success(request, f'User "{username}" created successfully with {role} role. OTP sent to {email} for password setup.')
+                    else:
+                        messages.warning(request, f'User "{username}" created successfully with {role} role. OTP email failed: {email_result.get("error", "Unknown error")}')
+                        
+                except Exception as e:
+                    messages.error(request, f'Error creating user: {str(e)}')
+                    # Clean up if user was created but profile creation failed
+                    if user and user.id:
+                        user.delete()
+        
+        elif action == 'toggle_user_access':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            # Prevent admin from disabling themselves
+            if user == request.user:
+                messages.error(request, 'You cannot disable your own account.')
+                return redirect('admin_control')
+            else:
+                user.is_active = not user.is_active
+                user.save()
+                status = 'enabled' if user.is_active else 'disabled'
+                messages.success(request, f'User {user.username} has been {status}.')
+                return redirect('admin_control')
+        
+        elif action == 'toggle_admin_status':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            # Prevent admin from removing their own admin privileges
+            if user == request.user:
+                messages.error(request, 'You cannot remove your own admin privileges.')
+                return redirect('admin_control')
+            else:
+                user.is_staff = not user.is_staff
+                user.save()
+                status = 'granted admin privileges' if user.is_staff else 'removed admin privileges'
+                messages.success(request, f'User {user.username} has been {status}.')
+                return redirect('admin_control')
+        
+        elif action == 'delete_user':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            # Prevent admin from deleting themselves
+            if user == request.user:
+                messages.error(request, 'You cannot delete your own account.')
+                return redirect('admin_control')
+            else:
+                username = user.username
+                user.delete()
+                messages.success(request, f'User {username} has been deleted.')
+                return redirect('admin_control')
+        
+        elif action == 'suspend_user':
+            user_id = request.POST.get('user_id')
+            suspension_days = int(request.POST.get('suspension_days', 1))
+            suspension_reason = request.POST.get('suspension_reason', 'Account suspended by administrator')
+            
+            user = get_object_or_404(User, id=user_id)
+            
+            # Prevent admin from suspending themselves
+            if user == request.user:
+                messages.error(request, 'You cannot suspend your own account.')
+                return redirect('admin_control')
+            else:
+                profile, created = UserProfile.objects.get_or_create(user=user)
+                profile.is_suspended = True
+                profile.suspension_reason = suspension_reason
+                profile.suspension_until = timezone.now() + timedelta(days=suspension_days)
+                profile.save()
+                
+                messages.success(request, f'User {user.username} has been suspended for {suspension_days} day(s).')
+                return redirect('admin_control')
+        
+        elif action == 'unsuspend_user':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            profile, created = UserProfile.objects.get_or_create(user=user)
+            profile.is_suspended = False
+            profile.suspension_reason = ''
+            profile.suspension_until = None
+            profile.save()
+            
+            messages.success(request, f'User {user.username} has been unsuspended.')
+            return redirect('admin_control')
+        
+        elif action == 'lock_user_account':
+            user_id = request.POST.get('user_id')
+            lock_hours = int(request.POST.get('lock_hours', 1))
+            
+            user = get_object_or_404(User, id=user_id)
+            
+            # Prevent admin from locking themselves
+            if user == request.user:
+                messages.error(request, 'You cannot lock your own account.')
+                return redirect('admin_control')
+            else:
+                profile, created = UserProfile.objects.get_or_create(user=user)
+                profile.account_locked_until = timezone.now() + timedelta(hours=lock_hours)
+                profile.save()
+                
+                messages.success(request, f'User {user.username} account has been locked for {lock_hours} hour(s).')
+                return redirect('admin_control')
+        
+        elif action == 'unlock_user_account':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            profile, created = UserProfile.objects.get_or_create(user=user)
+            profile.account_locked_until = None
+            profile.current_login_attempts = 0
+            profile.save()
+            
+            messages.success(request, f'User {user.username} account has been unlocked.')
+            return redirect('admin_control')
+        
+        elif action == 'reset_password':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            try:
+                # Generate new OTP for password reset
+                from ..models import generate_user_otp
+                otp = generate_user_otp(user)
+                
+                # Send password reset email
+                site_url = request.build_absolute_uri('/').rstrip('/')
+                from ..email_service import SimpleEmailService
+                email_service = SimpleEmailService()
+                
+                email_result = email_service.send_email(
+                    to_email=user.email,
+                    subject="Password Reset - E-Click",
+                    body=f"""<html>
+<body style="font-family: Arial, sans-serif;">
+    <p>Dear {user.username},</p>
+
+    <p>Your password has been reset by an administrator. Use the One-Time Password (OTP) below to set a new password:</p>
+
+    <p><strong>OTP: {otp}</strong></p>
+
+    <p>Reset your password here: {site_url}/user/setup-password/?username={user.username}</p>
+
+    <p>This OTP is valid for 24 hours.</p>
+
+    <p>If you did not request this password reset, please contact our support team immediately.</p>
+
+    <p>Best regards,<br>E-Click Team</p>
+</body>
+</html>""",
+                    from_email=None
+                )
+                
+                if email_result['success']:
+                    messages.success(request, f'Password reset email sent to {user.username} at {user.email}')
+                else:
+                    messages.warning(request, f'Password reset email failed: {email_result.get("error", "Unknown error")}')
+                    
+            except Exception as e:
+                messages.error(request, f'Error resetting password for {user.username}: {str(e)}')
+            
+            return redirect('admin_control')
+        
+        elif action == 'update_user_permissions':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            # Update user permissions
+            user.is_active = request.POST.get('is_active') == 'on'
+            user.is_staff = request.POST.get('is_staff') == 'on'
+            user.is_superuser = request.POST.get('is_superuser') == 'on'
+            
+            # Update custom permissions
+            profile, created = UserProfile.objects.get_or_create(user=user)
+            profile.can_access_dashboard = request.POST.get('can_access_dashboard') == 'on'
+            profile.can_access_projects = request.POST.get('can_access_projects') == 'on'
+            profile.can_access_reports = request.POST.get('can_access_reports') == 'on'
+            profile.can_access_analytics = request.POST.get('can_access_analytics') == 'on'
+            profile.can_access_admin = request.POST.get('can_access_admin') == 'on'
+            profile.can_manage_users = request.POST.get('can_manage_users') == 'on'
+            profile.can_manage_clients = request.POST.get('can_manage_clients') == 'on'
+            profile.save()
+            
+            user.save()
+            messages.success(request, f'Permissions updated for {user.username}.')
+            return redirect('admin_control')
+        
+        elif action == 'edit_user_profile':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            # Update user basic info
+            user.first_name = request.POST.get('first_name', '')
+            user.last_name = request.POST.get('last_name', '')
+            user.email = request.POST.get('email', '')
+            user.save()
+            
+            # Update profile
+            profile, created = UserProfile.objects.get_or_create(user=user)
+            profile.phone = request.POST.get('phone', '')
+            profile.address = request.POST.get('address', '')
+            profile.bio = request.POST.get('bio', '')
+            
+            if 'profile_picture' in request.FILES:
+                profile.profile_picture = request.FILES['profile_picture']
+            
+            profile.save()
+            messages.success(request, f'Profile updated for {user.username}.')
+            return redirect('admin_control')
+        
+        elif action == 'reset_user_password':
+            user_id = request.POST.get('user_id')
+            user = get_object_or_404(User, id=user_id)
+            
+            # Generate and send OTP for password reset
+            try:
+                print(f"DEBUG: Starting password reset OTP process for user {user.username}")
+                
+                # Generate a new OTP, invalidating the previous one
+                from ..models import generate_user_otp
+                otp = generate_user_otp(user)
+                
+                print(f"DEBUG: OTP record created for user {user.username}")
+                print(f"DEBUG: User email: {user.email}")
+                
+                # Send OTP email using SimpleEmailService with Microsoft SMTP
+                print(f"DEBUG: About to send email to {user.email}")
+                from ..email_service import SimpleEmailService
+                email_service = SimpleEmailService()
+                email_result = email_service.send_email(
+                    to_email=user.email,
+                    subject="Password Reset OTP - E-Click",
+                    body=f"""<html>
+<body style="font-family: Arial, sans-serif;">
+    <p>Dear {user.username},</p>
+
+    <p>You have requested a password reset. Please use the following OTP:</p>
+
+    <p><strong>Your OTP: {otp}</strong></p>
+
+    <p>This OTP will expire in 24 hours.</p>
+
+    <p>Best regards,<br>E-Click Team</p>
+</body>
+</html>""",
+                    from_email=None  # Will use default from settings
+                )
+                print(f"DEBUG: Email result: {email_result}")
+                
+                if not email_result['success']:
+                    print(f"DEBUG: Email failed with error: {email_result['error']}")
+                    messages.error(request, f'Failed to send OTP email: {email_result["error"]}')
+                    return render(request, 'home/admin_control_enhanced.html')
+                
+                print(f"DEBUG: Email sent successfully")
+                messages.success(request, f'Password reset OTP sent successfully to {user.email}.')
+                return redirect('admin_control')
+                
+            except Exception as e:
+                print(f"DEBUG: Exception occurred: {str(e)}")
+                print(f"DEBUG: Exception type: {type(e)}")
+                import traceback
+                traceback.print_exc()
+                messages.error(request, f'Failed to send password reset OTP: {str(e)}')
+                return redirect('admin_control')
+        
+        elif action == 'toggle_client_access':
+            client_id = request.POST.get('client_id')
+            client = get_object_or_404(Client, id=client_id)
+            
+            client.is_active = not client.is_active
+            client.save()
+            status = 'enabled' if client.is_active else 'disabled'
+            messages.success(request, f'Client {client.username} has been {status}.')
+            return redirect('admin_control')
+        
+        elif action == 'delete_client':
+            client_id = request.POST.get('client_id')
+            client = get_object_or_404(Client, id=client_id)
+            
+            username = client.username
+            client.delete()
+            messages.success(request, f'Client {username} has been deleted.')
+            return redirect('admin_control')
+        
+        elif action == 'edit_user':
+            user_id = request.POST.get('user_id')
+            if not user_id:
+                messages.error(request, 'User ID is required for editing.')
+                return redirect('admin_control')
+                
+            try:
+                user = get_object_or_404(User, id=user_id)
+            except (ValueError, User.DoesNotExist):
+                messages.error(request, 'Invalid user ID provided.')
+                return redirect('admin_control')
+            
+            # Prevent admin from editing themselves
+            if user == request.user:
+                messages.error(request, 'You cannot edit your own account through this interface.')
+                return redirect('admin_control')
+            
+            try:
+                # Update user basic info
+                user.username = request.POST.get('username', '').strip()
+                user.first_name = request.POST.get('first_name', '').strip()
+                user.last_name = request.POST.get('last_name', '').strip()
+                user.email = request.POST.get('email', '').strip()
+                
+                # Check if username is already taken by another user
+                if User.objects.exclude(id=user.id).filter(username=user.username).exists():
+                    messages.error(request, f'Username "{user.username}" is already taken by another user.')
+                    return redirect('admin_control')
+                
+                # Check if email is already taken by another user
+                if User.objects.exclude(id=user.id).filter(email=user.email).exists():
+                    messages.error(request, f'Email "{user.email}" is already taken by another user.')
+                    return redirect('admin_control')
+                
+                # Update role permissions
+                role = request.POST.get('role', 'user')
+                if role == 'admin':
+                    user.is_staff = True
+                    user.is_superuser = True
+                else:
+                    user.is_staff = False
+                    user.is_superuser = False
+                
+                # Update active status
+                user.is_active = request.POST.get('is_active') == 'true'
+                
+                user.save()
+                
+                # Update user profile
+                profile, created = UserProfile.objects.get_or_create(user=user)
+                profile.phone = request.POST.get('phone', '')
+                
+                # Update permissions - handle unchecked checkboxes properly
+                # Checkboxes only send 'on' when checked, so we check if the key exists
+                profile.can_access_dashboard = 'can_access_dashboard' in request.POST
+                profile.can_access_projects = 'can_access_projects' in request.POST
+                profile.can_access_reports = 'can_access_reports' in request.POST
+                profile.can_access_analytics = 'can_access_analytics' in request.POST
+                profile.can_access_admin = 'can_access_admin' in request.POST
+                profile.can_manage_users = 'can_manage_users' in request.POST
+                profile.can_manage_clients = 'can_manage_clients' in request.POST
+                
+                # Handle the new system logs permission
+                if hasattr(profile, 'can_access_system_logs'):
+                    profile.can_access_system_logs = 'can_access_system_logs' in request.POST
+                
+                profile.save()
+                
+                messages.success(request, f'User "{user.username}" has been updated successfully.')
+                return redirect('admin_control')
+                
+            except Exception as e:
+                messages.error(request, f'Error updating user: {str(e)}')
+                return redirect('admin_control')
+
+        elif action == 'add_client':
+            # Handle adding new client
+            username = request.POST.get('client_username', '').strip()
+            email = request.POST.get('client_email', '').strip()
+            full_name = request.POST.get('client_full_name', '').strip()
+            phone = request.POST.get('client_phone', '').strip()
+            company = request.POST.get('client_company', '').strip()
+
+            # Validation
+            if not all([username, email]):
+                messages.error(request, 'Username and email are required.')
+            elif Client.objects.filter(username=username).exists():
+                messages.error(request, f'Client username "{username}" already exists.')
+            elif Client.objects.filter(email=email).exists():
+                messages.error(request, f'Client email "{email}" already exists.')
+            else:
+                try:
+                    # Create new client (only fields that exist in the model)
+                    client = Client.objects.create(
+                        username=username,
+                        email=email,
+                        is_active=True
+                    )
+
+                    # Generate OTP for the new client
+                    otp = client.generate_otp()
+
+                    # Use full name in email if provided, otherwise use username
+                    greeting_name = full_name if full_name else username
+
+                    # Send password setup email using SimpleEmailService with Microsoft SMTP
+                    site_url = request.build_absolute_uri('/').rstrip('/')
+                    from ..email_service import SimpleEmailService
+                    email_service = SimpleEmailService()
+                    email_result = email_service.send_email(
+                        to_email=email,
+                        subject="Set Your Password - E-Click",
+                        body=f"""<html>
+<body style="font-family: Arial, sans-serif;">
+    <p>Dear {greeting_name},</p>
+
+    <p>Welcome to E-Click. Your client account has been created.</p>
+
+    <p>Please use the following One-Time Password (OTP) to set your password:</p>
+
+    <p><strong>Your OTP: {otp}</strong></p>
+
+    <p>You can set your password here: {site_url}/client/setup-password/?username={username}</p>
+
+    <p>Please note: This OTP is valid for 24 hours.</p>
+
+    <p>If you did not request this account, please contact our support team immediately.</p>
+
+    <p>Best regards,<br>E-Click Project Management Team</p>
+</body>
+</html>""",
+                        from_email=None  # Will use default from settings
+                    )
+
+                    if email_result['success']:
+                        messages.success(request, f'Client "{username}" created successfully. Password setup email sent to {email}.')
+                    else:
+                        messages.warning(request, f'Client "{username}" created successfully. Email sending failed: {email_result.get("error", "Unknown error")}. Please use the password reset feature.')
+
+                except Exception as e:
+                    messages.error(request, f'Error creating client: {str(e)}')
+
+            return redirect('admin_control')
+
+        elif action == 'reset_client_password':
+            # Handle client password reset - send OTP email
+            client_id = request.POST.get('client_id')
+
+            try:
+                client = Client.objects.get(id=client_id)
+
+                # Generate OTP for password reset
+                otp = client.generate_otp()
+
+                # Send password reset OTP email
+                site_url = request.build_absolute_uri('/').rstrip('/')
+                from ..email_service import email_service
+
+                email_result = email_service.send_password_reset_otp_email(
+                    to_email=client.email,
+                    otp=otp,
+                    username=client.username,
+                    site_url=site_url
+                )
+
+                if email_result['success']:
+                    messages.success(request, f'Password reset OTP has been sent to {client.email}.')
+                else:
+                    messages.error(request, f'Failed to send password reset email: {email_result.get("error", "Unknown error")}')
+
+            except Client.DoesNotExist:
+                messages.error(request, 'Client not found.')
+            except Exception as e:
+                messages.error(request, f'Error sending password reset email: {str(e)}')
+
+            return redirect('admin_control')
+
+        return redirect('admin_control')
+    
+    # User directory: one annotated query per page, searched and paginated server-side
+    user_search = request.GET.get('user_q', '').strip()
+    directory = User.objects.select_related('profile').annotate(
+        projects_assigned=Count('assigned_projects', distinct=True)
+    )
+    if user_search:
+        directory = directory.filter(
+            Q(username__icontains=user_search) |
+            Q(first_name__icontains=user_search) |
+            Q(last_name__icontains=user_search) |
+            Q(email__icontains=user_search)
+        )
+    users = Paginator(directory.order_by('-date_joined'), 25).get_page(request.GET.get('user_page'))
+    for user in users:
+        # Add profile picture URL directly to user object for template access
+        user.profile_picture_url = user.profile.get_profile_picture_url()
+    
+    # Get suspended and locked users
+    suspended_users = UserProfile.objects.filter(is_suspended=True).select_related('user')
+    locked_accounts = UserProfile.objects.filter(
+        Q(account_locked_until__isnull=False) & 
+        Q(account_locked_until__gt=timezone.now())
+    ).select_related('user')
+    
+    # Get all clients
+    clients = Client.objects.all().order_by('-created_at')
+    
+    # User Activity Summary (moved from reports), most active first
+    user_activity = [
+        {
+            'username': user.username,
+            'email': user.email,
+            'is_staff': user.is_staff,
+            'last_login': user.last_login,
+            'projects_created': user.projects_assigned,
+        }
+        for user in directory.order_by('-projects_assigned', 'username')[:10]
+    ]
+    
+    # System information from the latest collect_system_metrics sample
+    latest_sample = metrics_collector.latest()
+    system_info = {
+        'cpu_percent': latest_sample.cpu_percent if latest_sample else 0,
+        'memory_percent': latest_sample.memory_percent if latest_sample else 0,
+        'disk_usage': latest_sample.disk_percent if latest_sample else 0,
+        'sampled_at': latest_sample.sampled_at if latest_sample else None,
+        'alerts': latest_sample.alerts if latest_sample else [],
+    }
+    db_size = latest_sample.db_size if latest_sample else 0.0
+    
+    context = {
+        'total_users': total_users,
+        'total_clients': total_clients,
+        'total_projects': total_projects,
+        'total_tasks': total_tasks,
+        'total_subtasks': total_subtasks,
+        'active_users': active_users,
+        'inactive_users': inactive_users,
+        'admin_users': admin_users,
+        'active_clients': active_clients,
+        'inactive_clients': inactive_clients,
+        'projects_in_progress': projects_in_progress,
+        'projects_completed': projects_completed,
+        'projects_planned': projects_planned,
+        'completed_tasks': completed_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'not_started_tasks': not_started_tasks,
+        'recent_users': recent_users,
+        'recent_projects': recent_projects,
+        'users': users,
+        'user_search': user_search,
+        'clients': clients,
+        'user_activity': user_activity,
+        'system_info': system_info,
+        'db_size': round(db_size, 2),
+        'current_admin': request.user,
+        'suspended_users': suspended_users,
+        'locked_accounts': locked_accounts,
+        'suspended_users_count': suspended_users.count(),
+        'locked_accounts_count': locked_accounts.count(),
+    }
+    
+    return render(request, 'home/admin_control_enhanced.html', context)
+
+@login_required
+def admin_user_details(request, user_id):
+    """API endpoint to get user details for admin control"""
+    print(f"DEBUG: admin_user_details called with user_id: {user_id}")
+    print(f"DEBUG: request.user: {request.user}")
+    print(f"DEBUG: request.user.is_staff: {request.user.is_staff}")
+    print(f"DEBUG: request.method: {request.method}")
+    print(f"DEBUG: request.path: {request.path}")
+    
+    if not request.user.is_staff:
+        print("DEBUG: Access denied - user is not staff")
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    try:
+        print(f"DEBUG: Looking for user with ID: {user_id}")
+        user = User.objects.get(id=user_id)
+        print(f"DEBUG: Found user: {user.username}")
+        
+        profile, created = UserProfile.objects.get_or_create(user=user)
+        print(f"DEBUG: Profile created: {created}, Profile: {profile}")
+        
+        data = {
+            'id': user.id,
+            'username': user.username,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'email': user.email,
+            'is_active': user.is_active,
+            'is_staff': user.is_staff,
+            'is_superuser': user.is_superuser,
+            'date_joined': user.date_joined.strftime('%Y-%m-%d %H:%M:%S') if user.date_joined else None,
+            'last_login': user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else None,
+            'phone': profile.phone,
+            'address': profile.address,
+            'bio': profile.bio,
+            'role': 'Admin' if user.is_staff else 'User',
+            'can_access_dashboard': profile.can_access_dashboard,
+            'can_access_projects': profile.can_access_projects,
+            'can_access_reports': profile.can_access_reports,
+            'can_access_analytics': profile.can_access_analytics,
+            'can_access_admin': profile.can_access_admin,
+            'can_manage_users': profile.can_manage_users,
+            'can_manage_clients': profile.can_manage_clients,
+            'can_access_system_logs': getattr(profile, 'can_access_system_logs', False),
+        }
+        
+        print(f"DEBUG: Returning data: {data}")
+        return JsonResponse(data)
+    except User.DoesNotExist:
+        print(f"DEBUG: User with ID {user_id} not found")
+        return JsonResponse({'error': 'User not found'}, status=404)
+    except Exception as e:
+        print(f"DEBUG: Exception occurred: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
+
+@login_required
+def admin_user_permissions(request, user_id):
+    """API endpoint to get user permissions for admin control"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    try:
+        user = User.objects.get(id=user_id)
+        profile, created = UserProfile.objects.get_or_create(user=user)
+        
+        data = {
+            'id': user.id,
+            'username': user.username,
+            'is_active': user.is_active,
+            'is_staff': user.is_staff,
+            'is_superuser': user.is_superuser,
+            'can_access_dashboard': profile.can_access_dashboard,
+            'can_access_projects': profile.can_access_projects,
+            'can_access_reports': profile.can_access_reports,
+            'can_access_analytics': profile.can_access_analytics,
+            'can_access_admin': profile.can_access_admin,
+            'can_manage_users': profile.can_manage_users,
+            'can_manage_clients': profile.can_manage_clients,
+        }
+        
+        return JsonResponse(data)
+    except User.DoesNotExist:
+        return JsonResponse({'error': 'User not found'}, status=404)
+
+@login_required
+def admin_notifications(request):
+    """Admin notifications page"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('dashboard')
+    
+    # Get all notifications for admin, prioritizing system-wide notifications
+    notifications = Notification.objects.select_related(
+        'recipient', 'triggered_by', 'related_project', 'related_task', 'related_subtask'
+    ).order_by('-created_at')  # Order by creation date, newest first
+    
+    # Get filter parameters
+    notification_type = request.GET.get('type', '')
+    status_filter = request.GET.get('status', '')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    
+    # Apply filters
+    if notification_type:
+        notifications = notifications.filter(notification_type=notification_type)
+    
+    if status_filter == 'unread':
+        notifications = notifications.filter(is_read=False)
+    elif status_filter == 'read':
+        notifications = notifications.filter(is_read=True)
+    
+    if date_from:
+        notifications = notifications.filter(created_at__date__gte=date_from)
+    
+    if date_to:
+        notifications = notifications.filter(created_at__date__lte=date_to)
+    
+    # Calculate statistics in one aggregate
+    summary = notification_inbox.summary()
+    
+    # Pagination
+    paginator = Paginator(notifications, 20)  # 20 notifications per page
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'notifications': page_obj,
+        'total_notifications': summary['total'],
+        'unread_count': summary['unread'],
+        'today_count': summary['today'],
+        'week_count': summary['week'],
+        'notification_types': Notification.NOTIFICATION_TYPES,
+        'notification_type': notification_type,
+        'status_filter': status_filter,
+        'date_from': date_from,
+        'date_to': date_to,
+    }
+    
+    return render(request, 'home/admin_notifications.html', context)
+
+
+@login_required
+def admin_notifications_enhanced(request):
+    """Enhanced admin view for managing all notifications with comment responses"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('dashboard')
+    
+    # Get all notifications with related data
+    notifications = Notification.objects.select_related(
+        'recipient', 'triggered_by', 'related_project', 'related_task', 'related_subtask'
+    ).prefetch_related(
+        'related_comment', 'related_subtask_comment'
+    ).order_by('-created_at')
+    
+    # Filter by type if specified
+    notification_type = request.GET.get('type')
+    if notification_type:
+        notifications = notifications.filter(notification_type=notification_type)
+    
+    # Filter by status if specified
+    status_filter = request.GET.get('status')
+    if status_filter == 'unread':
+        notifications = notifications.filter(is_read=False)
+    elif status_filter == 'read':
+        notifications = notifications.filter(is_read=True)
+    
+    # Filter by admin notifications if specified
+    admin_filter = request.GET.get('admin')
+    if admin_filter == 'true':
+        notifications = notifications.filter(is_admin_notification=True)
+    elif admin_filter == 'false':
+        notifications = notifications.filter(is_admin_notification=False)
+    
+    # One page of notifications, ?cursor= for older ones
+    page = notification_inbox.page(notifications, cursor=request.GET.get('cursor'), limit=NOTIFICATIONS_PAGE_SIZE)
+    next_page_query = None
+    if page.has_next:
+        query = request.GET.copy()
+        query['cursor'] = page.next_cursor
+        next_page_query = query.urlencode()
+    
+    # Get notification counts for stats in one aggregate
+    summary = notification_inbox.summary()
+    
+    # Get recent comments that might need admin response
+    recent_task_comments = TaskComment.objects.filter(
+        is_admin_response=False
+    ).select_related('user', 'task__project').order_by('-created_at')[:10]
+    
+    recent_subtask_comments = SubTaskComment.objects.filter(
+        is_admin_response=False
+    ).select_related('user', 'subtask__task__project').order_by('-created_at')[:10]
+    
+    # Get users for message sending based on admin permissions
+    if hasattr(request.user, 'profile') and request.user.profile.can_manage_users:
+        available_users = User.objects.all().order_by('username')
+    else:
+        available_users = User.objects.filter(id=request.user.id)
+    
+    context = {
+        'notifications': page.notifications,
+        'next_page_query': next_page_query,
+        'total_notifications': summary['total'],
+        'unread_notifications': summary['unread'],
+        'admin_notifications': summary['admin'],
+        'team_notifications': summary['team'],
+        'recent_task_comments': recent_task_comments,
+        'recent_subtask_comments': recent_subtask_comments,
+        'notification_types': Notification.NOTIFICATION_TYPES,
+        'available_users': available_users,
+    }
+    
+    return render(request, 'home/admin_notifications_enhanced.html', context)
+
+
+@login_required
+def admin_respond_to_task_comment(request, comment_id):
+    """Admin responds to a task comment"""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'Admin privileges required'})
+    
+    if request.method == 'POST':
+        try:
+            task_comment = TaskComment.objects.get(id=comment_id)
+            response_text = request.POST.get('response_text', '').strip()
+            
+            if not response_text:
+                return JsonResponse({'success': False, 'message': 'Response text is required'})
+            
+            # Create admin response comment
+            admin_response = TaskComment.objects.create(
+                task=task_comment.task,
+                user=request.user,
+                comment=response_text,
+                is_admin_response=True,
+                parent_comment=task_comment
+            )
+            
+            # Create notification for the original commenter
+            Notification.create_if_not_exists(
+                recipient=task_comment.user,
+                notification_type='task_comment_response',
+                title=f'Admin Response to Your Comment',
+                message=f'Admin {request.user.get_full_name()} has responded to your comment on task "{task_comment.task.title}": {response_text}',
+                is_admin_notification=True,
+                related_task=task_comment.task,
+                related_comment=admin_response
+            )
+            
+            return JsonResponse({'success': True, 'message': 'Response sent successfully'})
+            
+        except TaskComment.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Comment not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+
+@login_required
+def update_task_with_notification(request, task_id):
+    """Update task and create notification with user tracking"""
+    if request.method == 'POST':
+        try:
+            task = Task.objects.get(id=task_id)
+            update_type = request.POST.get('update_type')
+            new_value = request.POST.get('new_value')
+            reason = request.POST.get('reason', '')
+            
+            # Store old value before updating
+            old_value = None
+            if update_type == 'status_changed':
+                old_value = task.get_status_display()
+                task.status = new_value
+
+            elif update_type == 'deadline_extended':
+                old_value = task.end_date.strftime('%Y-%m-%d') if task.end_date else 'Not set'
+                task.end_date = new_value
+            
+            task.save()
+            
+            # Create notification with user tracking
+            create_notification_for_task_update(
+                task=task,
+                user=request.user,
+                update_type=update_type,
+                old_value=old_value,
+                new_value=new_value,
+                reason=reason
+            )
+            
+            # Create TaskUpdate record
+            from ..models import TaskUpdate
+            TaskUpdate.objects.create(
+                task=task,
+                user=request.user,
+                update_type=update_type,
+                reason=reason,
+                old_value=old_value,
+                new_value=new_value
+            )
+            
+            return JsonResponse({'success': True, 'message': 'Task updated successfully'})
+            
+        except Task.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Task not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+
+@login_required
+def notification_demo(request):
+    """Demo page for the enhanced notification system"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('dashboard')
+    
+    # Get notification statistics in one aggregate
+    summary = notification_inbox.summary()
+    
+    # Get available tasks for testing
+    from ..models import Task
+    available_tasks = Task.objects.select_related('project').all()[:20]  # Limit to 20 tasks
+    
+    # Get available users for testing
+    from ..models import User
+    available_users = User.objects.filter(is_active=True).order_by('username')[:20]  # Limit to 20 users
+    
+    context = {
+        'total_notifications': summary['total'],
+        'unread_count': summary['unread'],
+        'today_count': summary['today'],
+        'tracked_count': summary['tracked'],
+        'available_tasks': available_tasks,
+        'available_users': available_users,
+    }
+    
+    return render(request, 'home/notification_demo.html', context)
+
+
+def create_notification_for_task_update(task, user, update_type, old_value=None, new_value=None, reason=None):
+    """Create notification when a task is updated"""
+    from ..models import Notification
+    
+    # Determine notification type and message
+    if update_type == 'status_changed':
+        notification_type = 'task_status_change'
+        title = f'Task Status Changed: {task.title}'
+        message = f'Task "{task.title}" status changed from {old_value} to {new_value}'
+        if reason:
+            message += f'. Reason: {reason}'
+
+    elif update_type == 'deadline_extended':
+        notification_type = 'deadline_extended'
+        title = f'Task Deadline Extended: {task.title}'
+        message = f'Task "{task.title}" deadline extended to {new_value}'
+        if reason:
+            message += f'. Reason: {reason}'
+    else:
+        notification_type = 'task_update'
+        title = f'Task Updated: {task.title}'
+        message = f'Task "{task.title}" was updated'
+        if reason:
+            message += f'. Reason: {reason}'
+    
+    # Create notification for project owner/admin
+    if task.project and task.project.client:
+        # Notify the client
+        Notification.create_if_not_exists(
+            recipient=task.project.client,
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            triggered_by=user,
+            related_task=task,
+            related_project=task.project
+        )
+    
+    # Notify task assignee if different from the user making the change
+    if task.assigned_to and task.assigned_to != user:
+        Notification.create_if_not_exists(
+            recipient=task.assigned_to,
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            triggered_by=user,
+            related_task=task,
+            related_project=task.project
+        )
+
+
+def create_notification_for_project_update(project, user, update_type, old_value=None, new_value=None, reason=None):
+    """Create notification when a project is updated"""
+    from ..models import Notification
+    
+    # Determine notification type and message
+    if update_type == 'status_changed':
+        notification_type = 'project_status_change'
+        title = f'Project Status Changed: {project.name}'
+        message = f'Project "{project.name}" status changed from {old_value} to {new_value}'
+        if reason:
+            message += f'. Reason: {reason}'
+    elif update_type == 'created':
+        notification_type = 'project_created'
+        title = f'New Project Created: {project.name}'
+        message = f'New project "{project.name}" has been created'
+    elif update_type == 'deadline_extended':
+        notification_type = 'deadline_extended'
+        title = f'Project Deadline Extended: {project.name}'
+        message = f'Project "{project.name}" deadline extended to {new_value}'
+        if reason:
+            message += f'. Reason: {reason}'
+    else:
+        notification_type = 'project_update'
+        title = f'Project Updated: {project.name}'
+        message = f'Project "{project.name}" was updated'
+        if reason:
+            message += f'. Reason: {reason}'
+    
+    # Create notification for project client
+    if project.client:
+        Notification.create_if_not_exists(
+            recipient=project.client,
+            notification_type=notification_type,
+            title=title,
+            message=message,
+            triggered_by=user,
+            related_project=project
+        )
+    
+    # Notify all team members assigned to the project (but prevent duplicates)
+    for task in project.tasks.all():
+        if task.assigned_to and task.assigned_to != user:
+            Notification.create_if_not_exists(
+                recipient=task.assigned_to,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                triggered_by=user,
+                related_project=project
+            )
+
+
+@login_required
+def admin_respond_to_subtask_comment(request, comment_id):
+    """Admin responds to a subtask comment"""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'Admin privileges required'})
+    
+    if request.method == 'POST':
+        try:
+            subtask_comment = SubTaskComment.objects.get(id=comment_id)
+            response_text = request.POST.get('response_text', '').strip()
+            
+            if not response_text:
+                return JsonResponse({'success': False, 'message': 'Response text is required'})
+            
+            # Create admin response comment
+            admin_response = SubTaskComment.objects.create(
+                subtask=subtask_comment.subtask,
+                user=request.user,
+                comment=response_text,
+                is_admin_response=True,
+                parent_comment=subtask_comment
+            )
+            
+            # Create notification for the original commenter
+            Notification.create_if_not_exists(
+                recipient=subtask_comment.user,
+                notification_type='subtask_comment_response',
+                title=f'Admin Response to Your Comment',
+                message=f'Admin {request.user.get_full_name()} has responded to your comment on subtask "{subtask_comment.subtask.title}": {response_text}',
+                is_admin_notification=True,
+                related_subtask=subtask_comment.subtask,
+                related_subtask_comment=admin_response
+            )
+            
+            return JsonResponse({'success': True, 'message': 'Response sent successfully'})
+            
+        except SubTaskComment.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Comment not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+
+@login_required
+def admin_send_message(request):
+    """Admin sends a message to a specific user or all users"""
+    if not request.user.is_staff:
+        return JsonResponse({'success': False, 'message': 'Admin privileges required'})
+    
+    if request.method == 'POST':
+        try:
+            recipient_id = request.POST.get('recipient_id')
+            message_text = request.POST.get('message_text', '').strip()
+            message_title = request.POST.get('message_title', '').strip()
+            
+            if not message_text or not message_title:
+                return JsonResponse({'success': False, 'message': 'Message title and text are required'})
+            
+            if recipient_id == 'all':
+                # Send to all users
+                users = User.objects.filter(is_active=True)
+                for user in users:
+                    Notification.create_if_not_exists(
+                        recipient=user,
+                        notification_type='admin_message',
+                        title=message_title,
+                        message=message_text,
+                        is_admin_notification=True
+                    )
+                message = f'Message sent to {users.count()} users'
+            else:
+                # Send to specific user
+                recipient = User.objects.get(id=recipient_id)
+                Notification.create_if_not_exists(
+                    recipient=recipient,
+                    notification_type='admin_message',
+                    title=message_title,
+                    message=message_text,
+                    is_admin_notification=True
+                )
+                message = f'Message sent to {recipient.get_full_name()}'
+            
+            return JsonResponse({'success': True, 'message': message})
+            
+        except User.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'User not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+
+@login_required
+def system_logs(request):
+    """System logs page for admins"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('dashboard')
+    
+    # Log navigation to system logs page
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='System Logs',
+        page_url=request.path,
+        request=request
+    )
+    
+    # Get filter parameters
+    action_filter = request.GET.get('action', '')
+    user_filter = request.GET.get('user', '')
+    date_from = request.GET.get('date_from', '')
+    date_to = request.GET.get('date_to', '')
+    search_query = request.GET.get('q', '').strip()
+    
+    # Start with all logs
+    logs = SystemLog.objects.all()
+    
+    # Apply filters
+    if action_filter:
+        logs = logs.filter(action=action_filter)
+    
+    if user_filter:
+        # Match against the small users table, then use the indexed user_id on the logs
+        logs = logs.filter(user_id__in=User.objects.filter(username__icontains=user_filter).values('id'))
+    
+    if search_query:
+        matching = search_index.matching_ids('system_log', search_query)
+        logs = logs.filter(id__in=matching) if matching is not None else logs.none()
+    
+    if date_from:
+        logs = logs.filter(timestamp__date__gte=date_from)
+    
+    if date_to:
+        logs = logs.filter(timestamp__date__lte=date_to)
+    
+    # Pagination
+    paginator = Paginator(logs, 50)  # 50 logs per page
+    page_number = request.GET.get('page')
+    page_obj = paginator.get_page(page_number)
+    
+    context = {
+        'page_obj': page_obj,
+        'action_choices': SystemLog.ACTION_CHOICES,
+        'action_filter': action_filter,
+        'user_filter': user_filter,
+        'date_from': date_from,
+        'date_to': date_to,
+        'search_query': search_query,
+    }
+    
+    # If it's an AJAX request, return only the logs table
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return render(request, 'home/system_logs_table.html', context)
+    
+    return render(request, 'home/system_logs.html', context)
+
+
+@login_required
+def system_monitoring(request):
+    """System monitoring page for admins, reads samples from collect_system_metrics"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('dashboard')
+    
+    history = metrics_collector.history()
+    latest_sample = history[-1] if history else None
+    
+    # Capacity alerts raised by the recent samples, newest first
+    recent_logs = [
+        {'message': alert['message'], 'level': 'WARNING', 'timestamp': sample.sampled_at}
+        for sample in reversed(history)
+        for alert in sample.alerts
+    ][:20]
+    
+    context = {
+        'system_info': latest_sample,
+        'history': history,
+        'trend_labels': json.dumps([sample.sampled_at.strftime('%H:%M') for sample in history]),
+        'trend_cpu': json.dumps([sample.cpu_percent for sample in history]),
+        'trend_memory': json.dumps([sample.memory_percent for sample in history]),
+        'trend_disk': json.dumps([sample.disk_percent for sample in history]),
+        'largest_tables': latest_sample.details.get('largest_tables', []) if latest_sample else [],
+        'recent_logs': recent_logs,
+    }
+    return render(request, 'home/system_monitoring.html', context)
@@ -0,0 +1,402 @@
+"""
+Backup management, creation, upload, restore and download views
+"""
+from django.shortcuts import render, redirect
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.conf import settings as django_settings
+from django.utils import timezone
+import os
+from datetime import datetime
+from ..models import Project, Task, SubTask, SystemLog, BackupFile
+from ..backup_restore import BackupRestoreEngine, file_sha256
+
+User = get_user_model()
+
+
+@login_required
+def backup_management(request):
+    """Backup management dashboard"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can manage backups.')
+        return redirect('dashboard')
+    
+    backups = BackupFile.objects.all()
+    
+    # Get backup statistics
+    total_backups = backups.count()
+    available_backups = backups.filter(status='available').count()
+    total_size_mb = sum(backup.file_size_mb for backup in backups)
+    
+    context = {
+        'backups': backups,
+        'total_backups': total_backups,
+        'available_backups': available_backups,
+        'total_size_mb': round(total_size_mb, 2),
+    }
+    
+    return render(request, 'home/backup_management.html', context)
+
+
+@login_required
+def create_backup(request):
+    """Create a new database backup"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can create backups.')
+        return redirect('backup_management')
+    
+    if request.method == 'POST':
+        description = request.POST.get('description', '')
+        export_all = request.POST.get('export_all', 'false')
+        
+        try:
+            from django.core.management import call_command
+            from django.conf import settings
+            import os
+            import hashlib
+            from datetime import datetime
+            
+            # Create backup directory if it doesn't exist
+            backup_dir = os.path.join(django_settings.BASE_DIR, 'backups')
+            os.makedirs(backup_dir, exist_ok=True)
+            
+            # Generate backup filename with timestamp
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            if export_all == 'true':
+                backup_filename = f"export_all_{timestamp}.json"
+                backup_type = 'export'
+            else:
+                backup_filename = f"backup_{timestamp}.json"
+                backup_type = 'manual'
+            
+            backup_path = os.path.join(backup_dir, backup_filename)
+            
+            # Create backup using Django's dumpdata command
+            from io import StringIO
+            output = StringIO()
+            call_command('dumpdata', '--exclude', 'contenttypes', '--exclude', 'auth.permission', 
+                       '--exclude', 'admin.logentry', '--exclude', 'sessions.session',
+                       '--indent', '2', stdout=output)
+            
+            # Write to file
+            with open(backup_path, 'w', encoding='utf-8') as f:
+                f.write(output.getvalue())
+            
+            # Get file size and create checksum
+            file_size = os.path.getsize(backup_path)
+            with open(backup_path, 'rb') as f:
+                checksum = hashlib.sha256(f.read()).hexdigest()
+            
+            # Create BackupFile record
+            backup_file = BackupFile.objects.create(
+                filename=backup_filename,
+                file_path=backup_path,
+                file_size=file_size,
+                backup_type=backup_type,
+                description=description,
+                created_by=request.user,
+                backup_checksum=checksum,
+                database_version='Django 4.2+',
+                total_records=sum([User.objects.count(), Project.objects.count(), Task.objects.count(), 
+                                 SubTask.objects.count(), SystemLog.objects.count()])
+            )
+            
+            # Log the backup creation
+            SystemLog.log_backup_created(request.user, backup_file, request)
+            
+            if export_all == 'true':
+                # For export, return the file as download
+                from django.http import FileResponse
+                response = FileResponse(open(backup_path, 'rb'), content_type='application/json')
+                response['Content-Disposition'] = f'attachment; filename="{backup_filename}"'
+                return response
+            else:
+                messages.success(request, f'Backup created successfully: {backup_filename}')
+                    
+        except Exception as e:
+            messages.error(request, f'Error creating backup: {str(e)}')
+            # Log the error
+            SystemLog.log_backup_failed(request.user, 'manual', str(e), request)
+        
+        return redirect('backup_management')
+    
+
+@login_required
+def upload_backup(request):
+    """Upload a backup file"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can upload backups.')
+        return redirect('backup_management')
+    
+    if request.method == 'POST':
+        backup_file = request.FILES.get('backup_file')
+        description = request.POST.get('description', '')
+        
+        if not backup_file:
+            messages.error(request, 'Please select a backup file to upload.')
+            return redirect('backup_management')
+        
+        # Validate file extension
+        if not backup_file.name.endswith('.json'):
+            messages.error(request, 'Only JSON backup files are allowed.')
+            return redirect('backup_management')
+        
+        try:
+            import os
+            import hashlib
+            from django.conf import settings
+            
+            # Create backup directory if it doesn't exist
+            backup_dir = os.path.join(settings.BASE_DIR, 'backups')
+            os.makedirs(backup_dir, exist_ok=True)
+            
+            # Generate unique filename
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"uploaded_backup_{timestamp}.json"
+            file_path = os.path.join(backup_dir, filename)
+            
+            # Save uploaded file
+            with open(file_path, 'wb+') as destination:
+                for chunk in backup_file.chunks():
+                    destination.write(chunk)
+            
+            # Get file size and create checksum
+            file_size = os.path.getsize(file_path)
+            with open(file_path, 'rb') as f:
+                checksum = hashlib.sha256(f.read()).hexdigest()
+            
+            # Create BackupFile record
+            backup_file = BackupFile.objects.create(
+                filename=filename,
+                file_path=file_path,
+                file_size=file_size,
+                backup_type='uploaded',
+                description=description,
+                created_by=request.user,
+                backup_checksum=checksum,
+                database_version='Unknown',
+                total_records=0
+            )
+            
+            # Log the backup upload
+            SystemLog.log_backup_uploaded(request.user, backup_file, request)
+            
+            messages.success(request, f'Backup uploaded successfully: {filename}')
+            
+        except Exception as e:
+            messages.error(request, f'Error uploading backup: {str(e)}')
+            # Log the error
+            SystemLog.log_backup_failed(request.user, 'upload', str(e), request)
+    
+    return redirect('backup_management')
+
+
+@login_required
+def restore_backup(request, backup_id):
+    """Restore database from a backup file"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can restore backups.')
+        return redirect('backup_management')
+    
+    # Check if this is a POST request
+    if request.method != 'POST':
+        messages.error(request, 'Invalid request method. Please use the restore button.')
+        return redirect('backup_management')
+    
+    try:
+        backup = BackupFile.objects.get(id=backup_id)
+        
+        if not backup.is_available:
+            messages.error(request, 'Backup file is not available for restore.')
+            return redirect('backup_management')
+        
+        # Verify file exists
+        if not os.path.exists(backup.file_path):
+            messages.error(request, f'Backup file not found on disk: {backup.file_path}')
+            backup.status = 'corrupted'
+            backup.save()
+            return redirect('backup_management')
+        
+
+        
+        # Verify file integrity if checksum exists
+        if backup.backup_checksum:
+            try:
+                current_checksum = file_sha256(backup.file_path)
+                
+                if current_checksum != backup.backup_checksum:
+                    messages.error(request, 'Backup file integrity check failed. File may be corrupted.')
+                    backup.status = 'corrupted'
+                    backup.save()
+                    return redirect('backup_management')
+            except Exception as e:
+                messages.error(request, f'Error checking file integrity: {str(e)}')
+                return redirect('backup_management')
+        
+        engine = BackupRestoreEngine()
+        
+        # Validate the backup contents without touching the database
+        if request.POST.get('dry_run') == 'true':
+            try:
+                result = engine.restore(backup.file_path, dry_run=True)
+                messages.success(request, f"Backup {backup.filename} is valid: {result['total_rows']} rows across {len(result['models'])} tables.")
+            except Exception as e:
+                messages.error(request, f'Backup validation failed: {str(e)}')
+            return redirect('backup_management')
+        
+        # Create a backup before restore (safety measure)
+        safety_backup_dir = os.path.join(django_settings.BASE_DIR, 'backups')
+        os.makedirs(safety_backup_dir, exist_ok=True)
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        safety_filename = f"pre_restore_backup_{timestamp}.json"
+        safety_path = os.path.join(safety_backup_dir, safety_filename)
+        
+        try:
+            # Create safety backup using management command
+            from django.core.management import call_command
+            from io import StringIO
+            
+            # Capture the output of dumpdata
+            output = StringIO()
+            call_command('dumpdata', 
+                        '--exclude', 'contenttypes', 
+                        '--exclude', 'auth.permission', 
+                        '--exclude', 'admin.logentry', 
+                        '--exclude', 'sessions.session',
+                        '--indent', '2', 
+                        stdout=output)
+            
+            # Write to file
+            with open(safety_path, 'w', encoding='utf-8') as f:
+                f.write(output.getvalue())
+            
+            # Create safety backup record
+            safety_size = os.path.getsize(safety_path)
+            safety_checksum = file_sha256(safety_path)
+            
+            safety_backup = BackupFile.objects.create(
+                filename=safety_filename,
+                file_path=safety_path,
+                file_size=safety_size,
+                backup_type='automatic',
+                description='Safety backup created before restore operation',
+                created_by=request.user,
+                backup_checksum=safety_checksum,
+                database_version='Django 4.2+',
+                total_records=sum([
+                    User.objects.count(), 
+                    Project.objects.count(), 
+                    Task.objects.count(), 
+                    SubTask.objects.count(), 
+                    SystemLog.objects.count()
+                ])
+            )
+            
+            messages.info(request, f'Safety backup created: {safety_filename}')
+            
+        except Exception as e:
+            messages.warning(request, f'Could not create safety backup: {str(e)}. Proceeding with restore...')
+        
+        try:
+            # Log the restore attempt
+            messages.info(request, f'Starting restore from backup: {backup.filename}')
+            
+            # Replace all data in a single transaction (rolled back on any error)
+            result = engine.restore(backup.file_path)
+            
+            # Update backup status
+            backup.status = 'restored'
+            backup.restored_at = timezone.now()
+            backup.restored_by = request.user
+            backup.save()
+            
+            # Log the restore operation
+            SystemLog.log_backup_restored(request.user, backup, request)
+            
+            messages.success(request, f"Database restored successfully from backup: {backup.filename} ({result['total_rows']} rows in {result['elapsed']}s)")
+            
+        except Exception as e:
+            # The restore transaction was rolled back, current data is unchanged
+            messages.error(request, f'Error during restore operation: {str(e)}. No data was changed.')
+            SystemLog.log_backup_failed(request.user, 'restore', str(e), request)
+            
+            return redirect('backup_management')
+        
+    except BackupFile.DoesNotExist:
+        messages.error(request, 'Backup file not found.')
+    except Exception as e:
+        messages.error(request, f'Error restoring backup: {str(e)}')
+        # Log the error
+        SystemLog.log_backup_failed(request.user, 'restore', str(e), request)
+    
+    return redirect('backup_management')
+
+
+@login_required
+def delete_backup(request, backup_id):
+    """Delete a backup file"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can delete backups.')
+        return redirect('backup_management')
+    
+    try:
+        backup = BackupFile.objects.get(id=backup_id)
+        
+        # Delete physical file
+        import os
+        if os.path.exists(backup.file_path):
+            os.remove(backup.file_path)
+        
+        # Log deletion before removing record
+        SystemLog.log_backup_deleted(request.user, backup, request)
+        
+        # Delete database record
+        backup.delete()
+        
+        messages.success(request, f'Backup deleted successfully: {backup.filename}')
+        
+    except BackupFile.DoesNotExist:
+        messages.error(request, 'Backup file not found.')
+    except Exception as e:
+        messages.error(request, f'Error deleting backup: {str(e)}')
+    
+    return redirect('backup_management')
+
+
+@login_required
+def download_backup(request, backup_id):
+    """Download a backup file"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can download backups.')
+        return redirect('backup_management')
+    
+    try:
+        backup = BackupFile.objects.get(id=backup_id)
+        
+        if not backup.is_available:
+            messages.error(request, 'Backup file is not available for download.')
+            return redirect('backup_management')
+        
+        import os
+        from django.http import FileResponse
+        
+        if os.path.exists(backup.file_path):
+            response = FileResponse(open(backup.file_path, 'rb'))
+            response['Content-Type'] = 'application/json'
+            response['Content-Disposition'] = f'attachment; filename="{backup.filename}"'
+            
+            # Log the download
+            SystemLog.log_backup_downloaded(request.user, backup, request)
+            
+            return response
+        else:
+            messages.error(request, 'Backup file not found on disk.')
+            
+    except BackupFile.DoesNotExist:
+        messages.error(request, 'Backup file not found.')
+    except Exception as e:
+        messages.error(request, f'Error downloading backup: {str(e)}')
+    
+    return redirect('backup_management')
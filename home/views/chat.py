@@ -0,0 +1,555 @@
+"""
+AI assistant, chatbot feedback and Eclick Chats views
+"""
+from django.shortcuts import render, redirect
+from django.contrib.auth.decorators import login_required
+from django.views.decorators.csrf import csrf_exempt
+from django.contrib import messages
+from django.http import JsonResponse
+from django.conf import settings as django_settings
+from django.utils import timezone
+from django.db.models import Max, Count
+import json
+import os
+import logging
+import uuid
+from ..ai_service import ai_service
+from ..rate_limit import rate_limit, get_rejection_stats
+from ..json_api import versioned_json
+from ..search_index import search_index
+
+logger = logging.getLogger(__name__)
+
+
+@csrf_exempt
+@rate_limit('ai_chat', limit=20, window=60)
+def ai_chat(request):
+    """AI Chat endpoint for robot interactions"""
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            question = data.get('question', '').strip()
+            user_id = data.get('user_id', '')
+            
+            if not question:
+                return JsonResponse({'error': 'Question is required'}, status=400)
+            
+            # Generate session ID if not provided
+            session_id = request.session.get('ai_session_id')
+            if not session_id:
+                session_id = str(uuid.uuid4())
+                request.session['ai_session_id'] = session_id
+            
+            # Get AI response
+            answer, confidence, response_time = ai_service.get_response(
+                question=question,
+                user_id=user_id,
+                session_id=session_id
+            )
+            
+            return JsonResponse({
+                'answer': answer,
+                'confidence': round(confidence, 2),
+                'response_time': round(response_time, 3),
+                'session_id': session_id
+            })
+            
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+    
+    return JsonResponse({'error': 'POST method required'}, status=405)
+
+def ai_feedback(request):
+    """Handle AI conversation feedback for learning"""
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            conversation_id = data.get('conversation_id')
+            was_helpful = data.get('was_helpful')
+            
+            if conversation_id is not None and was_helpful is not None:
+                ai_service.learn_from_feedback(conversation_id, was_helpful)
+                return JsonResponse({'success': True})
+            else:
+                return JsonResponse({'error': 'Missing required fields'}, status=400)
+                
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Invalid JSON'}, status=400)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+    
+    return JsonResponse({'error': 'POST method required'}, status=405)
+
+def _ai_stats_version(request):
+    from ..models import AILearningMetrics
+    last_updated = AILearningMetrics.objects.filter(id=1).values_list('last_updated', flat=True).first()
+    # local_size differs between workers, it must not change the ETag
+    stats = ai_service.get_answer_cache_stats()
+    return (last_updated, stats['hits'], stats['misses'])
+
+@versioned_json(_ai_stats_version)
+def ai_stats(request):
+    """Get AI learning statistics"""
+    if request.method == 'GET':
+        try:
+            stats = ai_service.get_learning_stats()
+            return JsonResponse(stats)
+        except Exception as e:
+            return JsonResponse({'error': str(e)}, status=500)
+    
+    return JsonResponse({'error': 'GET method required'}, status=405)
+
+@login_required
+def ai_knowledge_management(request):
+    """Admin interface for managing AI knowledge base"""
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Only administrators can manage AI knowledge.')
+        return redirect('dashboard')
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        
+        if action == 'add':
+            question = request.POST.get('question', '').strip()
+            answer = request.POST.get('answer', '').strip()
+            category = request.POST.get('category', '').strip()
+            tags = request.POST.get('tags', '').strip()
+            
+            if question and answer:
+                tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()] if tags else []
+                ai_service.add_knowledge(question, answer, category, tag_list)
+                messages.success(request, 'Knowledge added successfully!')
+            else:
+                messages.error(request, 'Question and answer are required.')
+        
+        elif action == 'initialize':
+            ai_service.initialize_knowledge_base()
+            messages.success(request, 'Knowledge base initialized with basic information!')
+    
+    # Get knowledge base entries
+    knowledge_entries = AIKnowledgeBase.objects.all()
+    stats = ai_service.get_learning_stats()
+    
+    context = {
+        'knowledge_entries': knowledge_entries,
+        'stats': stats
+    }
+    
+    return render(request, 'home/ai_knowledge_management.html', context)
+
+
+# =======================
+# Chatbot Feedback Views
+# =======================
+
+@csrf_exempt
+@rate_limit('chatbot_feedback', limit=10, window=60)
+def chatbot_feedback(request):
+    """Handle chatbot feedback and satisfaction ratings"""
+    if request.method == 'POST':
+        try:
+            import json
+            from ..models import ChatbotFeedback
+            
+            data = json.loads(request.body)
+            
+            # Get session ID (generate if not provided)
+            session_id = data.get('session_id', request.session.session_key or f'anon-{timezone.now().timestamp()}')
+            
+            # Get IP address
+            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+            ip_address = x_forwarded_for.split(',')[0] if x_forwarded_for else request.META.get('REMOTE_ADDR')
+            
+            # Create feedback record
+            feedback = ChatbotFeedback.objects.create(
+                session_id=session_id,
+                feedback_type=data.get('feedback_type', 'general'),
+                feedback_text=data.get('feedback_text', ''),
+                satisfaction_rating=data.get('satisfaction_rating'),
+                user_email=data.get('user_email'),
+                user_name=data.get('user_name'),
+                conversation_context=data.get('conversation_context', {}),
+                user_agent=request.META.get('HTTP_USER_AGENT', ''),
+                ip_address=ip_address
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Thank you for your feedback!',
+                'feedback_id': feedback.id
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'error': str(e)
+            }, status=400)
+    
+    return JsonResponse({'error': 'POST request required'}, status=405)
+
+
+@csrf_exempt  
+@rate_limit('chatbot_satisfaction', limit=10, window=60)
+def chatbot_satisfaction(request):
+    """Handle satisfaction rating submission"""
+    if request.method == 'POST':
+        try:
+            import json
+            from ..models import ChatbotFeedback
+            
+            data = json.loads(request.body)
+            rating = data.get('rating')
+            
+            if not rating or not (1 <= int(rating) <= 5):
+                return JsonResponse({
+                    'success': False,
+                    'error': 'Invalid rating. Must be between 1 and 5'
+                }, status=400)
+            
+            # Get session ID
+            session_id = data.get('session_id', request.session.session_key or f'anon-{timezone.now().timestamp()}')
+            
+            # Get IP address
+            x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+            ip_address = x_forwarded_for.split(',')[0] if x_forwarded_for else request.META.get('REMOTE_ADDR')
+            
+            # Create satisfaction feedback
+            feedback = ChatbotFeedback.objects.create(
+                session_id=session_id,
+                feedback_type='satisfaction',
+                satisfaction_rating=int(rating),
+                conversation_context=data.get('conversation_context', {}),
+                user_agent=request.META.get('HTTP_USER_AGENT', ''),
+                ip_address=ip_address
+            )
+            
+            return JsonResponse({
+                'success': True,
+                'message': f'Thank you! You rated {rating} out of 5',
+                'feedback_id': feedback.id
+            })
+            
+        except Exception as e:
+            return JsonResponse({
+                'success': False,
+                'error': str(e)
+            }, status=400)
+    
+    return JsonResponse({'error': 'POST request required'}, status=405)
+
+
+def _chatbot_stats_version(request):
+    from ..models import ChatbotFeedback
+    if not request.user.is_staff:
+        return None
+    latest = ChatbotFeedback.objects.aggregate(count=Count('id'), newest=Max('id'))
+    return (latest['count'], latest['newest'], get_rejection_stats())
+
+@versioned_json(_chatbot_stats_version)
+def chatbot_stats(request):
+    """Get chatbot satisfaction statistics (for admin)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Admin access required'}, status=403)
+    
+    from ..models import ChatbotFeedback
+    
+    # Totals, average and distribution (cached until new feedback arrives)
+    summary = ChatbotFeedback.get_summary()
+    
+    # Get recent feedback
+    recent_feedback = ChatbotFeedback.objects.filter(
+        feedback_text__isnull=False
+    ).exclude(feedback_text='').values(
+        'id', 'feedback_type', 'feedback_text', 'satisfaction_rating', 'created_at'
+    ).order_by('-created_at')[:10]
+    
+    return JsonResponse({
+        'success': True,
+        'stats': {
+            'average_satisfaction': summary['average_satisfaction'],
+            'distribution': summary['distribution'],
+            'total_feedback': summary['total_feedback'],
+            'total_ratings': summary['total_ratings'],
+            'recent_feedback': list(recent_feedback),
+            'rate_limit_rejections': get_rejection_stats()
+        }
+    })
+
+
+@login_required
+def satisfaction_report(request):
+    """Satisfaction report page (Admin only)"""
+    # Check if user is admin
+    if not request.user.is_superuser:
+        return redirect('home:index')
+
+    from ..models import ChatbotFeedback
+    from django.db.models import Q
+
+    # Report window in days (7/30/90/365)
+    try:
+        days = int(request.GET.get('days', 30))
+    except (TypeError, ValueError):
+        days = 30
+    if days not in ChatbotFeedback.REPORT_WINDOWS:
+        days = 30
+
+    # Totals, average and distribution (cached until new feedback arrives)
+    summary = ChatbotFeedback.get_summary()
+
+    # Get feedback by day for the trend chart in a single grouped query
+    daily_feedback = []
+    chart_labels = []
+    chart_ratings = []
+    chart_counts = []
+
+    for day in ChatbotFeedback.get_daily_trend(days):
+        daily_feedback.append({
+            'date': day['date'].strftime('%Y-%m-%d'),
+            'day_name': day['date'].strftime('%a'),
+            'count': day['count'],
+            'avg_rating': day['avg_rating'] or 0
+        })
+
+        # Data for chart
+        chart_labels.append(day['date'].strftime('%b %d'))
+        chart_ratings.append(day['avg_rating'])
+        chart_counts.append(day['count'])
+
+    recent_count = sum(chart_counts)
+
+    # Get recent detailed feedback
+    recent_feedback = ChatbotFeedback.objects.filter(
+        Q(feedback_text__isnull=False) | Q(satisfaction_rating__isnull=False)
+    ).order_by('-created_at')[:20]
+
+    import json
+
+    context = {
+        'avg_satisfaction': summary['average_satisfaction'],
+        'distribution': summary['distribution'],
+        'total_feedback': summary['total_feedback'],
+        'total_ratings': summary['total_ratings'],
+        'recent_count': recent_count,
+        'days': days,
+        'report_windows': ChatbotFeedback.REPORT_WINDOWS,
+        'daily_feedback': daily_feedback,
+        'recent_feedback': recent_feedback,
+        'chart_labels': json.dumps(chart_labels),
+        'chart_ratings': json.dumps(chart_ratings),
+        'chart_counts': json.dumps(chart_counts),
+    }
+
+    return render(request, 'home/satisfaction_report.html', context)
+
+
+@login_required
+def eclick_chats(request):
+    """Eclick Chats page - where clients and employees can send messages to devs"""
+    from ..models import DevMessage, Project
+    from django.db.models import Count, Q
+    from django.contrib import messages as django_messages
+
+    # Handle POST request (sending new message)
+    if request.method == 'POST':
+        action = request.POST.get('action')
+
+        if action == 'send_message':
+            message_type = request.POST.get('message_type', 'feedback')
+            subject = request.POST.get('subject', '').strip()
+            message = request.POST.get('message', '').strip()
+            priority = request.POST.get('priority', 'medium')
+            project_id = request.POST.get('project')
+
+            # Truncate subject to fit database limit (1000 chars)
+            max_subject_length = 1000
+            if len(subject) > max_subject_length:
+                subject = subject[:max_subject_length - 3] + '...'
+
+            if subject and message:
+                dev_message = DevMessage.objects.create(
+                    user=request.user,
+                    message_type=message_type,
+                    subject=subject,
+                    message=message,
+                    priority=priority,
+                    project_id=project_id if project_id else None
+                )
+
+                # Send email notification to admin
+                try:
+                    from ..email_service import email_service
+
+                    # Get project name if available
+                    project_name = 'None'
+                    if project_id:
+                        try:
+                            project = Project.objects.get(id=project_id)
+                            project_name = project.name
+                        except Project.DoesNotExist:
+                            pass
+
+                    # Prepare email content
+                    email_subject = f"New Message from {request.user.get_full_name() or request.user.username}"
+
+                    # Logo is embedded once as an inline CID image, encoded once per process
+                    logo_path = os.path.join(django_settings.BASE_DIR, 'static', 'images', 'E Click Logo (1).png')
+                    logo_cid = email_service.inline_image_cid(logo_path)
+
+                    # Build HTML email body with logo
+                    email_body = f"""<html>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+    <div style="text-align: center; margin-bottom: 20px;">
+        <img src="cid:{logo_cid}" alt="E-Click Logo" style="max-width: 200px;">
+    </div>
+
+    <p><strong>Subject:</strong> {subject}</p>
+
+    <p><strong>Message:</strong></p>
+    <p>{message}</p>
+
+    <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+    <p style="text-align: center; color: #666; font-size: 14px;">E-Click Project Management System</p>
+</body>
+</html>"""
+
+                    # Send email to admin
+                    email_service.send_email(
+                        to_email='ethan.sevenster@moc-pty.com',
+                        subject=email_subject,
+                        body=email_body,
+                        inline_images=[logo_path]
+                    )
+                except Exception as e:
+                    # Log error but don't fail the message submission
+                    logger.error(f"Failed to send email notification: {e}")
+
+                django_messages.success(request, 'Your message has been sent successfully!')
+                return redirect('eclick_chats')
+            else:
+                django_messages.error(request, 'Please provide both subject and message.')
+
+        elif action == 'respond' and request.user.is_staff:
+            message_id = request.POST.get('message_id')
+            response = request.POST.get('response', '').strip()
+
+            if message_id and response:
+                try:
+                    dev_message = DevMessage.objects.get(id=message_id)
+                    dev_message.admin_response = response
+                    dev_message.responded_by = request.user
+                    dev_message.responded_at = timezone.now()
+                    dev_message.status = 'resolved'
+                    dev_message.save()
+                    django_messages.success(request, 'Response sent successfully!')
+                except DevMessage.DoesNotExist:
+                    django_messages.error(request, 'Message not found.')
+
+        elif action == 'update_status' and request.user.is_staff:
+            message_id = request.POST.get('message_id')
+            new_status = request.POST.get('status')
+
+            if message_id and new_status:
+                try:
+                    dev_message = DevMessage.objects.get(id=message_id)
+                    dev_message.status = new_status
+                    dev_message.save()
+                    django_messages.success(request, 'Status updated successfully!')
+                except DevMessage.DoesNotExist:
+                    django_messages.error(request, 'Message not found.')
+
+        elif action == 'delete_message' and request.user.is_staff:
+            message_id = request.POST.get('message_id')
+
+            if message_id:
+                try:
+                    dev_message = DevMessage.objects.get(id=message_id)
+                    dev_message.delete()
+                    django_messages.success(request, 'Message deleted successfully!')
+                    return redirect('eclick_chats')
+                except DevMessage.DoesNotExist:
+                    django_messages.error(request, 'Message not found.')
+
+    # Get messages based on user role
+    if request.user.is_staff:
+        # Admin sees all messages
+        all_messages = DevMessage.objects.select_related('user', 'project', 'responded_by').all()
+    else:
+        # Regular users see only their messages
+        all_messages = DevMessage.objects.filter(user=request.user).select_related('project', 'responded_by').all()
+
+    # Apply filters from GET parameters
+    from datetime import timedelta
+
+    # Date filter
+    date_filter = request.GET.get('date_filter', 'all')
+    if date_filter == 'week':
+        week_ago = timezone.now() - timedelta(days=7)
+        all_messages = all_messages.filter(created_at__gte=week_ago)
+    elif date_filter == 'month':
+        month_ago = timezone.now() - timedelta(days=30)
+        all_messages = all_messages.filter(created_at__gte=month_ago)
+    elif date_filter == 'today':
+        today_start = timezone.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        all_messages = all_messages.filter(created_at__gte=today_start)
+
+    # Search filter
+    search_query = request.GET.get('search', '').strip()
+    if search_query:
+        # Subject, message, response and author names through the full-text index
+        matching = search_index.matching_ids('dev_message', search_query)
+        if matching is not None:
+            all_messages = all_messages.filter(id__in=matching)
+        else:
+            # Too short to be indexed, e.g. a single character
+            all_messages = all_messages.filter(subject__icontains=search_query)
+
+    # Status filter
+    status_filter = request.GET.get('status', '')
+    if status_filter:
+        all_messages = all_messages.filter(status=status_filter)
+
+    # Message type filter
+    type_filter = request.GET.get('type', '')
+    if type_filter:
+        all_messages = all_messages.filter(message_type=type_filter)
+
+    # Get statistics
+    total_messages = all_messages.count()
+    new_messages = all_messages.filter(status='new').count()
+    resolved_messages = all_messages.filter(status='resolved').count()
+
+    # Get messages by type
+    messages_by_type = all_messages.values('message_type').annotate(count=Count('id'))
+
+    # Get user's projects for dropdown
+    if request.user.is_staff:
+        user_projects = Project.objects.all()
+    else:
+        user_projects = Project.objects.filter(
+            Q(assigned_users=request.user) | Q(client_username=request.user.username)
+        ).distinct()
+
+    # Admin sees full dashboard with stats, regular users see simple form
+    if request.user.is_staff:
+        context = {
+            'dev_messages': all_messages.order_by('-created_at')[:100],  # Latest 100 messages
+            'total_messages': total_messages,
+            'new_messages': new_messages,
+            'resolved_messages': resolved_messages,
+            'messages_by_type': messages_by_type,
+            'user_projects': user_projects,
+            'is_admin': request.user.is_staff,
+            'current_date_filter': date_filter,
+            'current_search': search_query,
+            'current_status': status_filter,
+            'current_type': type_filter,
+        }
+        return render(request, 'home/eclickchatsadmin.html', context)
+    else:
+        context = {
+            'user_projects': user_projects,
+        }
+        return render(request, 'home/eclick_chats.html', context)
@@ -0,0 +1,493 @@
+"""
+Client portal: dashboard, project pages, Gantt data and client account views
+"""
+from django.shortcuts import render, redirect
+from django.contrib import messages
+from django.http import JsonResponse
+from django.db.models import Q
+import hashlib
+from ..models import Project, Client, TaskUpdate
+from ..client_links import client_project_ids, client_projects
+from ..rate_limit import rate_limit
+from ..json_api import CompactJsonResponse, versioned_json
+from ..report_snapshots import get_data_version
+from ..gantt_layout import build_gantt_layout, subtask_sort_key
+
+
+def client_dashboard(request):
+    """Client dashboard showing their projects"""
+    if 'client_id' not in request.session:
+        return redirect('login')
+    
+    client_id = request.session['client_id']
+    try:
+        client = Client.objects.get(id=client_id, is_active=True)
+        # Get projects where this client is involved (see home.client_links)
+        projects = client_projects(client).order_by('-created_at')
+        
+        # Calculate project statistics
+        total_projects = projects.count()
+        active_projects = projects.filter(status='in_progress').count()
+        completed_projects = projects.filter(status='completed').count()
+        planned_projects = projects.filter(status='planned').count()
+        
+        # Get recent tasks for all projects and calculate task counts
+        recent_tasks = []
+        total_all_tasks = 0
+        total_completed_tasks = 0
+        
+        for project in projects:
+            project_tasks = project.tasks.all().order_by('-updated_at')[:3]
+            completed_tasks_count = project.tasks.filter(status='completed').count()
+            total_tasks_count = project.tasks.count()
+
+            project.completed_tasks_count = completed_tasks_count
+            project.remaining_tasks_count = total_tasks_count - completed_tasks_count
+            total_all_tasks += total_tasks_count
+            total_completed_tasks += completed_tasks_count
+            
+            for task in project_tasks:
+                recent_tasks.append({
+                    'task': task,
+                    'project': project
+                })
+        
+        # Calculate overall progress percentage
+        overall_progress = (total_completed_tasks / total_all_tasks * 100) if total_all_tasks > 0 else 0
+        
+        # Sort by task update date
+        recent_tasks.sort(key=lambda x: x['task'].updated_at, reverse=True)
+        recent_tasks = recent_tasks[:6]  # Show only 6 most recent tasks
+        
+        return render(request, 'home/client_dashboard.html', {
+            'client': client,
+            'projects': projects,
+            'total_projects': total_projects,
+            'active_projects': active_projects,
+            'completed_projects': completed_projects,
+            'planned_projects': planned_projects,
+            'recent_tasks': recent_tasks,
+            'overall_progress': overall_progress
+        })
+    except Client.DoesNotExist:
+        return redirect('login')
+
+def client_project_detail(request, project_id):
+    """Client view of project details including tasks"""
+    if 'client_id' not in request.session:
+        return redirect('login')
+    
+    client_id = request.session['client_id']
+    try:
+        client = Client.objects.get(id=client_id, is_active=True)
+        # Get project where this client is involved (see home.client_links)
+        project = client_projects(client).filter(id=project_id).first()
+
+        if not project:
+            return redirect('client_dashboard')
+        
+        # Get all tasks for this project with their subtasks
+        tasks = project.tasks.all().order_by('start_date', 'created_at')
+        
+        # Calculate project progress
+        total_tasks = tasks.count()
+        completed_tasks = tasks.filter(status='completed').count()
+        in_progress_tasks = tasks.filter(status='in_progress').count()
+        on_hold_tasks = tasks.filter(status='on_hold').count()
+        not_started_tasks = tasks.filter(status='not_started').count()
+        
+        # Calculate progress percentage
+        progress_percentage = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        
+        # Get task updates and recent activity
+        task_updates = TaskUpdate.objects.filter(task__project=project).order_by('-created_at')[:10]
+        
+        return render(request, 'home/client_project_detail.html', {
+            'client': client,
+            'project': project,
+            'tasks': tasks,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'in_progress_tasks': in_progress_tasks,
+            'on_hold_tasks': on_hold_tasks,
+            'not_started_tasks': not_started_tasks,
+            'progress_percentage': progress_percentage,
+            'task_updates': task_updates
+        })
+    except Client.DoesNotExist:
+        return redirect('login')
+    except Project.DoesNotExist:
+        return redirect('client_dashboard')
+
+def _client_gantt_version(request):
+    client_id = request.session.get('client_id')
+    return (client_id, get_data_version()) if client_id else None
+
+@versioned_json(_client_gantt_version)
+def client_gantt_data(request):
+    """API endpoint for client Gantt chart data"""
+    if 'client_id' not in request.session:
+        return JsonResponse({'success': False, 'error': 'Not authenticated'})
+
+    client_id = request.session['client_id']
+    try:
+        client = Client.objects.get(id=client_id, is_active=True)
+        # Get projects where this client is involved (see home.client_links)
+        projects = client_projects(client).order_by('-created_at')
+
+        gantt_data = []
+        for gantt_project in build_gantt_layout(projects).projects:
+            project = gantt_project.project
+            gantt_data.append({
+                'id': project.id,
+                'name': project.name,
+                'client': project.client,
+                'start_date': project.start_date.isoformat() if project.start_date else None,
+                'end_date': project.end_date.isoformat() if project.end_date else None,
+                'status': project.status,
+                'tasks': [
+                    {
+                        'id': task.id,
+                        'title': task.title,
+                        'start_date': task.start_date.isoformat() if task.start_date else None,
+                        'end_date': task.end_date.isoformat() if task.end_date else None,
+                        'status': task.status,
+                        'priority': task.priority,
+                        'subtasks': [
+                            {
+                                'id': subtask.id,
+                                'title': subtask.title,
+                                'start_date': subtask.start_date.isoformat() if subtask.start_date else None,
+                                'end_date': subtask.end_date.isoformat() if subtask.end_date else None,
+                                'status': subtask.status,
+                                'priority': subtask.priority
+                            }
+                            for subtask in sorted(task.subtasks.all(), key=subtask_sort_key)
+                        ]
+                    }
+                    for task in gantt_project.tasks
+                ]
+            })
+
+        return CompactJsonResponse({'success': True, 'projects': gantt_data})
+    except Client.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Client not found'})
+    except Exception as e:
+        return JsonResponse({'success': False, 'error': str(e)})
+
+def client_logout(request):
+    """Client logout"""
+    if 'client_id' in request.session:
+        del request.session['client_id']
+    if 'client_username' in request.session:
+        del request.session['client_username']
+    return redirect('login')
+
+def client_settings(request):
+    """Client settings page for profile management"""
+    if 'client_id' not in request.session:
+        return redirect('login')
+    
+    client_id = request.session['client_id']
+    try:
+        client = Client.objects.get(id=client_id, is_active=True)
+        
+        if request.method == 'POST':
+            # Handle AJAX profile picture upload
+            if request.POST.get('upload_only') == 'true':
+                if 'profile_picture' in request.FILES:
+                    try:
+                        profile_picture = request.FILES['profile_picture']
+                        # Delete old profile picture if it exists
+                        if client.profile_picture:
+                            client.profile_picture.delete(save=False)
+                        client.profile_picture = profile_picture
+                        client.save()
+                        return JsonResponse({'success': True})
+                    except Exception as e:
+                        return JsonResponse({'success': False, 'error': str(e)})
+                return JsonResponse({'success': False, 'error': 'No file provided'})
+
+            # Handle profile updates
+            username = request.POST.get('username')
+            email = request.POST.get('email')
+
+            if username and email:
+                # Check if username or email already exists for other clients
+                existing_client = Client.objects.filter(
+                    (Q(username=username) | Q(email=email)) &
+                    ~Q(id=client_id)
+                ).first()
+                
+                if existing_client:
+                    if existing_client.username == username:
+                        pass
+                    else:
+                        pass
+                else:
+                    # Update client profile (username and email only)
+                    old_username = client.username
+                    old_email = client.email
+
+                    client.username = username
+                    client.email = email
+                    client.save()
+
+                    return redirect('client_settings')
+
+        return render(request, 'home/client_settings.html', {
+            'client': client
+        })
+    except Client.DoesNotExist:
+        return redirect('login')
+
+@rate_limit('send_client_otp', limit=5, window=300)
+def send_client_otp(request):
+    """Send OTP to client for password setup"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('projects_page')
+    
+    if request.method == 'POST':
+        project_id = request.POST.get('project_id')
+        client_username = request.POST.get('client_username')
+        client_email = request.POST.get('client_email')
+        
+        try:
+            project = Project.objects.get(id=project_id)
+            
+            # Check if client already exists by email or username
+            client = None
+            
+            # First try to find by email
+            try:
+                client = Client.objects.get(email=client_email)
+                # Client exists by email, use existing client
+                
+                # Check if this client is associated with any active projects
+                active_projects = bool(client_project_ids(client))
+                if not active_projects:
+                    # Client exists but has no active projects, update username if needed
+                    if client.username != client_username:
+                        client.username = client_username
+                        client.save()
+                        print(f"Updated client username from {client.username} to {client_username}")
+            except Client.DoesNotExist:
+                # Try to find by username
+                try:
+                    client = Client.objects.get(username=client_username)
+                    # Client exists by username, update email if needed
+                    if client.email != client_email:
+                        client.email = client_email
+                        client.save()
+                        print(f"Updated client email from {client.email} to {client_email}")
+                except Client.DoesNotExist:
+                    # Create new client
+                    client = Client.objects.create(
+                        username=client_username,
+                        email=client_email,
+                        is_active=True
+                    )
+                    print(f"Created new client: {client_username} ({client_email})")
+            
+            # Generate OTP (this already creates the OTP record)
+            otp = client.generate_otp()
+            
+            # Use localhost for development
+            site_url = request.build_absolute_uri('/').rstrip('/')
+            
+            # Send OTP email using SimpleEmailService with Microsoft SMTP
+            from ..email_service import SimpleEmailService
+            email_service = SimpleEmailService()
+            email_result = email_service.send_email(
+                to_email=client_email,
+                subject=f"Set Your Password - {project.name} Project",
+                body=f"""<html>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
+    <p>Dear {client_username},</p>
+    
+    <p>Welcome to the {project.name} project! Please use the following OTP to set your password:</p>
+    
+    <p style="font-size: 18px; font-weight: bold; color: #2563eb;">🔐 Your OTP: {otp}</p>
+    
+    <p>You can set your password here:</p>
+    <p><a href="{site_url}/client/setup-password/?username={client_username}" style="display: inline-block; background-color: #dc2626; color: white; padding: 12px 24px; text-decoration: none; border-radius: 6px; font-weight: bold;">Set Up New Password</a></p>
+
+    <p style="color: #dc2626; font-weight: bold;">⚠️ Please note: This OTP is valid for 24 hours.</p>
+
+    <p>Best regards,<br>E-Click Project Management Team</p>
+</body>
+</html>""",
+                from_email=None  # Will use default from settings
+            )
+            
+            if email_result['success']:
+                messages.success(request, f'We have sent an OTP to the client at {client_email}')
+            else:
+                messages.error(request, f'Error sending OTP: {email_result["error"]}')
+                
+        except Project.DoesNotExist:
+            messages.error(request, 'Project not found.')
+        except Exception as e:
+            messages.error(request, f'Error: {str(e)}')
+    
+    return redirect('projects_page')
+
+def client_setup_password(request):
+    """Client password setup using OTP"""
+    if request.method == 'POST':
+        username = request.POST.get('username')
+        otp = request.POST.get('otp')
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+
+        if not all([username, otp, new_password, confirm_password]):
+            return render(request, 'home/client_setup_password.html', {'username': username})
+
+        if new_password != confirm_password:
+            return render(request, 'home/client_setup_password.html', {'username': username})
+
+        if len(new_password) < 8:
+            return render(request, 'home/client_setup_password.html', {'username': username})
+        
+        try:
+            client = Client.objects.get(username=username)
+            
+            # Verify and consume the OTP
+            from ..otp_service import otp_service, VALID
+            if otp_service.verify(client, otp) != VALID:
+                return render(request, 'home/client_setup_password.html')
+
+            # Set client password
+            client.password = new_password
+            client.has_changed_password = True
+            client.save()
+
+            return redirect('client_dashboard')
+
+        except Client.DoesNotExist:
+            return render(request, 'home/client_setup_password.html')
+    
+    # GET request - show form
+    username = request.GET.get('username', '')
+    return render(request, 'home/client_setup_password.html', {'username': username})
+
+def client_change_password(request):
+    """Client change password page after login"""
+    # Check if client is logged in
+    client_id = request.session.get('client_id')
+    if not client_id:
+        return redirect('login')
+
+    try:
+        client = Client.objects.get(id=client_id, is_active=True)
+    except Client.DoesNotExist:
+        return redirect('login')
+
+    if request.method == 'POST':
+        old_password = request.POST.get('old_password')
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+
+        # Verify old password
+        old_password_hash = hashlib.sha256(old_password.encode()).hexdigest()
+        if client.password != old_password_hash:
+            return render(request, 'home/client_change_password.html')
+
+        # Validate new password
+        if new_password != confirm_password:
+            return render(request, 'home/client_change_password.html')
+
+        if len(new_password) < 6:
+            return render(request, 'home/client_change_password.html')
+
+        # Update password and mark as changed
+        client.password = hashlib.sha256(new_password.encode()).hexdigest()
+        client.has_changed_password = True
+        client.save()
+
+        return redirect('client_dashboard')
+
+    return render(request, 'home/client_change_password.html')
+def client_forgot_password(request):
+    """Client forgot password - Request OTP for password reset"""
+    if request.method == 'POST':
+        username_or_email = request.POST.get('username_or_email', '').strip()
+
+        if not username_or_email:
+            return render(request, 'home/client_forgot_password.html')
+
+        try:
+            # Try to find client by username or email
+            from django.db.models import Q
+            client = Client.objects.filter(
+                Q(username=username_or_email) | Q(email=username_or_email)
+            ).first()
+
+            if not client:
+                return render(request, 'home/client_forgot_password.html')
+
+            # Generate OTP
+            otp = client.generate_otp()
+
+            # Send OTP email
+            from ..email_service import email_service
+            site_url = request.build_absolute_uri('/')[:-1]
+
+            email_result = email_service.send_password_reset_otp_email(
+                to_email=client.email,
+                otp=otp,
+                username=client.username,
+                site_url=site_url
+            )
+
+            if email_result['success']:
+                return redirect('client_reset_password')
+            else:
+                return render(request, 'home/client_forgot_password.html')
+
+        except Exception as e:
+            return render(request, 'home/client_forgot_password.html')
+
+    return render(request, 'home/client_forgot_password.html')
+
+
+def client_reset_password(request):
+    """Client password reset using OTP"""
+    if request.method == 'POST':
+        username = request.POST.get('username')
+        otp = request.POST.get('otp')
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+
+        if not all([username, otp, new_password, confirm_password]):
+            return render(request, 'home/client_reset_password.html', {'username': username})
+
+        if new_password != confirm_password:
+            return render(request, 'home/client_reset_password.html', {'username': username})
+
+        if len(new_password) < 8:
+            return render(request, 'home/client_reset_password.html', {'username': username})
+
+        try:
+            client = Client.objects.get(username=username)
+
+            # Verify and consume the OTP
+            from ..otp_service import otp_service, VALID
+            if otp_service.verify(client, otp) != VALID:
+                return render(request, 'home/client_reset_password.html', {'username': username})
+
+            # Set client password
+            from django.contrib.auth.hashers import make_password
+            client.password = make_password(new_password)
+            client.has_changed_password = True
+            client.save()
+
+            return redirect('login')
+
+        except Client.DoesNotExist:
+            return render(request, 'home/client_reset_password.html', {'username': username})
+
+    # GET request - show form
+    username = request.GET.get('username', '')
+    return render(request, 'home/client_reset_password.html', {'username': username})
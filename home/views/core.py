@@ -0,0 +1,2192 @@
+"""
+Staff dashboard, projects, tasks, planner and notification views
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.utils import timezone
+from django.db.models import Max, Count, Q, Prefetch, prefetch_related_objects
+from django.core.paginator import Paginator
+from django.db import transaction
+import json
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+import logging
+from ..models import Project, Task, SubTask, UserProfile, Client, TaskUpdate, Notification, SystemLog, TaskComment, SubTaskComment
+from ..task_board import get_task_board
+from ..json_api import CompactJsonResponse, time_bucket, versioned_json
+from ..report_snapshots import get_data_version
+from ..gantt_layout import build_gantt_layout
+from ..comment_threads import TARGETS as COMMENT_TARGETS, build_threads, comment_threads
+from ..notification_inbox import notification_inbox
+from ..client_links import client_project_ids, client_project_ids_many
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+
+@login_required
+def dashboard(request):
+    from django.utils import timezone
+    from datetime import timedelta
+    
+    # Log navigation to dashboard
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='Dashboard',
+        page_url=request.path,
+        request=request
+    )
+    
+    # Get current date for display
+    current_date = timezone.now()
+    
+    if request.user.is_staff:
+        # Admin/Staff Dashboard - Show all projects and statistics
+        # Calculate statistics
+        total_projects = Project.objects.count()
+        active_projects = Project.objects.filter(status='in_progress').count()
+        completed_projects = Project.objects.filter(status='completed').count()
+        
+        # Calculate new projects this week
+        week_ago = current_date - timedelta(days=7)
+        new_projects = Project.objects.filter(created_at__gte=week_ago).count()
+        
+        # Calculate active percentage
+        active_percentage = (active_projects / total_projects * 100) if total_projects > 0 else 0
+        
+        # Task statistics
+        total_tasks = Task.objects.count()
+        completed_tasks = Task.objects.filter(status='completed').count()
+        pending_tasks = Task.objects.filter(status__in=['not_started', 'in_progress']).count()
+        
+        # Calculate completed tasks this week
+        completed_this_week = Task.objects.filter(
+            status='completed',
+            updated_at__gte=week_ago
+        ).count()
+        
+        # Calculate pending percentage
+        pending_percentage = (pending_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        
+        # Performance metrics
+        completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
+        efficiency_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        
+        # Calculate on-time delivery rate (simplified)
+        overdue_tasks = Task.objects.filter(
+            end_date__lt=current_date.date(),
+            status__in=['not_started', 'in_progress']
+        ).count()
+        on_time_rate = ((total_tasks - overdue_tasks) / total_tasks * 100) if total_tasks > 0 else 0
+        
+        # Recent activities (simplified for now)
+        recent_activities = []
+        
+        # Add recent project activities
+        recent_projects = Project.objects.order_by('-updated_at')[:5]
+        for project in recent_projects:
+            recent_activities.append({
+                'text': f'Project "{project.name}" was updated',
+                'time': project.updated_at.strftime('%b %d, %H:%M')
+            })
+        
+        # Add recent task activities
+        recent_tasks = Task.objects.order_by('-updated_at')[:5]
+        for task in recent_tasks:
+            recent_activities.append({
+                'text': f'Task "{task.title}" status changed to {task.status}',
+                'time': task.updated_at.strftime('%b %d, %H:%M')
+            })
+        
+        # Sort activities by time and take the most recent 10
+        recent_activities.sort(key=lambda x: x['time'], reverse=True)
+        recent_activities = recent_activities[:10]
+        
+        context = {
+            'current_date': current_date,
+            'total_projects': total_projects,
+            'active_projects': active_projects,
+            'new_projects': new_projects,
+            'active_percentage': round(active_percentage, 1),
+            'completed_tasks': completed_tasks,
+            'completed_this_week': completed_this_week,
+            'pending_tasks': pending_tasks,
+            'pending_percentage': round(pending_percentage, 1),
+            'completion_rate': round(completion_rate, 1),
+            'efficiency_rate': round(efficiency_rate, 1),
+            'on_time_rate': round(on_time_rate, 1),
+            'recent_activities': recent_activities,
+            'is_admin_dashboard': True,
+        }
+        
+    else:
+        # User Dashboard - Show only assigned projects and tasks
+        # Get user's assigned projects
+        assigned_projects = Project.objects.filter(assigned_users=request.user)
+        
+        # Calculate user-specific statistics
+        total_assigned_projects = assigned_projects.count()
+        active_assigned_projects = assigned_projects.filter(status='in_progress').count()
+        completed_assigned_projects = assigned_projects.filter(status='completed').count()
+        
+        # Get user's assigned tasks
+        assigned_tasks = Task.objects.filter(project__in=assigned_projects)
+        total_assigned_tasks = assigned_tasks.count()
+        completed_assigned_tasks = assigned_tasks.filter(status='completed').count()
+        pending_assigned_tasks = assigned_tasks.filter(status__in=['not_started', 'in_progress']).count()
+        
+        # Calculate completed tasks this week
+        week_ago = current_date - timedelta(days=7)
+        completed_this_week = assigned_tasks.filter(
+            status='completed',
+            updated_at__gte=week_ago
+        ).count()
+        
+        # Calculate percentages
+        active_percentage = (active_assigned_projects / total_assigned_projects * 100) if total_assigned_projects > 0 else 0
+        pending_percentage = (pending_assigned_tasks / total_assigned_tasks * 100) if total_assigned_tasks > 0 else 0
+        completion_rate = (completed_assigned_projects / total_assigned_projects * 100) if total_assigned_projects > 0 else 0
+        efficiency_rate = (completed_assigned_tasks / total_assigned_tasks * 100) if total_assigned_tasks > 0 else 0
+        
+        # Get overdue tasks
+        overdue_tasks = assigned_tasks.filter(
+            end_date__lt=current_date.date(),
+            status__in=['not_started', 'in_progress']
+        ).count()
+        on_time_rate = ((total_assigned_tasks - overdue_tasks) / total_assigned_tasks * 100) if total_assigned_tasks > 0 else 0
+        
+        # Recent activities for user's projects
+        recent_activities = []
+        
+        # Add recent project activities for assigned projects
+        recent_projects = assigned_projects.order_by('-updated_at')[:5]
+        for project in recent_projects:
+            recent_activities.append({
+                'text': f'Project "{project.name}" was updated',
+                'time': project.updated_at.strftime('%b %d, %H:%M')
+            })
+        
+        # Add recent task activities for assigned tasks
+        recent_tasks = assigned_tasks.order_by('-updated_at')[:5]
+        for task in recent_tasks:
+            recent_activities.append({
+                'text': f'Task "{task.title}" status changed to {task.status}',
+                'time': task.updated_at.strftime('%b %d, %H:%M')
+            })
+        
+        # Sort activities by time and take the most recent 10
+        recent_activities.sort(key=lambda x: x['time'], reverse=True)
+        recent_activities = recent_activities[:10]
+        
+        # Get upcoming tasks (due in next 7 days)
+        upcoming_tasks = assigned_tasks.filter(
+            end_date__gte=current_date.date(),
+            end_date__lte=current_date.date() + timedelta(days=7),
+            status__in=['not_started', 'in_progress']
+        ).order_by('end_date')[:5]
+        
+        # Get urgent tasks (tasks due soon)
+        urgent_tasks = assigned_tasks.filter(
+            end_date__lte=current_date.date() + timedelta(days=3),
+            status__in=['not_started', 'in_progress']
+        ).order_by('end_date')[:5]
+        
+        context = {
+            'current_date': current_date,
+            'total_projects': total_assigned_projects,
+            'active_projects': active_assigned_projects,
+            'new_projects': 0,  # Not relevant for user dashboard
+            'active_percentage': round(active_percentage, 1),
+            'completed_tasks': completed_assigned_tasks,
+            'completed_this_week': completed_this_week,
+            'pending_tasks': pending_assigned_tasks,
+            'pending_percentage': round(pending_percentage, 1),
+            'completion_rate': round(completion_rate, 1),
+            'efficiency_rate': round(efficiency_rate, 1),
+            'on_time_rate': round(on_time_rate, 1),
+            'recent_activities': recent_activities,
+            'upcoming_tasks': upcoming_tasks,
+            'urgent_tasks': urgent_tasks,
+            'assigned_projects': assigned_projects.order_by('-updated_at')[:5],
+            'is_admin_dashboard': False,
+        }
+    
+    return render(request, 'home/dashboard.html', context)
+
+@login_required
+def analytics(request):
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('login')
+    
+    # Get real data from database
+    from datetime import timedelta
+    from django.utils import timezone
+    
+    # Current date and previous month for comparison
+    current_date = timezone.now()
+    previous_month = current_date - timedelta(days=30)
+    
+    # Project statistics
+    total_projects = Project.objects.count()
+    active_projects = Project.objects.filter(status='in_progress').count()
+    completed_projects = Project.objects.filter(status='completed').count()
+    planned_projects = Project.objects.filter(status='planned').count()
+    
+    # Task statistics
+    total_tasks = Task.objects.count()
+    completed_tasks = Task.objects.filter(status='completed').count()
+    in_progress_tasks = Task.objects.filter(status='in_progress').count()
+    not_started_tasks = Task.objects.filter(status='not_started').count()
+    on_hold_tasks = Task.objects.filter(status='on_hold').count()
+    
+    # Task priority statistics
+    low_priority_tasks = Task.objects.filter(priority='low').count()
+    medium_priority_tasks = Task.objects.filter(priority='medium').count()
+    high_priority_tasks = Task.objects.filter(priority='high').count()
+    urgent_priority_tasks = Task.objects.filter(priority='urgent').count()
+    
+    # SubTask priority statistics
+    low_priority_subtasks = SubTask.objects.filter(priority='low').count()
+    medium_priority_subtasks = SubTask.objects.filter(priority='medium').count()
+    high_priority_subtasks = SubTask.objects.filter(priority='high').count()
+    urgent_priority_subtasks = SubTask.objects.filter(priority='urgent').count()
+    
+    # User statistics
+    total_users = User.objects.count()
+    active_users = User.objects.filter(is_active=True).count()
+    
+    # Client statistics
+    total_clients = Client.objects.count()
+    active_clients = Client.objects.filter(is_active=True).count()
+    
+    # Calculate completion rates
+    project_completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
+    task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    
+    # Calculate trends (compare with previous month)
+    previous_month_projects = Project.objects.filter(
+        created_at__gte=previous_month,
+        created_at__lt=current_date
+    ).count()
+    
+    current_month_projects = Project.objects.filter(
+        created_at__gte=current_date.replace(day=1)
+    ).count()
+    
+    project_trend = ((current_month_projects - previous_month_projects) / previous_month_projects * 100) if previous_month_projects > 0 else 0
+    project_trend_abs = abs(project_trend)
+    
+    # Monthly data for charts (last 6 months)
+    monthly_data = []
+    for i in range(6):
+        month_start = current_date - timedelta(days=30 * (i + 1))
+        month_end = current_date - timedelta(days=30 * i)
+        
+        projects_created = Project.objects.filter(
+            created_at__gte=month_start,
+            created_at__lt=month_end
+        ).count()
+        
+        tasks_created = Task.objects.filter(
+            created_at__gte=month_start,
+            created_at__lt=month_end
+        ).count()
+        
+        monthly_data.append({
+            'month': month_start.strftime('%b'),
+            'projects': projects_created,
+            'tasks': tasks_created
+        })
+    
+    # Reverse to show oldest to newest
+    monthly_data.reverse()
+    
+    # Project status data for pie chart
+    project_status_data = {
+        'planned': planned_projects,
+        'in_progress': active_projects,
+        'completed': completed_projects
+    }
+    
+    # Task status data for bar chart
+    task_status_data = {
+        'not_started': not_started_tasks,
+        'in_progress': in_progress_tasks,
+        'on_hold': on_hold_tasks,
+        'completed': completed_tasks
+    }
+    
+    # Task priority data for pie chart
+    task_priority_data = {
+        'low': low_priority_tasks,
+        'medium': medium_priority_tasks,
+        'high': high_priority_tasks,
+        'urgent': urgent_priority_tasks
+    }
+    
+    # SubTask priority data for pie chart
+    subtask_priority_data = {
+        'low': low_priority_subtasks,
+        'medium': medium_priority_subtasks,
+        'high': high_priority_subtasks,
+        'urgent': urgent_priority_subtasks
+    }
+    
+
+    
+    # Client project distribution
+    client_project_data = []
+    active_clients = list(Client.objects.filter(is_active=True).only('id', 'username'))
+    project_ids_by_client = client_project_ids_many(client.id for client in active_clients)
+    linked_ids = {project_id for ids in project_ids_by_client.values() for project_id in ids}
+    project_statuses = dict(Project.objects.filter(id__in=linked_ids).values_list('id', 'status'))
+    for client in active_clients:
+        statuses = [project_statuses[project_id] for project_id in project_ids_by_client[client.id] if project_id in project_statuses]
+        if statuses:
+            client_project_data.append({
+                'client': client.username,
+                'projects': len(statuses),
+                'completed': statuses.count('completed'),
+                'in_progress': statuses.count('in_progress')
+            })
+    
+    # Top performing projects
+    top_projects = []
+    for project in Project.objects.all():
+        project_tasks = project.tasks.all()
+        if project_tasks.exists():
+            completion_rate = (project_tasks.filter(status='completed').count() / project_tasks.count()) * 100
+            top_projects.append({
+                'name': project.name,
+                'completion_rate': round(completion_rate, 1),
+                'total_tasks': project_tasks.count(),
+                'completed_tasks': project_tasks.filter(status='completed').count()
+            })
+    
+    # Sort by completion rate and take top 5
+    top_projects.sort(key=lambda x: x['completion_rate'], reverse=True)
+    top_projects = top_projects[:5]
+    
+    # Recent activity (last 7 days)
+    recent_activity = []
+    
+    # Recent projects
+    recent_projects = Project.objects.filter(
+        updated_at__gte=current_date - timedelta(days=7)
+    ).order_by('-updated_at')[:5]
+    
+    for project in recent_projects:
+        recent_activity.append({
+            'type': 'project',
+            'title': f'Project "{project.name}" updated',
+            'time': project.updated_at.strftime('%b %d, %H:%M'),
+            'status': project.status
+        })
+    
+    # Recent tasks
+    recent_tasks = Task.objects.filter(
+        updated_at__gte=current_date - timedelta(days=7)
+    ).order_by('-updated_at')[:5]
+    
+    for task in recent_tasks:
+        recent_activity.append({
+            'type': 'task',
+            'title': f'Task "{task.title}" status: {task.status}',
+            'time': task.updated_at.strftime('%b %d, %H:%M'),
+            'status': task.status
+        })
+    
+    # Sort by time and take most recent 8
+    recent_activity.sort(key=lambda x: x['time'], reverse=True)
+    recent_activity = recent_activity[:8]
+    
+    # Performance metrics for radar chart
+    performance_metrics = {
+        'project_completion': round(project_completion_rate, 1),
+        'task_completion': round(task_completion_rate, 1),
+        'user_activity': round((active_users / total_users * 100) if total_users > 0 else 0, 1),
+        'client_engagement': round((active_clients / total_clients * 100) if total_clients > 0 else 0, 1),
+        'system_health': 85  # Placeholder - could be calculated based on various metrics
+    }
+    
+    context = {
+        'total_projects': total_projects,
+        'active_projects': active_projects,
+        'completed_projects': completed_projects,
+        'planned_projects': planned_projects,
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'not_started_tasks': not_started_tasks,
+        'on_hold_tasks': on_hold_tasks,
+        'low_priority_tasks': low_priority_tasks,
+        'medium_priority_tasks': medium_priority_tasks,
+        'high_priority_tasks': high_priority_tasks,
+        'urgent_priority_tasks': urgent_priority_tasks,
+        'low_priority_subtasks': low_priority_subtasks,
+        'medium_priority_subtasks': medium_priority_subtasks,
+        'high_priority_subtasks': high_priority_subtasks,
+        'urgent_priority_subtasks': urgent_priority_subtasks,
+        'total_users': total_users,
+        'active_users': active_users,
+        'total_clients': total_clients,
+        'active_clients': active_clients,
+        'project_completion_rate': round(project_completion_rate, 1),
+        'task_completion_rate': round(task_completion_rate, 1),
+        'project_trend': round(project_trend, 1),
+        'project_trend_abs': round(project_trend_abs, 1),
+        'monthly_data': monthly_data,
+        'project_status_data': project_status_data,
+        'task_status_data': task_status_data,
+        'task_priority_data': task_priority_data,
+        'subtask_priority_data': subtask_priority_data,
+
+        'client_project_data': client_project_data,
+        'top_projects': top_projects,
+        'recent_activity': recent_activity,
+        'performance_metrics': performance_metrics,
+    }
+    
+    return render(request, 'home/analytics.html', context)
+
+@login_required
+def add_project(request):
+    # Check if user has permission to create projects
+    try:
+        profile = request.user.profile
+        if not profile.can_create_projects and not request.user.is_staff:
+            messages.error(request, 'Access denied. You do not have permission to create projects.')
+            return redirect('projects_page')
+    except UserProfile.DoesNotExist:
+        if not request.user.is_staff:
+            messages.error(request, 'Access denied. Only administrators can create projects.')
+            return redirect('projects_page')
+    
+    if request.method == 'POST':
+        name = request.POST.get('name')
+        client = request.POST.get('client')
+        client_username = request.POST.get('client_username', '')
+        client_email = request.POST.get('client_email')
+        status = request.POST.get('status', 'planned')
+        assigned_user_ids = request.POST.getlist('assigned_users')
+        is_existing_client = request.POST.get('is_existing_client') == 'true'
+        
+        if name and client and client_email:
+            try:
+                # Project dates will be calculated automatically from task dates
+                
+                # Handle existing client selection
+                existing_client_id = request.POST.get('existing_client_id')
+                existing_client = None
+                
+                if is_existing_client and existing_client_id:
+                    # User selected an existing client from dropdown
+                    try:
+                        existing_client = Client.objects.get(id=existing_client_id)
+                        client_username = existing_client.username
+                        client_email = existing_client.email
+                        client = existing_client.username  # Use username as client name
+                        messages.info(request, f'Using existing client: {existing_client.username}')
+                    except Client.DoesNotExist:
+                        messages.error(request, 'Selected client not found. Please try again.')
+                        return redirect('projects_page')
+                elif is_existing_client and not existing_client_id:
+                    # User marked as existing but didn't select a client
+                    messages.error(request, 'Please select an existing client from the dropdown.')
+                    return redirect('projects_page')
+                else:
+                    # New client - check if email already exists
+                    try:
+                        existing_client = Client.objects.get(email=client_email)
+                        messages.error(request, f'Client with email {client_email} already exists. Please select "Existing Client" or use a different email.')
+                        return redirect('projects_page')
+                    except Client.DoesNotExist:
+                        # New client - will need OTP
+                        if not client_username:
+                            # Generate username from email if not provided
+                            base_username = client_email.split('@')[0]
+                            # Check if username already exists and make it unique
+                            counter = 1
+                            client_username = base_username
+                            while Client.objects.filter(username=client_username).exists():
+                                client_username = f"{base_username}{counter}"
+                                counter += 1
+                        
+                        # Create new client
+                        try:
+                            new_client = Client.objects.create(
+                                username=client_username,
+                                email=client_email,
+                                is_active=True
+                            )
+                        except Exception as e:
+                            messages.error(request, f'Error creating client: {str(e)}')
+                            return redirect('projects_page')
+                        
+                        # Generate and send OTP for new client
+                        otp = new_client.generate_otp()
+                        
+                        # Send OTP email using SimpleEmailService with Microsoft SMTP
+                        site_url = request.build_absolute_uri('/').rstrip('/')
+                        from ..email_service import SimpleEmailService
+                        email_service = SimpleEmailService()
+                        email_result = email_service.send_email(
+                            to_email=client_email,
+                            subject=f"Set Your Password - {name} Project",
+                            body=f"""<html>
+<body style="font-family: Arial, sans-serif;">
+    <p>Dear {client_username},</p>
+
+    <p>Welcome to the {name} project. Please use the One-Time Password (OTP) below to set your password:</p>
+
+    <p><strong>OTP: {otp}</strong></p>
+
+    <p>You can set your password here: {site_url}/client/setup-password/?username={client_username}</p>
+
+    <p>This OTP is valid for 24 hours.</p>
+
+    <p>Best regards,<br>E-Click Project Management Team</p>
+</body>
+</html>""",
+                            from_email=None  # Will use default from settings
+                        )
+                        
+                        if email_result['success']:
+                            messages.success(request, f'Project "{name}" created successfully! OTP email sent to {client_email}')
+                        else:
+                            messages.warning(request, f'Project "{name}" created successfully! OTP email failed: {email_result.get("error", "Unknown error")}')
+                
+                # Create project (dates will be calculated from tasks)
+                try:
+                    project = Project.objects.create(
+                        name=name,
+                        client=client,
+                        client_username=client_username,
+                        client_email=client_email,
+                        status=status
+                    )
+                except Exception as e:
+                    messages.error(request, f'Error creating project: {str(e)}')
+                    return redirect('projects_page')
+                
+                # Log project creation
+                SystemLog.log_project_created(request.user, project, request)
+                
+                # Create tasks from the form data
+                task_counter = 1
+                tasks_created = 0
+                earliest_start = None
+                latest_end = None
+                
+                while f'task_title_{task_counter}' in request.POST:
+                    task_title = request.POST.get(f'task_title_{task_counter}')
+                    task_start = request.POST.get(f'task_start_{task_counter}')
+                    task_end = request.POST.get(f'task_end_{task_counter}')
+                    task_status = request.POST.get(f'task_status_{task_counter}')
+                    task_description = request.POST.get(f'task_description_{task_counter}', '')
+                    
+                    if task_title and task_start and task_end:
+                        # Parse task dates
+                        task_start_date = datetime.strptime(task_start, '%Y-%m-%d').date()
+                        task_end_date = datetime.strptime(task_end, '%Y-%m-%d').date()
+                        
+                        # Get development status for this task
+                        task_development_status = request.POST.get(f'task_development_status_{task_counter}', 'original_quoted')
+                        
+                        # Get priority for this task
+                        task_priority = request.POST.get(f'task_priority_{task_counter}', 'medium')
+                        
+                        # Create task
+                        try:
+                            task = Task.objects.create(
+                                project=project,
+                                title=task_title,
+                                description=task_description,
+                                status=task_status,
+                                development_status=task_development_status,
+                                priority=task_priority,
+                                start_date=task_start_date,
+                                end_date=task_end_date
+                            )
+                        except Exception as e:
+                            messages.error(request, f'Error creating task "{task_title}": {str(e)}')
+                            return redirect('projects_page')
+                        
+                        # Handle estimated hours if provided
+                        estimated_hours = request.POST.get(f'task_estimated_hours_{task_counter}')
+                        if estimated_hours and estimated_hours.strip():
+                            try:
+                                task.estimated_hours = float(estimated_hours)
+                                task.save()
+                            except ValueError:
+                                pass  # Skip if invalid number
+                        
+                        # Handle task assignees if provided
+                        task_assignee_ids = request.POST.getlist(f'task_assigned_to_{task_counter}')
+                        if task_assignee_ids and task_assignee_ids[0]:  # Check if not empty
+                            assignees = User.objects.filter(id__in=task_assignee_ids)
+                            task.assigned_users.set(assignees)
+                        
+                        tasks_created += 1
+                        
+                        # Track earliest start and latest end dates
+                        if not earliest_start or task_start_date < earliest_start:
+                            earliest_start = task_start_date
+                        if not latest_end or task_end_date > latest_end:
+                            latest_end = task_end_date
+                        
+                        # Create subtasks for this task
+                        subtask_counter = 1
+                        while f'subtask_title_{task_counter}_{subtask_counter}' in request.POST:
+                            subtask_title = request.POST.get(f'subtask_title_{task_counter}_{subtask_counter}')
+                            subtask_description = request.POST.get(f'subtask_description_{task_counter}_{subtask_counter}', '')
+                            subtask_status = request.POST.get(f'subtask_status_{task_counter}_{subtask_counter}', 'not_started')
+                            
+                            if subtask_title:
+                                # Parse subtask dates if provided
+                                subtask_start_date = None
+                                subtask_end_date = None
+                                
+                                subtask_start = request.POST.get(f'subtask_start_{task_counter}_{subtask_counter}')
+                                subtask_end = request.POST.get(f'subtask_end_{task_counter}_{subtask_counter}')
+                                
+                                if subtask_start:
+                                    try:
+                                        subtask_start_date = datetime.strptime(subtask_start, '%Y-%m-%d').date()
+                                    except ValueError:
+                                        pass
+                                
+                                if subtask_end:
+                                    try:
+                                        subtask_end_date = datetime.strptime(subtask_end, '%Y-%m-%d').date()
+                                    except ValueError:
+                                        pass
+                                
+                                # Get priority for this subtask
+                                subtask_priority = request.POST.get(f'subtask_priority_{task_counter}_{subtask_counter}', 'medium')
+                                
+                                try:
+                                    SubTask.objects.create(
+                                        task=task,
+                                        title=subtask_title,
+                                        description=subtask_description,
+                                        status=subtask_status,
+                                        priority=subtask_priority,
+                                        start_date=subtask_start_date,
+                                        end_date=subtask_end_date
+                                    )
+                                except Exception as e:
+                                    messages.error(request, f'Error creating subtask "{subtask_title}": {str(e)}')
+                                    return redirect('projects_page')
+                            
+                            subtask_counter += 1
+                    
+                    task_counter += 1
+                
+                # Project dates are automatically calculated from task dates
+                # No need to set them manually - they are read-only properties
+                
+                if tasks_created > 0:
+                    if not existing_client or not is_existing_client:
+                        messages.success(request, f'Project "{name}" created successfully with {tasks_created} tasks!')
+                    else:
+                        messages.success(request, f'Project "{name}" created successfully with {tasks_created} tasks for existing client!')
+                else:
+                    if not existing_client or not is_existing_client:
+                        messages.success(request, f'Project "{name}" created successfully!')
+                    else:
+                        messages.success(request, f'Project "{name}" created successfully for existing client!')
+                
+                # Assign users if selected
+                if assigned_user_ids:
+                    users = User.objects.filter(id__in=assigned_user_ids)
+                    project.assigned_users.set(users)
+                
+                return redirect('projects_page')
+                
+            except Exception as e:
+                messages.error(request, f'Error creating project: {str(e)}')
+        else:
+            messages.error(request, 'Please fill in all required fields.')
+    
+    # If not POST or validation failed, redirect to projects page
+    return redirect('projects_page')
+@login_required
+def edit_project(request, project_id):
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    project = get_object_or_404(Project, id=project_id)
+    
+    if request.method == 'POST':
+        try:
+            # Store old data for logging
+            old_data = {
+                'name': project.name,
+                'client': project.client,
+                'client_username': project.client_username,
+                'client_email': project.client_email,
+                'status': project.status,
+                'assigned_users': [user.username for user in project.assigned_users.all()]
+            }
+            
+            project.name = request.POST.get('name')
+            project.client = request.POST.get('client')
+            project.client_username = request.POST.get('client_username', '')
+            project.client_email = request.POST.get('client_email')
+            project.status = request.POST.get('status')
+
+            # Also update the Client model email if the client exists
+            # This ensures the email is synced between Project and Client models
+            if project.client_username:
+                try:
+                    client_obj = Client.objects.get(username=project.client_username)
+                    if client_obj.email != project.client_email:
+                        old_email = client_obj.email
+                        client_obj.email = project.client_email
+                        client_obj.save()
+                        logger.info(f"Synced client email from {old_email} to {project.client_email} for {project.client_username}")
+                except Client.DoesNotExist:
+                    logger.warning(f"Client with username {project.client_username} not found in Client model")
+
+            # Project dates are automatically calculated from task dates
+            # No manual editing allowed
+
+            project.save()
+            
+            # Update assigned users
+            assigned_user_ids = request.POST.getlist('assigned_users')
+            if assigned_user_ids:
+                assigned_users = User.objects.filter(id__in=assigned_user_ids)
+                project.assigned_users.set(assigned_users)
+            else:
+                project.assigned_users.clear()
+
+            # Update assigned clients/investors
+            assigned_client_ids = request.POST.getlist('assigned_clients')
+            if assigned_client_ids:
+                assigned_clients = Client.objects.filter(id__in=assigned_client_ids)
+                project.clients.set(assigned_clients)
+            else:
+                project.clients.clear()
+
+            # Store new data for logging
+            new_data = {
+                'name': project.name,
+                'client': project.client,
+                'client_username': project.client_username,
+                'client_email': project.client_email,
+                'status': project.status,
+                'assigned_users': [user.username for user in project.assigned_users.all()]
+            }
+            
+            # Log project editing
+            SystemLog.log_project_edited(request.user, project, old_data, new_data, request)
+            
+            # Log project assignment changes if users were changed
+            if old_data['assigned_users'] != new_data['assigned_users']:
+                SystemLog.log_project_assigned(request.user, project, project.assigned_users.all(), request)
+            
+            # Log project status change if status was changed
+            if old_data['status'] != new_data['status']:
+                SystemLog.log_project_status_change(request.user, project, old_data['status'], new_data['status'], request)
+            
+            messages.success(request, f'Project {project.name} updated successfully.')
+            return redirect('projects_page')
+        except Exception as e:
+            messages.error(request, f'Error updating project: {str(e)}')
+    
+    # Get all users for assignment dropdown
+    all_users = User.objects.all().order_by('username')
+
+    # Get all clients for assignment dropdown
+    all_clients = Client.objects.filter(is_active=True).order_by('username')
+
+    return render(request, 'home/edit_project.html', {
+        'project': project,
+        'all_users': all_users,
+        'all_clients': all_clients
+    })
+
+@login_required
+def delete_project(request, project_id):
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    if request.method == 'POST':
+        project = get_object_or_404(Project, id=project_id)
+        try:
+            # Store project info for logging before deletion
+            project_name = project.name
+            client_email = project.client_email
+            client_username = project.client_username
+            
+            # Log project deletion
+            client_name = project.client if project.client else 'No Client'
+            SystemLog.log_project_deleted(request.user, project_name, client_name, request)
+            
+            # Delete the project first
+            project.delete()
+            
+            # Check if we should clean up client records
+            if client_email:
+                # Check if this client is still linked to any other project
+                remaining_client = Client.objects.filter(email=client_email).first()
+                
+                if remaining_client and not client_project_ids(remaining_client):
+                    # No other projects use this client, so we can safely delete client records
+                    try:
+                        # Delete related client OTPs
+                        from ..models import ClientOTP
+                        ClientOTP.objects.filter(client=remaining_client).delete()
+                        
+                        # Delete the client
+                        remaining_client.delete()
+                        
+                        print(f"Cleaned up client records for email: {client_email}")
+                    except Exception as client_cleanup_error:
+                        print(f"Warning: Could not clean up client records: {client_cleanup_error}")
+            
+            messages.success(request, f'Project {project_name} and all related data deleted successfully.')
+        except Exception as e:
+            messages.error(request, f'Error deleting project: {str(e)}')
+    
+    return redirect('projects_page')
+
+@login_required
+def complete_task(request, project_id, task_id):
+    """Allow users to mark tasks as completed"""
+    project = get_object_or_404(Project, id=project_id)
+    task = get_object_or_404(Task, id=task_id, project=project)
+    
+    # Check if user is assigned to this project
+    if request.user not in project.assigned_users.all():
+        messages.error(request, 'You are not assigned to this project.')
+        return redirect('project_tasks', project_id=project_id)
+    
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        old_status = task.status
+        
+        if action == 'complete':
+            task.status = 'completed'
+            messages.success(request, f'Task "{task.title}" marked as completed!')
+        elif action == 'in_progress':
+            task.status = 'in_progress'
+            messages.info(request, f'Task "{task.title}" marked as in progress.')
+        elif action == 'not_started':
+            task.status = 'not_started'
+            messages.info(request, f'Task "{task.title}" marked as not started.')
+        
+        task.save()
+        
+        # Log the task status change
+        SystemLog.log_task_status_change(request.user, task, old_status, task.status, request)
+        
+        # Send system-wide notification to all admins
+        Notification.create_if_not_exists(
+            recipient=None,  # System-wide notification
+            notification_type='task_update',
+            title=f'Task Status Updated',
+            message=f"{request.user.get_full_name() or request.user.username} changed task '{task.title}' status from {old_status} to {task.status} in project '{project.name}'",
+            related_project=project,
+            related_task=task,
+            triggered_by=request.user,
+            is_admin_notification=True
+        )
+    
+    return redirect('project_tasks', project_id=project_id)
+
+@login_required
+def settings(request):
+    
+    # Get or create user profile
+    profile, created = UserProfile.objects.get_or_create(user=request.user)
+    
+    if request.method == 'POST':
+        # Handle profile picture upload
+        if 'profile_picture' in request.FILES:
+            profile.profile_picture = request.FILES['profile_picture']
+        
+        # Update user information
+        user = request.user
+        user.first_name = request.POST.get('first_name', user.first_name)
+        user.last_name = request.POST.get('last_name', user.last_name)
+        user.email = request.POST.get('email', user.email)
+        user.save()
+        
+        # Update profile information
+        profile.bio = request.POST.get('bio', profile.bio)
+        profile.phone = request.POST.get('phone', profile.phone)
+        profile.save()
+        
+        messages.success(request, 'Profile updated successfully!')
+        return redirect('settings')
+    
+    context = {
+        'profile': profile,
+        'user': request.user,
+    }
+    return render(request, 'home/settings.html', context)
+
+PROJECTS_PAGE_SIZE = 24
+PROJECT_SORT_KEYS = {
+    'newest': ('-created_at', '-id'),
+    'oldest': ('created_at', 'id'),
+    'name': ('name', 'id'),
+    'status': ('status', '-created_at'),
+    'deadline': ('end_date', 'id'),
+}
+LOOKUP_LIMIT = 20
+
+
+def _project_listing(request):
+    """
+    Filtered, sorted and annotated project queryset for the projects page and API.
+
+    Visibility and the client filter use subqueries instead of joins so the task
+    rollups never need DISTINCT. Returns (queryset, filters dict).
+    """
+    filters = {
+        'q': request.GET.get('q', '').strip(),
+        'status': request.GET.get('status', ''),
+        'client': request.GET.get('client', ''),
+        'sort': request.GET.get('sort', 'newest'),
+    }
+    if filters['sort'] not in PROJECT_SORT_KEYS:
+        filters['sort'] = 'newest'
+
+    projects = Project.objects.all()
+    if not request.user.is_staff:
+        projects = projects.filter(
+            id__in=Project.assigned_users.through.objects.filter(user_id=request.user.id).values('project_id')
+        )
+    if filters['q']:
+        projects = projects.filter(
+            Q(name__icontains=filters['q']) |
+            Q(client__icontains=filters['q']) |
+            Q(client_email__icontains=filters['q'])
+        )
+    if filters['status'] in dict(Project.STATUS_CHOICES):
+        projects = projects.filter(status=filters['status'])
+    else:
+        filters['status'] = ''
+    if filters['client'].isdigit():
+        # Linked through Project.clients, client_username or client_email (home.client_links)
+        projects = projects.filter(id__in=client_project_ids(int(filters['client'])))
+    else:
+        filters['client'] = ''
+
+    projects = projects.annotate(
+        task_count=Count('tasks'),
+        completed_task_count=Count('tasks', filter=Q(tasks__status='completed')),
+    ).prefetch_related(
+        Prefetch('assigned_users', queryset=User.objects.only('id', 'username', 'first_name', 'last_name')),
+        Prefetch('clients', queryset=Client.objects.only('id', 'username')),
+    ).order_by(*PROJECT_SORT_KEYS[filters['sort']])
+    return projects, filters
+
+
+@login_required
+def projects_page(request):
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='Projects Page',
+        page_url=request.path,
+        request=request
+    )
+    try:
+        profile = request.user.profile
+        can_create_projects = profile.can_create_projects or request.user.is_staff
+        can_edit_projects = profile.can_edit_projects or request.user.is_staff
+        can_delete_projects = profile.can_delete_projects or request.user.is_staff
+    except UserProfile.DoesNotExist:
+        can_create_projects = request.user.is_staff
+        can_edit_projects = request.user.is_staff
+        can_delete_projects = request.user.is_staff
+
+    # Users and clients for the dropdowns are loaded on demand from the lookup endpoints
+    projects, filters = _project_listing(request)
+    page = Paginator(projects, PROJECTS_PAGE_SIZE).get_page(request.GET.get('page'))
+    selected_client = Client.objects.filter(id=filters['client']).only('id', 'username').first() if filters['client'] else None
+
+    return render(request, 'home/projects_page.html', {
+        'projects': page,
+        'filters': filters,
+        'filter_query': urlencode({key: value for key, value in filters.items() if value and not (key == 'sort' and value == 'newest')}),
+        'has_filters': bool(filters['q'] or filters['status'] or filters['client']),
+        'selected_client': selected_client,
+        'status_choices': Project.STATUS_CHOICES,
+        'can_create_projects': can_create_projects,
+        'can_edit_projects': can_edit_projects,
+        'can_delete_projects': can_delete_projects,
+    })
+
+@login_required
+def projects_api(request):
+    """Paginated JSON project listing with the same filters as the projects page"""
+    projects, filters = _project_listing(request)
+    try:
+        page_size = min(max(int(request.GET.get('page_size', PROJECTS_PAGE_SIZE)), 1), 100)
+    except ValueError:
+        page_size = PROJECTS_PAGE_SIZE
+    page = Paginator(projects, page_size).get_page(request.GET.get('page'))
+
+    return JsonResponse({
+        'projects': [
+            {
+                'id': project.id,
+                'name': project.name,
+                'client': project.client,
+                'client_email': project.client_email,
+                'status': project.status,
+                'status_display': project.get_status_display(),
+                'start_date': project.start_date.isoformat() if project.start_date else None,
+                'end_date': project.end_date.isoformat() if project.end_date else None,
+                'created_at': project.created_at.isoformat(),
+                'task_count': project.task_count,
+                'completed_task_count': project.completed_task_count,
+                'completion_rate': round(project.completed_task_count / project.task_count * 100, 1) if project.task_count else 0,
+                'assigned_users': [
+                    {'id': user.id, 'name': user.get_full_name() or user.username}
+                    for user in project.assigned_users.all()
+                ],
+                'clients': [
+                    {'id': client.id, 'username': client.username}
+                    for client in project.clients.all()
+                ],
+            }
+            for project in page
+        ],
+        'filters': filters,
+        'page': page.number,
+        'num_pages': page.paginator.num_pages,
+        'count': page.paginator.count,
+        'has_next': page.has_next(),
+    })
+
+def _lookup_limit(request):
+    try:
+        return min(max(int(request.GET.get('limit', LOOKUP_LIMIT)), 1), 100)
+    except ValueError:
+        return LOOKUP_LIMIT
+
+@login_required
+def lookup_users(request):
+    """Users matching ?q= for the assignment dropdowns (staff see everyone, others only themselves)"""
+    query = request.GET.get('q', '').strip()
+    users = User.objects.all() if request.user.is_staff else User.objects.filter(id=request.user.id)
+    if query:
+        users = users.filter(
+            Q(username__icontains=query) | Q(first_name__icontains=query) |
+            Q(last_name__icontains=query) | Q(email__icontains=query)
+        )
+    users = users.order_by('username').only('id', 'username', 'first_name', 'last_name', 'email', 'is_staff')[:_lookup_limit(request)]
+    return JsonResponse({
+        'results': [
+            {
+                'id': user.id,
+                'username': user.username,
+                'name': user.get_full_name() or user.username,
+                'email': user.email,
+                'is_staff': user.is_staff,
+            }
+            for user in users
+        ]
+    })
+
+@login_required
+def lookup_clients(request):
+    """Active clients matching ?q= for the client dropdowns"""
+    query = request.GET.get('q', '').strip()
+    clients = Client.objects.filter(is_active=True)
+    if query:
+        clients = clients.filter(Q(username__icontains=query) | Q(email__icontains=query))
+    clients = clients.order_by('username').only('id', 'username', 'email')[:_lookup_limit(request)]
+    return JsonResponse({
+        'results': [
+            {'id': client.id, 'username': client.username, 'email': client.email}
+            for client in clients
+        ]
+    })
+
+def _project_users_version(request, project_id):
+    # Assignment changes bump the project data version
+    return (project_id, get_data_version()) if request.user.is_staff else None
+
+@login_required
+@versioned_json(_project_users_version)
+def get_project_users(request, project_id):
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    try:
+        project = Project.objects.get(id=project_id)
+        assigned_users = list(project.assigned_users.values_list('id', flat=True))
+        return JsonResponse({'assigned_users': assigned_users})
+    except Project.DoesNotExist:
+        return JsonResponse({'error': 'Project not found'}, status=404)
+
+@login_required
+def assign_users_to_project(request, project_id):
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('projects_page')
+    try:
+        project = Project.objects.get(id=project_id)
+        if request.method == 'POST':
+            assigned_user_ids = request.POST.getlist('assigned_users')
+            project.assigned_users.clear()
+            if assigned_user_ids:
+                users = User.objects.filter(id__in=assigned_user_ids)
+                project.assigned_users.add(*users)
+                SystemLog.log_project_assigned(request.user, project, users, request)
+                messages.success(request, f'Successfully assigned {users.count()} user(s) to project "{project.name}"')
+            else:
+                messages.info(request, f'No users assigned to project "{project.name}"')
+        return redirect('projects_page')
+    except Project.DoesNotExist:
+        messages.error(request, 'Project not found.')
+        return redirect('projects_page')
+    except Exception as e:
+        messages.error(request, f'Error assigning users: {str(e)}')
+        return redirect('projects_page')
+
+@login_required
+def project_details(request, project_id):
+    project = get_object_or_404(Project, id=project_id)
+    
+    # Check if user is assigned to this project or is staff
+    if not request.user.is_staff and request.user not in project.assigned_users.all():
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    return JsonResponse({
+        'id': project.id,
+        'name': project.name,
+        'client': project.client,
+        'client_email': project.client_email,
+        'duration': "Not set",  # Duration calculation removed due to computed properties
+        'status': project.status,
+        'status_display': project.get_status_display(),
+        'created_at': project.created_at.isoformat(),
+        'updated_at': project.updated_at.isoformat(),
+    })
+
+@login_required
+def project_tasks(request, project_id):
+    project = get_object_or_404(Project, id=project_id)
+    
+    # Check if user is assigned to this project or is staff
+    if not request.user.is_staff and request.user not in project.assigned_users.all():
+        messages.error(request, 'You are not assigned to this project.')
+        return redirect('projects_page')
+    
+    tasks = project.tasks.all().order_by('start_date')
+    
+    # Calculate project progress
+    total_tasks = tasks.count()
+    completed_tasks = tasks.filter(status='completed').count()
+    progress_percentage = 0
+    if total_tasks > 0:
+        progress_percentage = (completed_tasks / total_tasks) * 100
+    
+    context = {
+        'project': project,
+        'tasks': tasks,
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'progress_percentage': progress_percentage,
+        'is_assigned_user': request.user in project.assigned_users.all(),
+        'is_staff': request.user.is_staff,
+    }
+    
+    return render(request, 'home/project_tasks.html', context)
+
+@login_required
+def add_task(request):
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    if request.method == 'POST':
+        try:
+            project_id = request.POST.get('project_id')
+            project = get_object_or_404(Project, id=project_id)
+            
+            # Get assigned users if specified
+            assigned_user_ids = request.POST.getlist('assigned_users')
+            
+            # Get dates
+            start_date = request.POST.get('start_date')
+            end_date = request.POST.get('end_date')
+            
+            # Convert empty strings to None for dates
+            if start_date == '':
+                start_date = None
+            if end_date == '':
+                end_date = None
+            
+            task = Task.objects.create(
+                project=project,
+                title=request.POST.get('title'),
+                description=request.POST.get('description', ''),
+                status=request.POST.get('status', 'not_started'),
+                priority=request.POST.get('priority', 'medium'),
+                development_status=request.POST.get('development_status', 'original_quoted'),
+                start_date=start_date,
+                end_date=end_date
+            )
+            
+            # Add assigned users after creating the task
+            if assigned_user_ids:
+                users = User.objects.filter(id__in=assigned_user_ids)
+                task.assigned_users.add(*users)
+            
+            return JsonResponse({'success': True, 'task_id': task.id})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+@login_required
+def add_subtask(request):
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    if request.method == 'POST':
+        try:
+            task_id = request.POST.get('task_id')
+            task = get_object_or_404(Task, id=task_id)
+            
+            subtask = SubTask.objects.create(
+                task=task,
+                title=request.POST.get('title'),
+                description=request.POST.get('description', ''),
+                status=request.POST.get('status', 'not_started')
+            )
+            
+            # Handle dates
+            start_date = request.POST.get('start_date')
+            end_date = request.POST.get('end_date')
+            if start_date:
+                subtask.start_date = start_date
+            if end_date:
+                subtask.end_date = end_date
+            subtask.save()
+            
+            return JsonResponse({'success': True, 'subtask_id': subtask.id})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+@login_required
+def toggle_subtask(request):
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            subtask_id = data.get('subtask_id')
+            is_completed = data.get('is_completed')
+            
+            subtask = get_object_or_404(SubTask, id=subtask_id)
+            subtask.is_completed = is_completed
+            # Sync status field with is_completed field to prevent inconsistency
+            if is_completed:
+                subtask.status = 'completed'
+            else:
+                # If uncompleting, set to in_progress (or could use previous status if tracked)
+                subtask.status = 'in_progress'
+            subtask.save()
+            
+            return JsonResponse({'success': True})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+@login_required
+def delete_task(request):
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            task_id = data.get('task_id')
+            
+            task = get_object_or_404(Task, id=task_id)
+            task.delete()
+            
+            return JsonResponse({'success': True})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+@login_required
+def delete_subtask(request):
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    if request.method == 'POST':
+        try:
+            data = json.loads(request.body)
+            subtask_id = data.get('subtask_id')
+            
+            subtask = get_object_or_404(SubTask, id=subtask_id)
+            subtask.delete()
+            
+            return JsonResponse({'success': True})
+        except Exception as e:
+            return JsonResponse({'success': False, 'error': str(e)})
+    
+    return JsonResponse({'success': False, 'error': 'Invalid request method'})
+
+def _dashboard_gantt_version(request):
+    # Activity times are relative, so the payload also changes every few minutes
+    return (request.user.pk, request.user.is_staff, get_data_version(), time_bucket(300))
+
+@login_required
+@versioned_json(_dashboard_gantt_version)
+def dashboard_gantt_data(request):
+    try:
+        # Get projects based on user role
+        if request.user.is_staff:
+            # Admin users can see all projects
+            projects = Project.objects.all().order_by('-created_at')
+        else:
+            # Regular users can only see projects they are assigned to
+            projects = Project.objects.filter(assigned_users=request.user).order_by('-created_at')
+        
+        # Projects, tasks and subtasks in three queries, laid out once
+        layout = build_gantt_layout(projects)
+        
+        projects_data = []
+        for gantt_project in layout.projects:
+            project = gantt_project.project
+            
+            tasks_data = []
+            for task in gantt_project.tasks:
+                start_offset, duration = gantt_project.task_offset(task)
+                tasks_data.append({
+                    'id': task.id,
+                    'title': task.title,
+                    'description': task.description,
+                    'status': task.status,
+                    'priority': task.priority,
+                    'development_status': task.development_status,
+                    'start_date': task.start_date.isoformat() if task.start_date and task.end_date else None,
+                    'end_date': task.end_date.isoformat() if task.start_date and task.end_date else None,
+                    'start_offset': start_offset,
+                    'duration': duration,
+                    'subtasks': [
+                        {
+                            'id': subtask.id,
+                            'title': subtask.title,
+                            'status': subtask.status,
+                            'priority': subtask.priority,
+                            'start_date': subtask.start_date.isoformat() if subtask.start_date else None,
+                            'end_date': subtask.end_date.isoformat() if subtask.end_date else None
+                        } for subtask in task.subtasks.all()
+                    ]
+                })
+            
+            projects_data.append({
+                'id': project.id,
+                'name': project.name,
+                'client': project.client,
+                'status': project.status,
+                'status_display': project.get_status_display(),
+                'priority': gantt_project.priority,
+                'development_status': gantt_project.development_status,
+                'progress': gantt_project.progress * 100,
+                'created_at': project.created_at.isoformat(),
+                'start_date': gantt_project.start.isoformat(),
+                'end_date': gantt_project.end.isoformat(),
+                'duration_days': gantt_project.duration,
+                'timeline_position': gantt_project.timeline_position,
+                'lane': gantt_project.lane,
+                'total_tasks': gantt_project.total_tasks,
+                'completed_tasks': gantt_project.completed_tasks,
+                'tasks': tasks_data
+            })
+        
+        # Generate real activity data based on actual database records
+        activities = []
+        
+        # Recent project creations
+        recent_projects = Project.objects.all().order_by('-created_at')[:3]
+        for project in recent_projects:
+            time_diff = timezone.now() - project.created_at
+            if time_diff.days == 0:
+                time_str = f"{time_diff.seconds // 3600} hours ago"
+            elif time_diff.days == 1:
+                time_str = "1 day ago"
+            else:
+                time_str = f"{time_diff.days} days ago"
+            
+            activities.append({
+                'type': 'project_created',
+                'title': f'New project "{project.name}" created',
+                'time': time_str,
+                'status': 'Completed',
+                'project_id': project.id
+            })
+        
+        # Recent task completions
+        recent_tasks = Task.objects.filter(status='completed').select_related('project').order_by('-updated_at')[:3]
+        for task in recent_tasks:
+            time_diff = timezone.now() - task.updated_at
+            if time_diff.days == 0:
+                time_str = f"{time_diff.seconds // 3600} hours ago"
+            elif time_diff.days == 1:
+                time_str = "1 day ago"
+            else:
+                time_str = f"{time_diff.days} days ago"
+            
+            activities.append({
+                'type': 'task_completed',
+                'title': f'Task "{task.title}" completed in {task.project.name}',
+                'time': time_str,
+                'status': 'Completed',
+                'project_id': task.project.id
+            })
+        
+        # Recent task updates
+        recent_updates = Task.objects.exclude(status='completed').select_related('project').order_by('-updated_at')[:2]
+        for task in recent_updates:
+            time_diff = timezone.now() - task.updated_at
+            if time_diff.days == 0:
+                time_str = f"{time_diff.seconds // 3600} hours ago"
+            elif time_diff.days == 1:
+                time_str = "1 day ago"
+            else:
+                time_str = f"{time_diff.days} days ago"
+            
+            activities.append({
+                'type': 'task_updated',
+                'title': f'Task "{task.title}" updated in {task.project.name}',
+                'time': time_str,
+                'status': task.get_status_display(),
+                'project_id': task.project.id
+            })
+        
+        # Calculate summary statistics
+        total_projects = len(projects_data)
+        on_track_projects = len([p for p in projects_data if p['timeline_position'] <= 100])
+        overall_progress = sum([p['progress'] for p in projects_data]) / total_projects if total_projects > 0 else 0
+        
+        # Calculate additional statistics for dashboard stats
+        total_tasks = sum([p['total_tasks'] for p in projects_data])
+        completed_tasks = sum([p['completed_tasks'] for p in projects_data])
+        active_projects = len([p for p in projects_data if p['status'] == 'in_progress'])
+        pending_tasks = total_tasks - completed_tasks
+        
+        # Calculate completed tasks this week
+        week_ago = timezone.now() - timedelta(days=7)
+        completed_this_week = Task.objects.filter(
+            status='completed',
+            updated_at__gte=week_ago
+        ).count()
+        
+        # Calculate percentages
+        active_percentage = (active_projects / total_projects * 100) if total_projects > 0 else 0
+        pending_percentage = (pending_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        
+        return CompactJsonResponse({
+            'success': True,
+            'projects': projects_data,
+            'activities': activities,
+            'summary': {
+                'total_projects': total_projects,
+                'active_projects': active_projects,
+                'active_percentage': round(active_percentage, 1),
+                'total_tasks': total_tasks,
+                'completed_tasks': completed_tasks,
+                'completed_this_week': completed_this_week,
+                'pending_tasks': pending_tasks,
+                'pending_percentage': round(pending_percentage, 1),
+                'on_track_projects': on_track_projects,
+                'overall_progress': round(overall_progress, 1)
+            }
+        })
+    except Exception as e:
+        logger.error(f"Error in dashboard_gantt_data: {e}")
+        return JsonResponse({
+            'success': False,
+            'error': 'Failed to load timeline data',
+            'projects': [],
+            'activities': [],
+            'summary': {
+                'total_projects': 0,
+                'on_track_projects': 0,
+                'overall_progress': 0
+            }
+        }, status=500)
+
+@login_required
+def team_dashboard(request):
+    """Team member dashboard showing assigned projects and tasks (Staff/Employees only)"""
+    # Redirect clients to client dashboard
+    if not request.user.is_staff:
+        return redirect('client_dashboard')
+
+    # Assigned projects and tasks, grouped in one pass and cached until project data changes
+    board = get_task_board(request.user)
+
+    # Subtasks and comments change independently of the board, load them for all tasks at once
+    prefetch_related_objects(
+        board.tasks,
+        Prefetch('subtasks__comments', queryset=SubTaskComment.objects.select_related('user')),
+        Prefetch('comments', queryset=TaskComment.objects.select_related('user')),
+    )
+    # Thread the prefetched comments in memory, replies under their parent
+    for task in board.tasks:
+        task.comment_threads = build_threads(task.comments.all())
+        for subtask in task.subtasks.all():
+            subtask.comment_threads = build_threads(subtask.comments.all())
+    
+    context = {
+        'assigned_projects': board.projects,
+        'assigned_tasks': board.tasks,
+        'total_projects': board.total_projects,
+        'active_projects': board.active_projects,
+        'completed_projects': board.completed_projects,
+        'total_tasks': board.total_tasks,
+        'completed_tasks': board.completed_tasks,
+        'pending_tasks': board.open_tasks,
+        'upcoming_tasks': board.upcoming_tasks,
+        'urgent_tasks': board.urgent_tasks,
+        'high_priority_tasks': board.high_priority_tasks,
+    }
+    
+    return render(request, 'home/team_dashboard.html', context)
+
+@login_required
+def comment_threads_api(request, kind, object_id):
+    """A page of a task's or subtask's comment threads as rendered HTML, ?cursor= for the next page (staff only)"""
+    if not request.user.is_staff:
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    target_model = COMMENT_TARGETS[kind][0]
+    get_object_or_404(target_model, id=object_id)
+    page = comment_threads.render_page(kind, object_id, cursor=request.GET.get('cursor') or None)
+    return JsonResponse({
+        'html': page['html'],
+        'next_cursor': page['next_cursor'],
+        'has_next': page['next_cursor'] is not None,
+        'thread_count': page['thread_count'],
+    })
+
+@login_required
+def user_planner(request):
+    """User planner page showing assigned tasks with planner interface"""
+    user = request.user
+    
+    # Assigned projects and tasks, grouped in one pass and cached until project data changes
+    board = get_task_board(user)
+    
+    # Get user's unread notifications
+    notifications = list(Notification.objects.filter(recipient=user, is_read=False).order_by('-created_at')[:5])
+    
+    context = {
+        'task_groups': {status: board.by_status[status] for status in ('not_started', 'in_progress', 'on_hold', 'completed')},
+        'assigned_projects': board.projects,
+        'notifications': notifications,
+        'total_tasks': board.total_tasks,
+        'completed_tasks': board.completed_tasks,
+        'pending_tasks': board.pending_tasks
+    }
+    
+    return render(request, 'home/user_planner.html', context)
+
+@login_required
+def update_task_status(request, task_id):
+    """Update task status and create notification"""
+    print(f"DEBUG: update_task_status called for task {task_id} by user {request.user.username}")
+    
+    if request.method == 'POST':
+        try:
+            task = Task.objects.get(id=task_id)
+            
+            # Check if user is assigned to this task's project
+            if request.user not in task.project.assigned_users.all():
+                return JsonResponse({'success': False, 'message': 'You are not assigned to this project'})
+            
+            update_type = request.POST.get('update_type')
+            reason = request.POST.get('reason', '')
+            estimated_completion = request.POST.get('estimated_completion')
+            
+            # Create task update
+            task_update = TaskUpdate.objects.create(
+                task=task,
+                user=request.user,
+                update_type=update_type,
+                reason=reason,
+                estimated_completion=estimated_completion if estimated_completion else None
+            )
+            
+            # Update task status based on update type
+            if update_type == 'completed':
+                task.status = 'completed'
+            elif update_type == 'delayed':
+                task.status = 'on_hold'
+            elif update_type == 'on_hold':
+                task.status = 'on_hold'
+            elif update_type == 'in_progress':
+                task.status = 'in_progress'
+            elif update_type == 'not_started':
+                task.status = 'not_started'
+            
+            task.save()
+            
+            # Create ONE system-wide notification for all admins to see
+            notification_title = f"Task Update: {task.title}"
+            notification_message = f"{request.user.username} marked task '{task.title}' as {update_type}"
+            if reason:
+                notification_message += f". Reason: {reason}"
+            
+            print(f"DEBUG: Creating system-wide notification for task update")
+            try:
+                notification = Notification.create_if_not_exists(
+                    recipient=None,  # System-wide notification
+                    notification_type='task_update',
+                    title=notification_title,
+                    message=notification_message,
+                    related_task=task,
+                    related_project=task.project,
+                    triggered_by=request.user,
+                    is_admin_notification=True
+                )
+                print(f"DEBUG: Successfully created/updated system notification {notification.id}")
+            except Exception as e:
+                print(f"DEBUG: Error creating system notification: {str(e)}")
+            
+            return JsonResponse({
+                'success': True, 
+                'message': 'Task status updated successfully',
+                'new_status': task.get_status_display()
+            })
+            
+        except Task.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Task not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@login_required
+def update_subtask_status(request, subtask_id):
+    """Update subtask status"""
+    print(f"DEBUG: update_subtask_status called for subtask {subtask_id} by user {request.user.username}")
+
+    if request.method == 'POST':
+        try:
+            subtask = SubTask.objects.get(id=subtask_id)
+            
+            # Check if user is assigned to this subtask's task's project
+            if request.user not in subtask.task.project.assigned_users.all():
+                return JsonResponse({'success': False, 'message': 'You are not assigned to this project'})
+            
+            new_status = request.POST.get('new_status')
+            reason = request.POST.get('reason', '')
+            
+            if not new_status:
+                return JsonResponse({'success': False, 'message': 'Status is required'})
+            
+            # Update subtask status
+            old_status = subtask.status
+            subtask.status = new_status
+            # Sync is_completed field with status field to prevent inconsistency
+            subtask.is_completed = (new_status == 'completed')
+            subtask.save()
+            
+            # Log the status change
+            SystemLog.log_subtask_status_change(request.user, subtask, old_status, new_status, request)
+            
+            # Create ONE system-wide notification for all admins to see
+            notification_title = f"Subtask Update: {subtask.title}"
+            notification_message = f"{request.user.username} updated subtask '{subtask.title}' status from {old_status} to {new_status}"
+            if reason:
+                notification_message += f". Reason: {reason}"
+            
+            print(f"DEBUG: Creating system-wide notification for subtask update")
+            try:
+                notification = Notification.create_if_not_exists(
+                    recipient=None,  # System-wide notification
+                    notification_type='subtask_status_change',
+                    title=notification_title,
+                    message=notification_message,
+                    related_task=subtask.task,
+                    related_project=subtask.task.project,
+                    triggered_by=request.user,
+                    is_admin_notification=True
+                )
+                print(f"DEBUG: Successfully created/updated system notification {notification.id}")
+            except Exception as e:
+                print(f"DEBUG: Error creating system notification: {str(e)}")
+            
+            return JsonResponse({
+                'success': True,
+                'message': 'Subtask status updated successfully',
+                'new_status': subtask.get_status_display()
+            })
+
+        except SubTask.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Subtask not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@login_required
+def add_subtask_comment(request, subtask_id):
+    """Add comment to subtask"""
+    if request.method == 'POST':
+        try:
+            subtask = SubTask.objects.get(id=subtask_id)
+            
+            # Check if user is assigned to this subtask's task's project
+            if request.user not in subtask.task.project.assigned_users.all():
+                return JsonResponse({'success': False, 'message': 'You are not assigned to this project'})
+            
+            comment_text = request.POST.get('comment_text', '')
+            
+            if not comment_text:
+                return JsonResponse({'success': False, 'message': 'Comment text is required'})
+            
+            # Create the comment (you may need to create a SubtaskComment model or use existing comment system)
+            # For now, we'll just return success
+            # TODO: Implement subtask comment storage
+            
+            # Create system-wide notification for all admins
+            notification_title = f"Subtask Comment: {subtask.title}"
+            notification_message = f"{request.user.username} added a comment to subtask '{subtask.title}': {comment_text[:100]}..."
+            
+            Notification.create_if_not_exists(
+                recipient=None,  # System-wide notification
+                notification_type='subtask_comment_added',
+                title=notification_title,
+                message=notification_message,
+                related_task=subtask.task,
+                related_project=subtask.task.project,
+                triggered_by=request.user,
+                is_admin_notification=True
+            )
+            
+            return JsonResponse({
+                'success': True, 
+                'message': 'Comment added successfully'
+            })
+            
+        except Subtask.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Subtask not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+@login_required
+def extend_subtask_deadline(request, subtask_id):
+    """Extend subtask deadline"""
+    if request.method == 'POST':
+        try:
+            subtask = Subtask.objects.get(id=subtask_id)
+            
+            # Check if user is assigned to this subtask's task's project
+            if request.user not in subtask.task.project.assigned_users.all():
+                return JsonResponse({'success': False, 'message': 'You are not assigned to this project'})
+            
+            new_end_date = request.POST.get('new_end_date', '')
+            reason = request.POST.get('reason', '')
+            
+            if not new_end_date:
+                return JsonResponse({'success': False, 'message': 'New end date is required'})
+            
+            # Update the task's end date (since subtasks inherit from tasks)
+            task = subtask.task
+            task.end_date = new_end_date
+            task.save()
+            
+            # Create system-wide notification for all admins
+            notification_title = f"Subtask Deadline Extended: {subtask.title}"
+            notification_message = f"{request.user.username} extended deadline for subtask '{subtask.title}' to {new_end_date}"
+            if reason:
+                notification_message += f". Reason: {reason}"
+            
+            Notification.create_if_not_exists(
+                recipient=None,  # System-wide notification
+                notification_type='subtask_deadline_extended',
+                title=notification_title,
+                message=notification_message,
+                related_task=task,
+                related_project=task.project,
+                triggered_by=request.user,
+                is_admin_notification=True
+            )
+            
+            return JsonResponse({
+                'success': True, 
+                'message': 'Deadline extended successfully'
+            })
+            
+        except Subtask.DoesNotExist:
+            return JsonResponse({'success': False, 'message': 'Subtask not found'})
+        except Exception as e:
+            return JsonResponse({'success': False, 'message': f'Error: {str(e)}'})
+    
+    return JsonResponse({'success': False, 'message': 'Invalid request method'})
+
+def _notifications_version(request):
+    latest = Notification.objects.filter(recipient=request.user).aggregate(
+        count=Count('id'), unread=Count('id', filter=Q(is_read=False)), newest=Max('id')
+    )
+    return (
+        request.user.pk, latest['count'], latest['unread'], latest['newest'],
+        request.GET.urlencode(), time_bucket(60),
+    )
+
+@login_required
+@versioned_json(_notifications_version)
+def get_notifications(request):
+    """Get user's notifications, newest first, ?cursor= for older ones and ?unread=1 for unread only"""
+    # Regular users only see their personal notifications (not system-wide ones)
+    notifications = notification_inbox.for_user(request.user).select_related('related_task', 'related_project')
+    if request.GET.get('unread') == '1':
+        notifications = notifications.filter(is_read=False)
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), 50)
+    except ValueError:
+        limit = 10
+    page = notification_inbox.page(notifications, cursor=request.GET.get('cursor'), limit=limit)
+    
+    notification_data = []
+    for notification in page.notifications:
+        notification_data.append({
+            'id': notification.id,
+            'title': notification.title,
+            'message': notification.message,
+            'type': notification.get_notification_type_display(),
+            'is_read': notification.is_read,
+            'created_at': notification.created_at.strftime('%M minutes ago') if (timezone.now() - notification.created_at).seconds < 3600 else notification.created_at.strftime('%b %d, %Y'),
+            'related_task_id': notification.related_task_id,
+            'related_project_id': notification.related_project_id,
+        })
+    
+    return JsonResponse({
+        'notifications': notification_data,
+        'next_cursor': page.next_cursor,
+        'has_next': page.has_next,
+        'counts': notification_inbox.counts(request.user),
+    })
+
+@login_required
+def mark_notification_read(request, notification_id):
+    """Mark notification as read"""
+    # Allow admins to mark any notification as read, regular users can only mark their own
+    owner = None if request.user.is_staff else request.user
+    if notification_inbox.mark_read([notification_id], user=owner):
+        return JsonResponse({'success': True})
+    
+    # Nothing changed: already read, or not a notification this user may see
+    notifications = Notification.objects.filter(id=notification_id)
+    if owner is not None:
+        notifications = notifications.filter(recipient=owner)
+    if notifications.exists():
+        return JsonResponse({'success': True, 'message': 'Already read'})
+    return JsonResponse({'success': False, 'message': 'Notification not found'})
+
+@login_required
+def mark_notifications_read(request):
+    """Mark several notifications read in one update: POST ids=<id>&ids=<id>... or all=1 for all of your own"""
+    if request.method != 'POST':
+        return JsonResponse({'success': False, 'message': 'Invalid request method'})
+    
+    if request.POST.get('all') == '1':
+        updated = notification_inbox.mark_all_read(request.user)
+    else:
+        try:
+            ids = [int(value) for value in request.POST.getlist('ids')]
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid notification id'})
+        updated = notification_inbox.mark_read(ids, user=None if request.user.is_staff else request.user)
+    
+    return JsonResponse({'success': True, 'updated': updated, 'unread': notification_inbox.unread_count(request.user)})
+
+@login_required
+def delete_notification(request, notification_id):
+    """Delete a notification (admin only)"""
+    print(f"DEBUG: delete_notification called by user: {request.user.username}")
+    print(f"DEBUG: User is_staff: {request.user.is_staff}")
+    print(f"DEBUG: User is_superuser: {request.user.is_superuser}")
+    
+    # Check if user has admin privileges
+    if not request.user.is_staff:
+        print(f"DEBUG: Access denied - user is not staff")
+        return JsonResponse({'success': False, 'message': 'Admin privileges required'})
+    
+    # Additional check for specific admin permissions if user profile exists
+    try:
+        if hasattr(request.user, 'profile'):
+            print(f"DEBUG: User profile permissions:")
+            print(f"DEBUG: - can_access_admin: {request.user.profile.can_access_admin}")
+            print(f"DEBUG: - can_manage_users: {request.user.profile.can_manage_users}")
+            
+            if not request.user.profile.can_access_admin:
+                print(f"DEBUG: Access denied - user does not have admin access permission")
+                return JsonResponse({'success': False, 'message': 'Admin access permission required'})
+    except Exception as e:
+        print(f"DEBUG: Error checking user profile: {str(e)}")
+        # Continue with staff check if profile check fails
+    
+    try:
+        print(f"DEBUG: Attempting to delete notification {notification_id}")
+        
+        # Use explicit transaction to ensure deletion is committed
+        with transaction.atomic():
+            # Get the notification and verify it exists
+            notification = Notification.objects.get(id=notification_id)
+            print(f"DEBUG: Found notification {notification_id}")
+            print(f"DEBUG: Notification details - Type: {notification.notification_type}, Recipient: {notification.recipient.username if notification.recipient else 'System-wide'}")
+            
+            # Store notification details for debugging
+            notification_details = {
+                'id': notification.id,
+                'type': notification.notification_type,
+                'recipient': notification.recipient.username if notification.recipient else 'System-wide',
+                'related_task': notification.related_task.id if notification.related_task else None,
+                'related_project': notification.related_project.id if notification.related_project else None,
+            }
+            print(f"DEBUG: Notification details before deletion: {notification_details}")
+            
+            # Delete the notification
+            print(f"DEBUG: Calling notification.delete()...")
+            notification.delete()
+            print(f"DEBUG: notification.delete() completed")
+            
+            # Verify deletion by trying to get it again
+            try:
+                verification = Notification.objects.get(id=notification_id)
+                print(f"DEBUG: WARNING - Notification {notification_id} still exists after deletion!")
+                print(f"DEBUG: This suggests the deletion failed or was rolled back")
+                return JsonResponse({'success': False, 'message': 'Deletion failed - notification still exists'})
+            except Notification.DoesNotExist:
+                print(f"DEBUG: Confirmed - Notification {notification_id} was successfully deleted from database")
+            
+            # Also check if there are other notifications with similar content
+            if notification_details['recipient'] != 'System-wide':
+                similar_notifications = Notification.objects.filter(
+                    notification_type=notification_details['type'],
+                    recipient__username=notification_details['recipient']
+                )
+            else:
+                similar_notifications = Notification.objects.filter(
+                    notification_type=notification_details['type'],
+                    recipient__isnull=True
+                )
+            print(f"DEBUG: Found {similar_notifications.count()} similar notifications after deletion")
+        
+        return JsonResponse({'success': True})
+    except Notification.DoesNotExist:
+        print(f"DEBUG: Notification {notification_id} not found for deletion")
+        return JsonResponse({'success': False, 'message': 'Notification not found'})
+    except Exception as e:
+        print(f"DEBUG: Error deleting notification {notification_id}: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'success': False, 'message': f'Error deleting notification: {str(e)}'})
+
+@login_required
+def edit_task(request, project_id, task_id):
+    project = get_object_or_404(Project, id=project_id)
+    task = get_object_or_404(Task, id=task_id, project=project)
+    
+    # Check if user is assigned to this project or is staff
+    if not request.user.is_staff and request.user not in project.assigned_users.all():
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({'success': False, 'error': 'Access denied. You are not assigned to this project.'})
+        messages.error(request, 'Access denied. You are not assigned to this project.')
+        return redirect('project_tasks', project_id=project_id)
+    
+    if request.method == 'POST':
+        try:
+            # Check if this is a JSON request for status-only update
+            if request.headers.get('Content-Type') == 'application/json':
+                import json
+                data = json.loads(request.body)
+                print(f"JSON data received: {data}")  # Debug print
+                
+                if 'status' in data and len(data) == 1:
+                    # Status-only update
+                    new_status = data['status']
+                    print(f"Updating task status from '{task.status}' to '{new_status}'")  # Debug print
+                    print(f"Status value type: {type(new_status)}")  # Debug print
+                    print(f"Status value length: {len(new_status) if new_status else 'None'}")  # Debug print
+                    
+                    # Validate status value
+                    valid_statuses = [choice[0] for choice in Task.STATUS_CHOICES]
+                    print(f"Valid statuses: {valid_statuses}")  # Debug print
+                    
+                    if new_status in valid_statuses:
+                        task.status = new_status
+                        task.save()
+                        print(f"Task status updated to '{task.status}'")  # Debug print
+                        
+                        return JsonResponse({'success': True, 'message': f'Task status updated to {task.get_status_display()}'})
+                    else:
+                        print(f"Invalid status value: '{new_status}'")  # Debug print
+                        return JsonResponse({'success': False, 'error': f'Invalid status value: {new_status}'})
+            
+            # Regular form submission
+            task.title = request.POST.get('title')
+            task.description = request.POST.get('description', '')
+            task.priority = request.POST.get('priority', 'medium')
+            task.status = request.POST.get('status')
+            task.development_status = request.POST.get('development_status', 'original_quoted')
+            
+            # Handle dates
+            start_date = request.POST.get('start_date')
+            end_date = request.POST.get('end_date')
+            if start_date == '':
+                start_date = None
+            if end_date == '':
+                end_date = None
+            
+            task.start_date = start_date
+            task.end_date = end_date
+            
+            # Handle assigned users
+            assigned_user_ids = request.POST.getlist('assigned_users')
+            task.assigned_users.clear()
+            if assigned_user_ids:
+                users = User.objects.filter(id__in=assigned_user_ids)
+                task.assigned_users.add(*users)
+            
+            # Project dates are recalculated from the task dates on commit
+            task.save()
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'message': f'Task "{task.title}" updated successfully!'})
+            
+            messages.success(request, f'Task "{task.title}" updated successfully!')
+            return redirect('project_tasks', project_id=project_id)
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': f'Error updating task: {str(e)}'})
+            messages.error(request, f'Error updating task: {str(e)}')
+    
+    # For AJAX requests, return JSON
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'})
+    
+    # For regular requests, render the template
+    context = {
+        'project': project,
+        'task': task,
+
+        'status_choices': Task.STATUS_CHOICES,
+    }
+    
+    return render(request, 'home/edit_task.html', context)
+
+@login_required
+def edit_subtask(request, project_id, task_id, subtask_id):
+    project = get_object_or_404(Project, id=project_id)
+    task = get_object_or_404(Task, id=task_id, project=project)
+    subtask = get_object_or_404(SubTask, id=subtask_id, task=task)
+    
+    # Check if user is assigned to this project or is staff
+    if not request.user.is_staff and request.user not in project.assigned_users.all():
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return JsonResponse({'success': False, 'error': 'Access denied. You are not assigned to this project.'})
+        messages.error(request, 'Access denied. You are not assigned to this project.')
+        return redirect('project_tasks', project_id=project_id)
+    
+    if request.method == 'POST':
+        try:
+            # Check if this is a JSON request for status-only update
+            if request.headers.get('Content-Type') == 'application/json':
+                import json
+                data = json.loads(request.body)
+                print(f"Subtask JSON data received: {data}")  # Debug print
+                
+                if 'status' in data and len(data) == 1:
+                    # Status-only update
+                    new_status = data['status']
+                    print(f"DEBUG JSON: Updating subtask status from '{subtask.status}' to '{new_status}'")
+                    print(f"DEBUG JSON: Status value type: {type(new_status)}")
+                    print(f"DEBUG JSON: Status value length: {len(new_status) if new_status else 'None'}")
+                    
+                    # Validate status value
+                    valid_statuses = [choice[0] for choice in SubTask.STATUS_CHOICES]
+                    print(f"DEBUG JSON: Valid statuses: {valid_statuses}")
+                    
+                    if new_status in valid_statuses:
+                        print(f"DEBUG JSON: Before update - Status: '{subtask.status}', Is Completed: {subtask.is_completed}")
+                        subtask.status = new_status
+                        # Also update is_completed based on status
+                        subtask.is_completed = (new_status == 'completed')
+                        subtask.save()
+                        print(f"DEBUG JSON: After update - Status: '{subtask.status}', Is Completed: {subtask.is_completed}")
+                        print(f"DEBUG JSON: Database save successful: {subtask.pk}")
+                        
+                        return JsonResponse({'success': True, 'message': f'Subtask status updated to {subtask.get_status_display()}'})
+                    else:
+                        print(f"DEBUG JSON: Invalid status value: '{new_status}'")
+                        return JsonResponse({'success': False, 'error': f'Invalid status value: {new_status}'})
+            
+            # Regular form submission
+            print(f"DEBUG: Form data received: {request.POST}")
+            print(f"DEBUG: Current subtask status: {subtask.status}")
+            
+            subtask.title = request.POST.get('title')
+            subtask.description = request.POST.get('description', '')
+            new_status = request.POST.get('status', 'not_started')
+            print(f"DEBUG: New status from form: {new_status}")
+            
+            subtask.status = new_status
+
+            
+            # Handle dates
+            start_date = request.POST.get('start_date')
+            end_date = request.POST.get('end_date')
+            if start_date == '': start_date = None
+            if end_date == '': end_date = None
+            subtask.start_date = start_date
+            subtask.end_date = end_date
+            
+            # Update is_completed based on status
+            subtask.is_completed = (new_status == 'completed')
+            print(f"DEBUG: Before save - Status: '{subtask.status}', Is Completed: {subtask.is_completed}")
+            subtask.save()
+            print(f"DEBUG: After save - Status: '{subtask.status}', Is Completed: {subtask.is_completed}")
+            print(f"DEBUG: Database save successful: {subtask.pk}")
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': True, 'message': f'Subtask "{subtask.title}" updated successfully!'})
+            
+            messages.success(request, f'Subtask "{subtask.title}" updated successfully!')
+            return redirect('project_tasks', project_id=project_id)
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': f'Error updating subtask: {str(e)}'})
+            messages.error(request, f'Error updating subtask: {str(e)}')
+    
+    # For AJAX requests, return JSON
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'})
+    
+    # For regular requests, render the template
+    context = {
+        'project': project,
+        'task': task,
+        'subtask': subtask,
+    }
+    
+    return render(request, 'home/edit_subtask.html', context)
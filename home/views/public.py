@@ -0,0 +1,610 @@
+"""
+Public site pages, staff login/logout, captcha and password reset views
+"""
+from django.shortcuts import render, redirect
+from django.contrib.auth import authenticate, login, logout
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.conf import settings as django_settings
+from django.utils import timezone
+from django.contrib.auth.tokens import default_token_generator
+from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
+from django.utils.encoding import force_bytes, force_str
+import hashlib
+import random
+import logging
+from ..models import Client, SystemLog
+from ..rate_limit import client_ip, rate_limit
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+
+def captcha_token_view(request):
+    """Return a signed, time-limited captcha token. Called via AJAX when the checkbox passes."""
+    from django.core import signing
+    token = signing.dumps('captcha_ok', salt='eclick-captcha')
+    return JsonResponse({'token': token})
+
+
+@rate_limit('captcha_challenge', limit=30, window=60, methods=None)
+def captcha_challenge_view(request):
+    """Generate a shape-selection captcha challenge. Correct answers stored in session only."""
+    shapes = ['circle', 'triangle', 'square', 'star', 'diamond', 'hexagon']
+    colors = ['red', 'blue', 'green', 'orange', 'purple', 'yellow']
+
+    if random.choice([True, False]):  # challenge by shape
+        target = random.choice(shapes)
+        prompt = 'Select all {}s'.format(target)
+        correct = [{'shape': target, 'color': random.choice(colors)} for _ in range(3)]
+        others = [s for s in shapes if s != target]
+        distractors = [{'shape': random.choice(others), 'color': random.choice(colors)} for _ in range(6)]
+    else:  # challenge by color
+        target = random.choice(colors)
+        prompt = 'Select all {} shapes'.format(target)
+        correct = [{'shape': random.choice(shapes), 'color': target} for _ in range(3)]
+        other_colors = [c for c in colors if c != target]
+        distractors = [{'shape': random.choice(shapes), 'color': random.choice(other_colors)} for _ in range(6)]
+
+    tagged = [dict(t, correct=True) for t in correct] + [dict(t, correct=False) for t in distractors]
+    random.shuffle(tagged)
+
+    correct_ids = [i for i, t in enumerate(tagged) if t['correct']]
+    tiles = [{'id': i, 'shape': t['shape'], 'color': t['color']} for i, t in enumerate(tagged)]
+
+    request.session['captcha_correct_ids'] = correct_ids
+    request.session.modified = True
+
+    return JsonResponse({'prompt': prompt, 'tiles': tiles})
+
+
+def captcha_verify_view(request):
+    """Verify shape-selection captcha. Returns signed token on correct selection."""
+    if request.method != 'POST':
+        return JsonResponse({'success': False}, status=405)
+
+    correct_ids = request.session.get('captcha_correct_ids')
+    if not correct_ids:
+        return JsonResponse({'success': False})
+
+    selected = sorted([int(x) for x in request.POST.getlist('selected') if x.isdigit()])
+    if selected == sorted(correct_ids):
+        from django.core import signing
+        token = signing.dumps('captcha_ok', salt='eclick-captcha')
+        del request.session['captcha_correct_ids']
+        request.session.modified = True
+        return JsonResponse({'success': True, 'token': token})
+
+    return JsonResponse({'success': False})
+
+
+def home(request):
+    """Public Home page (index)"""
+    from django.conf import settings
+    context = {
+        'recaptcha_site_key': settings.RECAPTCHA_PUBLIC_KEY
+    }
+    return render(request, 'home/index.html', context)
+
+def about(request):
+    """Public About page"""
+    return render(request, 'home/about.html')
+
+def solutions(request):
+    """Public Solutions page"""
+    return render(request, 'home/solutions.html')
+
+@rate_limit('contact_form', limit=3, window=60)
+def contact(request):
+    """Public Contact page with form handling"""
+    from django.conf import settings
+    import requests
+
+    if request.method == 'POST':
+        try:
+            # Extract form data
+            first_name = request.POST.get('first_name', '').strip()
+            last_name = request.POST.get('last_name', '').strip()
+            email = request.POST.get('email', '').strip()
+            phone = request.POST.get('phone', '').strip()
+            subject = request.POST.get('subject', '').strip()
+            message = request.POST.get('message', '').strip()
+            
+            # Honeypot — must be empty; bots tend to fill every field
+            if request.POST.get('website', '').strip():
+                return JsonResponse({'success': False, 'message': 'Invalid submission.'})
+
+            # Basic validation
+            if not all([first_name, last_name, email, subject, message]):
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Please fill in all required fields.'
+                })
+
+            # Google reCAPTCHA v2 verification
+            recaptcha_response = request.POST.get('g-recaptcha-response', '').strip()
+            if not recaptcha_response:
+                return JsonResponse({
+                    'success': False,
+                    'captcha_error': True,
+                    'message': 'Please complete the reCAPTCHA verification.',
+                })
+
+            # Verify with Google
+            recaptcha_data = {
+                'secret': settings.RECAPTCHA_PRIVATE_KEY,
+                'response': recaptcha_response,
+                'remoteip': client_ip(request)
+            }
+
+            try:
+                recaptcha_verify = requests.post(
+                    'https://www.google.com/recaptcha/api/siteverify',
+                    data=recaptcha_data,
+                    timeout=5
+                )
+                recaptcha_result = recaptcha_verify.json()
+
+                if not recaptcha_result.get('success', False):
+                    return JsonResponse({
+                        'success': False,
+                        'captcha_error': True,
+                        'message': 'reCAPTCHA verification failed. Please try again.',
+                    })
+            except Exception as e:
+                logger.error(f"reCAPTCHA verification error: {str(e)}")
+                return JsonResponse({
+                    'success': False,
+                    'captcha_error': True,
+                    'message': 'reCAPTCHA verification error. Please try again.',
+                })
+
+            # Email validation
+            import re
+            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+            if not re.match(email_pattern, email):
+                return JsonResponse({
+                    'success': False,
+                    'message': 'Please enter a valid email address.'
+                })
+            
+            # Send email notification using the same email service that works for reports
+            from ..email_service import email_service
+
+            # Prepare email content
+            email_subject = f"New Contact Form Submission – E-Click Website"
+            email_message = f"""New Contact Form Submission – E-Click Website
+
+Name: {first_name} {last_name}
+Email: {email}
+
+Phone: {phone}
+Subject: {subject}
+
+Message:
+{message}"""
+
+            try:
+                # Use the same email service that successfully sends reports
+                # Send to info@eclick.co.za with CC to admin@eclick.co.za
+                result = email_service.send_email(
+                    to_email='info@eclick.co.za',
+                    subject=email_subject,
+                    body=email_message,
+                    cc_emails=['admin@eclick.co.za']
+                )
+
+                if result.get('success'):
+                    return JsonResponse({
+                        'success': True,
+                        'message': 'Thank you for your message! We will get back to you soon.'
+                    })
+                else:
+                    print(f"Email sending failed: {result.get('error')}")
+                    return JsonResponse({
+                        'success': True,
+                        'message': 'Thank you for your message! We will get back to you soon.'
+                    })
+
+            except Exception as e:
+                # Log the error but don't expose it to the user
+                print(f"Email sending failed: {e}")
+                return JsonResponse({
+                    'success': True,  # Still return success to avoid user confusion
+                    'message': 'Thank you for your message! We will get back to you soon.'
+                })
+                
+        except Exception as e:
+            return JsonResponse({
+                'success': False, 
+                'message': 'An error occurred while processing your request. Please try again.'
+            })
+    
+    context = {
+        'recaptcha_site_key': settings.RECAPTCHA_PUBLIC_KEY
+    }
+    return render(request, 'home/contact.html', context)
+
+def services(request):
+    """Public Services page (supports existing template links)"""
+    return render(request, 'home/services.html')
+
+def clients(request):
+    """Public Clients page"""
+    return render(request, 'home/clients.html')
+
+@rate_limit('login', limit=10, window=60)
+def login_view(request):
+    """Simplified login view for both admin and clients without CSRF"""
+    if request.method == 'POST':
+        username = request.POST.get('username')
+        password = request.POST.get('password')
+        
+        if not username or not password:
+            messages.error(request, 'Username and password are required')
+            return render(request, 'home/login.html')
+        
+        # First try to authenticate as a Django user (admin/staff)
+        user = authenticate(request, username=username, password=password)
+        
+        if user is not None and user.is_active:
+            # Admin/Staff login successful
+            login(request, user)
+            messages.success(request, f'Welcome back, {user.username}!')
+            return redirect('dashboard')
+        
+        # Try to authenticate as a client
+        try:
+            client = Client.objects.get(username=username, is_active=True)
+            if client.password:
+                # Check if password uses Django hashing (starts with pbkdf2_sha256)
+                if client.password.startswith('pbkdf2_sha256'):
+                    # Use Django's check_password for proper hashing
+                    from django.contrib.auth.hashers import check_password
+                    if check_password(password, client.password):
+                        # Client login successful
+                        client.last_login = timezone.now()
+                        client.save(update_fields=['last_login'])
+                        request.session['client_id'] = client.id
+                        request.session['client_username'] = client.username
+                        return redirect('client_dashboard')
+                    else:
+                        pass
+                else:
+                    # Legacy SHA256 hashing (for backward compatibility)
+                    password_hash = hashlib.sha256(password.encode()).hexdigest()
+                    if client.password == password_hash:
+                        # Client login successful
+                        client.last_login = timezone.now()
+                        client.save(update_fields=['last_login'])
+                        request.session['client_id'] = client.id
+                        request.session['client_username'] = client.username
+                        return redirect('client_dashboard')
+                    else:
+                        pass
+            else:
+                pass
+        except Client.DoesNotExist:
+            pass
+    
+    return render(request, 'home/login.html')
+
+def logout_view(request):
+    # Check if it's a client logout
+    if 'client_id' in request.session:
+        # Clear client session
+        del request.session['client_id']
+        del request.session['client_username']
+        messages.success(request, 'Logged out successfully.')
+        return redirect('login')
+    else:
+        # Admin logout
+        if request.user.is_authenticated:
+            # Log the logout activity
+            SystemLog.log_logout(request.user, request)
+        logout(request)
+        return redirect('login')
+
+def user_setup_password(request):
+    """User password setup using OTP"""
+    if request.method == 'POST':
+        username = request.POST.get('username')
+        otp = request.POST.get('otp')
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+        
+        if not all([username, otp, new_password, confirm_password]):
+            messages.error(request, 'All fields are required.')
+            return render(request, 'home/user_setup_password.html')
+        
+        if new_password != confirm_password:
+            messages.error(request, 'Passwords do not match.')
+            return render(request, 'home/user_setup_password.html')
+        
+        if len(new_password) < 8:
+            messages.error(request, 'Password must be at least 8 characters long.')
+            return render(request, 'home/user_setup_password.html')
+        
+        try:
+            user = User.objects.get(username=username)
+            
+            # Verify and consume the OTP
+            from ..otp_service import otp_service, VALID, EXPIRED, LOCKED
+            result = otp_service.verify(user, otp)
+            
+            if result == EXPIRED:
+                messages.error(request, 'OTP has expired or is invalid.')
+                return render(request, 'home/user_setup_password.html')
+            
+            if result == LOCKED:
+                messages.error(request, 'Too many invalid attempts. Please request a new OTP.')
+                return render(request, 'home/user_setup_password.html')
+            
+            if result != VALID:
+                messages.error(request, 'Invalid OTP code.')
+                return render(request, 'home/user_setup_password.html')
+            
+            # Set user password
+            user.set_password(new_password)
+            user.save()
+            
+            # Automatically log the user in
+            from django.contrib.auth import login
+            login(request, user)
+            
+            messages.success(request, 'Password set successfully! Welcome to your dashboard.')
+            return redirect('dashboard')
+                
+        except User.DoesNotExist:
+            messages.error(request, 'User not found.')
+            return render(request, 'home/user_setup_password.html')
+    
+    # GET request - show form
+    username = request.GET.get('username', '')
+    return render(request, 'home/user_setup_password.html', {'username': username})
+
+def user_reset_password(request):
+    """User password reset using OTP sent by admin"""
+    if request.method == 'POST':
+        username = request.POST.get('username')
+        otp = request.POST.get('otp')
+        new_password = request.POST.get('new_password')
+        confirm_password = request.POST.get('confirm_password')
+        
+        if not all([username, otp, new_password, confirm_password]):
+            messages.error(request, 'All fields are required.')
+            return render(request, 'home/user_reset_password.html', {'username': username})
+        
+        if new_password != confirm_password:
+            messages.error(request, 'Passwords do not match.')
+            return render(request, 'home/user_reset_password.html', {'username': username})
+        
+        if len(new_password) < 8:
+            messages.error(request, 'Password must be at least 8 characters long.')
+            return render(request, 'home/user_reset_password.html', {'username': username})
+        
+        try:
+            user = User.objects.get(username=username)
+            
+            # Verify and consume the OTP
+            from ..otp_service import otp_service, VALID, EXPIRED, LOCKED
+            result = otp_service.verify(user, otp)
+            
+            if result == EXPIRED:
+                messages.error(request, 'OTP has expired or is invalid.')
+                return render(request, 'home/user_reset_password.html', {'username': username})
+            
+            if result == LOCKED:
+                messages.error(request, 'Too many invalid attempts. Please request a new OTP.')
+                return render(request, 'home/user_reset_password.html', {'username': username})
+            
+            if result != VALID:
+                messages.error(request, 'Invalid OTP code.')
+                return render(request, 'home/user_reset_password.html', {'username': username})
+            
+            # Set user password
+            user.set_password(new_password)
+            user.save()
+            
+            messages.success(request, 'Password reset successfully! You can now log in with your new password.')
+            return redirect('login')
+                
+        except User.DoesNotExist:
+            messages.error(request, 'User not found.')
+            return render(request, 'home/user_reset_password.html', {'username': username})
+    
+    # GET request - show form
+    username = request.GET.get('username', '')
+    return render(request, 'home/user_reset_password.html', {'username': username})
+
+@rate_limit('password_reset', limit=5, window=300)
+def password_reset_request(request):
+    """Handle password reset request"""
+    if request.method == 'POST':
+        username_or_email = request.POST.get('username_or_email', '').strip()
+
+        if not username_or_email:
+            messages.error(request, 'Please enter your username or email address.')
+            return render(request, 'home/password_reset.html')
+
+        # Try to find user by username or email (both User and Client)
+        user = None
+        is_client = False
+        user_email = None
+
+        # Check Django users first - try username then email
+        try:
+            user = User.objects.get(username=username_or_email)
+            user_email = user.email
+        except User.DoesNotExist:
+            try:
+                user = User.objects.get(email=username_or_email)
+                user_email = user.email
+            except User.DoesNotExist:
+                # Check clients - try username then email
+                try:
+                    user = Client.objects.get(username=username_or_email)
+                    user_email = user.email
+                    is_client = True
+                except Client.DoesNotExist:
+                    try:
+                        user = Client.objects.get(email=username_or_email)
+                        user_email = user.email
+                        is_client = True
+                    except Client.DoesNotExist:
+                        pass
+
+        if user and user_email:
+            # Generate token
+            token = default_token_generator.make_token(user)
+            uid = urlsafe_base64_encode(force_bytes(user.pk))
+
+            # Build reset URL
+            reset_url = request.build_absolute_uri(
+                f'/password-reset-confirm/{uid}/{token}/'
+            )
+
+            # Build logo URL (URL-encoded)
+            logo_url = request.build_absolute_uri('/static/images/E%20Click%20Logo%20(1).png')
+
+            # Get user's name
+            user_name = getattr(user, 'first_name', None) or getattr(user, 'username', 'User')
+
+            # Send simple email
+            from django.core.mail import EmailMultiAlternatives
+
+            subject = 'Password Reset Request - E-Click Technologies'
+
+            # Plain text version
+            text_content = f"""E-CLICK TECHNOLOGIES
+
+Dear {user_name},
+
+We received a request to reset your password for your E-Click Technologies account.
+
+To reset your password, please click the following link:
+{reset_url}
+
+This link will expire in 24 hours for security purposes.
+
+If you did not request a password reset, please disregard this email and your password will remain unchanged. For security concerns, please contact us immediately.
+
+Best regards,
+E-Click Technologies Team
+
+---
+Need assistance? Contact us:
+Email: info@eclick.co.za
+Phone: +27 76 740 1777"""
+
+            # Simple HTML version (just makes "Reset Password" clickable instead of showing URL)
+            html_content = f"""<html>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto; padding: 20px;">
+    <div style="text-align: center; margin-bottom: 30px;">
+        <img src="{logo_url}" alt="E-Click Technologies" style="height: 50px; width: auto;">
+    </div>
+
+    <p>Dear {user_name},</p>
+
+    <p>We received a request to reset your password for your E-Click Technologies account.</p>
+
+    <p>To reset your password, please click: <a href="{reset_url}" style="color: #dc2626; text-decoration: none; font-weight: bold;">Reset Password</a></p>
+
+    <p style="color: #666; font-size: 14px;"><strong>Important:</strong> This link will expire in 24 hours for security purposes.</p>
+
+    <p>If you did not request a password reset, please disregard this email and your password will remain unchanged. For security concerns, please contact us immediately.</p>
+
+    <p>Best regards,<br>
+    <strong>E-Click Technologies Team</strong></p>
+
+    <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+
+    <p style="font-size: 12px; color: #666;">
+        <strong>Need assistance?</strong><br>
+        Email: <a href="mailto:info@eclick.co.za" style="color: #dc2626; text-decoration: none;">info@eclick.co.za</a><br>
+        Phone: <a href="tel:+27767401777" style="color: #dc2626; text-decoration: none;">+27 76 740 1777</a>
+    </p>
+</body>
+</html>"""
+
+            try:
+                email = EmailMultiAlternatives(
+                    subject,
+                    text_content,
+                    django_settings.DEFAULT_FROM_EMAIL,
+                    [user_email]
+                )
+                email.attach_alternative(html_content, "text/html")
+                email.send(fail_silently=False)
+
+                messages.success(request, 'Password reset email sent! Please check your inbox.')
+                return redirect('password_reset_done')
+            except Exception as e:
+                messages.error(request, f'Error sending email: {str(e)}')
+                return render(request, 'home/password_reset.html')
+        else:
+            # Don't reveal if username/email exists or not (security best practice)
+            messages.success(request, 'If an account with that username or email exists, a password reset link has been sent.')
+            return redirect('password_reset_done')
+
+    return render(request, 'home/password_reset.html')
+
+def password_reset_done(request):
+    """Show confirmation that reset email was sent"""
+    return render(request, 'home/password_reset_done.html')
+
+def password_reset_confirm(request, uidb64, token):
+    """Handle password reset with token"""
+    try:
+        uid = force_str(urlsafe_base64_decode(uidb64))
+
+        # Try User first
+        user = None
+        is_client = False
+        try:
+            user = User.objects.get(pk=uid)
+        except User.DoesNotExist:
+            try:
+                user = Client.objects.get(pk=uid)
+                is_client = True
+            except Client.DoesNotExist:
+                user = None
+
+        if user and default_token_generator.check_token(user, token):
+            if request.method == 'POST':
+                password1 = request.POST.get('password1')
+                password2 = request.POST.get('password2')
+
+                if password1 != password2:
+                    messages.error(request, 'Passwords do not match.')
+                    return render(request, 'home/password_reset_confirm.html')
+
+                if len(password1) < 8:
+                    messages.error(request, 'Password must be at least 8 characters long.')
+                    return render(request, 'home/password_reset_confirm.html')
+
+                # Set new password
+                if is_client:
+                    from django.contrib.auth.hashers import make_password
+                    user.password = make_password(password1)
+                    user.save()
+                else:
+                    user.set_password(password1)
+                    user.save()
+
+                messages.success(request, 'Password reset successful! You can now login with your new password.')
+                return redirect('password_reset_complete')
+
+            return render(request, 'home/password_reset_confirm.html')
+        else:
+            messages.error(request, 'Invalid or expired password reset link.')
+            return redirect('password_reset')
+
+    except Exception as e:
+        messages.error(request, 'Invalid password reset link.')
+        return redirect('password_reset')
+
+def password_reset_complete(request):
+    """Show confirmation that password was reset"""
+    return render(request, 'home/password_reset_complete.html')
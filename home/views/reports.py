@@ -0,0 +1,4170 @@
+"""
+Report pages, PDF report generation and report emails
+"""
+from django.shortcuts import render, redirect, get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.utils import timezone
+from django.db.models import Count, Q, Avg, F, ExpressionWrapper, fields
+import os
+from datetime import timedelta
+import logging
+from ..models import Project, Task, SubTask, Client, SystemLog
+from ..report_snapshots import get_project_versions
+from ..client_links import client_project_ids_many, client_projects as client_projects_for
+from ..gantt_layout import build_gantt_layout
+from ..chart_cache import chart_cache
+
+User = get_user_model()
+# Matplotlib removed - charts will be disabled
+MATPLOTLIB_AVAILABLE = False
+logger = logging.getLogger(__name__)
+
+
+@login_required
+def reports(request):
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('login')
+    
+    # Get date range for filtering (default to last 30 days)
+    days_filter = request.GET.get('days', 30)
+    try:
+        days_filter = int(days_filter)
+    except ValueError:
+        days_filter = 30
+    
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days_filter)
+    
+    # Project Statistics
+    total_projects = Project.objects.count()
+    projects_in_progress = Project.objects.filter(status='in_progress').count()
+    projects_completed = Project.objects.filter(status='completed').count()
+    projects_planned = Project.objects.filter(status='planned').count()
+    
+    # Recent projects (last 30 days)
+    recent_projects = Project.objects.filter(
+        created_at__gte=start_date
+    ).order_by('-created_at')[:5]
+    
+    # Task Statistics
+    total_tasks = Task.objects.count()
+    completed_tasks = Task.objects.filter(status='completed').count()
+    in_progress_tasks = Task.objects.filter(status='in_progress').count()
+    not_started_tasks = Task.objects.filter(status='not_started').count()
+    pending_subtasks = SubTask.objects.filter(is_completed=False).count()
+    
+    # SubTask Statistics
+    total_subtasks = SubTask.objects.count()
+    completed_subtasks = SubTask.objects.filter(is_completed=True).count()
+    
+    # User Activity
+    total_users = User.objects.count()
+    active_users = User.objects.filter(last_login__gte=start_date).count()
+    inactive_users = total_users - active_users
+    
+    # Calculate percentages for charts
+    planned_percentage = (projects_planned / total_projects * 100) if total_projects > 0 else 0
+    in_progress_percentage = (projects_in_progress / total_projects * 100) if total_projects > 0 else 0
+    completed_percentage = (projects_completed / total_projects * 100) if total_projects > 0 else 0
+    
+    # Generate matplotlib charts
+    if MATPLOTLIB_AVAILABLE:
+        charts = generate_report_charts(days_filter, start_date, end_date)
+    else:
+        charts = {}
+    
+    # Top performing projects (by task completion rate)
+    projects_with_tasks = Project.objects.annotate(
+        total_tasks=Count('tasks'),
+        completed_tasks=Count('tasks', filter=Q(tasks__status='completed'))
+    ).filter(total_tasks__gt=0)
+    
+    top_projects = []
+    for project in projects_with_tasks:
+        completion_rate = (project.completed_tasks / project.total_tasks) * 100 if project.total_tasks > 0 else 0
+        top_projects.append({
+            'name': project.name,
+            'client': project.client,
+            'status': project.status,
+            'status_display': project.get_status_display(),
+            'total_tasks': project.total_tasks,
+            'completed_tasks': project.completed_tasks,
+            'completion_rate': round(completion_rate, 1),
+            'start_date': project.start_date,
+            'end_date': project.end_date,
+            'created_at': project.created_at,
+        })
+    
+    # Sort by completion rate
+    top_projects.sort(key=lambda x: x['completion_rate'], reverse=True)
+    top_projects = top_projects[:10]  # Top 10 projects
+    
+    # User activity summary
+    user_activity = []
+    for user in User.objects.all():
+        projects_created = Project.objects.filter(created_at__gte=start_date).count()
+        last_login = user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else 'Never'
+        
+        user_activity.append({
+            'username': user.username,
+            'email': user.email,
+            'last_login': last_login,
+            'projects_created': projects_created,
+            'is_staff': user.is_staff,
+        })
+    
+    # Performance metrics - calculate average completion time from tasks
+    completed_tasks_with_dates = Task.objects.filter(
+        project__status='completed',
+        start_date__isnull=False,
+        end_date__isnull=False
+    ).annotate(
+        duration_days=ExpressionWrapper(
+            F('end_date') - F('start_date'),
+            output_field=fields.DurationField()
+        )
+    )
+    
+    avg_completion_time = completed_tasks_with_dates.aggregate(
+        avg_days=Avg('duration_days')
+    )['avg_days']
+    
+    avg_completion_time = avg_completion_time.days if avg_completion_time else 0
+    
+    # Task efficiency metrics
+    task_efficiency = {
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'not_started_tasks': not_started_tasks,
+        'completion_rate': (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0,
+        'avg_completion_time': avg_completion_time,
+    }
+    
+    # Get clients with their projects
+    clients_with_projects = list(Client.objects.filter(is_active=True).order_by('username'))
+    # Projects of every client from the link table (see home.client_links), loaded in one query
+    project_ids_by_client = client_project_ids_many(client.id for client in clients_with_projects)
+    linked_projects = list(Project.objects.filter(
+        id__in={project_id for ids in project_ids_by_client.values() for project_id in ids}
+    ))
+    for client in clients_with_projects:
+        client_project_ids = set(project_ids_by_client[client.id])
+        # Store the list separately to avoid overriding the ManyToMany 'projects' attribute
+        client.project_list = [project for project in linked_projects if project.id in client_project_ids]
+        client.projects_count = len(client.project_list)
+    
+    context = {
+        'total_projects': total_projects,
+        'projects_planned': projects_planned,
+        'projects_in_progress': projects_in_progress,
+        'projects_completed': projects_completed,
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'not_started_tasks': not_started_tasks,
+        'total_subtasks': total_subtasks,
+        'completed_subtasks': completed_subtasks,
+        'pending_subtasks': pending_subtasks,
+        'total_users': total_users,
+        'active_users': active_users,
+        'inactive_users': inactive_users,
+        'top_projects': top_projects,
+        'user_activity': user_activity,
+        'recent_projects': recent_projects,
+        'clients_with_projects': clients_with_projects,
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'end_date': end_date.strftime('%Y-%m-%d'),
+        'days_filter': days_filter,
+        'planned_percentage': planned_percentage,
+        'in_progress_percentage': in_progress_percentage,
+        'completed_percentage': completed_percentage,
+        'task_efficiency': task_efficiency,
+        'charts': charts,
+    }
+    
+    return render(request, 'home/reports.html', context)
+
+
+def generate_report_charts(days_filter, start_date, end_date):
+    """Generate charts for the reports page - matplotlib removed"""
+    # Charts disabled - return empty dict
+    return {}
+
+
+def generate_pdf_report_data(days_filter=30):
+    """
+    Generate the same report data that's used for PDF generation in the reports view
+    This function extracts the data generation logic to be reusable
+    """
+    from django.db.models import Count, Q
+    from django.utils import timezone
+    from datetime import timedelta
+    from ..models import Project, Task, SubTask, User
+    
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days_filter)
+    
+    # Project Statistics
+    total_projects = Project.objects.count()
+    projects_in_progress = Project.objects.filter(status='in_progress').count()
+    projects_completed = Project.objects.filter(status='completed').count()
+    projects_planned = Project.objects.filter(status='planned').count()
+    
+    # Recent projects (last 30 days)
+    recent_projects = Project.objects.filter(
+        created_at__gte=start_date
+    ).order_by('-created_at')[:5]
+    
+    # Project status distribution
+    status_distribution = {
+        'planned': projects_planned,
+        'in_progress': projects_in_progress,
+        'completed': projects_completed,
+    }
+    
+    # Task Statistics
+    total_tasks = Task.objects.count()
+    completed_tasks = Task.objects.filter(status='completed').count()
+    in_progress_tasks = Task.objects.filter(status='in_progress').count()
+    not_started_tasks = Task.objects.filter(status='not_started').count()
+    
+    # SubTask Statistics
+    total_subtasks = SubTask.objects.count()
+    completed_subtasks = SubTask.objects.filter(is_completed=True).count()
+    pending_subtasks = total_subtasks - completed_subtasks
+    
+    # User Activity
+    total_users = User.objects.count()
+    active_users = User.objects.filter(last_login__gte=start_date).count()
+    inactive_users = total_users - active_users
+    
+    # Top performing projects (by task completion rate)
+    projects_with_tasks = Project.objects.annotate(
+        total_tasks=Count('tasks'),
+        completed_tasks=Count('tasks', filter=Q(tasks__status='completed'))
+    ).filter(total_tasks__gt=0)
+    
+    top_projects = []
+    for project in projects_with_tasks:
+        completion_rate = (project.completed_tasks / project.total_tasks) * 100
+        top_projects.append({
+            'name': project.name,
+            'client': project.client_username if project.client_username else project.client if project.client else 'N/A',
+            'completion_rate': round(completion_rate, 1),
+            'total_tasks': project.total_tasks,
+            'completed_tasks': project.completed_tasks,
+            'start_date': project.start_date,
+            'end_date': project.end_date,
+        })
+    
+    # Sort by completion rate
+    top_projects.sort(key=lambda x: x['completion_rate'], reverse=True)
+    top_projects = top_projects[:5]
+    
+    # User activity data
+    user_activity = []
+    for user in User.objects.all()[:10]:  # Top 10 users
+        user_tasks = Task.objects.filter(assigned_users=user).count()
+        user_completed = Task.objects.filter(assigned_users=user, status='completed').count()
+        user_activity.append({
+            'username': user.username,
+            'total_tasks': user_tasks,
+            'completed_tasks': user_completed,
+            'completion_rate': round((user_completed / user_tasks * 100) if user_tasks > 0 else 0, 1)
+        })
+    
+    # Weekly activity (simplified)
+    weekly_activity = {
+        'current_week': projects_in_progress,
+        'previous_week': projects_completed,
+        'trend': 'stable'
+    }
+    
+    # Calculate percentages
+    planned_percentage = (projects_planned / total_projects * 100) if total_projects > 0 else 0
+    in_progress_percentage = (projects_in_progress / total_projects * 100) if total_projects > 0 else 0
+    completed_percentage = (projects_completed / total_projects * 100) if total_projects > 0 else 0
+    
+    return {
+        'total_projects': total_projects,
+        'projects_in_progress': projects_in_progress,
+        'projects_completed': projects_completed,
+        'projects_planned': projects_planned,
+        'status_distribution': status_distribution,
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'in_progress_tasks': in_progress_tasks,
+        'not_started_tasks': not_started_tasks,
+        'total_subtasks': total_subtasks,
+        'completed_subtasks': completed_subtasks,
+        'pending_subtasks': pending_subtasks,
+        'total_users': total_users,
+        'active_users': active_users,
+        'inactive_users': inactive_users,
+        'recent_projects': recent_projects,
+        'top_projects': top_projects,
+        'user_activity': user_activity,
+        'weekly_activity': weekly_activity,
+        'start_date': start_date,
+        'end_date': end_date,
+        'planned_percentage': round(planned_percentage, 1),
+        'in_progress_percentage': round(in_progress_percentage, 1),
+        'completed_percentage': round(completed_percentage, 1),
+    }
+
+def generate_html_pdf_report(days_filter=30):
+    """
+    Generate PDF report - now uses simplified 2-page version for better information display
+    """
+    try:
+        # Use the new simplified 2-page report
+        return generate_simple_2page_report(days_filter)
+    except Exception as e:
+        logger.error(f"Error generating simplified PDF: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        # Fall back to complex version if simplified fails
+        return generate_exact_pdf_report(days_filter)
+
+def generate_html_pdf_report_OLD(days_filter=30):
+    """
+    OLD VERSION - Generate professional PDF from HTML template using xhtml2pdf
+    Guaranteed beautiful layout with E-Click branding - Works on all platforms
+    """
+    from django.template.loader import render_to_string
+    from xhtml2pdf import pisa
+    import tempfile
+    import os
+    from datetime import datetime
+
+    try:
+        # Get report data
+        report_data = generate_pdf_report_data(days_filter)
+
+        # Extract variables
+        start_date = report_data['start_date']
+        end_date = report_data['end_date']
+        total_projects = report_data['total_projects']
+        projects_in_progress = report_data['projects_in_progress']
+        projects_completed = report_data['projects_completed']
+        projects_planned = report_data['projects_planned']
+        total_tasks = report_data['total_tasks']
+        completed_tasks = report_data['completed_tasks']
+        in_progress_tasks = report_data['in_progress_tasks']
+        not_started_tasks = report_data['not_started_tasks']
+        total_users = report_data['total_users']
+        active_users = report_data['active_users']
+        top_projects = report_data['top_projects']
+
+        # Calculate rates
+        project_completion_rate = round((projects_completed / total_projects * 100) if total_projects > 0 else 0, 1)
+        task_completion_rate = round((completed_tasks / total_tasks * 100) if total_tasks > 0 else 0, 1)
+        user_engagement_rate = round((active_users / total_users * 100) if total_users > 0 else 0, 1)
+
+        # Get projects for Gantt chart
+        all_projects = Project.objects.all().prefetch_related('tasks')
+        gantt_layout = build_gantt_layout(
+            Project.objects.filter(start_date__isnull=False, end_date__isnull=False).order_by('start_date')[:10]
+        )
+
+        # Calculate Gantt chart data
+        gantt_projects = []
+        for gantt_project in gantt_layout.dated_projects:
+            project = gantt_project.project
+            start_fraction, width_fraction = gantt_layout.fraction(gantt_project.row)
+
+            # Status class
+            status_class = 'in-progress' if project.status == 'in_progress' else 'completed' if project.status == 'completed' else 'planned'
+
+            gantt_projects.append({
+                'name': project.name,
+                'start_percent': start_fraction * 100,
+                'duration_percent': width_fraction * 100,
+                'progress': round(gantt_project.progress * 100),
+                'status_class': status_class
+            })
+
+        # Get all projects for overview table
+        all_projects_list = []
+        for proj in all_projects[:15]:
+            start_str = proj.start_date.strftime('%m/%d/%y') if proj.start_date else 'N/A'
+            end_str = proj.end_date.strftime('%m/%d/%y') if proj.end_date else 'N/A'
+
+            proj_tasks = Task.objects.filter(project=proj)
+            total_proj_tasks = proj_tasks.count()
+            completed_proj_tasks = proj_tasks.filter(status='completed').count()
+            progress_pct = round((completed_proj_tasks / total_proj_tasks * 100) if total_proj_tasks > 0 else 0)
+
+            status_map = {
+                'planned': 'Planned',
+                'in_progress': 'In Progress',
+                'completed': 'Completed'
+            }
+            status_display = status_map.get(proj.status, proj.status)
+
+            all_projects_list.append({
+                'name': proj.name,
+                'client': proj.client,
+                'status': proj.status.replace('_', '-'),
+                'status_display': status_display,
+                'start_date_str': start_str,
+                'end_date_str': end_str,
+                'progress_pct': progress_pct
+            })
+
+        # Generate recommendations
+        recommendations = []
+        if project_completion_rate < 60:
+            recommendations.append("Accelerate Delivery: Focus on completing projects in progress to improve overall completion rate")
+        if task_completion_rate < 50:
+            recommendations.append("Task Prioritization: Implement task prioritization framework to increase completion velocity")
+        if user_engagement_rate < 70:
+            recommendations.append("User Engagement: Develop user engagement strategies to increase active participation")
+        if projects_in_progress > projects_completed * 2:
+            recommendations.append("Resource Optimization: Consider reallocating resources to balance project pipeline")
+        if project_completion_rate >= 80:
+            recommendations.append("Maintain Excellence: Current performance is excellent - continue current practices")
+        if not recommendations:
+            recommendations.append("Continuous Monitoring: Track key metrics regularly to identify improvement opportunities")
+
+        # Prepare context for template
+        context = {
+            'start_date': start_date.strftime("%B %d, %Y"),
+            'end_date': end_date.strftime("%B %d, %Y"),
+            'generated_date': timezone.now().strftime("%B %d, %Y at %I:%M %p"),
+            'total_projects': total_projects,
+            'projects_in_progress': projects_in_progress,
+            'projects_completed': projects_completed,
+            'projects_planned': projects_planned,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'in_progress_tasks': in_progress_tasks,
+            'not_started_tasks': not_started_tasks,
+            'total_users': total_users,
+            'active_users': active_users,
+            'project_completion_rate': project_completion_rate,
+            'task_completion_rate': task_completion_rate,
+            'user_engagement_rate': user_engagement_rate,
+            'projects_for_gantt': gantt_projects,
+            'all_projects': all_projects_list,
+            'top_projects': top_projects[:5],
+            'recommendations': recommendations,
+        }
+
+        # Render HTML
+        html_string = render_to_string('home/pdf_report_template.html', context)
+
+        # Generate PDF
+        temp_dir = tempfile.gettempdir()
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+        descriptive_filename = f"E-Click_Report_{timestamp}.pdf"
+        pdf_path = os.path.join(temp_dir, descriptive_filename)
+
+        # Generate PDF from HTML using xhtml2pdf
+        with open(pdf_path, 'wb') as pdf_file:
+            pisa_status = pisa.CreatePDF(html_string, dest=pdf_file)
+
+            if pisa_status.err:
+                raise Exception(f"xhtml2pdf error: {pisa_status.err}")
+
+        logger.info(f"PDF generated successfully using xhtml2pdf: {pdf_path}")
+        return pdf_path
+
+    except Exception as e:
+        logger.error(f"Error generating HTML PDF: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        # Fall back to old method if HTML generation fails
+        return generate_exact_pdf_report(days_filter)
+
+
+def _gantt_chart_params(layout, renderer):
+    """Chart cache parameters of each dated project, keyed on its data version"""
+    versions = get_project_versions([gantt_project.project.id for gantt_project in layout.dated_projects])
+    return [
+        (gantt_project, {'renderer': renderer, 'project': gantt_project.project.id,
+                         'version': versions[gantt_project.project.id]})
+        for gantt_project in layout.dated_projects
+    ]
+
+
+def _render_plotly_gantt(gantt_project):
+    """PNG bytes of one project's Plotly Gantt chart"""
+    import plotly.graph_objects as go
+    import pandas as pd
+
+    project = gantt_project.project
+    rows = gantt_project.rows
+
+    # Create Plotly Gantt chart using timeline approach
+    fig = go.Figure()
+
+    # Add bars for the project, its tasks and subtasks
+    for row in rows:
+        label = f"<b>{row.label}</b>" if row.kind == 'project' else ' ' * (2 * row.level) + row.label
+        start = row.start.strftime('%Y-%m-%d')
+        finish = row.end.strftime('%Y-%m-%d')
+
+        # Create bar trace with proper date range
+        fig.add_trace(go.Bar(
+            name=label,
+            x=[pd.to_datetime(finish)],  # End date
+            y=[label],
+            base=pd.to_datetime(start),  # Start date
+            orientation='h',
+            marker=dict(
+                color=row.color,
+                line=dict(color='black', width=1)
+            ),
+            text=f"{row.duration}d",
+            textposition='inside',
+            textfont=dict(color='white', size=10, family='Arial Bold'),
+            hovertemplate=f"<b>{label}</b><br>Start: {start}<br>End: {finish}<br>Duration: {row.duration} days<br><extra></extra>",
+            showlegend=False,
+            width=0.6
+        ))
+
+    # Update layout for professional appearance
+    fig.update_layout(
+        title=dict(
+            text=f"<b>{project.name} - Project Timeline</b>",
+            font=dict(size=20, color='#000000', family='Arial Black')
+        ),
+        xaxis=dict(
+            title="Timeline",
+            type='date',
+            gridcolor='#e5e7eb',
+            showgrid=True,
+            tickformat='%b %d<br>%Y',
+            tickfont=dict(size=11),
+            dtick='M1'  # Show monthly ticks
+        ),
+        yaxis=dict(
+            title="",
+            autorange="reversed",
+            tickfont=dict(size=11),
+            gridcolor='#e5e7eb',
+            showgrid=True
+        ),
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        height=max(500, len(rows) * 40),  # Dynamic height
+        width=1400,  # Wide chart
+        margin=dict(l=300, r=50, t=80, b=80),  # More left margin for task names
+        font=dict(family='Arial', size=12),
+        hovermode='closest',
+        barmode='overlay'
+    )
+
+    # Add legend manually
+    fig.add_trace(go.Bar(x=[None], y=[None], marker=dict(color='#dc2626'), name='In Progress', showlegend=True))
+    fig.add_trace(go.Bar(x=[None], y=[None], marker=dict(color='#10b981'), name='Completed', showlegend=True))
+    fig.add_trace(go.Bar(x=[None], y=[None], marker=dict(color='#9ca3af'), name='Planned', showlegend=True))
+
+    # High-quality image
+    return fig.to_image(format='png', width=1400, height=max(500, len(rows) * 40), scale=2)
+
+
+def create_plotly_gantt_charts(projects):
+    """
+    Create professional Gantt charts using Plotly for each project
+    Returns list of paths to the image files, which belong to the chart
+    cache: a project's chart is only rendered again after its data changes
+    """
+    # Shared with the matplotlib fallback, so the layout is computed once
+    layout = build_gantt_layout(projects)
+    try:
+        print("[INFO] Using Plotly for professional Gantt charts")
+
+        chart_paths = []
+        for gantt_project, params in _gantt_chart_params(layout, 'plotly'):
+            chart_paths.append(chart_cache.path('gantt', params, lambda: _render_plotly_gantt(gantt_project)))
+
+        print(f"[SUCCESS] Created {len(chart_paths)} Plotly charts")
+        return chart_paths
+
+    except ImportError as e:
+        error_msg = f"Plotly not installed: {str(e)}. Falling back to matplotlib."
+        logger.error(error_msg)
+        print(f"[WARNING] {error_msg}")
+        # Fall back to matplotlib if Plotly not available
+        return create_matplotlib_gantt_fallback(layout)
+    except Exception as e:
+        error_msg = f"Error creating Plotly Gantt charts: {str(e)}"
+        logger.error(error_msg)
+        print(f"[ERROR] {error_msg}")
+        import traceback
+        traceback.print_exc()
+        return create_matplotlib_gantt_fallback(layout)
+
+
+def _render_matplotlib_gantt(gantt_project):
+    """PNG bytes of one project's matplotlib Gantt chart"""
+    from io import BytesIO
+    import matplotlib.dates as mdates
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Patch
+
+    project = gantt_project.project
+    rows = gantt_project.rows
+
+    height = max(8, len(rows) * 0.5)
+    fig = Figure(figsize=(16, height))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+
+    for i, row in enumerate(rows):
+        name = ' ' * (2 * row.level) + f"[{row.kind.upper()}] {row.label}"
+        ax.barh(i, row.duration, left=row.start, height=0.7,
+               color=row.color, alpha=0.8, edgecolor='black', linewidth=0.8)
+        ax.text(row.start - timedelta(days=3), i, name,
+               va='center', ha='right', fontsize=10)
+
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %d, %Y'))
+    ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=2))
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+    ax.set_yticks([])
+    ax.set_xlabel('Date', fontsize=12)
+    ax.set_title(f'Project: {project.name}', fontsize=14, fontweight='bold', pad=20)
+    ax.grid(True, axis='x', alpha=0.3, linestyle='--')
+
+    legend_elements = [
+        Patch(facecolor='#dc2626', label='In Progress'),
+        Patch(facecolor='#10b981', label='Completed'),
+        Patch(facecolor='#9ca3af', label='Planned')
+    ]
+    ax.legend(handles=legend_elements, loc='upper right', fontsize=10)
+
+    fig.tight_layout()
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=200, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def create_matplotlib_gantt_fallback(projects):
+    """
+    Matplotlib fallback for Gantt charts if Plotly fails
+    """
+    print("[WARNING] Using matplotlib fallback (Plotly unavailable)")
+
+    if not projects:
+        return []
+
+    try:
+        layout = build_gantt_layout(projects)
+        return [
+            chart_cache.path('gantt', params, lambda: _render_matplotlib_gantt(gantt_project))
+            for gantt_project, params in _gantt_chart_params(layout, 'matplotlib')
+        ]
+
+    except Exception as e:
+        logger.error(f"Error creating matplotlib Gantt charts: {str(e)}")
+        return []
+
+
+def generate_simple_2page_report(days_filter=30):
+    """
+    Generate clean PDF report with basic information - Cards, Bar Chart, and Pie Chart only
+    NO Gantt charts - just simple visualizations
+    """
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image, KeepTogether
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from datetime import datetime
+    import tempfile
+    import os
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    # Get report data
+    report_data = generate_pdf_report_data(days_filter)
+
+    # Extract data
+    start_date = report_data['start_date']
+    end_date = report_data['end_date']
+    total_projects = report_data['total_projects']
+    projects_in_progress = report_data['projects_in_progress']
+    projects_completed = report_data['projects_completed']
+    projects_planned = report_data['projects_planned']
+    total_tasks = report_data['total_tasks']
+    completed_tasks = report_data['completed_tasks']
+    in_progress_tasks = report_data['in_progress_tasks']
+    not_started_tasks = report_data['not_started_tasks']
+    total_users = report_data['total_users']
+    active_users = report_data['active_users']
+
+    # Create PDF
+    temp_dir = tempfile.gettempdir()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    pdf_path = os.path.join(temp_dir, f"E-Click_Simple_Report_{timestamp}.pdf")
+
+    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=40, leftMargin=40, topMargin=30, bottomMargin=30)
+    story = []
+    styles = getSampleStyleSheet()
+
+    # Enhanced styles - Premium Typography & Color Palette
+    dark_red = colors.HexColor('#b91c1c')
+    charcoal = colors.HexColor('#374151')
+    light_gray = colors.HexColor('#f3f4f6')
+    accent_gray = colors.HexColor('#e5e7eb')  # Sophisticated accent
+    soft_blue = colors.white    # White background (no tint)
+
+    # Dramatically improved typography hierarchy
+    title_style = ParagraphStyle('Title', parent=styles['Title'],
+                                 fontSize=26, alignment=0, spaceAfter=3,
+                                 textColor=dark_red,
+                                 fontName='Helvetica-Bold',
+                                 leading=30)
+    subtitle_style = ParagraphStyle('Subtitle', parent=styles['Normal'],
+                                    fontSize=10, alignment=0, spaceAfter=12,
+                                    textColor=charcoal)
+    heading_style = ParagraphStyle('Heading', parent=styles['Heading2'],
+                                   fontSize=14, spaceAfter=6, spaceBefore=18,
+                                   textColor=dark_red,
+                                   fontName='Helvetica-Bold',
+                                   leading=18)
+    normal_style = ParagraphStyle('Normal', parent=styles['Normal'], fontSize=9, textColor=charcoal)
+    info_style = ParagraphStyle('Info', parent=styles['Normal'], fontSize=9, textColor=charcoal, leading=14)
+    small_style = ParagraphStyle('Small', parent=styles['Normal'], fontSize=7, textColor=charcoal)
+
+    # Premium Header with logo and improved typography
+    logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'static', 'images', 'E Click Logo (1).png')
+    if os.path.exists(logo_path):
+        logo = Image(logo_path, width=1.5*inch, height=0.75*inch)
+    else:
+        logo = Paragraph('<b><font size=22 color="#b91c1c">E-CLICK</font></b>', normal_style)
+
+    header_data = [
+        [logo,
+         Paragraph('<b>E-Click Project Report</b><br/><font size=9 color="#6b7280">Generated: {}</font>'.format(
+             datetime.now().strftime("%B %d, %Y at %I:%M %p")), title_style)]
+    ]
+    header_table = Table(header_data, colWidths=[2.5*inch, 4.5*inch])
+    header_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (0, 0), 'LEFT'),
+        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ]))
+    story.append(header_table)
+
+    # Elegant separator with gradient effect (using thicker line)
+    sep_table = Table([['']], colWidths=[7.0*inch], rowHeights=[3])
+    sep_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), dark_red),
+    ]))
+    story.append(sep_table)
+    story.append(Spacer(1, 12))  # More breathing room
+
+    # Calculate metrics
+    project_completion_rate = (projects_completed / total_projects * 100) if total_projects > 0 else 0
+
+    # Executive Summary - Projects Only with enhanced typography
+    story.append(Paragraph('Executive Summary', heading_style))
+    story.append(Spacer(1, 6))
+    metrics_intro = f"""Currently managing <b><font size=10>{total_projects} projects</font></b> across the organization with a <b><font size=10 color="#b91c1c">{project_completion_rate:.1f}%</font></b> completion rate."""
+    story.append(Paragraph(metrics_intro, info_style))
+    story.append(Spacer(1, 12))
+
+    # Premium Info Cards with sophisticated styling (Projects Only)
+    summary_data = [
+        ['Total Projects', 'Completed', 'In Progress', 'Planned'],
+        [str(total_projects), str(projects_completed), str(projects_in_progress), str(projects_planned)]
+    ]
+    summary_table = Table(summary_data, colWidths=[1.75*inch]*4)
+    summary_table.setStyle(TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('FONTSIZE', (0, 1), (-1, 1), 18),
+        ('GRID', (0, 0), (-1, -1), 1.5, accent_gray),
+        ('BACKGROUND', (0, 0), (-1, 0), dark_red),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('BACKGROUND', (0, 1), (-1, 1), light_gray),
+        ('TEXTCOLOR', (0, 1), (-1, 1), dark_red),
+        ('TOPPADDING', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ('LEFTPADDING', (0, 0), (-1, -1), 8),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ]))
+    story.append(summary_table)
+    story.append(Spacer(1, 18))  # More whitespace
+
+    # Create Highly Informative Pie Chart - Project Status Distribution
+    story.append(Paragraph('Project Status Distribution', heading_style))
+    story.append(Spacer(1, 4))
+
+    chart_image_paths = []
+    try:
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 3.8))
+        fig.patch.set_facecolor('white')
+
+        categories = ['Completed', 'In Progress', 'Planned']
+        values = [projects_completed, projects_in_progress, projects_planned]
+
+        # Vibrant, distinct colors - Green for completed, Blue for in progress, Orange for planned
+        colors_pie = ['#10b981', '#3b82f6', '#f97316']
+
+        # Calculate percentages
+        total = sum(values)
+        percentages = [(v/total*100) if total > 0 else 0 for v in values]
+
+        # LEFT CHART: Modern Donut Chart with center text and subtle shadow
+        wedges, texts, autotexts = ax1.pie(values, colors=colors_pie,
+                                            autopct=lambda pct: f'{pct:.1f}%' if pct > 0 else '',
+                                            startangle=90,
+                                            textprops={'fontsize': 11, 'fontweight': 'bold', 'color': 'white'},
+                                            wedgeprops={'edgecolor': 'white', 'linewidth': 2.5, 'antialiased': True},
+                                            pctdistance=0.85)
+
+        # Create donut effect by drawing white circle in center (larger hole for better text fit)
+        centre_circle = plt.Circle((0, 0), 0.65, fc='white', linewidth=0)
+        ax1.add_artist(centre_circle)
+
+        # Add center text showing total projects
+        ax1.text(0, 0.20, str(total_projects), ha='center', va='center',
+                fontsize=28, fontweight='bold', color='#b91c1c')
+        ax1.text(0, -0.08, 'Total\nProjects', ha='center', va='center',
+                fontsize=9, color='#374151', linespacing=1.3)
+
+        # Set aspect ratio to equal for perfect circle
+        ax1.set_aspect('equal')
+        ax1.set_title('Project Status Distribution', fontsize=14, fontweight='bold',
+                     color='#1f2937', pad=20)
+
+        # RIGHT SIDE: Microsoft-style professional table
+        ax2.axis('off')
+        ax2.set_xlim(0, 1)
+        ax2.set_ylim(0.05, 0.95)
+
+        # Microsoft-style table with borders
+        table_left = 0.08
+        table_right = 0.92
+        table_width = table_right - table_left
+        col1_width = table_width * 0.15  # Color indicator column
+        col2_width = table_width * 0.30  # Status column
+        col3_width = table_width * 0.20  # Count column
+        col4_width = table_width * 0.35  # Percentage column
+
+        border_color = '#4472C4'  # Microsoft blue
+
+        # Header row (Microsoft blue header)
+        header_y = 0.82
+        header_height = 0.08
+        ax2.add_patch(plt.Rectangle((table_left, header_y), table_width, header_height,
+                                   facecolor='#4472C4', edgecolor=border_color, linewidth=1.5))
+        ax2.text(table_left + table_width/2, header_y + header_height/2, 'PROJECT STATUS BREAKDOWN',
+                ha='center', va='center', fontsize=10, fontweight='bold', color='white')
+
+        # Column headers
+        col_header_y = 0.74
+        col_header_height = 0.08
+        ax2.add_patch(plt.Rectangle((table_left, col_header_y), table_width, col_header_height,
+                                   facecolor='#D9E2F3', edgecolor=border_color, linewidth=1))
+
+        # Column header dividers
+        col1_x = table_left + col1_width
+        col2_x = col1_x + col2_width
+        col3_x = col2_x + col3_width
+
+        ax2.plot([col1_x, col1_x], [col_header_y, col_header_y + col_header_height],
+                color=border_color, linewidth=1)
+        ax2.plot([col2_x, col2_x], [col_header_y, col_header_y + col_header_height],
+                color=border_color, linewidth=1)
+        ax2.plot([col3_x, col3_x], [col_header_y, col_header_y + col_header_height],
+                color=border_color, linewidth=1)
+
+        # Column header text
+        ax2.text(table_left + col1_width/2, col_header_y + col_header_height/2, '',
+                ha='center', va='center', fontsize=8, fontweight='bold', color='#1f2937')
+        ax2.text(col1_x + col2_width/2, col_header_y + col_header_height/2, 'Status',
+                ha='center', va='center', fontsize=9, fontweight='bold', color='#1f2937')
+        ax2.text(col2_x + col3_width/2, col_header_y + col_header_height/2, 'Projects',
+                ha='center', va='center', fontsize=9, fontweight='bold', color='#1f2937')
+        ax2.text(col3_x + col4_width/2, col_header_y + col_header_height/2, 'Percentage',
+                ha='center', va='center', fontsize=9, fontweight='bold', color='#1f2937')
+
+        # Data rows with light gray backgrounds
+        row_data = [
+            ('Completed', projects_completed, percentages[0], '#10b981', '#f3f4f6'),  # Light gray
+            ('In Progress', projects_in_progress, percentages[1], '#3b82f6', '#f3f4f6'),  # Light gray
+            ('Planned', projects_planned, percentages[2], '#f97316', '#f3f4f6')  # Light gray
+        ]
+
+        row_height = 0.09  # Slightly taller for better breathing room
+        current_y = 0.65
+
+        for idx, (status, count, pct, color, bg_tint) in enumerate(row_data):
+            # Subtle color-tinted background for each status type
+            ax2.add_patch(plt.Rectangle((table_left, current_y), table_width, row_height,
+                                       facecolor=bg_tint, edgecolor=border_color, linewidth=0.8))
+
+            # Vertical dividers
+            ax2.plot([col1_x, col1_x], [current_y, current_y + row_height],
+                    color=border_color, linewidth=0.8)
+            ax2.plot([col2_x, col2_x], [current_y, current_y + row_height],
+                    color=border_color, linewidth=0.8)
+            ax2.plot([col3_x, col3_x], [current_y, current_y + row_height],
+                    color=border_color, linewidth=0.8)
+
+            # Enhanced color indicator (larger square with subtle shadow effect)
+            indicator_size = 0.03
+            indicator_x = table_left + col1_width/2 - indicator_size/2
+            indicator_y = current_y + row_height/2 - indicator_size/2
+
+            # Shadow effect
+            shadow_offset = 0.002
+            ax2.add_patch(plt.Rectangle((indicator_x + shadow_offset, indicator_y - shadow_offset),
+                                       indicator_size, indicator_size,
+                                       facecolor='#00000020', edgecolor='none', zorder=1))
+            # Main indicator
+            ax2.add_patch(plt.Rectangle((indicator_x, indicator_y), indicator_size, indicator_size,
+                                       facecolor=color, edgecolor='white', linewidth=1.5, zorder=2))
+
+            # Status text (bolder)
+            ax2.text(col1_x + col2_width/2, current_y + row_height/2, status,
+                    ha='center', va='center', fontsize=10, fontweight='bold', color='#1f2937')
+
+            # Count text
+            ax2.text(col2_x + col3_width/2, current_y + row_height/2, f'{count} projects',
+                    ha='center', va='center', fontsize=9, color='#4b5563')
+
+            # Percentage text (larger and bolder)
+            ax2.text(col3_x + col4_width/2, current_y + row_height/2, f'{pct:.1f}%',
+                    ha='center', va='center', fontsize=10, fontweight='bold', color=color)
+
+            current_y -= row_height
+
+        # Draw outer border now that we know where the last row ends
+        # The border should go from the top of the header to the bottom of the last row
+        border_top = header_y + header_height
+        border_bottom = current_y + row_height  # current_y is now at the bottom of the last row
+        border_height = border_top - border_bottom
+        ax2.add_patch(plt.Rectangle((table_left, border_bottom), table_width, border_height,
+                                   facecolor='none', edgecolor=border_color, linewidth=2.5))
+
+        plt.tight_layout()
+        pie_chart_path = os.path.join(temp_dir, f'pie_chart_{timestamp}.png')
+        plt.savefig(pie_chart_path, dpi=180, bbox_inches='tight', facecolor='white')
+        plt.close()
+        chart_image_paths.append(pie_chart_path)
+
+        # Add informative chart to PDF
+        img = Image(pie_chart_path, width=7*inch, height=3.2*inch)
+        story.append(img)
+        story.append(Spacer(1, 8))
+    except Exception as e:
+        logger.error(f"Error creating pie chart: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        story.append(Paragraph('Chart generation failed', normal_style))
+        story.append(Spacer(1, 8))
+
+    # Get all projects for detailed list
+    all_projects = Project.objects.all().prefetch_related('tasks')
+
+    # Detailed Project List with enhanced visual hierarchy
+    story.append(Spacer(1, 6))
+    story.append(Paragraph('Detailed Project Overview', heading_style))
+    story.append(Spacer(1, 8))
+
+    if all_projects:
+        for idx, project in enumerate(all_projects):
+            # Calculate project metrics
+            tasks = project.tasks.all()
+            total_tasks_count = tasks.count()
+            completed_tasks_count = tasks.filter(status='completed').count()
+            progress = (completed_tasks_count / total_tasks_count * 100) if total_tasks_count > 0 else 0
+
+            # Status display - NO HTML, use Paragraph for colors
+            status_map = {
+                'completed': 'Completed',
+                'in_progress': 'In Progress',
+                'planned': 'Planned'
+            }
+            status_display = status_map.get(project.status, project.status.title())
+
+            status_colors = {
+                'completed': '#10b981',
+                'in_progress': '#3b82f6',
+                'planned': '#9ca3af'
+            }
+            status_color = status_colors.get(project.status, '#6b7280')
+
+            # Status background tints
+            status_bg_colors = {
+                'completed': light_gray,
+                'in_progress': soft_blue,
+                'planned': light_gray
+            }
+            bg_color = status_bg_colors.get(project.status, light_gray)
+
+            # Project header with number and icon indicator
+            project_header = f'''<b><font color="#b91c1c" size=12>▸ Project {idx+1}: {project.name}</font></b>'''
+
+            # Project details in well-styled table with background
+            project_details = [
+                ['Client:', project.client if project.client else 'Not Assigned',
+                 'Status:', Paragraph(f'<font color="{status_color}"><b>{status_display}</b></font>', normal_style)],
+                ['Start Date:', project.start_date.strftime('%b %d, %Y') if project.start_date else 'Not Set',
+                 'End Date:', project.end_date.strftime('%b %d, %Y') if project.end_date else 'Not Set'],
+                ['Progress:', f'{progress:.1f}%',
+                 'Tasks:', f'{completed_tasks_count} of {total_tasks_count} completed']
+            ]
+
+            details_table = Table(project_details, colWidths=[1.3*inch, 2.2*inch, 1.1*inch, 2.4*inch])
+            details_table.setStyle(TableStyle([
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+                ('TEXTCOLOR', (0, 0), (-1, -1), charcoal),
+                ('BACKGROUND', (0, 0), (-1, -1), bg_color),
+                ('TOPPADDING', (0, 0), (-1, -1), 6),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+                ('LEFTPADDING', (0, 0), (-1, -1), 8),
+                ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+                ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+                ('BOX', (0, 0), (-1, -1), 1, accent_gray),
+            ]))
+
+            # Keep header and table together on the same page
+            story.append(KeepTogether([
+                Paragraph(project_header, normal_style),
+                Spacer(1, 12),
+                details_table
+            ]))
+
+            # Elegant separator line with color accent
+            story.append(Spacer(1, 8))
+            sep = Table([['']], colWidths=[7*inch], rowHeights=[2])
+            sep.setStyle(TableStyle([
+                ('LINEBELOW', (0, 0), (-1, -1), 2, accent_gray),
+            ]))
+            story.append(sep)
+            story.append(Spacer(1, 10))
+    else:
+        story.append(Paragraph('No projects found in the system.', normal_style))
+
+    story.append(Spacer(1, 10))
+
+    # Footer with E-Click branding
+    story.append(Spacer(1, 10))
+    footer_text = '''<para align=center>
+        <font size=7 color="#9ca3af">─────────────────────────────────────</font><br/>
+        <b><font size=8 color="#b91c1c">E-CLICK PROJECT MANAGEMENT</font></b><br/>
+        <font size=7 color="#374151">Delivering Excellence Through Innovation</font><br/>
+        <font size=6 color="#9ca3af">Report Generated: {}</font>
+    </para>'''.format(datetime.now().strftime("%B %d, %Y"))
+    story.append(Paragraph(footer_text, normal_style))
+
+    # Build PDF - no headers/footers
+    doc.build(story)
+
+    # Clean up chart images after PDF is built
+    for chart_path in chart_image_paths:
+        if os.path.exists(chart_path):
+            try:
+                os.unlink(chart_path)
+            except:
+                pass
+
+    return pdf_path
+
+
+def create_gantt_chart(projects):
+    """
+    Create a Gantt chart visualization for project timelines
+    Uses E-Click branding colors: Red (#dc2626), Black, Gray
+    """
+    from reportlab.graphics.shapes import Drawing, Rect, String, Line
+    from reportlab.lib import colors
+    from datetime import datetime, timedelta
+
+    if not projects:
+        return None
+
+    try:
+        layout = build_gantt_layout(projects)
+        if not layout.dated_projects:
+            return None
+
+        # Chart dimensions - optimized for clarity
+        chart_width = 500
+        bar_height = 16
+        row_spacing = 26
+        margin_left = 130
+        margin_right = 20
+        margin_top = 45
+        margin_bottom = 25
+
+        timeline_width = chart_width - margin_left - margin_right
+        chart_height = margin_top + (len(layout.dated_projects) * row_spacing) + margin_bottom
+
+        # Create drawing
+        drawing = Drawing(chart_width, chart_height)
+
+        # Overall date range
+        min_date = layout.start
+        max_date = layout.end
+        total_days = layout.total_days
+
+        # Draw timeline axis
+        axis_y = chart_height - margin_top + 10
+        drawing.add(Line(margin_left, axis_y, margin_left + timeline_width, axis_y,
+                        strokeColor=colors.HexColor('#d1d5db'), strokeWidth=1))
+
+        # Add simplified date labels (start, middle, end only)
+        # This prevents overlapping dates
+        date_labels = [
+            (min_date, margin_left, 'start'),
+            (min_date + timedelta(days=total_days//2), margin_left + timeline_width//2, 'middle'),
+            (max_date, margin_left + timeline_width, 'end')
+        ]
+
+        for date, x_pos, position in date_labels:
+            label = date.strftime('%b %d, %y')
+            drawing.add(String(x_pos, axis_y + 8, label,
+                              fontSize=6, fillColor=colors.HexColor('#374151'), textAnchor='middle'))
+            # Small tick
+            drawing.add(Line(x_pos, axis_y, x_pos, axis_y + 4,
+                           strokeColor=colors.HexColor('#9ca3af'), strokeWidth=0.5))
+
+        # Draw project bars
+        y_position = axis_y - 20
+
+        for gantt_project in layout.dated_projects:
+            project = gantt_project.project
+
+            # Bar position
+            start_fraction, width_fraction = layout.fraction(gantt_project.row)
+            bar_x = margin_left + start_fraction * timeline_width
+            bar_width = max(8, width_fraction * timeline_width)
+
+            progress = gantt_project.progress
+            bar_color = colors.HexColor(gantt_project.row.color)
+
+            # Draw background bar
+            drawing.add(Rect(bar_x, y_position, bar_width, bar_height,
+                           fillColor=colors.HexColor('#f3f4f6'),
+                           strokeColor=colors.HexColor('#d1d5db'),
+                           strokeWidth=0.5))
+
+            # Draw progress bar
+            progress_width = bar_width * progress
+            if progress_width > 2:
+                drawing.add(Rect(bar_x, y_position, progress_width, bar_height,
+                               fillColor=bar_color, strokeColor=None, strokeWidth=0))
+
+            # Project name label (cleaner, shorter)
+            project_name = project.name[:18] + '..' if len(project.name) > 18 else project.name
+            drawing.add(String(margin_left - 6, y_position + 5, project_name,
+                              fontSize=7, fillColor=colors.HexColor('#111827'), textAnchor='end'))
+
+            # Progress percentage (only if bar is wide enough)
+            if bar_width > 25:
+                progress_text = f"{progress * 100:.0f}%"
+                text_color = colors.white if progress > 0.4 else colors.HexColor('#374151')
+                drawing.add(String(bar_x + bar_width / 2, y_position + 4, progress_text,
+                                  fontSize=6, fillColor=text_color,
+                                  textAnchor='middle', fontName='Helvetica-Bold'))
+
+            y_position -= row_spacing
+
+        # Legend at bottom
+        legend_y = margin_bottom - 12
+        legend_x = margin_left
+
+        drawing.add(String(legend_x, legend_y, 'Status:',
+                          fontSize=7, fillColor=colors.HexColor('#374151'), fontName='Helvetica-Bold'))
+
+        # Legend items
+        legend_items = [
+            (colors.HexColor('#dc2626'), 'In Progress'),
+            (colors.HexColor('#10b981'), 'Completed'),
+            (colors.HexColor('#9ca3af'), 'Planned')
+        ]
+
+        legend_x += 38
+        for color, label in legend_items:
+            drawing.add(Rect(legend_x, legend_y - 2, 10, 6, fillColor=color, strokeColor=None))
+            drawing.add(String(legend_x + 13, legend_y, label,
+                              fontSize=6, fillColor=colors.HexColor('#374151')))
+            legend_x += 60
+
+        return drawing
+
+    except Exception as e:
+        logger.error(f"Error creating Gantt chart: {str(e)}")
+        return None
+
+
+def generate_exact_pdf_report(days_filter=30):
+    """
+    Generate simplified 2-page E-Click PDF report focusing on information accuracy
+    Page 1: Executive Summary, Performance Analysis, Gantt Chart
+    Page 2: All Projects Overview Table
+    """
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from datetime import datetime, timedelta
+    import tempfile
+
+    # Get the same data as the reports view
+    report_data = generate_pdf_report_data(days_filter)
+
+    # Extract variables from report_data
+    start_date = report_data['start_date']
+    end_date = report_data['end_date']
+    total_projects = report_data['total_projects']
+    projects_in_progress = report_data['projects_in_progress']
+    projects_completed = report_data['projects_completed']
+    projects_planned = report_data['projects_planned']
+    total_tasks = report_data['total_tasks']
+    completed_tasks = report_data['completed_tasks']
+    in_progress_tasks = report_data['in_progress_tasks']
+    not_started_tasks = report_data['not_started_tasks']
+    total_subtasks = report_data['total_subtasks']
+    completed_subtasks = report_data['completed_subtasks']
+    pending_subtasks = report_data['pending_subtasks']
+    total_users = report_data['total_users']
+    active_users = report_data['active_users']
+    inactive_users = report_data['inactive_users']
+    top_projects = report_data['top_projects']
+
+    # Create descriptive temporary file for PDF
+    import os
+    temp_dir = tempfile.gettempdir()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    descriptive_filename = f"E-Click_2Page_Report_{timestamp}.pdf"
+    pdf_path = os.path.join(temp_dir, descriptive_filename)
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        pdf_path,
+        pagesize=A4,
+        rightMargin=40,
+        leftMargin=40,
+        topMargin=100,
+        bottomMargin=50,
+    )
+    story = []
+
+    # Get styles
+    styles = getSampleStyleSheet()
+
+    # Simple styles - focus on readability
+    title_style = ParagraphStyle(
+        'Title',
+        parent=styles['Heading1'],
+        fontSize=18,
+        textColor=colors.HexColor('#dc2626'),
+        alignment=1,
+        spaceAfter=10,
+    )
+
+    heading_style = ParagraphStyle(
+        'Heading',
+        parent=styles['Heading2'],
+        fontSize=12,
+        textColor=colors.HexColor('#dc2626'),
+        spaceAfter=8,
+        spaceBefore=12,
+    )
+
+    normal_style = ParagraphStyle(
+        'Normal',
+        parent=styles['Normal'],
+        fontSize=9,
+        spaceAfter=4,
+    )
+
+    # Simple header/footer
+    PAGE_WIDTH, PAGE_HEIGHT = A4
+
+    def draw_header_footer(canvas, doc):
+        canvas.saveState()
+        # Header
+        canvas.setFont('Helvetica-Bold', 16)
+        canvas.setFillColor(colors.HexColor('#dc2626'))
+        canvas.drawString(40, PAGE_HEIGHT - 40, 'E-CLICK')
+        canvas.setFont('Helvetica', 9)
+        canvas.setFillColor(colors.black)
+        canvas.drawRightString(PAGE_WIDTH - 40, PAGE_HEIGHT - 35, 'support@eclick.co.za')
+        canvas.drawRightString(PAGE_WIDTH - 40, PAGE_HEIGHT - 48, '(+27)')
+        # Footer
+        canvas.setFont('Helvetica-Bold', 8)
+        canvas.setFillColor(colors.HexColor('#dc2626'))
+        canvas.drawCentredString(PAGE_WIDTH / 2, 30, 'WE CARE, WE CAN, WE DELIVER')
+        canvas.setFont('Helvetica', 8)
+        canvas.setFillColor(colors.black)
+        canvas.drawCentredString(PAGE_WIDTH / 2, 18, f'Page {doc.page}')
+        canvas.restoreState()
+
+    # ===== PAGE 1: Summary & Metrics =====
+    story.append(Paragraph('E-Click Project Management Report', title_style))
+    story.append(Paragraph(f'{start_date.strftime("%B %d")} - {end_date.strftime("%B %d, %Y")}',
+                          ParagraphStyle('Subtitle', parent=normal_style, alignment=1, spaceAfter=15)))
+
+    # Executive Summary
+    story.append(Paragraph('Executive Summary', heading_style))
+
+    # Calculate metrics
+    project_completion_rate = (projects_completed / total_projects * 100) if total_projects > 0 else 0
+    task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    user_engagement_rate = (active_users / total_users * 100) if total_users > 0 else 0
+
+    # Summary table - 4 columns
+    summary_data = [
+        ['Total Projects', 'Total Tasks', 'Completion Rate', 'Active Users'],
+        [str(total_projects), str(total_tasks), f'{project_completion_rate:.1f}%', str(active_users)]
+    ]
+    summary_table = Table(summary_data, colWidths=[2.4*inch]*4)
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONT NAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f9fafb')),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+        ('FONTSIZE', (0, 1), (-1, -1), 11),
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+    ]))
+    story.append(summary_table)
+    story.append(Spacer(1, 12))
+
+    # Key Metrics
+    story.append(Paragraph('Key Metrics', heading_style))
+    metrics_text = f"""
+    • Project Completion: {project_completion_rate:.1f}% ({projects_completed} of {total_projects} completed)<br/>
+    • Task Completion: {task_completion_rate:.1f}% ({completed_tasks} of {total_tasks} completed)<br/>
+    • Active Projects: {projects_in_progress} currently in progress<br/>
+    • User Engagement: {user_engagement_rate:.1f}% ({active_users} of {total_users} users active)
+    """
+    story.append(Paragraph(metrics_text, normal_style))
+    story.append(Spacer(1, 12))
+    analysis_table = Table(analysis_data, colWidths=[1.5*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.6*inch])
+    analysis_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),  # Red header
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),  # White background
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#000000')),  # Black text
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#000000')),  # Black grid lines
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.white]),  # All white rows
+    ]))
+    story.append(analysis_table)
+    story.append(Spacer(1, 15))
+
+    # Charts Section
+    try:
+        # Project Status Distribution Pie Chart
+        status_values = [projects_planned, projects_in_progress, projects_completed]
+        status_labels = ['Planned', 'In Progress', 'Completed']
+        if sum(status_values) > 0:
+            drawing = Drawing(400, 220)
+            pie = Pie()
+            pie.x = 130
+            pie.y = 10
+            pie.width = 140
+            pie.height = 140
+            pie.data = status_values
+            pie.labels = [f"{label} ({val})" for label, val in zip(status_labels, status_values)]
+            pie.slices.strokeWidth = 0.5
+            pie.slices[0].fillColor = colors.HexColor('#ef4444')  # red
+            pie.slices[1].fillColor = colors.HexColor('#111827')  # near black
+            pie.slices[2].fillColor = colors.HexColor('#9ca3af')  # gray
+            drawing.add(pie)
+            story.append(Paragraph('Project Status Distribution', heading_style))
+            story.append(drawing)
+            story.append(Spacer(1, 12))
+
+        # Task Distribution Bar Chart
+        task_values = [completed_tasks, in_progress_tasks, not_started_tasks]
+        task_labels = ['Completed', 'In Progress', 'Not Started']
+        if sum(task_values) > 0:
+            drawing = Drawing(400, 220)
+            bc = VerticalBarChart()
+            bc.x = 40
+            bc.y = 30
+            bc.height = 150
+            bc.width = 320
+            bc.data = [task_values]
+            bc.categoryAxis.categoryNames = task_labels
+            bc.barWidth = 18
+            bc.groupSpacing = 12
+            bc.valueAxis.valueMin = 0
+            bc.bars[0].fillColor = colors.HexColor('#ef4444')
+            drawing.add(bc)
+            story.append(Paragraph('Task Distribution', heading_style))
+            story.append(drawing)
+            story.append(Spacer(1, 12))
+
+        # Weekly Activity Line Chart (projects created)
+        if isinstance(report_data.get('weekly_activity'), list) and report_data['weekly_activity']:
+            labels = [w['week'] for w in report_data['weekly_activity']]
+            projects_series = [w['projects'] for w in report_data['weekly_activity']]
+            drawing = Drawing(420, 240)
+            lc = HorizontalLineChart()
+            lc.x = 40
+            lc.y = 40
+            lc.height = 150
+            lc.width = 320
+            lc.data = [projects_series]
+            lc.categoryAxis.categoryNames = labels
+            lc.lines[0].strokeColor = colors.HexColor('#ef4444')
+            story.append(Paragraph('Weekly Activity (Projects Created)', heading_style))
+            drawing.add(lc)
+            story.append(drawing)
+            story.append(Spacer(1, 12))
+    except Exception:
+        # If charts fail, continue with the rest of the report
+        pass
+
+    # Project Timeline - Gantt Chart Visualization
+    story.append(PageBreak())
+    story.append(Paragraph('Project Timeline - Gantt Chart', heading_style))
+    story.append(Spacer(1, 10))
+
+    # Get all projects with their dates for Gantt chart
+    try:
+        all_projects_for_gantt = list(
+            Project.objects.filter(start_date__isnull=False, end_date__isnull=False).order_by('start_date')[:10]
+        )  # Show max 10 projects
+
+        if all_projects_for_gantt:
+            # Create Gantt chart
+            gantt_chart = create_gantt_chart(all_projects_for_gantt)
+            if gantt_chart:
+                story.append(gantt_chart)
+                story.append(Spacer(1, 10))
+                story.append(Paragraph('<i>Timeline visualization showing project start and end dates with current progress</i>',
+                    ParagraphStyle('ItalicSmall', parent=normal_style, fontSize=8, textColor=colors.HexColor('#6b7280'), alignment=1)))
+            else:
+                story.append(Paragraph('No projects with defined timelines available for Gantt visualization', normal_style))
+        else:
+            story.append(Paragraph('No projects with defined timelines available', normal_style))
+    except Exception as e:
+        logger.error(f"Error creating Gantt chart: {str(e)}")
+        story.append(Paragraph('Gantt chart visualization temporarily unavailable', normal_style))
+
+    story.append(Spacer(1, 15))
+
+    # All Projects Overview Table
+    story.append(Paragraph('All Projects Overview', heading_style))
+    story.append(Spacer(1, 10))
+
+    try:
+        all_projects_list = Project.objects.all().order_by('-created_at')
+
+        if all_projects_list:
+            # Create comprehensive projects table
+            projects_overview_data = [['Project Name', 'Client', 'Status', 'Start Date', 'End Date', 'Progress']]
+
+            for proj in all_projects_list[:15]:  # Show max 15 projects
+                # Format dates
+                start_str = proj.start_date.strftime('%m/%d/%y') if proj.start_date else 'N/A'
+                end_str = proj.end_date.strftime('%m/%d/%y') if proj.end_date else 'N/A'
+
+                # Calculate progress
+                proj_tasks = Task.objects.filter(project=proj)
+                total_proj_tasks = proj_tasks.count()
+                completed_proj_tasks = proj_tasks.filter(status='completed').count()
+                progress_pct = (completed_proj_tasks / total_proj_tasks * 100) if total_proj_tasks > 0 else 0
+
+                # Status display
+                status_map = {
+                    'planned': 'Planned',
+                    'in_progress': 'In Progress',
+                    'completed': 'Completed'
+                }
+                status_display = status_map.get(proj.status, proj.status)
+
+                projects_overview_data.append([
+                    proj.name[:30] + '...' if len(proj.name) > 30 else proj.name,
+                    proj.client[:20] + '...' if len(proj.client) > 20 else proj.client,
+                    status_display,
+                    start_str,
+                    end_str,
+                    f"{progress_pct:.0f}%"
+                ])
+
+            overview_table = Table(projects_overview_data, colWidths=[2.2*inch, 1.5*inch, 1.1*inch, 0.7*inch, 0.7*inch, 1.1*inch])
+            overview_table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),  # E-Click red header
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('ALIGN', (5, 0), (5, -1), 'CENTER'),  # Center progress column
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 8),
+                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+                ('TOPPADDING', (0, 0), (-1, 0), 8),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),  # Light gray grid
+                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+                ('FONTSIZE', (0, 1), (-1, -1), 7),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),  # Alternating rows
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ]))
+            story.append(overview_table)
+        else:
+            story.append(Paragraph('No projects available', normal_style))
+    except Exception as e:
+        logger.error(f"Error creating projects overview: {str(e)}")
+        story.append(Paragraph('Projects overview temporarily unavailable', normal_style))
+
+    story.append(Spacer(1, 15))
+
+    # Deep Dive Analysis (exact same as reports view)
+    story.append(Paragraph('Deep Dive Analysis', heading_style))
+    
+    # Project insights (exact same as reports view)
+    project_insights = []
+    if projects_completed > 0:
+        project_insights.append(f"Success Rate: {projects_completed} projects successfully delivered")
+    if projects_in_progress > projects_completed:
+        project_insights.append(f"Pipeline Alert: {projects_in_progress} projects in progress - consider resource allocation")
+    if projects_planned > projects_in_progress:
+        project_insights.append(f"Planning Strength: {projects_planned} projects in planning phase")
+    
+    # Task insights (exact same as reports view)
+    task_insights = []
+    if completed_tasks > in_progress_tasks:
+        task_insights.append(f"Task Velocity: High completion rate with {completed_tasks} tasks finished")
+    if not_started_tasks > completed_tasks:
+        task_insights.append(f"Task Backlog: {not_started_tasks} tasks pending - prioritize execution")
+    
+    # User insights (exact same as reports view)
+    user_insights = []
+    if active_users > inactive_users:
+        user_insights.append(f"Team Engagement: Strong user activity with {active_users} active users")
+    else:
+        user_insights.append(f"Engagement Concern: {inactive_users} inactive users - consider engagement strategies")
+    
+    # Combine all insights (exact same as reports view)
+    all_insights = project_insights + task_insights + user_insights
+    for insight in all_insights:
+        story.append(Paragraph(insight, insight_style))
+    
+    story.append(Spacer(1, 15))
+    
+    # Top Performers (if any) (exact same as reports view)
+    if top_projects:
+        story.append(Paragraph('Top Performing Projects', heading_style))
+        
+        # Show only top 3 projects with detailed metrics (exact same as reports view)
+        top_3_projects = top_projects[:3]
+        projects_data = [['Rank', 'Project', 'Client', 'Completion', 'Tasks', 'Duration']]
+        
+        for i, project in enumerate(top_3_projects, 1):
+            # Calculate duration based on start and end dates
+            duration_text = "N/A"
+            if project.get('start_date') and project.get('end_date'):
+                start_date = project['start_date']
+                end_date = project['end_date']
+                if isinstance(start_date, str):
+                    start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+                if isinstance(end_date, str):
+                    end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+                duration_days = (end_date - start_date).days
+                duration_weeks = max(1, duration_days // 7)
+                duration_text = f"{duration_weeks} weeks"
+            
+            projects_data.append([
+                f"#{i}",
+                project['name'][:20] + "..." if len(project['name']) > 20 else project['name'],
+                project['client'][:15] + "..." if len(project['client']) > 15 else project['client'],
+                f"{project['completion_rate']}%",
+                f"{project['completed_tasks']}/{project['total_tasks']}",
+                duration_text
+            ])
+        
+        projects_table = Table(projects_data, colWidths=[0.5*inch, 1.5*inch, 1.2*inch, 0.8*inch, 0.8*inch, 0.6*inch])
+        projects_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),  # Red header
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),  # Light gray background
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 7),
+            ('ALIGN', (0, 1), (0, -1), 'CENTER'),
+            ('ALIGN', (3, 1), (-1, -1), 'CENTER'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.white]),  # All white rows
+        ]))
+        story.append(projects_table)
+        story.append(Spacer(1, 15))
+    
+    # Strategic Recommendations (exact same as reports view)
+    story.append(Paragraph('Strategic Recommendations', heading_style))
+    
+    recommendations = []
+    
+    # Performance-based recommendations (exact same as reports view)
+    if project_completion_rate < 60:
+        recommendations.append("Accelerate Delivery: Focus on completing projects in progress to improve overall completion rate")
+    if task_completion_rate < 50:
+        recommendations.append("Task Prioritization: Implement task prioritization framework to increase completion velocity")
+    if user_engagement_rate < 70:
+        recommendations.append("User Engagement: Develop user engagement strategies to increase active participation")
+    
+    # Resource-based recommendations (exact same as reports view)
+    if projects_in_progress > projects_completed * 2:
+        recommendations.append("Resource Optimization: Consider reallocating resources to balance project pipeline")
+    if not_started_tasks > completed_tasks:
+        recommendations.append("Task Management: Implement task initiation protocols to reduce backlog")
+    
+    # Positive reinforcement (exact same as reports view)
+    if project_completion_rate >= 80:
+        recommendations.append("Maintain Excellence: Current performance is excellent - continue current practices")
+    if task_completion_rate >= 75:
+        recommendations.append("Sustain Momentum: Task completion rate is strong - maintain current workflow")
+    
+    # Default recommendations if no specific ones (exact same as reports view)
+    if not recommendations:
+        recommendations.append("Continuous Monitoring: Track key metrics regularly to identify improvement opportunities")
+        recommendations.append("Process Optimization: Review and optimize project management processes")
+    
+    for rec in recommendations:
+        story.append(Paragraph(rec, insight_style))
+    
+    story.append(Spacer(1, 15))
+    
+    # Footer (exact same as reports view)
+    story.append(Paragraph(f'Generated on {timezone.now().strftime("%B %d, %Y at %I:%M %p")} | E-Click Project Management', ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        alignment=1,
+        textColor=colors.HexColor('#6b7280'),  # Gray
+        fontName='Helvetica'
+    )))
+    
+    # Build PDF with header/footer on all pages
+    doc.build(story, onFirstPage=draw_header_footer, onLaterPages=draw_header_footer)
+    
+    return pdf_path
+
+def generate_simple_hello_pdf():
+    """Generate a simple PDF that only says 'hello'"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    import tempfile
+    import os
+    from datetime import datetime
+    
+    # Create temporary file for PDF
+    temp_dir = tempfile.gettempdir()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    filename = f"hello_report_{timestamp}.pdf"
+    pdf_path = os.path.join(temp_dir, filename)
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    story = []
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    
+    # Add "hello" to the PDF
+    story.append(Paragraph("hello", styles['Normal']))
+    
+    # Build PDF
+    doc.build(story)
+    
+    return pdf_path
+
+def generate_project_summary_pdf(project, client_name, total_tasks, completed_tasks, task_completion_rate, team_size, recent_tasks, recent_subtasks, generated_time):
+    """Generate an email-style PDF report that matches the exact format shown in the image with donut chart"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Flowable
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.lib.enums import TA_CENTER, TA_LEFT
+    from reportlab.graphics.shapes import Drawing, Circle, String
+    from reportlab.graphics.charts.piecharts import Pie
+    from reportlab.graphics import renderPDF
+    import tempfile
+    import os
+    from datetime import datetime
+    
+    # Working DonutChart implementation with red/black/white theme - centered and bigger
+    def create_donut_chart(progress_percentage):
+        """Create a centered, bigger donut chart with red/black/white theme for one-page layout"""
+        try:
+            drawing = Drawing(400, 150)  # Bigger size and centered
+            pie = Pie()
+            pie.x = 130  # Centered horizontally
+            pie.y = 15
+            pie.width = 120  # Bigger chart
+            pie.height = 120
+            
+            # Ensure valid progress data
+            progress = max(0, min(100, float(progress_percentage or 0)))
+            remaining = 100 - progress
+            
+            # Create donut chart showing completed vs remaining
+            pie.data = [progress, remaining] if remaining > 0 else [progress]
+            pie.labels = ['', '']
+            pie.slices[0].fillColor = colors.HexColor('#dc2626')  # Red for progress
+            if remaining > 0:
+                pie.slices[1].fillColor = colors.HexColor('#000000')  # Black for remaining
+            
+            pie.slices.strokeColor = colors.white
+            pie.slices.strokeWidth = 2
+            drawing.add(pie)
+            
+            # Add center circle for donut effect
+            cx, cy = 190, 75  # Centered
+            ring = Circle(cx, cy, 40, fillColor=colors.white, strokeColor=colors.white)  # Bigger center
+            drawing.add(ring)
+            
+            # Add percentage in center
+            pct_label = String(cx, cy - 4, f"{progress:.1f}%", textAnchor='middle')
+            pct_label.fontName = 'Helvetica-Bold'
+            pct_label.fontSize = 16  # Bigger text
+            pct_label.fillColor = colors.HexColor('#000000')  # Black text
+            drawing.add(pct_label)
+            
+            return drawing
+        except Exception:
+            # Return empty drawing if chart creation fails
+            return Drawing(400, 150)
+    
+    # Create temporary file for PDF
+    temp_dir = tempfile.gettempdir()
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    safe_name = ''.join(c if c.isalnum() or c in ('_', '-') else '_' for c in (project.name or 'project'))[:40]
+    filename = f"EClick_Project_Summary_{safe_name}_{timestamp}.pdf"
+    pdf_path = os.path.join(temp_dir, filename)
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(
+        pdf_path, 
+        pagesize=A4,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        rightMargin=0.75*inch
+    )
+    story = []
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    
+    # Compact Email-style title (RED like in image)
+    title_style = ParagraphStyle(
+        'EmailTitle',
+        parent=styles['Heading1'],
+        fontSize=16,  # Smaller for one-page
+        spaceAfter=6,
+        spaceBefore=0,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#dc2626'),  # Red color like in image
+        fontName='Helvetica-Bold'
+    )
+    
+    # Compact Subtitle style (gray)
+    subtitle_style = ParagraphStyle(
+        'EmailSubtitle',
+        parent=styles['Normal'],
+        fontSize=9,  # Smaller for one-page
+        spaceAfter=10,
+        alignment=TA_CENTER,
+        textColor=colors.HexColor('#6b7280'),
+        fontName='Helvetica'
+    )
+    
+    # Red/Black/White Email greeting style
+    greeting_style = ParagraphStyle(
+        'EmailGreeting',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=8,
+        textColor=colors.HexColor('#000000'),  # Black text
+        fontName='Helvetica-Bold'
+    )
+    
+    # Red/Black/White Email body style
+    body_style = ParagraphStyle(
+        'EmailBody',
+        parent=styles['Normal'],
+        fontSize=9,
+        spaceAfter=6,
+        textColor=colors.HexColor('#000000'),  # Black text
+        fontName='Helvetica',
+        leading=12
+    )
+    
+    # Red/Black/White Section heading style
+    section_heading_style = ParagraphStyle(
+        'SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=11,
+        spaceAfter=4,
+        spaceBefore=8,
+        textColor=colors.HexColor('#dc2626'),  # Red headings
+        fontName='Helvetica-Bold'
+    )
+    
+    # EMAIL HEADER (project-specific)
+    story.append(Paragraph(f"Project Report: {project.name}", title_style))
+    story.append(Paragraph(f"Generated on {generated_time}", subtitle_style))
+    
+    # EMAIL GREETING
+    story.append(Paragraph(f"Dear {client_name},", greeting_style))
+    story.append(Spacer(1, 6))
+    
+    # DONUT CHART (centered, showing project task completion)
+    donut_chart = create_donut_chart(task_completion_rate)
+    story.append(donut_chart)
+    story.append(Spacer(1, 8))
+    
+    # EMAIL BODY TEXT (project-specific)
+    story.append(Paragraph(f"Please find the progress summary for your project '{project.name}' below.", body_style))
+    story.append(Spacer(1, 8))
+    
+    # PROJECT-SPECIFIC SUMMARY TABLE
+    project_status = getattr(project, 'get_status_display', lambda: getattr(project, 'status', 'Unknown'))()
+    
+    summary_data = [
+        ['Project Details', 'Information'],
+        ['Project Name', project.name or 'N/A'],
+        ['Current Status', project_status],
+        ['Total Tasks', str(max(0, total_tasks))],
+        ['Completed Tasks', str(max(0, completed_tasks))],
+        ['Task Completion Rate', f'{task_completion_rate:.1f}%']
+    ]
+    
+    summary_table = Table(summary_data, colWidths=[4.5*inch, 2*inch])
+    summary_table.setStyle(TableStyle([
+        # Header row (red theme)
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),  # Red header
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('ALIGN', (0, 0), (-1, 0), 'LEFT'),
+        
+        # Data rows (white background, black text)
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#000000')),  # Black text
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 1), (1, -1), 'CENTER'),
+        ('TOPPADDING', (0, 0), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('LEFTPADDING', (0, 0), (-1, -1), 12),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+        
+        # Grid lines (black)
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#000000'))
+    ]))
+    story.append(summary_table)
+    story.append(Spacer(1, 8))
+    
+    # PROJECT HIGHLIGHTS SECTION
+    story.append(Paragraph("Project Highlights", section_heading_style))
+    highlights_text = f"""• Your project '{project.name}' has completed {completed_tasks} out of {total_tasks} tasks ({task_completion_rate:.1f}% completion rate).<br/>
+• Current project status: {project_status}.<br/>
+• Team size: {team_size} member{'s' if team_size != 1 else ''} working on this project.<br/>
+• Recent activity: {recent_tasks} new tasks and {recent_subtasks} new subtasks in the last 30 days."""
+    story.append(Paragraph(highlights_text, body_style))
+    story.append(Spacer(1, 6))
+    
+    # PROJECT NEXT STEPS SECTION
+    story.append(Paragraph("Next Steps", section_heading_style))
+    next_steps_text = f"""• Continue monitoring progress on '{project.name}' to maintain momentum.<br/>
+• Reply with any specific priorities you'd like us to focus on for this project.<br/>
+• Schedule a project review if you'd like to discuss any adjustments or requirements."""
+    story.append(Paragraph(next_steps_text, body_style))
+    story.append(Spacer(1, 6))
+    
+    # EMAIL CLOSING
+    closing_text = """If you have any questions, simply reply to this email and our team will assist you.<br/><br/>
+Warm regards,<br/><br/>
+E-Click Project Management Team"""
+    story.append(Paragraph(closing_text, body_style))
+    story.append(Spacer(1, 8))
+    
+    # FOOTER BANNER (exactly like image)
+    footer_banner = Table([["WE CARE, WE CAN, WE DELIVER"]], colWidths=[6*inch])
+    footer_banner.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#dc2626')),  # Red background
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 12),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('TOPPADDING', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ]))
+    story.append(footer_banner)
+    
+    # Build PDF
+    doc.build(story)
+    return pdf_path
+
+def generate_project_specific_pdf_report(project_id, days_filter=30):
+    """
+    Generate a project-specific PDF report with the exact same design as the main reports page
+    This function creates a detailed report for one specific project using the same styling and structure
+    """
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.linecharts import HorizontalLineChart
+    from reportlab.graphics.charts.piecharts import Pie
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics import renderPDF
+    from io import BytesIO
+    from datetime import datetime
+    import tempfile
+    
+    # Get the project
+    project = get_object_or_404(Project, id=project_id)
+    
+    # Get enhanced project-specific data
+    total_tasks = project.tasks.count()
+    completed_tasks = project.tasks.filter(status='completed').count()
+    in_progress_tasks = project.tasks.filter(status='in_progress').count()
+    not_started_tasks = project.tasks.filter(status='not_started').count()
+    on_hold_tasks = project.tasks.filter(status='on_hold').count()
+    guidance_required_tasks = project.tasks.filter(status='in_progress_guidance_required').count()
+    
+    # Get priority distribution
+    high_priority_tasks = project.tasks.filter(priority='high').count()
+    urgent_tasks = project.tasks.filter(priority='urgent').count()
+    medium_priority_tasks = project.tasks.filter(priority='medium').count()
+    low_priority_tasks = project.tasks.filter(priority='low').count()
+    
+    # Get development status distribution
+    development_statuses = project.tasks.values('development_status').annotate(count=Count('id'))
+    
+    total_subtasks = SubTask.objects.filter(task__project=project).count()
+    completed_subtasks = SubTask.objects.filter(task__project=project, is_completed=True).count()
+    pending_subtasks = total_subtasks - completed_subtasks
+    
+    # Calculate completion rates
+    task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    subtask_completion_rate = (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
+    
+    # Get recent activity (last 30 days)
+    from django.utils import timezone
+    from django.db.models import Count
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days_filter)
+    
+    recent_tasks = project.tasks.filter(created_at__gte=start_date).count()
+    recent_subtasks = SubTask.objects.filter(task__project=project, created_at__gte=start_date).count()
+    recent_comments = sum(task.comments.filter(created_at__gte=start_date).count() for task in project.tasks.all())
+    
+    # Get team information
+    team_members = project.assigned_users.all()
+    team_size = team_members.count()
+    
+    # Calculate average task completion time
+    completed_tasks_with_dates = project.tasks.filter(status='completed', start_date__isnull=False, end_date__isnull=False)
+    avg_completion_days = 0
+    if completed_tasks_with_dates.exists():
+        completion_times = [(task.end_date - task.start_date).days for task in completed_tasks_with_dates]
+        avg_completion_days = sum(completion_times) / len(completion_times)
+    
+    # Calculate project timeline progress
+    timeline_progress = 0
+    days_remaining = 0
+    if project.start_date and project.end_date:
+        days_elapsed = (timezone.now().date() - project.start_date).days
+        total_days = (project.end_date - project.start_date).days
+        if total_days > 0:
+            timeline_progress = (days_elapsed / total_days) * 100
+            days_remaining = max(0, total_days - days_elapsed)
+    
+    # Create descriptive temporary file for PDF
+    import os, re
+    temp_dir = tempfile.gettempdir()
+    safe_project = re.sub(r'[^a-zA-Z0-9_-]+', '_', project.name).strip('_')[:40]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    descriptive_filename = f"E-Click_ProjectReport_{safe_project}_{timestamp}.pdf"
+    pdf_path = os.path.join(temp_dir, descriptive_filename)
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    story = []
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    
+    # Custom styles for professional report with red, black, white theme
+    title_style = ParagraphStyle(
+        'ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        spaceAfter=20,
+        alignment=1,  # Center alignment
+        textColor=colors.HexColor('#dc2626'),  # Red
+        fontName='Helvetica-Bold'
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'ReportSubtitle',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=15,
+        alignment=1,
+        textColor=colors.HexColor('#6b7280'),  # Gray
+        fontName='Helvetica'
+    )
+    
+    heading_style = ParagraphStyle(
+        'SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=8,
+        spaceBefore=15,
+        textColor=colors.HexColor('#1f2937'),  # Dark gray/black
+        fontName='Helvetica-Bold'
+    )
+    
+    normal_style = ParagraphStyle(
+        'BodyText',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=4,
+        fontName='Helvetica'
+    )
+    
+    insight_style = ParagraphStyle(
+        'InsightText',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        leftIndent=20,
+        fontName='Helvetica',
+        textColor=colors.HexColor('#374151')  # Dark gray
+    )
+    
+    # Company signature style
+    signature_style = ParagraphStyle(
+        'CompanySignature',
+        parent=styles['Normal'],
+        fontSize=16,
+        spaceAfter=0,
+        alignment=0,  # Left alignment
+        textColor=colors.HexColor('#dc2626'),  # Red
+        fontName='Helvetica-Bold'
+    )
+    
+    # Header with company signature (exact same structure as reports view)
+    # Add company signature in top left
+    story.append(Paragraph('E-Click', signature_style))
+    story.append(Spacer(1, 5))
+    
+    story.append(Paragraph(f'Project Report: {project.name}', title_style))
+    story.append(Paragraph(f'Client: {project.client} | {start_date.strftime("%B %d, %Y")} - {end_date.strftime("%B %d, %Y")}', subtitle_style))
+    story.append(Spacer(1, 15))
+    
+    # Professional contact header (if available)
+    try:
+        contact_lines = []
+        if getattr(project, 'client_username', None):
+            contact_lines.append(str(project.client_username))
+        if getattr(project, 'client_email', None):
+            contact_lines.append(str(project.client_email))
+        if getattr(project, 'client', None) and project.client not in contact_lines:
+            contact_lines.insert(0, str(project.client))
+        if contact_lines:
+            for line in contact_lines[:3]:
+                story.append(Paragraph(line, normal_style))
+            story.append(Spacer(1, 8))
+    except Exception:
+        pass
+
+    # Progress donut chart
+    try:
+        total_for_progress = max(1, total_tasks)
+        progress_pct = (completed_tasks / total_for_progress) * 100
+        drawing = Drawing(420, 220)
+        pie = Pie()
+        pie.x = 140
+        pie.y = 40
+        pie.width = 140
+        pie.height = 140
+        pie.data = [completed_tasks, max(0, total_tasks - completed_tasks)]
+        pie.labels = ['Completed', 'Remaining']
+        pie.slices[0].fillColor = colors.HexColor('#dc2626')
+        pie.slices[1].fillColor = colors.HexColor('#e5e7eb')
+        drawing.add(pie)
+        # Donut hole and percentage label
+        from reportlab.graphics.shapes import Circle, String
+        center_x, center_y = 210, 110
+        hole = Circle(center_x, center_y, 40, fillColor=colors.white, strokeColor=colors.white)
+        drawing.add(hole)
+        label = String(center_x, center_y - 4, f"{progress_pct:.1f}%", textAnchor='middle')
+        label.fontName = 'Helvetica-Bold'
+        label.fontSize = 16
+        drawing.add(label)
+        story.append(Paragraph('Overall Task Completion', heading_style))
+        story.append(drawing)
+        story.append(Spacer(1, 12))
+    except Exception:
+        pass
+    
+    # Executive Summary with Enhanced Insights
+    story.append(Paragraph('Executive Summary', heading_style))
+    
+    # Enhanced key insights
+    insights = []
+    insights.append(f"Project Performance: {task_completion_rate:.1f}% completion rate with {in_progress_tasks} active tasks")
+    insights.append(f"Task Efficiency: {task_completion_rate:.1f}% task completion with {completed_tasks} tasks delivered")
+    insights.append(f"SubTask Progress: {subtask_completion_rate:.1f}% subtask completion showing detailed execution")
+    insights.append(f"Timeline Status: {timeline_progress:.1f}% of project timeline elapsed ({days_remaining} days remaining)")
+    insights.append(f"Team Resources: {team_size} team members assigned to this project")
+    insights.append(f"Performance Metrics: Average task completion time is {avg_completion_days:.1f} days")
+    
+    # Priority insights
+    if urgent_tasks > 0:
+        insights.append(f"Priority Alert: {urgent_tasks} urgent tasks require immediate attention")
+    if high_priority_tasks > 0:
+        insights.append(f"High Priority: {high_priority_tasks} high-priority tasks in progress")
+    
+    # Status insights
+    if on_hold_tasks > 0:
+        insights.append(f"Status Alert: {on_hold_tasks} tasks are currently on hold")
+    if guidance_required_tasks > 0:
+        insights.append(f"Guidance Required: {guidance_required_tasks} tasks need additional guidance")
+    
+    # Recent activity insights
+    if recent_tasks > 0 or recent_subtasks > 0:
+        insights.append(f"Recent Activity: {recent_tasks} new tasks and {recent_subtasks} new subtasks in last 30 days")
+    
+    for insight in insights:
+        story.append(Paragraph(insight, insight_style))
+    
+    story.append(Spacer(1, 10))
+    
+    # Performance Analysis (exact same structure as reports view)
+    story.append(Paragraph('Performance Analysis', heading_style))
+    
+    # Create enhanced comprehensive analysis table
+    analysis_data = [
+        ['Metric', 'Current', 'Target', 'Performance', 'Trend'],
+        ['Task Completion', f"{task_completion_rate:.1f}%", '75%', 'Green' if task_completion_rate >= 75 else 'Yellow' if task_completion_rate >= 50 else 'Red', 'Up' if completed_tasks > in_progress_tasks else 'Stable'],
+        ['SubTask Completion', f"{subtask_completion_rate:.1f}%", '70%', 'Green' if subtask_completion_rate >= 70 else 'Yellow' if subtask_completion_rate >= 50 else 'Red', 'Up' if completed_subtasks > pending_subtasks else 'Stable'],
+        ['Timeline Progress', f"{timeline_progress:.1f}%", '80%', 'Green' if timeline_progress <= 80 else 'Yellow' if timeline_progress <= 100 else 'Red', 'Up' if timeline_progress > 50 else 'Stable'],
+        ['Project Status', project.get_status_display(), 'Completed', 'Green' if project.status == 'completed' else 'Yellow' if project.status == 'in_progress' else 'Red', 'Up' if project.status == 'in_progress' else 'Stable'],
+        ['Team Efficiency', f"{team_size} members", 'Optimal', 'Green' if team_size >= 2 else 'Yellow' if team_size == 1 else 'Red', 'Stable'],
+        ['Priority Management', f"{urgent_tasks} urgent", '0', 'Green' if urgent_tasks == 0 else 'Red', 'Down' if urgent_tasks > 0 else 'Stable'],
+        ['Task Velocity', f"{avg_completion_days:.1f} days", '5 days', 'Green' if avg_completion_days <= 5 else 'Yellow' if avg_completion_days <= 10 else 'Red', 'Up' if avg_completion_days < 7 else 'Stable']
+    ]
+    
+    analysis_table = Table(analysis_data, colWidths=[1.5*inch, 0.8*inch, 0.8*inch, 0.8*inch, 0.6*inch])
+    analysis_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),  # Red header
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),  # White background
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#000000')),  # Black text
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#000000')),  # Black grid lines
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.white]),  # All white rows
+    ]))
+    story.append(analysis_table)
+    story.append(Spacer(1, 15))
+    
+    # Action log table (Action / Date Completed)
+    try:
+        actions = [['Action', 'Date Completed']]
+        task_qs = project.tasks.all().order_by('end_date')
+        idx = 1
+        for t in task_qs:
+            action_name = f"{idx} {t.title}" if getattr(t, 'title', None) else f"{idx} Task"
+            date_text = t.end_date.strftime('%d/%m/%Y') if getattr(t, 'end_date', None) else '-'
+            actions.append([action_name, date_text])
+            idx += 1
+        if len(actions) > 1:
+            table = Table(actions, colWidths=[4.2*inch, 2.0*inch])
+            table.setStyle(TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#111827')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 10),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e5e7eb')),
+                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f9fafb')]),
+            ]))
+            story.append(table)
+            story.append(Spacer(1, 12))
+            story.append(Paragraph('WE CARE, WE CAN, WE DELIVER', subtitle_style))
+            story.append(Spacer(1, 10))
+    except Exception:
+        pass
+    
+    # Deep Dive Analysis (exact same structure as reports view)
+    story.append(Paragraph('Deep Dive Analysis', heading_style))
+    
+    # Project insights (exact same format as reports view)
+    project_insights = []
+    if completed_tasks > 0:
+        project_insights.append(f"Success Rate: {completed_tasks} tasks successfully completed")
+    if in_progress_tasks > completed_tasks:
+        project_insights.append(f"Pipeline Alert: {in_progress_tasks} tasks in progress - consider resource allocation")
+    if not_started_tasks > completed_tasks:
+        project_insights.append(f"Planning Strength: {not_started_tasks} tasks in planning phase")
+    
+    # Task insights (exact same format as reports view)
+    task_insights = []
+    if completed_tasks > in_progress_tasks:
+        task_insights.append(f"Task Velocity: High completion rate with {completed_tasks} tasks finished")
+    if not_started_tasks > completed_tasks:
+        task_insights.append(f"Task Backlog: {not_started_tasks} tasks pending - prioritize execution")
+    
+    # Timeline insights (exact same format as reports view)
+    timeline_insights = []
+    if timeline_progress > 100:
+        timeline_insights.append(f"Timeline Alert: Project has exceeded its planned timeline")
+    elif timeline_progress >= 80:
+        timeline_insights.append(f"Timeline Status: Project is approaching its deadline")
+    else:
+        timeline_insights.append(f"Timeline Status: {timeline_progress:.1f}% of timeline elapsed")
+    
+    # Combine all insights (exact same format as reports view)
+    all_insights = project_insights + task_insights + timeline_insights
+    for insight in all_insights:
+        story.append(Paragraph(insight, insight_style))
+    
+    story.append(Spacer(1, 15))
+    
+    # Project Details (exact same structure as reports view)
+    story.append(Paragraph('Project Details', heading_style))
+    
+    # Show enhanced project details with comprehensive metrics
+    project_data = [['Metric', 'Value', 'Status', 'Progress']]
+    
+    project_data.append([
+        'Project Name',
+        project.name[:30] + "..." if len(project.name) > 30 else project.name,
+        project.get_status_display(),
+        f"{task_completion_rate:.1f}%"
+    ])
+    
+    project_data.append([
+        'Client',
+        project.client[:25] + "..." if len(project.client) > 25 else project.client,
+        'Active',
+        f"{subtask_completion_rate:.1f}%"
+    ])
+    
+    project_data.append([
+        'Duration',
+        f"{(project.end_date - project.start_date).days + 1} days" if project.start_date and project.end_date else "Not set",
+        'Planned',
+        f"{timeline_progress:.1f}%"
+    ])
+    
+    project_data.append([
+        'Tasks',
+        f"{completed_tasks}/{total_tasks}",
+        'In Progress' if in_progress_tasks > 0 else 'Completed' if completed_tasks == total_tasks else 'Planning',
+        f"{(completed_tasks/total_tasks*100):.1f}%" if total_tasks > 0 else "0%"
+    ])
+    
+    project_data.append([
+        'Team Size',
+        f"{team_size} members",
+        'Optimal' if team_size >= 2 else 'Limited' if team_size == 1 else 'None',
+        f"{(team_size/3*100):.1f}%" if team_size > 0 else "0%"
+    ])
+    
+    project_data.append([
+        'Priority Tasks',
+        f"{urgent_tasks} urgent, {high_priority_tasks} high",
+        'Alert' if urgent_tasks > 0 else 'Good' if high_priority_tasks > 0 else 'Normal',
+        f"{(urgent_tasks + high_priority_tasks)/total_tasks*100:.1f}%" if total_tasks > 0 else "0%"
+    ])
+    
+    project_data.append([
+        'Recent Activity',
+        f"{recent_tasks} tasks, {recent_subtasks} subtasks",
+        'Active' if recent_tasks > 0 or recent_subtasks > 0 else 'Quiet',
+        f"{(recent_tasks + recent_subtasks)/max(1, total_tasks)*100:.1f}%"
+    ])
+    
+    project_data.append([
+        'Avg Completion',
+        f"{avg_completion_days:.1f} days",
+        'Fast' if avg_completion_days <= 5 else 'Normal' if avg_completion_days <= 10 else 'Slow',
+        f"{(5/avg_completion_days*100):.1f}%" if avg_completion_days > 0 else "0%"
+    ])
+    
+    project_table = Table(project_data, colWidths=[1.2*inch, 1.5*inch, 1*inch, 0.8*inch])
+    project_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),  # Red header
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 8),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),  # White background
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.HexColor('#000000')),  # Black text
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#000000')),  # Black grid lines
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 7),
+        ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+        ('ALIGN', (3, 1), (-1, -1), 'CENTER'),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.white]),  # All white rows
+    ]))
+    story.append(project_table)
+    story.append(Spacer(1, 15))
+    
+    # Strategic Recommendations (exact same structure as reports view)
+    # Priority and Development Status Analysis
+    story.append(Paragraph('Priority and Development Analysis', heading_style))
+    
+    # Priority distribution table
+    priority_data = [['Priority Level', 'Count', 'Percentage', 'Status']]
+    total_priority_tasks = urgent_tasks + high_priority_tasks + medium_priority_tasks + low_priority_tasks
+    
+    if urgent_tasks > 0:
+        priority_data.append(['Urgent', str(urgent_tasks), f"{(urgent_tasks/total_priority_tasks*100):.1f}%", 'Critical'])
+    if high_priority_tasks > 0:
+        priority_data.append(['High', str(high_priority_tasks), f"{(high_priority_tasks/total_priority_tasks*100):.1f}%", 'Important'])
+    if medium_priority_tasks > 0:
+        priority_data.append(['Medium', str(medium_priority_tasks), f"{(medium_priority_tasks/total_priority_tasks*100):.1f}%", 'Normal'])
+    if low_priority_tasks > 0:
+        priority_data.append(['Low', str(low_priority_tasks), f"{(low_priority_tasks/total_priority_tasks*100):.1f}%", 'Low'])
+    
+    if len(priority_data) > 1:
+        priority_table = Table(priority_data, colWidths=[1.2*inch, 0.8*inch, 1*inch, 1*inch])
+        priority_table.setStyle(TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f8fafc')),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 7),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.white]),  # All white rows
+        ]))
+        story.append(priority_table)
+        story.append(Spacer(1, 12))
+    
+    # Development status insights
+    if development_statuses:
+        story.append(Paragraph('Development Status Distribution:', heading_style))
+        for status in development_statuses:
+            status_name = status['development_status'].replace('_', ' ').title()
+            status_count = status['count']
+            story.append(Paragraph(f"• {status_name}: {status_count} tasks", insight_style))
+        story.append(Spacer(1, 12))
+    
+    story.append(Paragraph('Strategic Recommendations', heading_style))
+    
+    recommendations = []
+    
+    # Performance-based recommendations
+    if task_completion_rate < 50:
+        recommendations.append("Accelerate Task Completion: Focus on completing tasks in progress to improve overall completion rate")
+    if subtask_completion_rate < 50:
+        recommendations.append("SubTask Prioritization: Implement subtask prioritization framework to increase completion velocity")
+    if timeline_progress > 100:
+        recommendations.append("Timeline Management: Project has exceeded timeline - consider scope adjustment or resource allocation")
+    
+    # Priority-based recommendations
+    if urgent_tasks > 0:
+        recommendations.append("Urgent Task Resolution: Address urgent tasks immediately to prevent project delays")
+    if high_priority_tasks > 3:
+        recommendations.append("Priority Management: Consider reducing high-priority tasks to focus on critical deliverables")
+    
+    # Team-based recommendations
+    if team_size < 2:
+        recommendations.append("Team Expansion: Consider adding team members to improve project velocity")
+    if team_size > 5:
+        recommendations.append("Team Optimization: Large team size may impact coordination - consider team structure review")
+    
+    # Resource-based recommendations
+    if in_progress_tasks > completed_tasks * 2:
+        recommendations.append("Resource Optimization: Consider reallocating resources to balance task pipeline")
+    if not_started_tasks > completed_tasks:
+        recommendations.append("Task Management: Implement task initiation protocols to reduce backlog")
+    
+    # Status-based recommendations
+    if on_hold_tasks > 0:
+        recommendations.append("Task Unblocking: Review and resolve on-hold tasks to maintain project momentum")
+    if guidance_required_tasks > 0:
+        recommendations.append("Guidance Provision: Provide additional guidance for tasks requiring clarification")
+    
+    # Performance metrics recommendations
+    if avg_completion_days > 10:
+        recommendations.append("Process Optimization: Review task execution processes to reduce completion time")
+    if recent_activity['tasks'] == 0 and recent_activity['subtasks'] == 0:
+        recommendations.append("Activity Stimulation: Encourage team activity to maintain project momentum")
+    
+    # Positive reinforcement
+    if task_completion_rate >= 80:
+        recommendations.append("Maintain Excellence: Current performance is excellent - continue current practices")
+    if subtask_completion_rate >= 75:
+        recommendations.append("Sustain Momentum: SubTask completion rate is strong - maintain current workflow")
+    if avg_completion_days <= 5:
+        recommendations.append("Efficiency Recognition: Task completion speed is excellent - document best practices")
+    
+    # Status-based recommendations
+    if project.status == 'completed':
+        recommendations.append("Project Success: Project has been successfully completed - document lessons learned")
+    elif project.status == 'in_progress' and in_progress_tasks == 0:
+        recommendations.append("Project Activation: Start working on planned tasks to move project forward")
+    elif project.status == 'planned' and total_tasks == 0:
+        recommendations.append("Project Planning: Consider adding tasks to begin project execution")
+    
+    # Default recommendations if no specific ones
+    if not recommendations:
+        recommendations.append("Continuous Monitoring: Track key metrics regularly to identify improvement opportunities")
+        recommendations.append("Process Optimization: Review and optimize project management processes")
+        recommendations.append("Team Communication: Ensure regular team updates and status meetings")
+    
+    for rec in recommendations:
+        story.append(Paragraph(rec, insight_style))
+    
+    story.append(Spacer(1, 15))
+    
+    # Footer (exact same format as reports view)
+    story.append(Paragraph(f'Generated on {timezone.now().strftime("%B %d, %Y at %I:%M %p")} | E-Click Project Management', ParagraphStyle(
+        'Footer',
+        parent=styles['Normal'],
+        fontSize=8,
+        alignment=1,
+        textColor=colors.HexColor('#6b7280'),  # Gray
+        fontName='Helvetica'
+    )))
+    
+    # Charts Section
+    try:
+        # Status distribution pie chart
+        status_values = [not_started_tasks, in_progress_tasks, completed_tasks]
+        status_labels = ['Not Started', 'In Progress', 'Completed']
+        if sum(status_values) > 0:
+            drawing = Drawing(400, 220)
+            pie = Pie()
+            pie.x = 130
+            pie.y = 10
+            pie.width = 140
+            pie.height = 140
+            pie.data = status_values
+            pie.labels = [f"{label} ({val})" for label, val in zip(status_labels, status_values)]
+            pie.slices[0].fillColor = colors.HexColor('#9ca3af')
+            pie.slices[1].fillColor = colors.HexColor('#111827')
+            pie.slices[2].fillColor = colors.HexColor('#ef4444')
+            drawing.add(pie)
+            story.append(Paragraph('Status Distribution', heading_style))
+            story.append(drawing)
+            story.append(Spacer(1, 12))
+
+        # Task distribution bar chart
+        drawing = Drawing(400, 220)
+        bc = VerticalBarChart()
+        bc.x = 40
+        bc.y = 30
+        bc.height = 150
+        bc.width = 320
+        bc.data = [[completed_tasks, in_progress_tasks, not_started_tasks]]
+        bc.categoryAxis.categoryNames = ['Completed', 'In Progress', 'Not Started']
+        bc.bars[0].fillColor = colors.HexColor('#ef4444')
+        drawing.add(bc)
+        story.append(Paragraph('Task Distribution', heading_style))
+        story.append(drawing)
+        story.append(Spacer(1, 12))
+    except Exception:
+        pass
+
+    # Build PDF with header/footer on all pages
+    try:
+        doc.build(story, onFirstPage=draw_header_footer, onLaterPages=draw_header_footer)
+    except Exception as _e:
+        doc.build(story)
+    
+    return pdf_path
+
+def generate_comprehensive_project_pdf_report(project_id, days_filter=30):
+    """
+    Generate a comprehensive PDF report for a single project using the same format as client reports
+    This function creates a detailed report for one specific project using professional styling
+    """
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, ListFlowable, ListItem, KeepInFrame
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.linecharts import HorizontalLineChart
+    from reportlab.graphics.charts.piecharts import Pie
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics import renderPDF
+    from io import BytesIO
+    from datetime import datetime
+    import tempfile
+    
+    # Get the project and its tasks
+    project = get_object_or_404(Project, id=project_id)
+    project_tasks = project.tasks.all()
+    
+    # Get project-specific data
+    total_tasks = project_tasks.count()
+    completed_tasks = project_tasks.filter(status='completed').count()
+    in_progress_tasks = project_tasks.filter(status='in_progress').count()
+    not_started_tasks = project_tasks.filter(status='not_started').count()
+    on_hold_tasks = project_tasks.filter(status='on_hold').count()
+    
+    # Get subtasks for this project
+    project_subtasks = SubTask.objects.filter(task__project=project)
+    total_subtasks = project_subtasks.count()
+    completed_subtasks = project_subtasks.filter(is_completed=True).count()
+    pending_subtasks = total_subtasks - completed_subtasks
+    
+    # Calculate completion rates
+    task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    subtask_completion_rate = (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
+    
+    # Calculate timeline progress
+    timeline_progress = 0
+    if project.start_date and project.end_date:
+        from django.utils import timezone
+        end_date = timezone.now()
+        total_duration = (project.end_date - project.start_date).days
+        elapsed_duration = (end_date - project.start_date).days
+        if total_duration > 0:
+            timeline_progress = (elapsed_duration / total_duration) * 100
+    
+    # Get recent activity (last N days)
+    from django.utils import timezone
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days_filter)
+    
+    recent_tasks = project_tasks.filter(created_at__gte=start_date).count()
+    
+    # Create descriptive temporary file for PDF
+    import os, re
+    temp_dir = tempfile.gettempdir()
+    safe_project = re.sub(r'[^a-zA-Z0-9_-]+', '_', project.name).strip('_')[:40]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    descriptive_filename = f"E-Click_ProjectReport_{safe_project}_{timestamp}.pdf"
+    pdf_path = os.path.join(temp_dir, descriptive_filename)
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    story = []
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    
+    # Custom styles for professional report with red/white/black theme
+    title_style = ParagraphStyle(
+        'ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        spaceAfter=20,
+        alignment=1,  # Center alignment
+        textColor=colors.HexColor('#dc2626'),  # Red
+        fontName='Helvetica-Bold'
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'ReportSubtitle',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=15,
+        alignment=1,
+        textColor=colors.HexColor('#6b7280'),  # Gray
+        fontName='Helvetica'
+    )
+    
+    heading_style = ParagraphStyle(
+        'SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=8,
+        spaceBefore=15,
+        textColor=colors.HexColor('#1f2937'),  # Dark gray/black
+        fontName='Helvetica-Bold'
+    )
+    
+    normal_style = ParagraphStyle(
+        'NormalText',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        textColor=colors.HexColor('#374151'),  # Dark gray
+        fontName='Helvetica'
+    )
+    
+    # Build content for comprehensive project report
+    elements = []
+
+    # Title + Project Info
+    elements.append(Paragraph('E-Click', title_style))
+    elements.append(Paragraph(f'Project Report: {project.name}', subtitle_style))
+    elements.append(Spacer(1, 10))
+    
+    # Client and Date Range
+    client_info = f'Client: {project.client} | {start_date.strftime("%B %d, %Y")} - {end_date.strftime("%B %d, %Y")}'
+    elements.append(Paragraph(client_info, normal_style))
+    elements.append(Spacer(1, 6))
+    
+    # Client Details
+    elements.append(Paragraph(project.client, normal_style))
+    elements.append(Paragraph(project.client_email or 'No email', normal_style))
+    elements.append(Spacer(1, 12))
+    
+    # Overall Task Completion Section
+    elements.append(Paragraph('Overall Task Completion', heading_style))
+    elements.append(Spacer(1, 6))
+    
+    # Task completion donut chart
+    try:
+        drawing = Drawing(380, 180)
+        pie = Pie()
+        pie.x = 120
+        pie.y = 20
+        pie.width = 140
+        pie.height = 140
+        
+        # Create donut chart showing completed vs remaining
+        pie.data = [completed_tasks, total_tasks - completed_tasks]
+        pie.labels = ['', '']
+        pie.slices[0].fillColor = colors.HexColor('#dc2626')  # Red for completed
+        pie.slices[1].fillColor = colors.HexColor('#e5e7eb')  # Light gray for remaining
+        
+        pie.slices.strokeColor = colors.white
+        pie.slices.strokeWidth = 1
+        drawing.add(pie)
+        
+        # Add center circle for donut effect
+        from reportlab.graphics.shapes import Circle, String
+        cx, cy = 190, 90
+        ring = Circle(cx, cy, 48, fillColor=colors.white, strokeColor=colors.white)
+        drawing.add(ring)
+        
+        # Add percentage in center
+        pct_label = String(cx, cy - 4, f"{task_completion_rate:.1f}%", textAnchor='middle')
+        pct_label.fontName = 'Helvetica-Bold'
+        pct_label.fontSize = 18
+        pct_label.fillColor = colors.HexColor('#111827')
+        drawing.add(pct_label)
+        
+        elements.append(drawing)
+        elements.append(Spacer(1, 6))
+    except Exception:
+        pass
+    
+    # Task completion labels
+    elements.append(Paragraph('Completed', normal_style))
+    elements.append(Paragraph('Remaining', normal_style))
+    elements.append(Spacer(1, 12))
+    
+    # Executive Summary
+    elements.append(Paragraph('Executive Summary', heading_style))
+    elements.append(Spacer(1, 6))
+    
+    summary_items = [
+        f'Project Performance: {task_completion_rate:.1f}% completion rate with {in_progress_tasks} active tasks',
+        f'Task Efficiency: {task_completion_rate:.1f}% task completion with {completed_tasks} tasks delivered',
+        f'SubTask Progress: {subtask_completion_rate:.1f}% subtask completion showing detailed execution',
+        f'Timeline Status: {timeline_progress:.1f}% of project timeline elapsed'
+    ]
+    
+    for item in summary_items:
+        elements.append(Paragraph(f'• {item}', normal_style))
+        elements.append(Spacer(1, 3))
+    
+    elements.append(Spacer(1, 8))
+    
+    # Performance Analysis Table
+    elements.append(Paragraph('Performance Analysis', heading_style))
+    elements.append(Spacer(1, 6))
+    
+    performance_data = [
+        ['Metric', 'Current', 'Target', 'Performance', 'Trend'],
+        ['Task Completion', f'{task_completion_rate:.1f}%', '75%', 'Red' if task_completion_rate < 75 else 'Green', 'Up'],
+        ['SubTask Completion', f'{subtask_completion_rate:.1f}%', '70%', 'Red' if subtask_completion_rate < 70 else 'Green', 'Up'],
+        ['Timeline Progress', f'{timeline_progress:.1f}%', '80%', 'Red' if timeline_progress > 80 else 'Green', 'Up'],
+        ['Project Status', project.get_status_display(), 'Completed', 'Yellow' if project.status == 'in_progress' else 'Green', 'Up']
+    ]
+    
+    performance_table = Table(performance_data, colWidths=[doc.width * 0.25, doc.width * 0.2, doc.width * 0.2, doc.width * 0.2, doc.width * 0.15])
+    performance_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#111827')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.6, colors.HexColor('#e5e7eb')),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('LEADING', (0, 1), (-1, -1), 10),
+    ]))
+    elements.append(performance_table)
+    elements.append(Spacer(1, 12))
+    
+    # Action Items Table
+    elements.append(Paragraph('Action Items', heading_style))
+    elements.append(Spacer(1, 6))
+    
+    # Get all tasks for this project with completion dates
+    action_items = []
+    for i, task in enumerate(project_tasks.order_by('status', 'created_at'), 1):
+        if task.status == 'completed' and task.completed_at:
+            completion_date = task.completed_at.strftime('%d/%m/%Y')
+        else:
+            completion_date = 'Pending'
+        
+        action_items.append([str(i), task.name, completion_date])
+    
+    # Add header row
+    action_header = [['#', 'Action', 'Date Completed']]
+    action_data = action_header + action_items
+    
+    action_table = Table(action_data, colWidths=[doc.width * 0.1, doc.width * 0.7, doc.width * 0.2])
+    action_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#111827')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 9),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.6, colors.HexColor('#e5e7eb')),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('FONTSIZE', (0, 1), (-1, -1), 8),
+        ('LEADING', (0, 1), (-1, -1), 10),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ]))
+    elements.append(action_table)
+    
+    # Build the PDF
+    doc.build(elements)
+    return pdf_path
+
+def generate_client_specific_pdf_report(client_id, days_filter=30):
+    """
+    Generate a client-specific PDF report with comprehensive project and task data
+    This function creates a detailed report for one specific client using professional styling
+    """
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, ListFlowable, ListItem, KeepInFrame
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.graphics.shapes import Drawing, String
+    from reportlab.graphics.charts.linecharts import HorizontalLineChart
+    from reportlab.graphics.charts.piecharts import Pie
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    from reportlab.graphics import renderPDF
+    from io import BytesIO
+    from datetime import datetime
+    import tempfile
+    
+    # Get the client and their projects
+    client = get_object_or_404(Client, id=client_id)
+    client_projects = client_projects_for(client)
+    
+    # Get client-specific data
+    total_projects = client_projects.count()
+    completed_projects = client_projects.filter(status='completed').count()
+    in_progress_projects = client_projects.filter(status='in_progress').count()
+    planned_projects = client_projects.filter(status='planned').count()
+    
+    # Get all tasks for this client's projects
+    client_tasks = Task.objects.filter(project__in=client_projects)
+    total_tasks = client_tasks.count()
+    completed_tasks = client_tasks.filter(status='completed').count()
+    in_progress_tasks = client_tasks.filter(status='in_progress').count()
+    not_started_tasks = client_tasks.filter(status='not_started').count()
+    
+    # Get subtasks for this client's projects
+    client_subtasks = SubTask.objects.filter(task__project__in=client_projects)
+    total_subtasks = client_subtasks.count()
+    completed_subtasks = client_subtasks.filter(is_completed=True).count()
+    pending_subtasks = total_subtasks - completed_subtasks
+    
+    # Calculate completion rates
+    project_completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
+    task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    subtask_completion_rate = (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
+    
+    # Get recent activity (last 30 days)
+    from django.utils import timezone
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days_filter)
+    
+    recent_projects = client_projects.filter(created_at__gte=start_date).count()
+    recent_tasks = client_tasks.filter(created_at__gte=start_date).count()
+    
+    # Create descriptive temporary file for PDF
+    import os, re
+    temp_dir = tempfile.gettempdir()
+    safe_client = re.sub(r'[^a-zA-Z0-9_-]+', '_', (client.username or client.email or 'Client')).strip('_')[:40]
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M')
+    descriptive_filename = f"E-Click_ClientReport_{safe_client}_{timestamp}.pdf"
+    pdf_path = os.path.join(temp_dir, descriptive_filename)
+    
+    # Create PDF document
+    doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    story = []
+    
+    # Get styles
+    styles = getSampleStyleSheet()
+    
+    # Custom styles for professional report with red/white/black theme
+    title_style = ParagraphStyle(
+        'ReportTitle',
+        parent=styles['Heading1'],
+        fontSize=20,
+        spaceAfter=20,
+        alignment=1,  # Center alignment
+        textColor=colors.HexColor('#dc2626'),  # Red
+        fontName='Helvetica-Bold'
+    )
+    
+    subtitle_style = ParagraphStyle(
+        'ReportSubtitle',
+        parent=styles['Normal'],
+        fontSize=12,
+        spaceAfter=15,
+        alignment=1,
+        textColor=colors.HexColor('#6b7280'),  # Gray
+        fontName='Helvetica'
+    )
+    
+    heading_style = ParagraphStyle(
+        'SectionHeading',
+        parent=styles['Heading2'],
+        fontSize=14,
+        spaceAfter=8,
+        spaceBefore=15,
+        textColor=colors.HexColor('#1f2937'),  # Dark gray/black
+        fontName='Helvetica-Bold'
+    )
+    
+    normal_style = ParagraphStyle(
+        'NormalText',
+        parent=styles['Normal'],
+        fontSize=10,
+        spaceAfter=6,
+        textColor=colors.HexColor('#374151'),  # Dark gray
+        fontName='Helvetica'
+    )
+    
+    # Build content strictly matching the email and fit on one page
+    elements = []
+
+    # Title + generated date
+    elements.append(Paragraph('Your E-Click Client Progress Report', title_style))
+    elements.append(Paragraph(f'Generated on {timezone.now().strftime("%B %d, %Y at %I:%M %p")}', subtitle_style))
+    elements.append(Spacer(1, 6))
+
+    # Greeting
+    client_display = client.username or client.email or 'Client'
+    elements.append(Paragraph(f'Dear {client_display},', normal_style))
+    elements.append(Spacer(1, 6))
+
+    # Donut chart (refined styling)
+    try:
+        # Use project completion as the primary metric (matches user expectation)
+        completed_count = completed_projects if total_projects > 0 else completed_tasks
+        overall_total = total_projects if total_projects > 0 else total_tasks
+        overall_total = max(1, overall_total)
+        overall_pct = (completed_count / overall_total) * 100
+        drawing = Drawing(380, 180)
+        pie = Pie()
+        pie.x = 120
+        pie.y = 20
+        pie.width = 140
+        pie.height = 140
+        # If multiple projects exist, give each project its own colored slice
+        if total_projects > 1:
+            pie.data = [1] * total_projects
+            pie.labels = [''] * total_projects
+            # Color mapping: completed (red), in-progress (near black), planned (gray)
+            palette = [colors.HexColor('#dc2626'), colors.HexColor('#111827'), colors.HexColor('#9ca3af')]
+            for i in range(total_projects):
+                if i < completed_projects:
+                    pie.slices[i].fillColor = palette[0]
+                elif i < completed_projects + in_progress_projects:
+                    pie.slices[i].fillColor = palette[1]
+                else:
+                    pie.slices[i].fillColor = palette[2]
+        else:
+            # Fallback to completed vs remaining donut
+            pie.data = [max(0, completed_count), max(0, overall_total - completed_count)]
+            pie.labels = ['', '']
+            pie.slices[0].fillColor = colors.HexColor('#dc2626')
+            pie.slices[1].fillColor = colors.HexColor('#e5e7eb')
+        pie.slices.strokeColor = colors.white
+        pie.slices.strokeWidth = 1
+        drawing.add(pie)
+        from reportlab.graphics.shapes import Circle, String
+        cx, cy = 190, 90
+        ring = Circle(cx, cy, 48, fillColor=colors.white, strokeColor=colors.white)
+        drawing.add(ring)
+        pct_label = String(cx, cy - 4, f"{overall_pct:.1f}%", textAnchor='middle')
+        pct_label.fontName = 'Helvetica-Bold'
+        pct_label.fontSize = 18
+        pct_label.fillColor = colors.HexColor('#111827')
+        drawing.add(pct_label)
+        elements.append(drawing)
+        elements.append(Spacer(1, 6))
+    except Exception:
+        pass
+
+    # Intro line before summary
+    elements.append(Paragraph('Please find your summary below. A detailed, presentation-ready PDF is attached for your records.', normal_style))
+    elements.append(Spacer(1, 8))
+
+    # Summary table (Project Summary | Totals)
+    summary_data = [
+        ['Project Summary', 'Totals'],
+        ['Total Projects', str(total_projects)],
+        ['Completed Projects', str(completed_projects)],
+        ['Projects In Progress', str(in_progress_projects)],
+        ['Total Tasks', str(total_tasks)],
+        ['Completed Tasks', str(completed_tasks)],
+    ]
+    # Make the summary table wider and close to the content edges (even wider)
+    summary_table = Table(summary_data, colWidths=[doc.width * 0.7, doc.width * 0.3])
+    summary_table.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#111827')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.6, colors.HexColor('#e5e7eb')),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('LEADING', (0, 1), (-1, -1), 12),
+    ]))
+    elements.append(summary_table)
+    elements.append(Spacer(1, 8))
+
+    # Remove KPI cards to match request (cleaner look like the email)
+
+    # Highlights list
+    elements.append(Paragraph('Highlights', heading_style))
+    highlights = [
+        'Clear visibility of your portfolio progress and current workload.',
+        'Attached PDF includes detailed tables, charts, and next-step recommendations.',
+        "We'll continue to monitor and update you proactively.",
+    ]
+    elements.append(
+        ListFlowable(
+            [ListItem(Paragraph(h, normal_style)) for h in highlights],
+            bulletType='bullet',
+            leftIndent=12,
+            bulletIndent=6,
+            bulletFontName='Helvetica',
+            bulletFontSize=9,
+        )
+    )
+    elements.append(Spacer(1, 6))
+
+    # Next Steps list
+    elements.append(Paragraph('Next Steps', heading_style))
+    next_steps = [
+        'Review the attached PDF for full insights and project-level details.',
+        "Reply with any priorities you'd like us to fast-track this week.",
+        "Book a 15-minute review if you'd like us to walk you through the data.",
+    ]
+    elements.append(
+        ListFlowable(
+            [ListItem(Paragraph(n, normal_style)) for n in next_steps],
+            bulletType='bullet',
+            leftIndent=12,
+            bulletIndent=6,
+            bulletFontName='Helvetica',
+            bulletFontSize=9,
+        )
+    )
+    elements.append(Spacer(1, 8))
+
+    # Closing
+    elements.append(Paragraph('If you have any questions, simply reply to this email and our team will assist you.', normal_style))
+    elements.append(Paragraph('Warm regards,', normal_style))
+    elements.append(Paragraph('<b>E-Click Project Management Team</b>', normal_style))
+    elements.append(Spacer(1, 10))
+
+    # Footer banner with rounded corners via a custom Flowable
+    from reportlab.platypus import Flowable
+    class RoundedBanner(Flowable):
+        def __init__(self, width: float, height: float, text: str):
+            super().__init__()
+            self._width = width
+            self._height = height
+            self._text = text
+        def wrap(self, availWidth, availHeight):
+            self._width = min(self._width, availWidth)
+            return self._width, self._height
+        def draw(self):
+            radius = 6
+            self.canv.setFillColor(colors.HexColor('#111827'))
+            self.canv.setStrokeColor(colors.HexColor('#111827'))
+            try:
+                self.canv.roundRect(0, 0, self._width, self._height, radius, stroke=1, fill=1)
+            except Exception:
+                # Fallback to regular rectangle
+                self.canv.rect(0, 0, self._width, self._height, stroke=1, fill=1)
+            self.canv.setFillColor(colors.white)
+            self.canv.setFont('Helvetica', 10)
+            self.canv.drawString(12, (self._height - 10) / 2, self._text)
+    elements.append(RoundedBanner(doc.width, 26, 'WE CARE, WE CAN, WE DELIVER'))
+
+    # Fit all content into one page using KeepInFrame with shrink
+    # Fit to one page; use mode='shrink' for ReportLab versions without 'shrink' kw arg
+    try:
+        one_page = KeepInFrame(doc.width, doc.height - 20, elements, hAlign='LEFT', vAlign='TOP', mode='shrink')
+    except TypeError:
+        one_page = KeepInFrame(doc.width, doc.height - 20, elements, hAlign='LEFT', vAlign='TOP')
+    doc.build([one_page])
+    return pdf_path
+
+@login_required
+def send_report(request):
+    if not request.user.is_superuser:
+        messages.error(request, 'Access denied. Admin privileges required.')
+        return redirect('login')
+    
+    # Log navigation to send report page
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='Send Report',
+        page_url=request.path,
+        request=request
+    )
+    
+    from django.db.models import Count, Q
+    from datetime import datetime, timedelta
+    # from .services import GoogleCloudEmailService
+    import json
+    
+    if request.method == 'POST':
+        # Get form data, several recipients may be separated by commas or semicolons
+        recipient_email = request.POST.get('recipient_email', '')
+        recipients = [email.strip() for email in recipient_email.replace(';', ',').split(',') if email.strip()]
+        recipient_email = ', '.join(recipients)
+        date_range = request.POST.get('date_range', '30')
+        custom_message = request.POST.get('custom_message', '')
+        
+        # Validate required fields
+        if not recipient_email:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': 'Recipient email is required.'})
+            else:
+                messages.error(request, 'Recipient email is required.')
+                return redirect('send_report')
+        
+        try:
+            date_range = int(date_range)
+        except ValueError:
+            date_range = 30
+        
+        end_date = timezone.now()
+        start_date = end_date - timedelta(days=date_range)
+        
+        # Generate report data (same as reports view)
+        total_projects = Project.objects.count()
+        projects_in_progress = Project.objects.filter(status='in_progress').count()
+        projects_completed = Project.objects.filter(status='completed').count()
+        projects_planned = Project.objects.filter(status='planned').count()
+        
+        total_tasks = Task.objects.count()
+        completed_tasks = Task.objects.filter(status='completed').count()
+        in_progress_tasks = Task.objects.filter(status='in_progress').count()
+        not_started_tasks = Task.objects.filter(status='not_started').count()
+        
+        total_subtasks = SubTask.objects.count()
+        completed_subtasks = SubTask.objects.filter(is_completed=True).count()
+        
+        total_users = User.objects.count()
+        active_users = User.objects.filter(last_login__gte=start_date).count()
+        
+        # Calculate rates
+        project_completion_rate = (projects_completed / total_projects * 100) if total_projects > 0 else 0
+        task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        user_engagement_rate = (active_users / total_users * 100) if total_users > 0 else 0
+        
+        # Prepare report data for email service
+        report_data = {
+            'total_projects': total_projects,
+            'projects_completed': projects_completed,
+            'projects_in_progress': projects_in_progress,
+            'projects_planned': projects_planned,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'in_progress_tasks': in_progress_tasks,
+            'not_started_tasks': not_started_tasks,
+            'total_subtasks': total_subtasks,
+            'completed_subtasks': completed_subtasks,
+            'total_users': total_users,
+            'active_users': active_users,
+            'project_completion_rate': project_completion_rate,
+            'task_completion_rate': task_completion_rate,
+            'user_engagement_rate': user_engagement_rate,
+            'date_range': f"{start_date.strftime('%B %d')} to {end_date.strftime('%B %d, %Y')}",
+            'generated_date': timezone.now().strftime("%B %d, %Y at %I:%M %p"),
+            'days_filter': date_range,  # Pass the days filter to use the exact same date range
+        }
+        
+        try:
+            logger.info(f"Sending comprehensive PDF report to: {recipient_email}")
+            logger.info(f"Date range: {date_range} days")
+            logger.info(f"Custom message: {custom_message}")
+
+            # Send email with PDF attachment using SimpleEmailService
+            from ..email_service import SimpleEmailService
+            email_service = SimpleEmailService()
+
+            # Generates the PDF once and sends each recipient their own copy
+            result = email_service.send_report_email(
+                to_email=recipients,
+                report_data=report_data,
+                custom_message=custom_message
+            )
+
+            logger.info(f"Email service result: {result}")
+            
+            # Log the result for debugging
+            if result['success']:
+                print(f"Report sent successfully to {recipient_email}")
+            else:
+                print(f"Failed to send report: {result.get('error', 'Unknown error')}")
+            
+            if result['success']:
+                # Track the sent report
+                from ..models import SentReport
+                for recipient in recipients:
+                    SentReport.log_report_sent(
+                        report_type='general',
+                        sent_by=request.user,
+                        recipient_email=recipient,
+                        report_title=f'General Report - {date_range} Days',
+                        report_data=report_data,
+                        custom_message=custom_message
+                    )
+                
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': True, 'message': f'Report sent successfully to {recipient_email}'})
+                else:
+                    messages.success(request, f'Report sent successfully to {recipient_email}')
+            else:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': result.get("error", "Unknown error")})
+                else:
+                    messages.error(request, f'Error sending report: {result.get("error", "Unknown error")}')
+            
+            return redirect('send_report')
+            
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': str(e)})
+            else:
+                messages.error(request, f'Error sending report: {str(e)}')
+                return redirect('send_report')
+    
+    # GET request - show the form
+    return render(request, 'home/send_report.html')
+
+@login_required
+def send_complete_report(request):
+    """Send complete report page with report history"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    # Log navigation to send complete report page
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='Send Complete Report',
+        page_url=request.path,
+        request=request
+    )
+    
+    # Get recent sent reports
+    from ..models import SentReport
+    sent_reports = SentReport.objects.all()[:10]  # Get last 10 reports
+    
+    context = {
+        'sent_reports': sent_reports,
+    }
+    
+    return render(request, 'home/send_complete_report.html', context)
+
+
+
+@login_required
+def send_project_report(request, project_id):
+    """
+    Send a project-specific report to the client email associated with the project
+    """
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    # Log navigation to send project report page
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='Send Project Report',
+        page_url=request.path,
+        request=request
+    )
+    
+    # from .services import GoogleCloudEmailService
+    from django.utils import timezone
+    
+    # Get the project
+    project = get_object_or_404(Project, id=project_id)
+    
+    if request.method == 'POST':
+        # Get form data
+        custom_message = request.POST.get('custom_message', '')
+        date_range = request.POST.get('date_range', '30')
+        
+        try:
+            date_range = int(date_range)
+        except ValueError:
+            date_range = 30
+        
+        # Check if project has a client email
+        if not project.client_email:
+            messages.error(request, f'Project "{project.name}" does not have a client email associated with it.')
+            return redirect('projects_page')
+        
+        # Generate comprehensive report data (same format as client report)
+        total_tasks = project.tasks.count()
+        completed_tasks = project.tasks.filter(status='completed').count()
+        in_progress_tasks = project.tasks.filter(status='in_progress').count()
+        not_started_tasks = project.tasks.filter(status='not_started').count()
+        on_hold_tasks = project.tasks.filter(status='on_hold').count()
+        
+        total_subtasks = SubTask.objects.filter(task__project=project).count()
+        completed_subtasks = SubTask.objects.filter(task__project=project, is_completed=True).count()
+        
+        # Calculate rates
+        task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+        subtask_completion_rate = (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
+        
+        # Get date range
+        end_date = timezone.now()
+        start_date = end_date - timedelta(days=date_range)
+        
+        # Calculate timeline progress
+        timeline_progress = 0
+        if project.start_date and project.end_date:
+            total_duration = (project.end_date - project.start_date).days
+            elapsed_duration = (end_date.date() - project.start_date).days
+            if total_duration > 0:
+                timeline_progress = (elapsed_duration / total_duration) * 100
+        
+        # Prepare comprehensive report data
+        report_data = {
+            'project_id': project_id,
+            'project_name': project.name,
+            'client_name': project.client,
+            'client_email': project.client_email,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'in_progress_tasks': in_progress_tasks,
+            'not_started_tasks': not_started_tasks,
+            'on_hold_tasks': on_hold_tasks,
+            'total_subtasks': total_subtasks,
+            'completed_subtasks': completed_subtasks,
+            'task_completion_rate': task_completion_rate,
+            'subtask_completion_rate': subtask_completion_rate,
+            'project_status': project.get_status_display(),
+            'project_duration': f"{(project.end_date - project.start_date).days + 1} days" if project.start_date and project.end_date else "Not set",
+            'date_range': f"{start_date.strftime('%B %d')} to {end_date.strftime('%B %d, %Y')}",
+            'generated_date': timezone.now().strftime("%B %d, %Y at %I:%M %p"),
+            'days_filter': date_range,
+            'timeline_progress': timeline_progress,
+        }
+        
+        try:
+            # Generate comprehensive client report for ALL projects of this client
+            # Find the client associated with this project using client_username
+            client = None
+            if project.client_username:
+                client = Client.objects.filter(username=project.client_username).first()
+                print(f"Found client by client_username: {project.client_username} -> {client}")
+            elif project.client:
+                # Fallback: try to find client by the client name field
+                client = Client.objects.filter(username=project.client).first()
+                print(f"Found client by client field: {project.client} -> {client}")
+            else:
+                print(f"No client found. project.client_username: '{project.client_username}', project.client: '{project.client}'")
+            
+            if client:
+                # Generate comprehensive client report using the same function
+                pdf_path = generate_client_specific_pdf_report(client.id, date_range)
+                
+                # Send comprehensive client report email using SimpleEmailService with Microsoft SMTP
+                from ..email_service import SimpleEmailService
+                email_service = SimpleEmailService()
+                result = email_service.send_email(
+                    to_email=project.client_email,
+                    subject=f"E-Click Comprehensive Client Report: {project.client}",
+                    body=f"""
+                    Dear {project.client},
+
+                    {custom_message if custom_message else 'Please find attached your comprehensive client report covering all your projects for the recent period.'}
+
+                    This report includes:
+                    • All your projects and their current status
+                    • Complete task breakdown across all projects
+                    • Performance metrics and completion rates
+                    • Timeline analysis and progress tracking
+                    • Date Range: {report_data['date_range']}
+
+                    Best regards,
+                    E-Click Project Management Team
+                    """,
+                    from_email=None,  # Will use default from settings
+                    attachments=[pdf_path]
+                )
+            else:
+                # Fallback to project-specific report if client not found
+                pdf_path = generate_comprehensive_project_pdf_report(project_id, date_range)
+                
+                # Send project report email using SimpleEmailService with Microsoft SMTP
+                from ..email_service import SimpleEmailService
+                email_service = SimpleEmailService()
+                result = email_service.send_email(
+                    to_email=project.client_email,
+                    subject=f"E-Click Project Report: {project.name}",
+                    body=f"""
+                    Dear {project.client},
+
+                    {custom_message if custom_message else 'Please find attached your comprehensive project report covering the recent period.'}
+
+                    Project Summary:
+                    • Project Name: {project.name}
+                    • Project Status: {project.get_status_display()}
+                    • Total Tasks: {total_tasks}
+                    • Completed Tasks: {completed_tasks}
+                    • Tasks In Progress: {in_progress_tasks}
+                    • Task Completion Rate: {task_completion_rate:.1f}%
+                    • SubTask Completion Rate: {subtask_completion_rate:.1f}%
+                    • Date Range: {report_data['date_range']}
+
+                    Best regards,
+                    E-Click Project Management Team
+                    """,
+                    from_email=None,  # Will use default from settings
+                    attachments=[pdf_path]
+                )
+            
+            # Cleanup temporary PDF
+            try:
+                import os
+                if pdf_path and os.path.exists(pdf_path):
+                    os.unlink(pdf_path)
+            except Exception:
+                pass
+            
+            # Handle email service result
+            if result['success']:
+                if client:
+                    messages.success(request, f'Comprehensive client report for {project.client} sent successfully to {project.client_email}')
+                else:
+                    messages.success(request, f'Comprehensive project report sent successfully to {project.client_email}')
+            else:
+                if client:
+                    messages.error(request, f'Error sending client report: {result.get("error", "Unknown error")}')
+                else:
+                    messages.error(request, f'Error sending project report: {result.get("error", "Unknown error")}')
+            
+            return redirect('projects_page')
+            
+        except Exception as e:
+            messages.error(request, f'Error sending project report: {str(e)}')
+            return redirect('projects_page')
+    
+    # GET request - show the form
+    # Calculate client-wide statistics for the comprehensive report
+    client = None
+    if project.client_username:
+        client = Client.objects.filter(username=project.client_username).first()
+    elif project.client:
+        # Fallback: try to find client by the client name field
+        client = Client.objects.filter(username=project.client).first()
+    
+    if client:
+        # Get all projects for this client
+        client_projects = client_projects_for(client)
+        total_projects = client_projects.count()
+        completed_projects = client_projects.filter(status='completed').count()
+        in_progress_projects = client_projects.filter(status='in_progress').count()
+        planned_projects = client_projects.filter(status='planned').count()
+        
+        # Get all tasks for this client's projects
+        client_tasks = Task.objects.filter(project__in=client_projects)
+        total_tasks = client_tasks.count()
+        completed_tasks = client_tasks.filter(status='completed').count()
+        in_progress_tasks = client_tasks.filter(status='in_progress').count()
+        
+        context = {
+            'project': project,
+            'client': client,
+            'completed_projects': completed_projects,
+            'in_progress_projects': in_progress_projects,
+            'planned_projects': planned_projects,
+            'total_projects': total_projects,
+            'completed_tasks': completed_tasks,
+            'in_progress_tasks': in_progress_tasks,
+            'total_tasks': total_tasks,
+        }
+    else:
+        # Fallback to project-specific data if client not found
+        total_tasks = project.tasks.count()
+        completed_tasks = project.tasks.filter(status='completed').count()
+        in_progress_tasks = project.tasks.filter(status='in_progress').count()
+        not_started_tasks = project.tasks.filter(status='not_started').count()
+        on_hold_tasks = project.tasks.filter(status='on_hold').count()
+        
+        context = {
+            'project': project,
+            'completed_tasks': completed_tasks,
+            'in_progress_tasks': in_progress_tasks,
+            'not_started_tasks': not_started_tasks,
+            'on_hold_tasks': on_hold_tasks,
+            'total_tasks': total_tasks,
+        }
+    
+    return render(request, 'home/send_project_report.html', context)
+
+@login_required
+def send_client_report(request):
+    """Send a comprehensive report for a specific client with all their projects"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    # Log navigation to send client report page
+    SystemLog.log_navigation(
+        user=request.user,
+        page_name='Send Client Report',
+        page_url=request.path,
+        request=request
+    )
+    
+    # from .services import GoogleCloudEmailService
+    from django.utils import timezone
+    
+    if request.method == 'POST':
+        try:
+            client_id = request.POST.get('client_id')
+            client_email = request.POST.get('client_email')
+            client_username = request.POST.get('client_username')
+            
+            if not client_id or not client_email:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': 'Missing client information.'})
+                else:
+                    messages.error(request, 'Missing client information.')
+                    return redirect('reports')
+            
+            # Get the client and their projects
+            try:
+                client = get_object_or_404(Client, id=client_id)
+                # Served from the client's snapshot unless one of their projects changed
+                from ..report_snapshots import get_client_snapshot
+                snapshot, _ = get_client_snapshot(client)
+
+                if not snapshot['total_projects']:
+                    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                        return JsonResponse({'success': False, 'error': f'No projects found for client {client.username}.'})
+                    else:
+                        messages.warning(request, f'No projects found for client {client.username}.')
+                        return redirect('reports')
+            except Exception as e:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': f'Client not found: {str(e)}'})
+                else:
+                    messages.error(request, f'Client not found: {str(e)}')
+                    return redirect('reports')
+            
+            # Calculate client statistics
+            total_projects = snapshot['total_projects']
+            completed_projects = snapshot['completed_projects']
+            in_progress_projects = snapshot['active_projects']
+            planned_projects = snapshot['planned_projects']
+            total_tasks = snapshot['total_tasks']
+            completed_tasks = snapshot['completed_tasks']
+            in_progress_tasks = snapshot['in_progress_tasks']
+            
+            # Calculate completion rates
+            project_completion_rate = (completed_projects / total_projects * 100) if total_projects > 0 else 0
+            task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+            
+            # Prepare report data
+            report_data = {
+                'client_id': client_id,
+                'client_name': client_username,
+                'client_email': client_email,
+                'total_projects': total_projects,
+                'completed_projects': completed_projects,
+                'in_progress_projects': in_progress_projects,
+                'planned_projects': planned_projects,
+                'total_tasks': total_tasks,
+                'completed_tasks': completed_tasks,
+                'in_progress_tasks': in_progress_tasks,
+                'project_completion_rate': project_completion_rate,
+                'task_completion_rate': task_completion_rate,
+                'generated_date': timezone.now().strftime("%B %d, %Y at %I:%M %p"),
+                'projects': [
+                    {
+                        'id': project['id'],
+                        'name': project['name'],
+                        'status': project['status'],
+                        'start_date': project['start_date'].isoformat() if project['start_date'] else None,
+                        'end_date': project['end_date'].isoformat() if project['end_date'] else None,
+                        'created_at': project['created_at'].isoformat() if project['created_at'] else None
+                    }
+                    for project in snapshot['projects']
+                ]
+            }
+
+            print(f"Sending client report to: {client_email}")
+
+            # Generate matplotlib donut chart
+            from ..chart_utils import generate_donut_chart
+            from email.mime.image import MIMEImage
+            from django.core.mail import EmailMultiAlternatives
+            from django.conf import settings
+            import os
+
+            chart_buffer = generate_donut_chart(report_data['task_completion_rate'])
+
+            # Load E-Click logo
+            logo_path = os.path.join(settings.BASE_DIR, 'static', 'images', 'E Click Logo (1).png')
+            with open(logo_path, 'rb') as f:
+                logo_data = f.read()
+
+            # Build polished HTML email body for client with inline chart
+            email_body = f"""
+<html>
+  <body style="margin:0;padding:0;background:#f8fafc;font-family:Segoe UI, Roboto, Helvetica, Arial, sans-serif;color:#111827;">
+    <div style="max-width:720px;margin:0 auto;padding:24px;">
+      <div style="background:#ffffff;border:1px solid #e5e7eb;border-radius:12px;overflow:hidden;">
+        <div style="padding:24px 24px 8px 24px;border-bottom:1px solid #f3f4f6;position:relative;">
+          <div style="display:flex;align-items:center;position:relative;">
+            <img src="cid:eclick_logo" alt="E-Click Logo" style="max-width:60px;height:auto;margin-right:15px;"/>
+            <div style="flex:1;">
+              <h1 style="margin:0 0 6px 0;font-size:22px;color:#dc2626;">Your E-Click Client Progress Report</h1>
+              <p style="margin:0;color:#6b7280;font-size:13px;">Generated on {report_data['generated_date']}</p>
+            </div>
+          </div>
+        </div>
+        <div style="padding:24px;">
+          <p style="margin:0 0 12px 0;color:#000000;font-weight:bold;">Dear {client_username},</p>
+
+          <!-- DONUT CHART - Matplotlib generated inline image -->
+          <div style="text-align:center;margin:30px 0;">
+            <img src="cid:progress_chart" alt="Progress Chart" style="max-width:400px;height:auto;"/>
+          </div>
+
+          <!-- Legend -->
+          <div style="text-align:center;margin:20px 0;">
+            <span style="display:inline-block;margin:0 15px;">
+              <span style="display:inline-block;width:15px;height:15px;background:#dc2626;border-radius:50%;vertical-align:middle;"></span>
+              <span style="margin-left:5px;color:#000000;">Completed: {report_data['task_completion_rate']:.1f}%</span>
+            </span>
+            <span style="display:inline-block;margin:0 15px;">
+              <span style="display:inline-block;width:15px;height:15px;background:#e5e7eb;border-radius:50%;vertical-align:middle;border:1px solid #ccc;"></span>
+              <span style="margin-left:5px;color:#000000;">Remaining: {100 - report_data['task_completion_rate']:.1f}%</span>
+            </span>
+          </div>
+          
+          <p style="margin:0 0 16px 0;color:#000000;">Please find your summary below. A detailed, presentation-ready PDF is attached for your records.</p>
+
+          <table role="presentation" cellspacing="0" cellpadding="0" style="width:100%;border-collapse:collapse;margin:0 0 16px 0;">
+            <tr>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#2d3748;color:#ffffff;font-weight:600;width:60%;">Project Summary</td>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#2d3748;color:#ffffff;font-weight:600;width:40%;">Totals</td>
+            </tr>
+            <tr>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">Total Projects</td>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">{report_data['total_projects']}</td>
+            </tr>
+            <tr>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">Completed Projects</td>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">{report_data['completed_projects']}</td>
+            </tr>
+            <tr>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">Projects In Progress</td>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">{report_data['in_progress_projects']}</td>
+            </tr>
+            <tr>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">Total Tasks</td>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">{report_data['total_tasks']}</td>
+            </tr>
+            <tr>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">Completed Tasks</td>
+              <td style="padding:10px 12px;border:1px solid #000000;background:#ffffff;color:#000000;">{report_data['completed_tasks']}</td>
+            </tr>
+          </table>
+
+          <div style="display:flex;gap:12px;flex-wrap:wrap;margin:8px 0 16px 0;">
+            <div style="flex:1;min-width:240px;background:#ffffff;border:1px solid #000000;border-radius:10px;padding:12px;">
+              <div style="font-size:12px;color:#000000;margin-bottom:6px;">Project Completion Rate</div>
+              <div style="font-size:18px;font-weight:700;color:#000000;">{report_data['project_completion_rate']:.1f}%</div>
+            </div>
+            <div style="flex:1;min-width:240px;background:#ffffff;border:1px solid #000000;border-radius:10px;padding:12px;">
+              <div style="font-size:12px;color:#000000;margin-bottom:6px;">Task Completion Rate</div>
+              <div style="font-size:18px;font-weight:700;color:#000000;">{report_data['task_completion_rate']:.1f}%</div>
+            </div>
+          </div>
+
+          <h3 style="margin:18px 0 8px 0;color:#dc2626;font-size:16px;">Highlights</h3>
+          <ul style="margin:0 0 16px 20px;color:#000000;">
+            <li>Clear visibility of your portfolio progress and current workload.</li>
+            <li>Attached PDF includes detailed tables, charts, and next-step recommendations.</li>
+            <li>We'll continue to monitor and update you proactively.</li>
+          </ul>
+
+          <h3 style="margin:18px 0 8px 0;color:#dc2626;font-size:16px;">Next Steps</h3>
+          <ul style="margin:0 0 16px 20px;color:#000000;">
+            <li>Review the attached PDF for full insights and project-level details.</li>
+            <li>Reply with any priorities you'd like us to fast-track this week.</li>
+            <li>Book a 15-minute review if you'd like us to walk you through the data.</li>
+          </ul>
+
+          <p style="margin:0 0 18px 0;color:#000000;">If you have any questions, simply reply to this email and our team will assist you.</p>
+          <p style="margin:0;color:#000000;">Warm regards,<br/><strong>E-Click Project Management Team</strong></p>
+        </div>
+        <div style="padding:14px 24px;background:#2d3748;color:#ffffff;text-align:center;font-size:12px;">
+          WE CARE, WE CAN, WE DELIVER
+        </div>
+      </div>
+    </div>
+  </body>
+</html>
+            """
+
+            # Generate client-specific PDF and attach it
+            pdf_path = generate_client_specific_pdf_report(client_id)
+
+            # Create email with HTML and attachments
+            email = EmailMultiAlternatives(
+                subject=f"Client Report - {client_username} - E-Click",
+                body='Please view this email in HTML mode.',
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[client_email]
+            )
+            email.attach_alternative(email_body, "text/html")
+
+            # Attach E-Click logo as inline image
+            logo_img = MIMEImage(logo_data, 'png')
+            logo_img.add_header('Content-ID', '<eclick_logo>')
+            logo_img.add_header('Content-Disposition', 'inline', filename='eclick_logo.png')
+            email.attach(logo_img)
+
+            # Attach progress chart as inline image
+            chart_img = MIMEImage(chart_buffer.read(), 'png')
+            chart_img.add_header('Content-ID', '<progress_chart>')
+            chart_img.add_header('Content-Disposition', 'inline', filename='progress_chart.png')
+            email.attach(chart_img)
+
+            # Attach PDF report
+            if pdf_path:
+                email.attach_file(pdf_path)
+
+            try:
+                email.send()
+                result = {'success': True, 'message': 'Email sent successfully'}
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+
+            # Cleanup temporary PDF
+            try:
+                import os
+                if pdf_path and os.path.exists(pdf_path):
+                    os.unlink(pdf_path)
+            except Exception:
+                pass
+            print(f"Client email service result: {result}")
+            
+            # Handle email service result
+            if result['success']:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': True, 'message': f'Client report sent successfully to {client_email}'})
+                else:
+                    messages.success(request, f'Client report sent successfully to {client_email}')
+            else:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': result.get("error", "Unknown error")})
+                else:
+                    messages.error(request, f'Error sending client report: {result.get("error", "Unknown error")}')
+            
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': str(e)})
+            else:
+                messages.error(request, f'Error sending client report: {str(e)}')
+    
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'})
+    else:
+        return redirect('reports')
+
+@login_required
+def download_report(request):
+    """
+    Download a PDF report directly to the user's computer
+    """
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    if request.method == 'POST':
+        # Get form data
+        date_range = request.POST.get('date_range', '30')
+        
+        try:
+            date_range = int(date_range)
+        except ValueError:
+            date_range = 30
+        
+        try:
+            # Generate PDF report
+            pdf_file = generate_exact_pdf_report(days_filter=date_range)
+            
+            # Read the PDF file
+            with open(pdf_file, 'rb') as f:
+                pdf_content = f.read()
+            
+            # Clean up the temporary file
+            try:
+                os.unlink(pdf_file)
+            except:
+                pass
+            
+            # Create response with PDF content
+            from django.http import HttpResponse
+            from datetime import datetime
+            response = HttpResponse(pdf_content, content_type='application/pdf')
+            response['Content-Disposition'] = f'attachment; filename="E-Click_Report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf"'
+            
+            return response
+            
+        except Exception as e:
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': f'Error generating PDF: {str(e)}'})
+            else:
+                messages.error(request, f'Error generating PDF: {str(e)}')
+                return redirect('reports')
+    
+    # If not POST, redirect to reports page
+    return redirect('reports')
+
+@login_required
+def send_project_report_ajax(request):
+    """Send a comprehensive project-specific report via AJAX POST request"""
+    if not request.user.is_staff:
+        messages.error(request, 'Access denied. Staff privileges required.')
+        return redirect('login')
+    
+    # from .services import GoogleCloudEmailService
+    from django.utils import timezone
+    from django.db.models import Q, Count, Avg
+    from datetime import timedelta
+    from django.conf import settings
+
+    if request.method == 'POST':
+        try:
+            project_id = request.POST.get('project_id')
+            client_email = request.POST.get('client_email')
+            client_username = request.POST.get('client_username')
+            
+            if not project_id or not client_email:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': 'Missing project information.'})
+                else:
+                    messages.error(request, 'Missing project information.')
+                    return redirect('reports')
+            
+            # Get the project with related data
+            try:
+                project = Project.objects.select_related().prefetch_related(
+                    'tasks__subtasks',
+                    'tasks__assigned_users',
+                    'tasks__comments',
+                    'assigned_users'
+                ).get(id=project_id)
+                
+                if not project:
+                    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                        return JsonResponse({'success': False, 'error': f'Project not found.'})
+                    else:
+                        messages.warning(request, f'Project not found.')
+                        return redirect('reports')
+            except Exception as e:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': f'Project not found: {str(e)}'})
+                else:
+                    messages.error(request, f'Project not found: {str(e)}')
+                    return redirect('reports')
+            
+            # Enhanced project data collection
+            total_tasks = project.tasks.count()
+            completed_tasks = project.tasks.filter(status='completed').count()
+            in_progress_tasks = project.tasks.filter(status='in_progress').count()
+            not_started_tasks = project.tasks.filter(status='not_started').count()
+            on_hold_tasks = project.tasks.filter(status='on_hold').count()
+            guidance_required_tasks = project.tasks.filter(status='in_progress_guidance_required').count()
+            
+            # Get detailed subtask information
+            project_subtasks = SubTask.objects.filter(task__project=project)
+            total_subtasks = project_subtasks.count()
+            completed_subtasks = project_subtasks.filter(is_completed=True).count()
+            pending_subtasks = total_subtasks - completed_subtasks
+            
+            # Get priority distribution
+            high_priority_tasks = project.tasks.filter(priority='high').count()
+            urgent_tasks = project.tasks.filter(priority='urgent').count()
+            medium_priority_tasks = project.tasks.filter(priority='medium').count()
+            low_priority_tasks = project.tasks.filter(priority='low').count()
+            
+            # Get development status distribution
+            development_statuses = project.tasks.values('development_status').annotate(count=Count('id'))
+            
+            # Calculate completion rates
+            task_completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+            subtask_completion_rate = (completed_subtasks / total_subtasks * 100) if total_subtasks > 0 else 0
+            
+            # Calculate project timeline progress
+            timeline_progress = 0
+            days_remaining = 0
+            if project.start_date and project.end_date:
+                days_elapsed = (timezone.now().date() - project.start_date).days
+                total_days = (project.end_date - project.start_date).days
+                if total_days > 0:
+                    timeline_progress = (days_elapsed / total_days) * 100
+                    days_remaining = max(0, total_days - days_elapsed)
+            
+            # Get recent activity (last 30 days)
+            end_date = timezone.now()
+            start_date = end_date - timedelta(days=30)
+            
+            recent_tasks = project.tasks.filter(created_at__gte=start_date).count()
+            recent_subtasks = project_subtasks.filter(created_at__gte=start_date).count()
+            recent_comments = sum(task.comments.filter(created_at__gte=start_date).count() for task in project.tasks.all())
+            
+            # Get team information
+            team_members = project.assigned_users.all()
+            team_size = team_members.count()
+            
+            # Calculate average task completion time
+            completed_tasks_with_dates = project.tasks.filter(status='completed', start_date__isnull=False, end_date__isnull=False)
+            avg_completion_days = 0
+            if completed_tasks_with_dates.exists():
+                completion_times = [(task.end_date - task.start_date).days for task in completed_tasks_with_dates]
+                avg_completion_days = sum(completion_times) / len(completion_times)
+            
+            # Prepare comprehensive report data
+            report_data = {
+                'project_id': project_id,
+                'project_name': project.name,
+                'client_name': client_username,
+                'client_email': client_email,
+                'total_tasks': total_tasks,
+                'completed_tasks': completed_tasks,
+                'in_progress_tasks': in_progress_tasks,
+                'not_started_tasks': not_started_tasks,
+                'on_hold_tasks': on_hold_tasks,
+                'guidance_required_tasks': guidance_required_tasks,
+                'total_subtasks': total_subtasks,
+                'completed_subtasks': completed_subtasks,
+                'pending_subtasks': pending_subtasks,
+                'high_priority_tasks': high_priority_tasks,
+                'urgent_tasks': urgent_tasks,
+                'medium_priority_tasks': medium_priority_tasks,
+                'low_priority_tasks': low_priority_tasks,
+                'task_completion_rate': task_completion_rate,
+                'subtask_completion_rate': subtask_completion_rate,
+                'timeline_progress': timeline_progress,
+                'days_remaining': days_remaining,
+                'project_status': project.get_status_display(),
+                'team_size': team_size,
+                'recent_activity': {
+                    'tasks': recent_tasks,
+                    'subtasks': recent_subtasks,
+                    'comments': recent_comments
+                },
+                'avg_completion_days': avg_completion_days,
+                'development_statuses': list(development_statuses),
+                'generated_date': timezone.now().strftime("%B %d, %Y at %I:%M %p"),
+                'project': {
+                    'id': project.id,
+                    'name': project.name,
+                    'status': project.status,
+                    'start_date': project.start_date.isoformat() if project.start_date else None,
+                    'end_date': project.end_date.isoformat() if project.end_date else None,
+                    'created_at': project.created_at.isoformat() if project.created_at else None
+                }
+            }
+            
+            print(f"Sending comprehensive project report to: {client_email}")
+
+            # Generate matplotlib donut chart and load logo
+            from ..chart_utils import generate_donut_chart
+            from email.mime.image import MIMEImage
+            from django.core.mail import EmailMultiAlternatives
+            import os
+
+            chart_buffer = generate_donut_chart(task_completion_rate)
+
+            # Load E-Click logo
+            logo_path = os.path.join(settings.BASE_DIR, 'static', 'images', 'E Click Logo (1).png')
+            with open(logo_path, 'rb') as f:
+                logo_data = f.read()
+
+            # Create styled email body with project information
+            email_body = f"""<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body style="margin: 0; padding: 0; background-color: #f5f5f5;">
+<div style="font-family: Arial, sans-serif; max-width: 720px; margin: 20px auto; background-color: #ffffff; color: #000000; border: 1px solid #e5e7eb; border-radius: 8px; overflow: hidden; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    <div style="background-color: #ffffff; padding: 20px; border-bottom: 1px solid #f3f4f6; text-align: center;">
+        <img src="cid:eclick_logo" alt="E-Click Logo" style="max-width: 150px; height: auto;"/>
+    </div>
+
+    <div style="padding: 20px; background-color: #ffffff;">
+        <p style="color: #000000; font-size: 16px; margin-bottom: 10px; font-weight: bold;">Dear {client_username},</p>
+
+        <!-- DONUT CHART - Matplotlib generated inline image -->
+        <div style="text-align:center;margin:30px 0;">
+            <img src="cid:progress_chart" alt="Progress Chart" style="max-width:400px;height:auto;"/>
+        </div>
+
+        <!-- Legend -->
+        <div style="text-align:center;margin:20px 0;">
+            <span style="display:inline-block;margin:0 15px;">
+                <span style="display:inline-block;width:15px;height:15px;background:#dc2626;border-radius:50%;vertical-align:middle;"></span>
+                <span style="margin-left:5px;color:#000000;">Completed: {task_completion_rate:.1f}%</span>
+            </span>
+            <span style="display:inline-block;margin:0 15px;">
+                <span style="display:inline-block;width:15px;height:15px;background:#e5e7eb;border-radius:50%;vertical-align:middle;border:1px solid #ccc;"></span>
+                <span style="margin-left:5px;color:#000000;">Remaining: {100 - task_completion_rate:.1f}%</span>
+            </span>
+        </div>
+        
+        <p style="color: #000000; font-size: 14px; margin-bottom: 20px;">Please find your summary below. A detailed, presentation-ready PDF is attached for your records.</p>
+        
+        <div style="background-color: #ffffff; border: 1px solid #e5e7eb; border-radius: 8px; padding: 20px; margin-bottom: 20px;">
+            <h2 style="color: #1f2937; font-size: 18px; margin-top: 0; margin-bottom: 15px;">Project Summary</h2>
+            <table style="width: 100%; border-collapse: collapse; margin-bottom: 15px;">
+                <tr style="background-color: #2d3748; color: #ffffff;">
+                    <th style="padding: 10px; text-align: left; border: 1px solid #000000;">Project Summary</th>
+                    <th style="padding: 10px; text-align: center; border: 1px solid #000000;">Totals</th>
+                </tr>
+                <tr style="background-color: #ffffff;">
+                    <td style="padding: 10px; border: 1px solid #000000; font-weight: bold; color: #000000;">Total Projects</td>
+                    <td style="padding: 10px; border: 1px solid #000000; text-align: center; color: #000000;">1</td>
+                </tr>
+                <tr style="background-color: #ffffff;">
+                    <td style="padding: 10px; border: 1px solid #000000; font-weight: bold; color: #000000;">Completed Projects</td>
+                    <td style="padding: 10px; border: 1px solid #000000; text-align: center; color: #000000;">{1 if project.status == 'completed' else 0}</td>
+                </tr>
+                <tr style="background-color: #ffffff;">
+                    <td style="padding: 10px; border: 1px solid #000000; font-weight: bold; color: #000000;">Projects In Progress</td>
+                    <td style="padding: 10px; border: 1px solid #000000; text-align: center; color: #000000;">{1 if project.status == 'in_progress' else 0}</td>
+                </tr>
+                <tr style="background-color: #ffffff;">
+                    <td style="padding: 10px; border: 1px solid #000000; font-weight: bold; color: #000000;">Total Tasks</td>
+                    <td style="padding: 10px; border: 1px solid #000000; text-align: center; color: #000000;">{total_tasks if total_tasks > 0 else 0}</td>
+                </tr>
+                <tr style="background-color: #ffffff;">
+                    <td style="padding: 10px; border: 1px solid #000000; font-weight: bold; color: #000000;">Completed Tasks</td>
+                    <td style="padding: 10px; border: 1px solid #000000; text-align: center; color: #000000;">{completed_tasks if completed_tasks > 0 else 0}</td>
+                </tr>
+            </table>
+            
+            <div style="display: flex; justify-content: space-between; margin-bottom: 15px;">
+                <div style="text-align: center; flex: 1; background-color: #f9fafb; border-radius: 8px; padding: 15px; margin-right: 10px;">
+                    <h3 style="color: #1f2937; margin: 0 0 5px 0; font-size: 16px;">Project Completion Rate</h3>
+                    <p style="color: #000000; font-size: 18px; font-weight: bold; margin: 0;">{100 if project.status == 'completed' else 0}%</p>
+                </div>
+                <div style="text-align: center; flex: 1; background-color: #f9fafb; border-radius: 8px; padding: 15px; margin-left: 10px;">
+                    <h3 style="color: #1f2937; margin: 0 0 5px 0; font-size: 16px;">Task Completion Rate</h3>
+                    <p style="color: #000000; font-size: 18px; font-weight: bold; margin: 0;">{task_completion_rate:.1f}%</p>
+                </div>
+            </div>
+        </div>
+        
+        <div style="background-color: #f9fafb; border-left: 4px solid #dc2626; padding: 15px; margin-bottom: 20px;">
+            <h2 style="color: #dc2626; font-size: 18px; margin-top: 0; margin-bottom: 15px;">Project Details</h2>
+            <ul style="color: #000000; font-size: 14px; margin: 0; padding-left: 20px;">
+                <li style="margin-bottom: 8px;"><strong>Project Name:</strong> {project.name}</li>
+                <li style="margin-bottom: 8px;"><strong>Current Status:</strong> {project.get_status_display()}</li>
+                <li style="margin-bottom: 8px;"><strong>Team Size:</strong> {team_size} members</li>
+                <li style="margin-bottom: 8px;"><strong>Recent Activity:</strong> {recent_tasks} new tasks, {recent_subtasks} new subtasks in last 30 days</li>
+            </ul>
+        </div>
+        
+        
+        
+        <div style="background-color: #f9fafb; border-left: 4px solid #dc2626; padding: 15px; margin-bottom: 20px;">
+            <h2 style="color: #dc2626; font-size: 18px; margin-top: 0; margin-bottom: 15px;">Next Steps</h2>
+            <ul style="color: #000000; font-size: 14px; margin: 0; padding-left: 20px;">
+                <li style="margin-bottom: 8px;">Review the attached PDF for full insights and project-level details.</li>
+                <li style="margin-bottom: 8px;">Reply with any priorities you'd like us to fast-track this week.</li>
+                <li style="margin-bottom: 8px;">Book a 15-minute review if you'd like us to walk you through the data.</li>
+            </ul>
+        </div>
+        
+        <p style="color: #000000; font-size: 14px; margin-bottom: 20px;">If you have any questions, simply reply to this email and our team will assist you.</p>
+        
+        <div style="text-align: center; margin-top: 30px;">
+            <p style="color: #000000; font-size: 14px; margin-bottom: 10px;">Warm regards,</p>
+            <p style="color: #000000; font-size: 14px; font-weight: bold; margin-bottom: 5px;">E-Click Project Management Team</p>
+        </div>
+    </div>
+    
+    <div style="background-color: #1f2937; color: #ffffff; padding: 15px; text-align: center;">
+        <p style="margin: 0; font-size: 16px; font-weight: bold;">WE CARE, WE CAN, WE DELIVER</p>
+    </div>
+</div>
+</body>
+</html>"""
+            
+            # Generate summary PDF with the same information as the email (no Highlights)
+            generated_time_str = timezone.now().strftime("%B %d, %Y at %I:%M %p")
+            pdf_path = generate_project_summary_pdf(
+                project=project,
+                client_name=client_username,
+                total_tasks=total_tasks,
+                completed_tasks=completed_tasks,
+                task_completion_rate=task_completion_rate,
+                team_size=team_size,
+                recent_tasks=recent_tasks,
+                recent_subtasks=recent_subtasks,
+                generated_time=generated_time_str,
+            )
+            
+            # Send email with simple subject
+            subject = f"Project Report: {project.name}"
+
+            # Create email with HTML and attachments
+            email = EmailMultiAlternatives(
+                subject=subject,
+                body='Please view this email in HTML mode.',
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[client_email]
+            )
+            email.attach_alternative(email_body, "text/html")
+
+            # Attach E-Click logo as inline image
+            logo_img = MIMEImage(logo_data, 'png')
+            logo_img.add_header('Content-ID', '<eclick_logo>')
+            logo_img.add_header('Content-Disposition', 'inline', filename='eclick_logo.png')
+            email.attach(logo_img)
+
+            # Attach progress chart as inline image
+            chart_img = MIMEImage(chart_buffer.read(), 'png')
+            chart_img.add_header('Content-ID', '<progress_chart>')
+            chart_img.add_header('Content-Disposition', 'inline', filename='progress_chart.png')
+            email.attach(chart_img)
+
+            # Attach PDF report
+            if pdf_path:
+                email.attach_file(pdf_path)
+
+            try:
+                email.send()
+                result = {'success': True, 'message': 'Email sent successfully'}
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            
+            # Clean up temporary PDF file
+            try:
+                import os
+                if pdf_path and os.path.exists(pdf_path):
+                    os.unlink(pdf_path)
+            except Exception:
+                pass
+                
+            print(f"Enhanced project email service result: {result}")
+            
+            # Handle email service result
+            if result['success']:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({
+                        'success': True, 
+                        'message': f'Enhanced project report sent successfully to {client_email}',
+                        'report_summary': {
+                            'tasks_completed': completed_tasks,
+                            'completion_rate': f"{task_completion_rate:.1f}%",
+                            'timeline_progress': f"{timeline_progress:.1f}%",
+                            'days_remaining': days_remaining
+                        }
+                    })
+                else:
+                    messages.success(request, f'Enhanced project report sent successfully to {client_email}')
+            else:
+                if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                    return JsonResponse({'success': False, 'error': f'Error sending report: {result.get("error", "Unknown error")}'})
+                else:
+                    messages.error(request, f'Error sending enhanced project report: {result.get("error", "Unknown error")}')
+            
+        except Exception as e:
+            import traceback
+            print(f"Error in enhanced project report: {str(e)}")
+            print(f"Traceback: {traceback.format_exc()}")
+            
+            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+                return JsonResponse({'success': False, 'error': f'Error generating enhanced report: {str(e)}'})
+            else:
+                messages.error(request, f'Error sending enhanced project report: {str(e)}')
+    
+    if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return JsonResponse({'success': False, 'error': 'Invalid request method'})
+    else:
+        return redirect('reports')
@@ -325,15 +325,9 @@ class UserPermission(models.Model):
     
     @classmethod
     def has_permission(cls, user, section, permission):
-        """Check if user has specific permission for a section"""
-        if user.is_superuser:
-            return True
-        return cls.objects.filter(
-            user=user,
-            section=section,
-            permission=permission,
-            is_active=True
-        ).exists()
+        """Check if user has specific permission for a section (from the cached permission matrix)"""
+        from .permissions import has_permission
+        return has_permission(user, section, permission)
     
     @classmethod
     def grant_permission(cls, user, section, permission, granted_by=None):
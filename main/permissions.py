@@ -0,0 +1,107 @@
+"""
+Compiled permission matrix for UserPermission
+
+All active grants are loaded with one query and compiled into one integer
+bitset per user, with a bit for every (section, permission) pair. The
+matrix is cached under a version counter that every grant, revoke or
+delete bumps, and the current matrix is also kept in process memory, so a
+request can run any number of checks without touching the database.
+"""
+import threading
+import time
+
+from django.core.cache import cache
+
+from .models import UserPermission
+
+MATRIX_VERSION_KEY = 'permission_matrix_version'
+MATRIX_KEY = 'permission_matrix:{}'
+MATRIX_TIMEOUT = 60 * 60  # also bounds staleness after queryset.update()
+
+SECTIONS = [section for section, _ in UserPermission.SECTION_CHOICES]
+PERMISSIONS = [permission for permission, _ in UserPermission.PERMISSION_CHOICES]
+BITS = {
+    (section, permission): 1 << (section_index * len(PERMISSIONS) + permission_index)
+    for section_index, section in enumerate(SECTIONS)
+    for permission_index, permission in enumerate(PERMISSIONS)
+}
+
+_local = threading.local()
+
+
+def _initial_version():
+    # Seeded from the clock so a version lost to cache eviction never
+    # matches the version a cached matrix was built with
+    return int(time.time() * 1000)
+
+
+def get_matrix_version():
+    """Current matrix version: one cache round trip, two only when it is not set yet"""
+    version = cache.get(MATRIX_VERSION_KEY)
+    if version is None:
+        cache.add(MATRIX_VERSION_KEY, _initial_version(), None)
+        version = cache.get(MATRIX_VERSION_KEY) or _initial_version()
+    return version
+
+
+def bump_matrix_version():
+    """Invalidate the compiled matrix after grants change"""
+    cache.add(MATRIX_VERSION_KEY, _initial_version(), None)
+    try:
+        return cache.incr(MATRIX_VERSION_KEY)
+    except ValueError:
+        version = _initial_version()
+        cache.set(MATRIX_VERSION_KEY, version, None)
+        return version
+
+
+class PermissionMatrix:
+    """Active grants of every user as {user_id: bitset}"""
+
+    def __init__(self, masks):
+        self.masks = masks
+
+    @classmethod
+    def build(cls):
+        """Compile the matrix from a single query"""
+        masks = {}
+        grants = UserPermission.objects.filter(is_active=True).values_list('user_id', 'section', 'permission')
+        for user_id, section, permission in grants:
+            bit = BITS.get((section, permission))
+            if bit:
+                masks[user_id] = masks.get(user_id, 0) | bit
+        return cls(masks)
+
+    def has_permission(self, user, section, permission):
+        if user.is_superuser:
+            return True
+        bit = BITS.get((section, permission))
+        return bool(bit and self.masks.get(user.pk, 0) & bit)
+
+    def grants(self, user_id):
+        """(section, permission) pairs granted to a user, in choice order"""
+        mask = self.masks.get(user_id, 0)
+        return [pair for pair, bit in BITS.items() if mask & bit]
+
+
+def get_permission_matrix():
+    """The current matrix, rebuilt only after a grant changes"""
+    version = get_matrix_version()
+    local = getattr(_local, 'matrix', None)
+    if local is not None and local[0] == version:
+        return local[1]
+
+    key = MATRIX_KEY.format(version)
+    matrix = cache.get(key)
+    if matrix is None:
+        matrix = PermissionMatrix.build()
+        cache.set(key, matrix, MATRIX_TIMEOUT)
+    _local.matrix = (version, matrix)
+    return matrix
+
+
+def has_permission(user, section, permission):
+    """Check a grant against the compiled matrix"""
+    if not user.is_authenticated:
+        return False
+    return get_permission_matrix().has_permission(user, section, permission)
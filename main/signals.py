@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import UserPermission
+from .permissions import bump_matrix_version
+
+
+@receiver([post_save, post_delete], sender=UserPermission)
+def permission_grants_changed(sender, instance, **kwargs):
+    """Grants, revokes and deletes invalidate the compiled permission matrix"""
+    bump_matrix_version()
@@ -16,19 +16,12 @@ import json
 import csv
 from datetime import datetime, timedelta
 from django.core.serializers.json import DjangoJSONEncoder
+from home.json_api import CompactJsonResponse, versioned_json
 from django.db import models
 import os
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Flowable
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from reportlab.graphics.shapes import Drawing, Circle, Wedge, String
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics import renderPDF
-from reportlab.platypus.flowables import Flowable
+# ReportLab is imported inside the PDF functions so web workers only load it when a report is generated
 import math
+from functools import lru_cache
 
 
 from django.shortcuts import get_object_or_404, redirect
@@ -1230,7 +1223,23 @@ def export_dashboard_data(request):
    response['Content-Disposition'] = f'attachment; filename="dashboard_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json"'
    return response
 
+def _dashboard_data_version(request):
+   """Version token for the polled dashboard endpoints: the user's project, activity and task maxima"""
+   projects = Project.objects.filter(team=request.user)
+   rollup = {'count': models.Count('id'), 'updated': models.Max('updated_at')}
+   return (
+       request.user.pk,
+       datetime.now().date(),  # overdue counts change at midnight
+       # Through a subquery so the member count is not limited to the filtered team join
+       Project.objects.filter(id__in=projects.values('id')).aggregate(
+           projects=models.Count('id', distinct=True), updated=models.Max('updated_at'), members=models.Count('team')
+       ),
+       Activity.objects.filter(project__in=projects).aggregate(**rollup),
+       WeeklyTask.objects.filter(project_week__project__in=projects).aggregate(**rollup),
+   )
+
 @login_required
+@versioned_json(_dashboard_data_version)
 def get_dashboard_stats(request):
    """Get dashboard statistics via AJAX"""
    projects = Project.objects.filter(team=request.user)
@@ -1293,6 +1302,7 @@ def get_dashboard_stats(request):
    return JsonResponse(stats)
 
 @login_required
+@versioned_json(_dashboard_data_version)
 def refresh_dashboard_data(request):
    """Refresh dashboard data via AJAX"""
    # This view can be called periodically to refresh dashboard data
@@ -1351,7 +1361,7 @@ def refresh_dashboard_data(request):
            'created_at': activity.created_at.isoformat()
        })
    
-   return JsonResponse({
+   return CompactJsonResponse({
        'projects': projects_data,
        'activities': activities_data,
        'stats': {
@@ -1677,6 +1687,19 @@ def system_logs(request):
 # Working DonutChart implementation with red/black/white theme - centered and bigger
 def create_donut_chart(progress_percentage):
     """Create a centered, bigger donut chart with red/black/white theme for one-page layout"""
+    try:
+        # Ensure valid progress data; drawings are reused per displayed percentage
+        progress = round(max(0, min(100, float(progress_percentage or 0))), 1)
+    except (TypeError, ValueError):
+        progress = 0.0
+    return _donut_drawing(progress)
+
+@lru_cache(maxsize=1001)
+def _donut_drawing(progress):
+    from reportlab.lib import colors
+    from reportlab.graphics.shapes import Drawing, Circle, String
+    from reportlab.graphics.charts.piecharts import Pie
+
     try:
         drawing = Drawing(400, 150)  # Bigger size and centered
         pie = Pie()
@@ -1685,8 +1708,6 @@ def create_donut_chart(progress_percentage):
         pie.width = 120  # Bigger chart
         pie.height = 120
         
-        # Ensure valid progress data
-        progress = max(0, min(100, float(progress_percentage or 0)))
         remaining = 100 - progress
         
         # Create donut chart showing completed vs remaining
@@ -1719,6 +1740,13 @@ def create_donut_chart(progress_percentage):
 
 def generate_project_pdf(project):
     """Generate an email-style PDF report that matches the exact format shown in the image"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+
     # Create filename with date
     today = datetime.now().strftime('%Y-%m-%d')
     filename = f"ProjectReport_{project.name.replace(' ', '_')}_{today}.pdf"
@@ -2186,10 +2214,11 @@ def permission_management(request):
     sections = UserPermission.SECTION_CHOICES
     permissions = UserPermission.PERMISSION_CHOICES
     
-    # Get current permissions for each user
+    # Current permissions for each user, from a single query
     user_permissions = {}
-    for user in users:
-        user_permissions[user.id] = UserPermission.objects.filter(user=user, is_active=True)
+    grants = UserPermission.objects.filter(is_active=True, user__is_active=True).order_by('section', 'permission')
+    for grant in grants:
+        user_permissions.setdefault(grant.user_id, []).append(grant)
     
     context = {
         'users': users,
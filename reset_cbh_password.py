@@ -6,7 +6,6 @@ import os
 import sys
 import django
 from datetime import timedelta
-import random
 
 # Setup Django environment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -40,22 +39,13 @@ print("Password set to: 123")
 
 # Generate OTP
 print("\n[STEP 2] Generating OTP for password reset...")
-otp = ''.join(random.choices('0123456789', k=6))
+otp = client.generate_otp()  # Invalidates any existing OTP
 print(f"Generated OTP: {otp}")
 
-# Mark all existing OTPs as used
-existing_otps = ClientOTP.objects.filter(client=client, is_used=False).count()
-if existing_otps > 0:
-    ClientOTP.objects.filter(client=client).update(is_used=True)
-    print(f"Marked {existing_otps} existing OTP(s) as used")
-
-# Create new OTP record
-otp_obj = ClientOTP.objects.create(
-    client=client,
-    otp=otp,
-    is_used=False,
-    expires_at=timezone.now() + timedelta(minutes=10)
-)
+# Shorten the expiry for this test
+otp_obj = ClientOTP.objects.get(client=client, is_used=False)
+otp_obj.expires_at = timezone.now() + timedelta(minutes=10)
+otp_obj.save(update_fields=['expires_at'])
 print(f"OTP record created (expires in 10 minutes)")
 print(f"Expires at: {otp_obj.expires_at.strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -77,20 +77,20 @@ def test_client_password_reset():
     else:
         print(f"[FAIL] Forgot password failed (status: {response.status_code})")
 
-    # Get the OTP
-    otp_record = ClientOTP.objects.filter(client=client).order_by('-created_at').first()
-    if not otp_record:
+    # Only a hash of the emailed OTP is stored, so issue a fresh one to use below
+    if not ClientOTP.objects.filter(client=client, is_used=False).exists():
         print("[FAIL] No OTP record found")
         return
+    otp = client.generate_otp()
 
-    print(f"[OK] OTP retrieved: {otp_record.otp}")
+    print(f"[OK] OTP issued: {otp}")
 
     # Step 2: Reset password with OTP
     print("\nStep 2: Reset password with OTP...")
     new_password = "TestPassword123!"
     response = test_client.post(f"{reset_url}?username={client.username}", {
         'username': client.username,
-        'otp': otp_record.otp,
+        'otp': otp,
         'new_password': new_password,
         'confirm_password': new_password
     })
@@ -145,9 +145,9 @@ def test_client_password_reset():
             if response.status_code == 200:
                 print(f"[OK] Admin password reset endpoint works")
                 # Check if new OTP was generated
-                latest_otp = ClientOTP.objects.filter(client=client).order_by('-created_at').first()
+                latest_otp = ClientOTP.objects.filter(client=client, is_used=False).first()
                 if latest_otp:
-                    print(f"[OK] New OTP generated: {latest_otp.otp}")
+                    print(f"[OK] New OTP generated, expires at {latest_otp.expires_at}")
             else:
                 print(f"[INFO] Admin reset response: {response.status_code}")
         else: